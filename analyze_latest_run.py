@@ -1,7 +1,7 @@
 # analyze_latest_run.py
 import os
 import sys
-from sqlalchemy import create_engine, func, desc, case
+from sqlalchemy import create_engine, desc
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.exc import NoResultFound
 import numpy as np
@@ -16,7 +16,8 @@ project_root = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, project_root)
 
 try:
-    from reinforcestrategycreator.db_models import Base, TrainingRun, Episode, TradingOperation, OperationType
+    from reinforcestrategycreator.db_models import Base, TrainingRun
+    from reinforcestrategycreator.analytics import episode_returns, non_hold_operations
     # Assuming get_db is not needed directly here, we'll create a session locally
 except ImportError as e:
     print(f"Error importing project modules: {e}")
@@ -65,66 +66,36 @@ def analyze_latest_run(db: Session):
         print(f"Found latest completed run: {run_id} (Ended: {latest_completed_run.end_time})")
 
         # 2. Calculate average Sharpe Ratio for this run
-        sharpe_ratios_query = db.query(Episode.sharpe_ratio)\
-            .filter(Episode.run_id == run_id)\
-            .filter(Episode.sharpe_ratio.isnot(None))
+        sharpe_ratios = episode_returns(db, run_id, completed_only=False)["sharpe_ratio"]
+        n_with_sharpe = int(np.count_nonzero(~np.isnan(sharpe_ratios)))
 
-        sharpe_ratios = sharpe_ratios_query.all()
-
-        if not sharpe_ratios:
+        if not n_with_sharpe:
             print(f"No episodes with Sharpe ratios found for run {run_id}.")
             avg_sharpe_ratio = None
         else:
-            # Extract values from tuples and handle potential NaNs/Infs if necessary
-            valid_sharpe_ratios = [r[0] for r in sharpe_ratios if r[0] is not None and np.isfinite(r[0])]
-            if not valid_sharpe_ratios:
+            # NULLs arrive as NaN; also drop infinite ratios
+            valid_sharpe_ratios = sharpe_ratios[np.isfinite(sharpe_ratios)]
+            if not len(valid_sharpe_ratios):
                  avg_sharpe_ratio = None
                  print(f"No finite Sharpe ratios found for run {run_id}.")
             else:
-                avg_sharpe_ratio = np.mean(valid_sharpe_ratios)
-                print(f"Average Sharpe Ratio: {avg_sharpe_ratio:.4f} (from {len(valid_sharpe_ratios)} episodes with valid ratios out of {len(sharpe_ratios)} total)")
+                avg_sharpe_ratio = float(np.mean(valid_sharpe_ratios))
+                print(f"Average Sharpe Ratio: {avg_sharpe_ratio:.4f} (from {len(valid_sharpe_ratios)} episodes with valid ratios out of {n_with_sharpe} total)")
 
 
         # 3. Calculate average number of non-HOLD operations per episode
-        # Get episode IDs for the run
-        # Corrected: Use Episode.episode_id instead of Episode.id
-        episode_ids_query = db.query(Episode.episode_id).filter(Episode.run_id == run_id)
-        episode_ids = [e.episode_id for e in episode_ids_query.all()] # Corrected: Use e.episode_id
-        num_episodes_in_run = len(episode_ids)
-
+        # Counted per episode in SQL; episodes without operations count as 0
+        non_hold_counts = non_hold_operations(db, run_id)["non_hold_count"]
+        num_episodes_in_run = len(non_hold_counts)
 
-        if not episode_ids:
+        if not num_episodes_in_run:
             print(f"No episodes found for run {run_id}.")
             avg_non_hold_ops = None
         else:
             print(f"Found {num_episodes_in_run} episodes for run {run_id}.")
-            # Count non-HOLD operations per episode
-            # Using case to count only non-HOLD operations
-            ops_per_episode_query = db.query(
-                    TradingOperation.episode_id,
-                    # Corrected: Use TradingOperation.operation_id instead of TradingOperation.id
-                    func.count(case((TradingOperation.operation_type != OperationType.HOLD, TradingOperation.operation_id))).label('non_hold_count')
-                )\
-                .filter(TradingOperation.episode_id.in_(episode_ids))\
-                .group_by(TradingOperation.episode_id)
-
-            ops_per_episode = ops_per_episode_query.all()
-
-            # Create a dictionary {episode_id: count}
-            ops_count_dict = {ep_id: count for ep_id, count in ops_per_episode}
-
-            # Ensure all episodes from the run are considered, even those with 0 non-HOLD ops
-            non_hold_counts = []
-            for ep_id in episode_ids:
-                 count = ops_count_dict.get(ep_id, 0) # Default to 0 if no non-HOLD ops found for an episode
-                 non_hold_counts.append(count)
-
-            if not non_hold_counts: # Should not happen if episode_ids is not empty, but safety check
-                 avg_non_hold_ops = 0.0
-            else:
-                 avg_non_hold_ops = np.mean(non_hold_counts)
+            avg_non_hold_ops = float(np.mean(non_hold_counts))
 
-            print(f"Average Non-HOLD Operations per Episode: {avg_non_hold_ops:.2f} (Total non-HOLD ops: {sum(non_hold_counts)} across {num_episodes_in_run} episodes)")
+            print(f"Average Non-HOLD Operations per Episode: {avg_non_hold_ops:.2f} (Total non-HOLD ops: {int(non_hold_counts.sum())} across {num_episodes_in_run} episodes)")
 
 
         return run_id, avg_sharpe_ratio, avg_non_hold_ops
@@ -0,0 +1,140 @@
+"""
+Compare SQL window-function analytics against the per-episode ORM loops.
+
+Fills a database with one synthetic run (default 10,000 episodes of 50 steps)
+and times, for that run:
+  * run metrics: the former hyperparameter_optimization.get_episode_metrics
+    (all Episode objects, then one Step query per episode) versus
+    analytics.run_summary (one query);
+  * episode table: full Episode ORM rows versus analytics.episode_columns.
+
+Uses a temporary SQLite file unless --db-url is given. With --db-url the
+tables are created if missing and the synthetic run is deleted afterwards.
+
+Usage:
+    python benchmark_episode_analytics.py --episodes 10000 --steps 50
+"""
+import argparse
+import datetime
+import os
+import tempfile
+import time
+
+import numpy as np
+from sqlalchemy import create_engine, delete, insert, select
+from sqlalchemy.orm import Session
+
+from reinforcestrategycreator.analytics import episode_columns, run_summary
+from reinforcestrategycreator.db_models import Base, Episode, Step, TrainingRun
+
+RUN_ID = "RUN-BENCH-ANALYTICS"
+
+
+def populate(engine, episodes: int, steps: int, seed: int = 0) -> None:
+    """Inserts one run of random-walk episodes with bulk Core inserts."""
+    rng = np.random.default_rng(seed)
+    start = datetime.datetime(2024, 1, 1)
+    timestamps = [start + datetime.timedelta(minutes=t) for t in range(steps)]
+    actions = np.array(["buy", "sell", "hold"])
+    with engine.begin() as conn:
+        conn.execute(insert(TrainingRun), [{"run_id": RUN_ID, "status": "completed", "start_time": start}])
+        for first in range(0, episodes, 1000):
+            count = min(1000, episodes - first)
+            values = 10000 * np.cumprod(1 + rng.normal(0, 0.01, (count, steps)), axis=1)
+            episode_rows = [
+                {
+                    "run_id": RUN_ID, "rllib_episode_id": f"{RUN_ID}-{first + i}", "status": "completed",
+                    "start_time": start, "initial_portfolio_value": float(v[0]), "final_portfolio_value": float(v[-1]),
+                    "pnl": float(v[-1] - v[0]), "total_reward": float(v[-1] / v[0] - 1), "total_steps": steps
+                }
+                for i, v in enumerate(values)
+            ]
+            ids = conn.execute(insert(Episode).returning(Episode.episode_id, sort_by_parameter_order=True), episode_rows).scalars().all()
+            step_actions = actions[rng.integers(0, 3, (count, steps))]
+            conn.execute(insert(Step), [
+                {"episode_id": episode_id, "timestamp": timestamps[t], "portfolio_value": float(values[i, t]),
+                 "action": step_actions[i, t]}
+                for i, episode_id in enumerate(ids) for t in range(steps)
+            ])
+
+
+def orm_metrics(db: Session, run_id: str) -> dict:
+    """The per-episode loop get_episode_metrics used before the analytics module."""
+    episodes = db.query(Episode).filter(Episode.run_id == run_id, Episode.status == "completed").all()
+    pnl_values = [episode.pnl for episode in episodes if episode.pnl is not None]
+    returns = np.array(pnl_values)
+    metrics = {
+        "pnl_mean": sum(pnl_values) / len(pnl_values),
+        "win_rate": sum(1 for pnl in pnl_values if pnl > 0) / len(pnl_values),
+        "sharpe_ratio": np.mean(returns) / (np.std(returns) + 1e-6)
+    }
+    max_drawdowns = []
+    for episode in episodes:
+        steps = db.query(Step).filter(Step.episode_id == episode.episode_id).order_by(Step.timestamp, Step.step_id).all()
+        portfolio_values = [step.portfolio_value for step in steps if step.portfolio_value is not None]
+        if portfolio_values:
+            max_value = portfolio_values[0]
+            max_drawdown = 0
+            for value in portfolio_values:
+                if value > max_value:
+                    max_value = value
+                drawdown = (max_value - value) / max_value if max_value > 0 else 0
+                max_drawdown = max(max_drawdown, drawdown)
+            max_drawdowns.append(max_drawdown)
+    metrics["max_drawdown"] = sum(max_drawdowns) / len(max_drawdowns)
+    return metrics
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--episodes", type=int, default=10000)
+    parser.add_argument("--steps", type=int, default=50)
+    parser.add_argument("--db-url", default=None)
+    args = parser.parse_args()
+
+    tmpdir = None
+    db_url = args.db_url
+    if db_url is None:
+        tmpdir = tempfile.TemporaryDirectory()
+        db_url = f"sqlite:///{os.path.join(tmpdir.name, 'analytics.db')}"
+    engine = create_engine(db_url)
+    Base.metadata.create_all(engine)
+
+    try:
+        _, seconds = timed(populate, engine, args.episodes, args.steps)
+        print(f"Inserted {args.episodes:,} episodes x {args.steps} steps in {seconds:.1f}s ({engine.dialect.name})")
+
+        with Session(engine) as db:
+            legacy, legacy_s = timed(orm_metrics, db, RUN_ID)
+        with Session(engine) as db:
+            summary, sql_s = timed(run_summary, db, RUN_ID)
+        with Session(engine) as db:
+            _, orm_rows_s = timed(lambda: db.query(Episode).filter(Episode.run_id == RUN_ID).all())
+        with Session(engine) as db:
+            _, columns_s = timed(episode_columns, db, RUN_ID)
+
+        print(f"{'query':<16} {'ORM loop s':>11} {'SQL s':>8} {'speed-up':>9}")
+        print(f"{'run metrics':<16} {legacy_s:>11.2f} {sql_s:>8.3f} {legacy_s / sql_s:>8.0f}x")
+        print(f"{'episode table':<16} {orm_rows_s:>11.2f} {columns_s:>8.3f} {orm_rows_s / columns_s:>8.1f}x")
+        for key in ("pnl_mean", "sharpe_ratio", "win_rate", "max_drawdown"):
+            print(f"  {key:<13} ORM {legacy[key]:>12.6f}   SQL {summary[key]:>12.6f}")
+    finally:
+        if args.db_url is not None:
+            with engine.begin() as conn:
+                episode_ids = select(Episode.episode_id).where(Episode.run_id == RUN_ID)
+                conn.execute(delete(Step).where(Step.episode_id.in_(episode_ids)))
+                conn.execute(delete(Episode).where(Episode.run_id == RUN_ID))
+                conn.execute(delete(TrainingRun).where(TrainingRun.run_id == RUN_ID))
+        engine.dispose()
+        if tmpdir is not None:
+            tmpdir.cleanup()
+
+
+if __name__ == "__main__":
+    main()
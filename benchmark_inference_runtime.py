@@ -0,0 +1,137 @@
+"""
+Benchmark cold start and latency of InferenceRuntime against per-sample torch inference.
+
+Exports a StrategyAgent Q-network with ModelExporter, then measures:
+  * cold start: a fresh interpreter that imports, loads the model and makes
+    one prediction. Three variants: InferenceRuntime, the rebuild-and-load
+    path that the generated paper trading module used before, and
+    ModelExporter.load_model. Each row also shows whether Ray was imported.
+  * latency: one prediction from a dict observation, and a batch of N
+    observations predicted one at a time versus with predict_batch.
+
+Usage:
+    python benchmark_inference_runtime.py --state-size 64 --threads 1
+"""
+import argparse
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import torch
+
+from reinforcestrategycreator.backtesting.export import ModelExporter
+from reinforcestrategycreator.inference import InferenceRuntime
+from reinforcestrategycreator.rl_agent import StrategyAgent
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+COLD_START = {
+    "runtime": (
+        "from reinforcestrategycreator.inference import InferenceRuntime\n"
+        "model = InferenceRuntime(os.path.join(EXPORT_DIR, MODEL_ID + '_inference'), num_threads=THREADS)\n"
+        "model.predict(np.zeros(STATE_SIZE))\n"
+    ),
+    "rebuild+load": (
+        "import torch\n"
+        "torch.set_num_threads(THREADS)\n"
+        "from reinforcestrategycreator.rl_agent import StrategyAgent\n"
+        "agent = StrategyAgent(state_size=STATE_SIZE, action_size=3)\n"
+        "agent.model.load_state_dict(torch.load(os.path.join(EXPORT_DIR, MODEL_ID + '.pth')))\n"
+        "agent.model.eval()\n"
+        "with torch.no_grad():\n"
+        "    agent.model(torch.zeros(1, STATE_SIZE)).argmax(dim=1).item()\n"
+    ),
+    "ModelExporter": (
+        "import torch\n"
+        "torch.set_num_threads(THREADS)\n"
+        "from reinforcestrategycreator.backtesting.export import ModelExporter\n"
+        "agent = ModelExporter(EXPORT_DIR).load_model(MODEL_ID)\n"
+        "with torch.no_grad():\n"
+        "    agent.model(torch.zeros(1, STATE_SIZE)).argmax(dim=1).item()\n"
+    ),
+}
+
+
+def cold_start(variant: str, export_dir: str, model_id: str, state_size: int, threads: int) -> tuple:
+    """Seconds from interpreter start to first prediction, and whether Ray was imported."""
+    code = (
+        "import os, sys, time\n"
+        "start = time.perf_counter()\n"
+        "import logging; logging.disable(logging.ERROR)\n"
+        "import numpy as np\n"
+        f"EXPORT_DIR, MODEL_ID, STATE_SIZE, THREADS = {export_dir!r}, {model_id!r}, {state_size}, {threads}\n"
+        + COLD_START[variant]
+        + "print(time.perf_counter() - start, 'ray' in sys.modules)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", code], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+    )
+    seconds, ray_loaded = result.stdout.split()[-2:]
+    return float(seconds), ray_loaded == "True"
+
+
+def per_call_us(fn, repeats: int) -> float:
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) / repeats * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--state-size", type=int, default=64)
+    parser.add_argument("--threads", type=int, default=1)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 32, 256, 1024])
+    parser.add_argument("--repeats", type=int, default=200)
+    args = parser.parse_args()
+    logging.disable(logging.ERROR)
+    torch.set_num_threads(args.threads)
+
+    with tempfile.TemporaryDirectory() as export_dir:
+        agent = StrategyAgent(state_size=args.state_size, action_size=3)
+        exporter = ModelExporter(export_dir=export_dir)
+        model_path = exporter.export_model(agent, "SPY", "2020-01-01", "2021-01-01", {"episodes": 1}, {"pnl": 0.0})
+        model_id = os.path.basename(model_path)[:-len(".pth")]
+        runtime = InferenceRuntime(os.path.join(export_dir, f"{model_id}_inference"), num_threads=args.threads)
+        model = agent.model.eval()
+
+        print(f"state size {args.state_size}, {args.threads} thread(s)")
+        print(f"{'cold start':<16} {'seconds':>8} {'ray imported':>13}")
+        for variant in COLD_START:
+            seconds, ray_loaded = cold_start(variant, export_dir, model_id, args.state_size, args.threads)
+            print(f"{variant:<16} {seconds:>8.2f} {str(ray_loaded):>13}")
+
+        rng = np.random.default_rng(0)
+        observation = {f"f{i}": float(v) for i, v in enumerate(rng.standard_normal(args.state_size))}
+
+        def legacy_single(obs=observation):
+            # What the generated TradingModelInference did per decision
+            tensor = torch.tensor(np.array(list(obs.values()), dtype=np.float32)).unsqueeze(0)
+            with torch.no_grad():
+                return torch.argmax(model(tensor), dim=1).item()
+
+        print(f"\n{'latency':<16} {'per-sample us':>14} {'runtime us':>11} {'speed-up':>9}")
+        legacy_us = per_call_us(legacy_single, args.repeats)
+        runtime_us = per_call_us(lambda: runtime.predict(observation), args.repeats)
+        print(f"{'single (dict)':<16} {legacy_us:>14.1f} {runtime_us:>11.1f} {legacy_us / runtime_us:>8.1f}x")
+
+        for batch_size in args.batch_sizes:
+            batch = rng.standard_normal((batch_size, args.state_size)).astype(np.float32)
+
+            def legacy_batch():
+                with torch.no_grad():
+                    return [torch.argmax(model(torch.from_numpy(row).unsqueeze(0)), dim=1).item() for row in batch]
+
+            repeats = max(3, args.repeats // batch_size)
+            legacy_us = per_call_us(legacy_batch, repeats)
+            runtime_us = per_call_us(lambda: runtime.predict_batch(batch), repeats)
+            print(f"{f'batch {batch_size}':<16} {legacy_us:>14.1f} {runtime_us:>11.1f} {legacy_us / runtime_us:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
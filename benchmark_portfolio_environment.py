@@ -0,0 +1,64 @@
+"""
+Benchmark PortfolioTradingEnv step cost from 1 to 500 assets.
+
+Builds the portfolio environment on synthetic OHLCV bars for each asset count
+and times env.step with random target weights. Reports microseconds per step,
+per asset-step and relative to one asset, next to a single-asset TradingEnv
+step for reference: N single-asset environments cost N times that.
+
+Usage:
+    python benchmark_portfolio_environment.py --assets 1 10 50 100 500 --bars 2000
+"""
+import argparse
+import logging
+import time
+
+import numpy as np
+
+from benchmarks.synthetic import make_ohlcv, make_panel
+from reinforcestrategycreator.portfolio_environment import PortfolioTradingEnv
+from reinforcestrategycreator.technical_analyzer import calculate_indicators
+from reinforcestrategycreator.trading_environment import TradingEnv
+
+
+def per_step_us(env, actions, steps: int) -> float:
+    """Mean microseconds per env.step over ``steps`` steps, resetting at the end of data."""
+    env.reset(seed=0)
+    start = time.perf_counter()
+    for i in range(steps):
+        _, _, terminated, truncated, _ = env.step(actions[i % len(actions)])
+        if terminated or truncated:
+            env.reset(seed=0)
+    return (time.perf_counter() - start) / steps * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--assets", type=int, nargs="+", default=[1, 10, 50, 100, 500])
+    parser.add_argument("--bars", type=int, default=2000)
+    parser.add_argument("--window-size", type=int, default=10)
+    parser.add_argument("--steps", type=int, default=2000)
+    args = parser.parse_args()
+    logging.disable(logging.ERROR)
+    rng = np.random.default_rng(0)
+
+    df = calculate_indicators(make_ohlcv(args.bars)).dropna()
+    single = TradingEnv(env_config={"df": df, "initial_balance": 10000.0, "window_size": args.window_size})
+    single_us = per_step_us(single, rng.integers(0, 3, 256).tolist(), args.steps)
+    print(f"TradingEnv (1 asset, {df.shape[1]} features): {single_us:.1f} us/step")
+
+    print(f"\n{'assets':>7} {'obs size':>9} {'build s':>8} {'us/step':>9} {'us/asset':>9} {'vs 1 asset':>11} {'vs N TradingEnv':>16}")
+    base_us = None
+    for n_assets in args.assets:
+        data = make_panel(n_assets, args.bars)
+        start = time.perf_counter()
+        env = PortfolioTradingEnv({"data": data, "initial_balance": 10000.0, "window_size": args.window_size})
+        build = time.perf_counter() - start
+        step_us = per_step_us(env, rng.uniform(-1, 1, (256, n_assets)).astype(np.float32), args.steps)
+        base_us = base_us or step_us
+        print(f"{n_assets:>7} {env.observation_space.shape[0]:>9} {build:>8.2f} {step_us:>9.1f} "
+              f"{step_us / n_assets:>9.2f} {step_us / base_us:>10.1f}x {n_assets * single_us / step_us:>15.0f}x")
+
+
+if __name__ == "__main__":
+    main()
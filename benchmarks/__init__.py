@@ -0,0 +1 @@
+"""Standing performance benchmark suite. See ``benchmarks.runner``."""
@@ -0,0 +1,33 @@
+"""
+Benchmarks for StrategyAgent.learn with uniform and prioritized replay.
+
+Each learn call samples one mini-batch from a buffer pre-filled with random
+transitions and takes one gradient step.
+"""
+import torch
+
+from benchmarks.runner import benchmark
+from benchmarks.synthetic import make_transitions
+from reinforcestrategycreator.rl_agent import StrategyAgent
+
+STATE_SIZE = 212  # window_size=10 observation of the benchmark environment
+
+
+def make_agent(use_prioritized_replay: bool) -> StrategyAgent:
+    torch.manual_seed(0)
+    torch.set_num_threads(1)
+    agent = StrategyAgent(state_size=STATE_SIZE, action_size=3, memory_size=2000, batch_size=32,
+                          use_prioritized_replay=use_prioritized_replay)
+    for transition in make_transitions(2000, STATE_SIZE):
+        agent.remember(*transition)
+    return agent
+
+
+@benchmark("agent.learn_uniform")
+def agent_learn_uniform():
+    return make_agent(use_prioritized_replay=False).learn
+
+
+@benchmark("agent.learn_per")
+def agent_learn_per():
+    return make_agent(use_prioritized_replay=True).learn
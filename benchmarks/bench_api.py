@@ -0,0 +1,85 @@
+"""
+Benchmarks for the API list endpoints against an in-memory SQLite database.
+
+The database holds 20 runs of 50 episodes each; episode 1 has 1000 steps.
+Requests go through FastAPI's TestClient with the DB and API key
+dependencies overridden, so no server or Postgres is needed.
+"""
+import datetime
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from benchmarks.runner import benchmark
+from reinforcestrategycreator.api.dependencies import get_api_key, get_db
+from reinforcestrategycreator.api.main import app
+from reinforcestrategycreator.db_models import Base, Episode, Step, TrainingRun
+
+N_RUNS, N_EPISODES, N_STEPS = 20, 50, 1000
+_client = None
+
+
+def get_client() -> TestClient:
+    """Builds the populated database and the client once for all API benchmarks."""
+    global _client
+    if _client is not None:
+        return _client
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    start = datetime.datetime(2024, 1, 1)
+    with session_factory() as session:
+        for r in range(N_RUNS):
+            run_id = f"RUN-{r:03d}"
+            session.add(TrainingRun(run_id=run_id, start_time=start + datetime.timedelta(days=r), status="completed"))
+            session.add_all([
+                Episode(run_id=run_id, rllib_episode_id=f"{run_id}-{e}", status="completed",
+                        start_time=start, pnl=float(e), total_reward=float(e), total_steps=N_STEPS)
+                for e in range(N_EPISODES)
+            ])
+        session.flush()
+        session.add_all([
+            Step(episode_id=1, timestamp=start + datetime.timedelta(minutes=t), portfolio_value=10000.0 + t,
+                 reward=0.0, asset_price=100.0, action="hold", position="flat")
+            for t in range(N_STEPS)
+        ])
+        session.commit()
+
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_api_key] = lambda: "benchmark"
+    _client = TestClient(app)
+    return _client
+
+
+def get(path: str):
+    client = get_client()
+
+    def request():
+        response = client.get(path)
+        response.raise_for_status()
+    return request
+
+
+@benchmark("api.list_runs")
+def api_list_runs():
+    return get("/api/v1/runs/?page_size=20")
+
+
+@benchmark("api.list_run_episodes")
+def api_list_run_episodes():
+    return get("/api/v1/runs/RUN-000/episodes/?page_size=50")
+
+
+@benchmark("api.list_episode_steps")
+def api_list_episode_steps():
+    return get("/api/v1/episodes/1/steps/?page_size=100")
@@ -0,0 +1,76 @@
+"""
+Benchmarks for TradingEnv, PortfolioTradingEnv and the technical indicators.
+
+The environment runs on a 2000-bar synthetic series with the indicator
+columns from ``calculate_indicators``, as in training. The portfolio
+environment runs on synthetic OHLCV bars for 10 and 500 assets.
+"""
+import numpy as np
+
+from benchmarks.runner import benchmark
+from benchmarks.synthetic import make_ohlcv, make_panel
+from reinforcestrategycreator.portfolio_environment import PortfolioTradingEnv
+from reinforcestrategycreator.technical_analyzer import calculate_indicators
+from reinforcestrategycreator.trading_environment import TradingEnv
+
+
+def make_env(n_rows: int = 2000) -> TradingEnv:
+    df = calculate_indicators(make_ohlcv(n_rows)).dropna()
+    env = TradingEnv(env_config={"df": df, "initial_balance": 10000.0, "window_size": 10})
+    env.reset(seed=0)
+    return env
+
+
+@benchmark("env.reset")
+def env_reset():
+    env = make_env()
+    return lambda: env.reset(seed=0)
+
+
+@benchmark("env.step")
+def env_step():
+    env = make_env()
+    actions = iter(np.random.default_rng(0).integers(0, 3, 1 << 24).tolist())
+
+    def step():
+        _, _, terminated, truncated, _ = env.step(next(actions))
+        if terminated or truncated:
+            env.reset(seed=0)
+    return step
+
+
+@benchmark("env.get_observation")
+def env_get_observation():
+    env = make_env()
+    for action in (1, 0, 0, 2, 0):
+        env.step(action)
+    return env._get_observation
+
+
+def portfolio_step(n_assets: int):
+    env = PortfolioTradingEnv({"data": make_panel(n_assets, 2000), "initial_balance": 10000.0, "window_size": 10})
+    env.reset(seed=0)
+    actions = np.random.default_rng(0).uniform(-1, 1, (256, n_assets)).astype(np.float32)
+    counter = iter(range(1 << 30))
+
+    def step():
+        _, _, terminated, truncated, _ = env.step(actions[next(counter) % len(actions)])
+        if terminated or truncated:
+            env.reset(seed=0)
+    return step
+
+
+@benchmark("env.portfolio_step_10")
+def env_portfolio_step_10():
+    return portfolio_step(10)
+
+
+@benchmark("env.portfolio_step_500")
+def env_portfolio_step_500():
+    return portfolio_step(500)
+
+
+@benchmark("indicators.calculate_indicators_2000")
+def indicators():
+    df = make_ohlcv(2000)
+    return lambda: calculate_indicators(df)
@@ -0,0 +1,67 @@
+"""
+Benchmarks for the pipeline DQN training step, EvaluationEngine backtests and
+synthetic bar generation (one million rows, 1000 symbols).
+"""
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.runner import benchmark
+from benchmarks.synthetic import make_ohlcv, make_transitions
+from reinforcestrategycreator_pipeline.src.data.synthetic_source import SyntheticDataSource
+from reinforcestrategycreator_pipeline.src.evaluation.engine import EvaluationEngine
+from reinforcestrategycreator_pipeline.src.models.implementations.dqn import DQN
+
+N_FEATURES = 8
+
+
+def make_dqn(input_dim: int) -> DQN:
+    np.random.seed(0)
+    model = DQN({"hyperparameters": {"hidden_layers": [64, 64]}, "hidden_dims": [64, 64]})
+    model.build(input_shape=(input_dim,), output_shape=(3,))
+    return model
+
+
+def make_backtest_data(n_rows: int = 5000) -> pd.DataFrame:
+    """Close prices near 1.0 plus random features, as in bench_evaluation_backtest."""
+    data = make_ohlcv(n_rows)[["close"]].rename(columns={"close": "Close"}) / 100.0
+    rng = np.random.default_rng(1)
+    for i in range(N_FEATURES - 1):
+        data[f"feature_{i}"] = rng.standard_normal(n_rows)
+    return data
+
+
+@benchmark("pipeline.dqn_train_step")
+def dqn_train_step():
+    model = make_dqn(N_FEATURES)
+    for transition in make_transitions(2000, N_FEATURES):
+        model.replay_buffer.push(*transition)
+    return lambda: model._train_step(32, 0.99)
+
+
+def make_engine() -> EvaluationEngine:
+    return EvaluationEngine(model_registry=MagicMock(), data_manager=MagicMock(), artifact_store=MagicMock())
+
+
+@benchmark("pipeline.backtest_sequential_5000")
+def backtest_sequential():
+    data = make_backtest_data()
+    model, engine = make_dqn(data.shape[1]), make_engine()
+    return lambda: engine._run_sequential_backtest(model, data, 100000.0)
+
+
+@benchmark("pipeline.backtest_batched_5000")
+def backtest_batched():
+    data = make_backtest_data()
+    model, engine = make_dqn(data.shape[1]), make_engine()
+    return lambda: engine._run_batched_backtest(model, data, 100000.0)
+
+
+@benchmark("pipeline.synthetic_bars_1m")
+def synthetic_bars():
+    source = SyntheticDataSource("benchmark", {
+        "symbols": 1000, "n_bars": 1000, "seed": 0,
+        "regimes": [{"drift": 0.0005, "volatility": 0.01}, {"drift": -0.001, "volatility": 0.03}]
+    })
+    return lambda: sum(len(chunk) for chunk in source.iter_chunks())
@@ -0,0 +1,311 @@
+"""
+Benchmark Runner Module
+
+A small asv-style harness for the standing benchmark suite. Benchmarks are
+registered with the ``benchmark`` decorator on a setup function that builds
+its inputs and returns the zero-argument callable to time. The runner
+calibrates how many calls make up one sample, collects several samples and
+stores per-call statistics in one JSON file per commit. ``compare`` reads two
+result files and flags benchmarks that got slower than a threshold.
+
+Usage (from the repository root):
+    python -m benchmarks run
+    python -m benchmarks run --filter env. --repeat 7
+    python -m benchmarks compare <base-commit> <head-commit> --threshold 0.1
+"""
+import argparse
+import datetime
+import gc
+import importlib
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(PROJECT_ROOT, "benchmarks", "results")
+BENCHMARK_MODULES = [
+    "benchmarks.bench_environment",
+    "benchmarks.bench_agent",
+    "benchmarks.bench_pipeline",
+    "benchmarks.bench_api",
+]
+STATS = ("median", "min", "mean", "stdev")
+
+_REGISTRY: Dict[str, Callable[[], Callable[[], Any]]] = {}
+
+
+def benchmark(name: str) -> Callable:
+    """
+    Registers a benchmark setup function under a dotted name.
+
+    The decorated function is called once per run (untimed) and must return
+    the callable whose per-call time is measured.
+    """
+    def decorator(setup: Callable[[], Callable[[], Any]]) -> Callable[[], Callable[[], Any]]:
+        if name in _REGISTRY:
+            raise ValueError(f"Benchmark '{name}' is already registered")
+        _REGISTRY[name] = setup
+        return setup
+    return decorator
+
+
+def discover(modules: Optional[List[str]] = None) -> Dict[str, Callable[[], Callable[[], Any]]]:
+    """Imports the benchmark modules and returns the registry, sorted by name."""
+    for module in modules or BENCHMARK_MODULES:
+        importlib.import_module(module)
+    return dict(sorted(_REGISTRY.items()))
+
+
+def time_callable(fn: Callable[[], Any], repeat: int = 5, min_time: float = 0.2) -> Dict[str, Any]:
+    """
+    Measures the per-call time of a callable.
+
+    Args:
+        fn (Callable): The callable to time.
+        repeat (int): Number of samples to collect.
+        min_time (float): Minimum duration of one sample in seconds. The number of
+            calls per sample is doubled until a sample takes at least this long.
+
+    Returns:
+        Dict[str, Any]: 'median', 'min', 'mean' and 'stdev' seconds per call,
+            'number' (calls per sample), 'repeat' and the raw 'samples'.
+    """
+    fn()  # warm-up: lazy imports, caches, allocator
+    gc_was_enabled = gc.isenabled()
+    gc.disable()  # as in timeit, so collection pauses do not land in random samples
+    try:
+        number = 1
+        while number < 1 << 20:
+            start = time.perf_counter()
+            for _ in range(number):
+                fn()
+            if time.perf_counter() - start >= min_time:
+                break
+            number *= 2
+
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(number):
+                fn()
+            samples.append((time.perf_counter() - start) / number)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    return {
+        "median": statistics.median(samples),
+        "min": min(samples),
+        "mean": statistics.fmean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "number": number,
+        "repeat": len(samples),
+        "samples": samples,
+    }
+
+
+def run_benchmarks(name_filter: Optional[str] = None,
+                   repeat: int = 5,
+                   min_time: float = 0.2,
+                   modules: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Runs every registered benchmark whose name contains ``name_filter``.
+
+    A benchmark that raises is recorded with an 'error' entry instead of
+    aborting the run.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Statistics per benchmark name.
+    """
+    results = {}
+    for name, setup in discover(modules).items():
+        if name_filter and name_filter not in name:
+            continue
+        try:
+            results[name] = time_callable(setup(), repeat=repeat, min_time=min_time)
+        except Exception as e:
+            logging.getLogger(__name__).exception(f"Benchmark {name} failed")
+            results[name] = {"error": f"{type(e).__name__}: {e}"}
+    return results
+
+
+def git_commit(cwd: str = PROJECT_ROOT) -> str:
+    """Short hash of HEAD, suffixed with '-dirty' if tracked files are modified."""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short=12", "HEAD"], cwd=cwd,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        status = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=cwd,
+                                capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{commit}-dirty" if status else commit
+
+
+def machine_info() -> Dict[str, Any]:
+    """Describes the machine so results from different hosts are not compared blindly."""
+    import numpy as np
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+    }
+
+
+def save_results(results: Dict[str, Dict[str, Any]], commit: str, output_dir: str = RESULTS_DIR) -> str:
+    """
+    Writes the results of one run to ``<output_dir>/<commit>.json``.
+
+    Returns:
+        str: Path of the written file.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    path = os.path.join(output_dir, f"{commit}.json")
+    document = {
+        "commit": commit,
+        "timestamp": datetime.datetime.now().isoformat(),
+        "machine": machine_info(),
+        "benchmarks": results,
+    }
+    with open(path, "w") as f:
+        json.dump(document, f, indent=2)
+    return path
+
+
+def load_results(ref: str, results_dir: str = RESULTS_DIR) -> Dict[str, Any]:
+    """Loads a result file given its path or a commit id stored in ``results_dir``."""
+    path = ref if os.path.isfile(ref) else os.path.join(results_dir, f"{ref}.json")
+    if not os.path.isfile(path):
+        matches = sorted(f for f in os.listdir(results_dir) if f.startswith(ref)) if os.path.isdir(results_dir) else []
+        if len(matches) != 1:
+            raise FileNotFoundError(f"No unique benchmark result for '{ref}' in {results_dir}")
+        path = os.path.join(results_dir, matches[0])
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def compare_results(base: Dict[str, Any], head: Dict[str, Any],
+                    threshold: float = 0.1, stat: str = "median") -> List[Dict[str, Any]]:
+    """
+    Compares two result documents benchmark by benchmark.
+
+    Args:
+        base (Dict[str, Any]): Result document of the reference commit.
+        head (Dict[str, Any]): Result document of the commit under test.
+        threshold (float): Relative slowdown above which a benchmark is a regression
+            (0.1 flags anything more than 10% slower). Equally large speed-ups are
+            reported as improvements.
+        stat (str): Statistic to compare, one of STATS.
+
+    Returns:
+        List[Dict[str, Any]]: One row per benchmark with 'name', 'base', 'head',
+            'ratio' (head / base) and 'status' ('regression', 'improved', 'ok',
+            'added', 'removed' or 'failed').
+    """
+    if stat not in STATS:
+        raise ValueError(f"Unknown statistic '{stat}'. Expected one of {STATS}")
+
+    base_results, head_results = base["benchmarks"], head["benchmarks"]
+    rows = []
+    for name in sorted(set(base_results) | set(head_results)):
+        old, new = base_results.get(name), head_results.get(name)
+        row = {"name": name, "base": None, "head": None, "ratio": None}
+        if new is None:
+            row["status"] = "removed"
+        elif old is None:
+            row["status"] = "added"
+            row["head"] = new.get(stat)
+        elif "error" in new or "error" in old:
+            row["status"] = "failed"
+        else:
+            row["base"], row["head"] = old[stat], new[stat]
+            row["ratio"] = new[stat] / old[stat] if old[stat] > 0 else float("inf")
+            if row["ratio"] > 1.0 + threshold:
+                row["status"] = "regression"
+            elif row["ratio"] < 1.0 / (1.0 + threshold):
+                row["status"] = "improved"
+            else:
+                row["status"] = "ok"
+        rows.append(row)
+    return rows
+
+
+def format_seconds(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "-"
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run the suite and store the results for the current commit")
+    run_parser.add_argument("--filter", default=None, help="Only run benchmarks whose name contains this string")
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.add_argument("--min-time", type=float, default=0.2, help="Minimum seconds per sample")
+    run_parser.add_argument("--output-dir", default=RESULTS_DIR)
+    run_parser.add_argument("--commit", default=None, help="Name of the result file (default: current git commit)")
+
+    subparsers.add_parser("list", help="List the registered benchmarks")
+
+    compare_parser = subparsers.add_parser("compare", help="Compare two stored results and flag regressions")
+    compare_parser.add_argument("base", help="Commit id or result file of the reference run")
+    compare_parser.add_argument("head", help="Commit id or result file of the run under test")
+    compare_parser.add_argument("--threshold", type=float, default=0.1, help="Relative slowdown that counts as a regression")
+    compare_parser.add_argument("--stat", choices=STATS, default="median")
+    compare_parser.add_argument("--results-dir", default=RESULTS_DIR)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "list":
+        for name in discover():
+            print(name)
+        return 0
+
+    if args.command == "run":
+        logging.disable(logging.ERROR)
+        commit = args.commit or git_commit()
+        results = run_benchmarks(args.filter, repeat=args.repeat, min_time=args.min_time)
+        print(f"{'benchmark':<40} {'median':>10} {'min':>10} {'stdev':>10} {'calls':>8}")
+        for name, result in results.items():
+            if "error" in result:
+                print(f"{name:<40} {'error: ' + result['error']}")
+                continue
+            print(f"{name:<40} {format_seconds(result['median']):>10} {format_seconds(result['min']):>10} "
+                  f"{format_seconds(result['stdev']):>10} {result['number'] * result['repeat']:>8}")
+        print(f"\nResults written to {save_results(results, commit, args.output_dir)}")
+        return 0
+
+    base = load_results(args.base, args.results_dir)
+    head = load_results(args.head, args.results_dir)
+    if base.get("machine") != head.get("machine"):
+        print("warning: results come from different machines or environments", file=sys.stderr)
+    rows = compare_results(base, head, threshold=args.threshold, stat=args.stat)
+
+    print(f"{base['commit']} -> {head['commit']} ({args.stat}, threshold {args.threshold:.0%})")
+    print(f"{'benchmark':<40} {'base':>10} {'head':>10} {'ratio':>7}  status")
+    for row in rows:
+        ratio = f"{row['ratio']:.2f}x" if row["ratio"] is not None else "-"
+        print(f"{row['name']:<40} {format_seconds(row['base']):>10} {format_seconds(row['head']):>10} {ratio:>7}  {row['status']}")
+
+    regressions = [row["name"] for row in rows if row["status"] == "regression"]
+    if regressions:
+        print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,43 @@
+"""
+Synthetic Data Module
+
+Deterministic market data for the benchmark suite, so benchmarks run offline
+and produce comparable timings across commits.
+"""
+import numpy as np
+import pandas as pd
+
+from reinforcestrategycreator_pipeline.src.data.synthetic_source import SyntheticDataSource
+
+
+def make_ohlcv(n_rows: int = 2000, seed: int = 0) -> pd.DataFrame:
+    """
+    Creates daily OHLCV bars for one symbol with the pipeline's SyntheticDataSource.
+
+    Args:
+        n_rows (int): Number of bars.
+        seed (int): Random seed.
+
+    Returns:
+        pd.DataFrame: Columns 'open', 'high', 'low', 'close' and 'volume' on a daily index.
+    """
+    source = SyntheticDataSource("benchmark", {"n_bars": n_rows, "start_date": "2015-01-01", "seed": seed})
+    return source.load_data(symbol=source.symbols[0])
+
+
+def make_panel(n_assets: int, n_rows: int = 2000, seed: int = 0) -> pd.DataFrame:
+    """Long-format OHLCV bars for ``n_assets`` symbols on a common daily index, as PortfolioTradingEnv takes them."""
+    source = SyntheticDataSource("benchmark", {
+        "symbols": n_assets, "n_bars": n_rows, "start_date": "2015-01-01", "seed": seed
+    })
+    return source.load_data()
+
+
+def make_transitions(n: int, state_size: int, seed: int = 0):
+    """Random (state, action, reward, next_state, done) tuples for filling replay buffers."""
+    rng = np.random.default_rng(seed)
+    states = rng.standard_normal((n + 1, state_size)).astype(np.float32)
+    actions = rng.integers(0, 3, n)
+    rewards = rng.standard_normal(n)
+    dones = rng.random(n) < 0.01
+    return [(states[i], int(actions[i]), float(rewards[i]), states[i + 1], bool(dones[i])) for i in range(n)]
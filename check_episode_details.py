@@ -1,7 +1,8 @@
 import argparse
 import logging
+import numpy as np
 from sqlalchemy.orm import sessionmaker
-from reinforcestrategycreator.db_models import Episode  # Assuming Episode model is in db_models
+from reinforcestrategycreator.analytics import episode_columns
 from reinforcestrategycreator.db_utils import get_db_session # For database session
 from datetime import datetime
 
@@ -14,29 +15,31 @@ def get_episode_details(db_session, run_id_to_check: str):
     """
     logging.info(f"Querying episode details for run_id: {run_id_to_check}")
 
-    episodes = db_session.query(Episode).filter(Episode.run_id == run_id_to_check).all()
+    key_columns = [
+        'rllib_episode_id', 'start_time', 'end_time', 
+        'initial_portfolio_value', 'final_portfolio_value', 'status', 'pnl', 
+        'sharpe_ratio', 'max_drawdown', 'total_reward', 'total_steps', 'win_rate'
+    ]
+    # Only the checked columns are selected, one array per column
+    episodes = episode_columns(db_session, run_id_to_check, ['episode_id'] + key_columns)
+    n_episodes = len(episodes['episode_id'])
 
-    if not episodes:
+    if not n_episodes:
         logging.warning(f"No episodes found for run_id: {run_id_to_check}")
         print(f"No episodes found for run_id: {run_id_to_check}")
         return False
 
-    logging.info(f"Found {len(episodes)} episodes for run_id {run_id_to_check}.")
+    logging.info(f"Found {n_episodes} episodes for run_id {run_id_to_check}.")
     print(f"\nDetails for episodes with run_id: {run_id_to_check}")
     
     all_filled = True
-    key_columns = [
-        'rllib_episode_id', 'start_time', 'end_time', 
-        'initial_portfolio_value', 'final_portfolio_value', 'status', 'pnl', 
-        'sharpe_ratio', 'max_drawdown', 'total_reward', 'total_steps', 'win_rate'
-    ]
 
-    for i, episode in enumerate(episodes):
-        print(f"\n--- Episode {i+1} (DB ID: {episode.episode_id}) ---")
+    for i in range(n_episodes):
+        print(f"\n--- Episode {i+1} (DB ID: {int(episodes['episode_id'][i])}) ---")
         episode_all_filled = True
         for col in key_columns:
-            value = getattr(episode, col, 'N/A')
-            if value is None:
+            value = episodes[col][i]
+            if value is None or (isinstance(value, float) and np.isnan(value)):
                 print(f"  {col}: NULL (MISSING!)")
                 all_filled = False
                 episode_all_filled = False
@@ -1,9 +1,7 @@
 import pandas as pd
 import numpy as np
 import logging
-from typing import List, Dict, Any
-from sklearn.cluster import KMeans
-from sklearn.preprocessing import StandardScaler
+from typing import List, Dict, Any, Optional
 
 def analyze_decision_making(steps_df: pd.DataFrame) -> Dict[str, Any]:
     """
@@ -188,6 +186,10 @@ def analyze_decision_making(steps_df: pd.DataFrame) -> Dict[str, Any]:
             features_df = features_df.dropna() # Drop rows if asset_price or action is NaN
 
             if not features_df.empty:
+                # sklearn adds about a second to dashboard startup, so import it only when clustering
+                from sklearn.cluster import KMeans
+                from sklearn.preprocessing import StandardScaler
+
                 # Standardize features
                 scaler = StandardScaler()
                 features_scaled = scaler.fit_transform(features_df)
@@ -496,8 +498,12 @@ def generate_episode_summary(findings: Dict[str, Any]) -> str:
     
     return " ".join(summary_points)
 
-def calculate_additional_metrics(steps_df: pd.DataFrame, trades: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Calculate additional performance metrics not already provided by the API."""
+def calculate_additional_metrics(steps_df: pd.DataFrame, trades: List[Dict[str, Any]], series: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Calculate additional performance metrics not already provided by the API.
+
+    Portfolio stats come from the exact statistics of the persisted episode
+    series when it is given, and are only recomputed from steps_df otherwise.
+    """
     metrics = {}
     
     # Calculate position holding stats
@@ -524,8 +530,19 @@ def calculate_additional_metrics(steps_df: pd.DataFrame, trades: List[Dict[str,
                 else:
                     metrics['short_win_rate'] = 0
     
+    if series is not None:
+        metrics['volatility'] = series['return_std'] * 100  # as percentage
+        downside_deviation = series['downside_std']
+        if downside_deviation:
+            metrics['sortino_ratio'] = series['mean_return'] / downside_deviation
+        else:
+            metrics['sortino_ratio'] = float('inf')  # No negative returns
+        if series['max_drawdown'] > 0:
+            metrics['calmar_ratio'] = series['total_return'] / series['max_drawdown']
+        else:
+            metrics['calmar_ratio'] = float('inf')  # No drawdown
     # Calculate portfolio stats from steps data
-    if not steps_df.empty and 'portfolio_value' in steps_df.columns:
+    elif not steps_df.empty and 'portfolio_value' in steps_df.columns:
         portfolio_values = steps_df['portfolio_value'].values
         returns = np.diff(portfolio_values) / portfolio_values[:-1]
         
@@ -139,6 +139,15 @@ def fetch_episode_steps(episode_id: int) -> pd.DataFrame:
 
     return df.sort_index()
 
+def fetch_episode_series(episode_id: int) -> Optional[Dict[str, Any]]:
+    """Fetches the downsampled equity/drawdown series persisted for an episode, if any."""
+    data = fetch_api_data(f"/episodes/{episode_id}/series/")
+    if not data:
+        return None
+    for name in ("step", "equity", "drawdown"):
+        data[name] = np.asarray(data[name])
+    return data
+
 def fetch_episode_trades(episode_id: int) -> List[Dict[str, Any]]:
     """Fetches all trades for a given episode."""
     trades_list = []
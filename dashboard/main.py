@@ -11,7 +11,7 @@ from typing import List, Dict, Any
 from dashboard.api import (
     fetch_latest_run, fetch_run_summary, fetch_run_episodes,
     fetch_episode_steps, fetch_episode_trades, fetch_episode_operations,
-    fetch_episode_model
+    fetch_episode_model, fetch_episode_series
 )
 from dashboard.analysis import (
     analyze_decision_making, analyze_why_episode_performed,
@@ -157,10 +157,11 @@ def main():
                 steps_df = fetch_episode_steps(selected_episode_id)
                 trades = fetch_episode_trades(selected_episode_id)
                 operations = fetch_episode_operations(selected_episode_id)
+                series = fetch_episode_series(selected_episode_id) # None for episodes logged without a series
                 # model_data = fetch_episode_model(selected_episode_id) # Removed from here
 
                 # Calculate additional metrics
-                additional_metrics = calculate_additional_metrics(steps_df, trades)
+                additional_metrics = calculate_additional_metrics(steps_df, trades, series)
                 
                 # Display episode metrics
                 st.subheader(f"Episode {selected_episode_id} Performance")
@@ -188,7 +189,7 @@ def main():
                     st.info("No trading operations found for this episode.")
                 
                 # Drawdown Chart
-                fig_drawdown = create_drawdown_chart(steps_df, template=plot_template)
+                fig_drawdown = create_drawdown_chart(steps_df, template=plot_template, series=series)
                 if fig_drawdown:
                     st.plotly_chart(fig_drawdown, use_container_width=True)
                 
@@ -96,27 +96,35 @@ def create_price_operations_chart(steps_df: pd.DataFrame, operations: List[Dict[
 
     return fig, markers_plotted
 
-def create_drawdown_chart(steps_df: pd.DataFrame, template="plotly_dark") -> Optional[go.Figure]:
-    """Creates a Drawdown chart based on portfolio values."""
-    if steps_df.empty or 'portfolio_value' not in steps_df.columns:
-        return None
-    
-    # Calculate drawdowns
-    portfolio_values = steps_df['portfolio_value'].values
-    peak = portfolio_values[0]
-    drawdowns = []
-    
-    for value in portfolio_values:
-        if value > peak:
-            peak = value
-        drawdown_pct = (peak - value) / peak * 100 if peak > 0 else 0
-        drawdowns.append(drawdown_pct)
+def create_drawdown_chart(steps_df: pd.DataFrame, template="plotly_dark", series: Optional[Dict[str, Any]] = None) -> Optional[go.Figure]:
+    """Creates a Drawdown chart from the persisted episode series, or else from the step portfolio values."""
+    if series is not None:
+        # Series drawdowns are fractions at downsampled step indices
+        x_values = series['step']
+        drawdowns = np.asarray(series['drawdown']) * 100
+        xaxis_title = "Step"
+    else:
+        if steps_df.empty or 'portfolio_value' not in steps_df.columns:
+            return None
+        
+        # Calculate drawdowns
+        portfolio_values = steps_df['portfolio_value'].values
+        peak = portfolio_values[0]
+        drawdowns = []
+        
+        for value in portfolio_values:
+            if value > peak:
+                peak = value
+            drawdown_pct = (peak - value) / peak * 100 if peak > 0 else 0
+            drawdowns.append(drawdown_pct)
+        x_values = steps_df.index
+        xaxis_title = "Time"
     
     # Create figure
     fig = go.Figure()
     
     fig.add_trace(go.Scatter(
-        x=steps_df.index,
+        x=x_values,
         y=drawdowns,
         fill='tozeroy',
         mode='lines',
@@ -126,7 +134,7 @@ def create_drawdown_chart(steps_df: pd.DataFrame, template="plotly_dark") -> Opt
     
     fig.update_layout(
         title="Portfolio Drawdown Over Time",
-        xaxis_title="Time",
+        xaxis_title=xaxis_title,
         yaxis_title="Drawdown (%)",
         yaxis=dict(tickformat='.2f', ticksuffix='%'),
         height=400,
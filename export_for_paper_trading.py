@@ -23,6 +23,7 @@ from ray.tune.registry import register_env
 
 # Import project-specific modules
 from reinforcestrategycreator.trading_environment import TradingEnv
+from reinforcestrategycreator.inference import export_inference_artifact
 
 # Configure logging
 logging.basicConfig(
@@ -140,6 +141,37 @@ def load_best_model() -> tuple:
     # Load the checkpoint
     algo.restore(latest_checkpoint)
     
+    return algo, best_config
+
+def build_q_network(model_architecture: Dict[str, Any]) -> torch.nn.Module:
+    """
+    Build the fully connected Q-network described by the exported architecture.
+    
+    Args:
+        model_architecture: Dict with fcnet_hiddens, fcnet_activation,
+            observation_space and action_space
+        
+    Returns:
+        PyTorch model
+    """
+    activation_map = {
+        "relu": torch.nn.ReLU,
+        "tanh": torch.nn.Tanh,
+        "sigmoid": torch.nn.Sigmoid
+    }
+    activation_fn = activation_map.get(model_architecture["fcnet_activation"], torch.nn.ReLU)
+    
+    layers = []
+    prev_layer_size = model_architecture["observation_space"][0]
+    for size in model_architecture["fcnet_hiddens"]:
+        layers.append(torch.nn.Linear(prev_layer_size, size))
+        layers.append(activation_fn())
+        prev_layer_size = size
+    
+    # Output layer
+    layers.append(torch.nn.Linear(prev_layer_size, model_architecture["action_space"]))
+    return torch.nn.Sequential(*layers)
+
 def export_model_for_inference(algo: DQN, config: Dict[str, Any]) -> str:
     """
     Export the model in a format suitable for inference.
@@ -184,6 +216,18 @@ def export_model_for_inference(algo: DQN, config: Dict[str, Any]) -> str:
         with open(os.path.join(export_path, "model_architecture.json"), "w") as f:
             json.dump(model_config, f, indent=4)
         
+        # Rebuild the network once here and serialize it, so inference hosts load a
+        # TorchScript artifact and need neither this code nor Ray/RLlib
+        q_network = build_q_network(model_config)
+        q_network.load_state_dict(torch.load(model_path))
+        export_inference_artifact(
+            q_network,
+            input_dim=model_config["observation_space"][0],
+            export_dir=export_path,
+            fmt="torchscript",
+            metadata={"export_timestamp": timestamp, "model_type": "DQN"}
+        )
+        
         # Export environment configuration
         env_config = config["env_config"].copy()
         
@@ -234,91 +278,45 @@ def create_inference_module(export_path: str) -> None:
     inference_code = """
 import os
 import json
-import torch
 import numpy as np
-import pandas as pd
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List
+
+from reinforcestrategycreator.inference import InferenceRuntime
 
 class TradingModelInference:
-    def __init__(self, model_dir: str):
+    def __init__(self, model_dir: str, num_threads: int = 1, max_batch_size: int = 256):
         \"\"\"
-        Initialize the inference model.
+        Initialize the inference model from the exported TorchScript artifact.
         
         Args:
             model_dir: Directory containing the exported model
+            num_threads: Intra-op threads used for inference
+            max_batch_size: Rows of the preallocated input buffer
         \"\"\"
         self.model_dir = model_dir
         
-        # Load model architecture
-        with open(os.path.join(model_dir, "model_architecture.json"), "r") as f:
-            self.model_architecture = json.load(f)
-        
         # Load environment configuration
         with open(os.path.join(model_dir, "env_config.json"), "r") as f:
             self.env_config = json.load(f)
         
-        # Load model weights
-        self.model = self._build_model()
-        self.model.load_state_dict(torch.load(os.path.join(model_dir, "model.pt")))
-        self.model.eval()  # Set to evaluation mode
+        # Load the serialized network; no model code or Ray/RLlib is needed
+        self.runtime = InferenceRuntime(model_dir, num_threads=num_threads, max_batch_size=max_batch_size)
         
         # Load metadata
         with open(os.path.join(model_dir, "metadata.json"), "r") as f:
             self.metadata = json.load(f)
     
-    def _build_model(self) -> torch.nn.Module:
+    def preprocess_observation(self, observation: Dict[str, Any]) -> np.ndarray:
         \"\"\"
-        Build the PyTorch model based on the architecture.
-        
-        Returns:
-            PyTorch model
-        \"\"\"
-        # Extract architecture parameters
-        fcnet_hiddens = self.model_architecture["fcnet_hiddens"]
-        fcnet_activation = self.model_architecture["fcnet_activation"]
-        input_dim = self.model_architecture["observation_space"][0]
-        output_dim = self.model_architecture["action_space"]
-        
-        # Map activation function
-        activation_map = {
-            "relu": torch.nn.ReLU,
-            "tanh": torch.nn.Tanh,
-            "sigmoid": torch.nn.Sigmoid
-        }
-        activation_fn = activation_map.get(fcnet_activation, torch.nn.ReLU)
-        
-        # Build layers
-        layers = []
-        prev_layer_size = input_dim
-        
-        for size in fcnet_hiddens:
-            layers.append(torch.nn.Linear(prev_layer_size, size))
-            layers.append(activation_fn())
-            prev_layer_size = size
-        
-        # Output layer
-        layers.append(torch.nn.Linear(prev_layer_size, output_dim))
-        
-        # Create sequential model
-        return torch.nn.Sequential(*layers)
-    
-    def preprocess_observation(self, observation: Dict[str, Any]) -> torch.Tensor:
-        \"\"\"
-        Preprocess the observation for model input.
+        Flatten the observation dictionary into a model input row.
         
         Args:
             observation: Raw observation dictionary
             
         Returns:
-            Preprocessed observation tensor
+            Float32 observation array
         \"\"\"
-        # Convert to numpy array
-        obs_array = np.array(list(observation.values()), dtype=np.float32)
-        
-        # Convert to PyTorch tensor
-        obs_tensor = torch.tensor(obs_array, dtype=torch.float32).unsqueeze(0)  # Add batch dimension
-        
-        return obs_tensor
+        return self.runtime.observation_to_array(observation)
     
     def predict(self, observation: Dict[str, Any]) -> int:
         \"\"\"
@@ -330,15 +328,19 @@ class TradingModelInference:
         Returns:
             Predicted action (0: hold, 1: buy, 2: sell)
         \"\"\"
-        # Preprocess observation
-        obs_tensor = self.preprocess_observation(observation)
-        
-        # Get model prediction
-        with torch.no_grad():
-            q_values = self.model(obs_tensor)
-            action = torch.argmax(q_values, dim=1).item()
+        return self.runtime.predict(observation)
+    
+    def predict_batch(self, observations: np.ndarray) -> np.ndarray:
+        \"\"\"
+        Predict actions for a batch of flat observations.
         
-        return action
+        Args:
+            observations: Array of shape (n, n_features)
+            
+        Returns:
+            Array of n predicted actions
+        \"\"\"
+        return self.runtime.predict_batch(observations)
     
     def get_action_probabilities(self, observation: Dict[str, Any]) -> List[float]:
         \"\"\"
@@ -350,23 +352,14 @@ class TradingModelInference:
         Returns:
             List of action probabilities [p_hold, p_buy, p_sell]
         \"\"\"
-        # Preprocess observation
-        obs_tensor = self.preprocess_observation(observation)
-        
-        # Get model prediction
-        with torch.no_grad():
-            q_values = self.model(obs_tensor)
-            # Convert to probabilities using softmax
-            probs = torch.nn.functional.softmax(q_values, dim=1).squeeze().tolist()
-        
-        return probs
+        return self.runtime.action_probabilities(observation).tolist()
 """
     
     with open(os.path.join(export_path, "inference.py"), "w") as f:
         f.write(inference_code.strip())
     
     logger.info(f"Inference module created at {os.path.join(export_path, 'inference.py')}")
-    return algo, best_config
+
 def create_ib_config_files() -> None:
     """Create configuration files for Interactive Brokers integration."""
     logger.info("Creating Interactive Brokers configuration files...")
@@ -2,10 +2,12 @@
 import os
 import json
 import pandas as pd
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine
 from sqlalchemy.exc import SQLAlchemyError
 from dotenv import load_dotenv
 
+from reinforcestrategycreator.analytics import episode_columns, run_summary
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -28,25 +30,13 @@ def get_episode_metrics(run_id):
 
         with engine.connect() as connection:
             # Select relevant metrics from the episodes table
-            query = text("""
-                SELECT
-                    episode_id,
-                    run_id,
-                    start_time,
-                    end_time,
-                    initial_portfolio_value,
-                    final_portfolio_value,
-                    pnl,
-                    sharpe_ratio,
-                    max_drawdown,
-                    total_reward,
-                    total_steps,
-                    win_rate
-                FROM episodes
-                WHERE run_id = :run_id
-                ORDER BY episode_id
-            """)
-            df = pd.read_sql_query(query, connection, params={'run_id': run_id})
+            columns = [
+                'episode_id', 'start_time', 'end_time', 'initial_portfolio_value',
+                'final_portfolio_value', 'pnl', 'sharpe_ratio', 'max_drawdown',
+                'total_reward', 'total_steps', 'win_rate'
+            ]
+            df = pd.DataFrame(episode_columns(connection, run_id, columns))
+            df.insert(1, 'run_id', run_id)
 
             if df.empty:
                 print(f"No episode data found for run_id: {run_id}")
@@ -69,6 +59,11 @@ def get_episode_metrics(run_id):
             avg_metrics = df[numeric_cols].mean()
             print(avg_metrics.to_string())
 
+            # Run-level aggregates over completed episodes, including drawdowns from the steps
+            print("\nRun Summary (completed episodes):")
+            for name, value in run_summary(connection, run_id).items():
+                print(f"{name:<20} {value:.4f}")
+
             return df
 
     except SQLAlchemyError as e:
@@ -14,7 +14,6 @@ import json
 import datetime
 import uuid
 import pandas as pd
-import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 from typing import Dict, List, Any, Tuple, Optional
@@ -26,7 +25,8 @@ from sqlalchemy import func, desc
 
 # Import project-specific modules
 from reinforcestrategycreator.db_utils import get_db_session
-from reinforcestrategycreator.db_models import Episode, TrainingRun, Step
+from reinforcestrategycreator.db_models import TrainingRun
+from reinforcestrategycreator.analytics import run_summary
 from reinforcestrategycreator.trading_environment import TradingEnv
 from reinforcestrategycreator.callbacks import DatabaseLoggingCallbacks
 
@@ -228,60 +228,15 @@ def get_episode_metrics(run_id: str) -> Dict[str, float]:
     
     try:
         with get_db_session() as db:
-            # Get all completed episodes for this run
-            episodes = db.query(Episode).filter(
-                Episode.run_id == run_id,
-                Episode.status == "completed"
-            ).all()
-            
-            if not episodes:
-                logger.warning(f"No completed episodes found for run_id {run_id}")
-                return metrics
-            
-            # Calculate PnL mean
-            pnl_values = [episode.pnl for episode in episodes if episode.pnl is not None]
-            if pnl_values:
-                metrics["pnl_mean"] = sum(pnl_values) / len(pnl_values)
-            
-            # Calculate win rate (episodes with positive PnL)
-            if pnl_values:
-                win_count = sum(1 for pnl in pnl_values if pnl > 0)
-                metrics["win_rate"] = win_count / len(pnl_values)
-            
-            # Calculate Sharpe ratio (simplified)
-            if pnl_values and len(pnl_values) > 1:
-                returns = np.array(pnl_values)
-                metrics["sharpe_ratio"] = np.mean(returns) / (np.std(returns) + 1e-6)
-            
-            # Calculate max drawdown
-            # For this, we need the portfolio value over time for each episode
-            # We'll take the average max drawdown across episodes
-            max_drawdowns = []
-            for episode in episodes:
-                # Get all steps for this episode
-                steps = db.query(Step).filter(
-                    Step.episode_id == episode.episode_id
-                ).order_by(Step.step_number).all()
-                
-                if steps:
-                    # Extract portfolio values
-                    portfolio_values = [step.portfolio_value for step in steps if step.portfolio_value is not None]
-                    
-                    if portfolio_values:
-                        # Calculate drawdown
-                        max_value = portfolio_values[0]
-                        max_drawdown = 0
-                        
-                        for value in portfolio_values:
-                            if value > max_value:
-                                max_value = value
-                            drawdown = (max_value - value) / max_value if max_value > 0 else 0
-                            max_drawdown = max(max_drawdown, drawdown)
-                        
-                        max_drawdowns.append(max_drawdown)
-            
-            if max_drawdowns:
-                metrics["max_drawdown"] = sum(max_drawdowns) / len(max_drawdowns)
+            summary = run_summary(db, run_id)
+    
+        if not summary["episodes"]:
+            logger.warning(f"No completed episodes found for run_id {run_id}")
+            return metrics
+        
+        # Drawdown is the mean of per-episode step drawdowns, computed in SQL
+        for key in metrics:
+            metrics[key] = summary[key]
     
     except Exception as e:
         logger.error(f"Error calculating metrics for run_id {run_id}: {e}", exc_info=True)
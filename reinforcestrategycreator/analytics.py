@@ -0,0 +1,340 @@
+"""
+Episode Analytics Module
+
+Computes per-episode and run-level analytics inside the database. Drawdowns
+are read from the series persisted at episode end (see episode_series.py);
+episodes logged without one fall back to a running peak over their steps
+(``max() OVER (PARTITION BY episode ORDER BY time)``). Aggregates are grouped
+server-side, so callers receive one compact array per metric instead of
+loading every Episode and Step ORM object.
+
+All functions accept either a SQLAlchemy ``Session`` or ``Connection`` and
+work on any backend with window-function support (PostgreSQL, SQLite 3.25+).
+"""
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+from sqlalchemy import Float, Integer, and_, case, func, select, union_all
+
+from .db_models import Episode, EpisodeSeries, OperationType, Step, TradingOperation
+from .episode_series import SERIES_ROWS, decode_series
+
+EPISODE_COLUMNS = (
+    'episode_id', 'rllib_episode_id', 'start_time', 'end_time',
+    'initial_portfolio_value', 'final_portfolio_value', 'status', 'pnl',
+    'sharpe_ratio', 'max_drawdown', 'total_reward', 'total_steps', 'win_rate'
+)
+
+SERIES_STATS = (
+    'n_steps', 'total_return', 'mean_return', 'return_std', 'downside_std',
+    'max_drawdown', 'max_drawdown_step', 'peak_value'
+)
+
+
+def _episode_filter(run_id: str, completed_only: bool):
+    """WHERE clause selecting the episodes of a run."""
+    condition = Episode.run_id == run_id
+    if completed_only:
+        condition = and_(condition, Episode.status == "completed")
+    return condition
+
+
+def _drawdown_subquery(run_id: str, completed_only: bool):
+    """Per-episode maximum drawdown from the persisted series, or else from the steps."""
+    running_peak = func.max(Step.portfolio_value).over(
+        partition_by=Step.episode_id,
+        order_by=(Step.timestamp, Step.step_id)
+    )
+    step_drawdowns = (
+        select(
+            Step.episode_id.label("episode_id"),
+            Step.portfolio_value.label("value"),
+            running_peak.label("peak")
+        )
+        .join(Episode, Episode.episode_id == Step.episode_id)
+        .outerjoin(EpisodeSeries, EpisodeSeries.episode_id == Step.episode_id)
+        .where(
+            _episode_filter(run_id, completed_only),
+            EpisodeSeries.episode_id.is_(None),
+            Step.portfolio_value.isnot(None)
+        )
+        .subquery()
+    )
+    drawdown = case(
+        (step_drawdowns.c.peak > 0, (step_drawdowns.c.peak - step_drawdowns.c.value) / step_drawdowns.c.peak),
+        else_=0.0
+    )
+    from_steps = (
+        select(
+            step_drawdowns.c.episode_id,
+            func.max(drawdown).label("max_drawdown")
+        )
+        .group_by(step_drawdowns.c.episode_id)
+    )
+    persisted = (
+        select(EpisodeSeries.episode_id.label("episode_id"), EpisodeSeries.max_drawdown.label("max_drawdown"))
+        .join(Episode, Episode.episode_id == EpisodeSeries.episode_id)
+        .where(_episode_filter(run_id, completed_only))
+    )
+    return union_all(persisted, from_steps).subquery()
+
+
+def episode_columns(db, run_id: str, columns: Sequence[str] = EPISODE_COLUMNS,
+                    completed_only: bool = False) -> Dict[str, np.ndarray]:
+    """
+    Fetches selected Episode columns for a run as one array per column.
+
+    Args:
+        db: SQLAlchemy session or connection.
+        run_id (str): The training run to read.
+        columns (Sequence[str]): Episode column names to select.
+        completed_only (bool): Only include episodes with status 'completed'.
+
+    Returns:
+        Dict[str, np.ndarray]: Column name to values, ordered by episode_id. Numeric
+            columns are float arrays with NaN for NULL (integer columns stay integer
+            when fully populated); others are object arrays.
+    """
+    selected = [getattr(Episode, name) for name in columns]
+    rows = db.execute(
+        select(*selected).where(_episode_filter(run_id, completed_only)).order_by(Episode.episode_id)
+    ).all()
+    result = {}
+    for i, column in enumerate(selected):
+        values = [row[i] for row in rows]
+        if isinstance(column.type, Integer) and None not in values:
+            result[column.key] = np.array(values, dtype=np.int64)
+        elif isinstance(column.type, (Float, Integer)):
+            result[column.key] = np.array(values, dtype=float)
+        else:
+            result[column.key] = np.array(values, dtype=object)
+    return result
+
+
+def episode_drawdowns(db, run_id: str, completed_only: bool = True) -> Dict[str, np.ndarray]:
+    """
+    Fetches the maximum drawdown of every episode.
+
+    The value comes from the persisted episode series; steps are only scanned
+    for episodes logged before series were persisted.
+
+    Args:
+        db: SQLAlchemy session or connection.
+        run_id (str): The training run to analyze.
+        completed_only (bool): Only include episodes with status 'completed'.
+
+    Returns:
+        Dict[str, np.ndarray]: 'episode_id' and 'max_drawdown' arrays. Episodes with
+            neither a series nor any step portfolio values are omitted.
+    """
+    drawdowns = _drawdown_subquery(run_id, completed_only)
+    rows = db.execute(select(drawdowns.c.episode_id, drawdowns.c.max_drawdown).order_by(drawdowns.c.episode_id)).all()
+    return {
+        "episode_id": np.array([row[0] for row in rows], dtype=np.int64),
+        "max_drawdown": np.array([row[1] for row in rows], dtype=float)
+    }
+
+
+def episode_returns(db, run_id: str, completed_only: bool = True) -> Dict[str, np.ndarray]:
+    """
+    Fetches per-episode PnL, fractional return, reward and Sharpe ratio.
+
+    Args:
+        db: SQLAlchemy session or connection.
+        run_id (str): The training run to analyze.
+        completed_only (bool): Only include episodes with status 'completed'.
+
+    Returns:
+        Dict[str, np.ndarray]: 'episode_id', 'pnl', 'return', 'total_reward' and
+            'sharpe_ratio' arrays ordered by episode_id, with NaN for missing values.
+    """
+    fractional_return = case(
+        (Episode.initial_portfolio_value > 0,
+         Episode.final_portfolio_value / Episode.initial_portfolio_value - 1.0),
+        else_=None
+    )
+    rows = db.execute(
+        select(Episode.episode_id, Episode.pnl, fractional_return, Episode.total_reward, Episode.sharpe_ratio)
+        .where(_episode_filter(run_id, completed_only))
+        .order_by(Episode.episode_id)
+    ).all()
+    names = ("pnl", "return", "total_reward", "sharpe_ratio")
+    result = {"episode_id": np.array([row[0] for row in rows], dtype=np.int64)}
+    for i, name in enumerate(names, start=1):
+        result[name] = np.array([row[i] for row in rows], dtype=float)
+    return result
+
+
+def action_distribution(db, run_id: str, completed_only: bool = True) -> Dict[str, np.ndarray]:
+    """
+    Counts the actions taken in every episode of a run.
+
+    Args:
+        db: SQLAlchemy session or connection.
+        run_id (str): The training run to analyze.
+        completed_only (bool): Only include episodes with status 'completed'.
+
+    Returns:
+        Dict[str, np.ndarray]: 'episode_id' (E,), 'actions' (A,) sorted action labels
+            and 'counts' (E, A) step counts per episode and action.
+    """
+    rows = db.execute(
+        select(Step.episode_id, Step.action, func.count())
+        .join(Episode, Episode.episode_id == Step.episode_id)
+        .where(_episode_filter(run_id, completed_only), Step.action.isnot(None))
+        .group_by(Step.episode_id, Step.action)
+    ).all()
+    episode_ids = np.array(sorted({row[0] for row in rows}), dtype=np.int64)
+    actions = np.array(sorted({row[1] for row in rows}), dtype=object)
+    counts = np.zeros((len(episode_ids), len(actions)), dtype=np.int64)
+    if rows:
+        rows_idx = np.searchsorted(episode_ids, [row[0] for row in rows])
+        action_idx = np.searchsorted(actions, [row[1] for row in rows])
+        counts[rows_idx, action_idx] = [row[2] for row in rows]
+    return {"episode_id": episode_ids, "actions": actions, "counts": counts}
+
+
+def non_hold_operations(db, run_id: str, completed_only: bool = False) -> Dict[str, np.ndarray]:
+    """
+    Counts non-HOLD trading operations per episode, including episodes with none.
+
+    Args:
+        db: SQLAlchemy session or connection.
+        run_id (str): The training run to analyze.
+        completed_only (bool): Only include episodes with status 'completed'.
+
+    Returns:
+        Dict[str, np.ndarray]: 'episode_id' and 'non_hold_count' arrays.
+    """
+    rows = db.execute(
+        select(Episode.episode_id, func.count(TradingOperation.operation_id))
+        .outerjoin(TradingOperation, and_(
+            TradingOperation.episode_id == Episode.episode_id,
+            TradingOperation.operation_type != OperationType.HOLD
+        ))
+        .where(_episode_filter(run_id, completed_only))
+        .group_by(Episode.episode_id)
+        .order_by(Episode.episode_id)
+    ).all()
+    return {
+        "episode_id": np.array([row[0] for row in rows], dtype=np.int64),
+        "non_hold_count": np.array([row[1] for row in rows], dtype=np.int64)
+    }
+
+
+def run_summary(db, run_id: str, completed_only: bool = True) -> Dict[str, float]:
+    """
+    Aggregates episode results of a run in a single query.
+
+    The PnL standard deviation is taken over deviations from a windowed mean
+    (``avg(pnl) OVER ()``), which is exact on every backend without a native
+    ``stddev`` aggregate.
+
+    Args:
+        db: SQLAlchemy session or connection.
+        run_id (str): The training run to analyze.
+        completed_only (bool): Only include episodes with status 'completed'.
+
+    Returns:
+        Dict[str, float]: 'episodes', 'pnl_mean', 'pnl_std', 'sharpe_ratio' (mean PnL
+            over its standard deviation), 'win_rate', 'max_drawdown' (mean of the
+            per-episode step drawdowns) and 'mean_total_reward'.
+    """
+    drawdowns = _drawdown_subquery(run_id, completed_only)
+    episodes = (
+        select(
+            Episode.episode_id,
+            Episode.pnl,
+            Episode.total_reward,
+            (Episode.pnl - func.avg(Episode.pnl).over()).label("pnl_dev"),
+            drawdowns.c.max_drawdown
+        )
+        .outerjoin(drawdowns, drawdowns.c.episode_id == Episode.episode_id)
+        .where(_episode_filter(run_id, completed_only))
+        .subquery()
+    )
+    row = db.execute(
+        select(
+            func.count(),
+            func.count(episodes.c.pnl),
+            func.avg(episodes.c.pnl),
+            func.avg(episodes.c.pnl_dev * episodes.c.pnl_dev),
+            func.sum(case((episodes.c.pnl > 0, 1), else_=0)),
+            func.avg(episodes.c.max_drawdown),
+            func.avg(episodes.c.total_reward)
+        )
+    ).one()
+    n_episodes, n_pnl, pnl_mean, pnl_var, wins, max_drawdown, mean_reward = row
+
+    summary = {
+        "episodes": float(n_episodes),
+        "pnl_mean": float(pnl_mean or 0.0),
+        "pnl_std": float(np.sqrt(pnl_var)) if pnl_var is not None else 0.0,
+        "sharpe_ratio": 0.0,
+        "win_rate": float(wins) / n_pnl if n_pnl else 0.0,
+        "max_drawdown": float(max_drawdown or 0.0),
+        "mean_total_reward": float(mean_reward or 0.0)
+    }
+    if n_pnl > 1:
+        summary["sharpe_ratio"] = summary["pnl_mean"] / (summary["pnl_std"] + 1e-6)
+    return summary
+
+
+def load_episode_series(db, episode_id: int) -> Optional[Dict[str, Any]]:
+    """
+    Loads the persisted equity/drawdown series of one episode.
+
+    Args:
+        db: SQLAlchemy session or connection.
+        episode_id (int): The episode to read.
+
+    Returns:
+        Optional[Dict[str, Any]]: The exact summary statistics plus 'step', 'equity'
+            and 'drawdown' arrays, or None if the episode has no persisted series.
+    """
+    stats = [getattr(EpisodeSeries, name) for name in SERIES_STATS]
+    row = db.execute(
+        select(EpisodeSeries.series, *stats).where(EpisodeSeries.episode_id == episode_id)
+    ).first()
+    if row is None:
+        return None
+    result = dict(zip(SERIES_STATS, row[1:]))
+    result.update(decode_series(row[0]))
+    return result
+
+
+def episode_series(db, run_id: str, completed_only: bool = True) -> Dict[str, np.ndarray]:
+    """
+    Loads the persisted series of every episode of a run as padded matrices.
+
+    Args:
+        db: SQLAlchemy session or connection.
+        run_id (str): The training run to read.
+        completed_only (bool): Only include episodes with status 'completed'.
+
+    Returns:
+        Dict[str, np.ndarray]: 'episode_id' (E,), 'n_points' (E,), one (E,) array per
+            summary statistic and 'step', 'equity', 'drawdown' as (E, P) float arrays
+            padded with NaN past each episode's n_points.
+    """
+    stats = [getattr(EpisodeSeries, name) for name in SERIES_STATS]
+    rows = db.execute(
+        select(EpisodeSeries.episode_id, EpisodeSeries.n_points, EpisodeSeries.series, *stats)
+        .join(Episode, Episode.episode_id == EpisodeSeries.episode_id)
+        .where(_episode_filter(run_id, completed_only))
+        .order_by(EpisodeSeries.episode_id)
+    ).all()
+    n_points = np.array([row[1] for row in rows], dtype=np.int64)
+    width = int(n_points.max()) if len(rows) else 0
+    result = {
+        "episode_id": np.array([row[0] for row in rows], dtype=np.int64),
+        "n_points": n_points,
+    }
+    for i, name in enumerate(SERIES_STATS, start=3):
+        result[name] = np.array([row[i] for row in rows], dtype=float)
+    for name in SERIES_ROWS:
+        result[name] = np.full((len(rows), width), np.nan)
+    for e, row in enumerate(rows):
+        for name, values in decode_series(row[2]).items():
+            result[name][e, :len(values)] = values
+    return result
@@ -5,16 +5,17 @@ from fastapi import Depends, HTTPException, status, Security
 from fastapi.security import APIKeyHeader
 from sqlalchemy.orm import Session
 
-from reinforcestrategycreator.db_utils import SessionLocal
+from reinforcestrategycreator.db_utils import get_session_factory
 
 # --- Database Dependency ---
 
 def get_db() -> Generator[Session, None, None]:
     """
     Dependency that provides a SQLAlchemy database session per request.
-    Ensures the session is closed afterwards.
+    Ensures the session is closed afterwards. The engine is created on the
+    first request, so the app starts without a reachable database.
     """
-    db = SessionLocal()
+    db = get_session_factory()()
     try:
         yield db
     finally:
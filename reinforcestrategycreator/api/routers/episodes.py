@@ -13,6 +13,7 @@ from reinforcestrategycreator.api import schemas
 from reinforcestrategycreator.api.schemas import episodes as episode_schemas # Import the new schemas
 from reinforcestrategycreator.api.schemas import TradingOperationRead # Added TradingOperationRead
 from reinforcestrategycreator.api.dependencies import DBSession, APIKey, get_api_key # Import get_api_key
+from reinforcestrategycreator.analytics import load_episode_series
 # Removed import of PaginationParams, will define params directly
 
 # Import constants from runs or define them here if preferred
@@ -256,6 +257,26 @@ async def read_episode_operations(
         page_size=limit,
         items=operations # Ensure this matches the schema name 'TradingOperationRead' implicitly
     )
+
+
+@router.get("/{episode_id}/series/", response_model=episode_schemas.EpisodeSeries)
+async def get_episode_series(
+    episode_id: Annotated[int, Path(description="The ID of the episode whose equity series to retrieve")],
+    db: DBSession,
+    api_key: str = Depends(get_api_key),
+):
+    """
+    Retrieve the downsampled equity/drawdown series and exact path statistics
+    persisted when the episode ended. Does not read the steps table.
+    """
+    series = load_episode_series(db, episode_id)
+    if series is None:
+        raise HTTPException(status_code=404, detail=f"No equity series stored for episode {episode_id}")
+    for name in ("step", "equity", "drawdown"):
+        series[name] = series[name].tolist()
+    return episode_schemas.EpisodeSeries(episode_id=episode_id, **series)
+
+
 @router.get("/{episode_id}/model/", response_model=episode_schemas.ModelParameters)
 async def get_episode_model_parameters(
     episode_id: Annotated[int, Path(description="The ID of the episode whose model parameters to retrieve")],
@@ -71,6 +71,21 @@ from typing import List # Ensure List is imported if not already
 # Schema for the list of episode IDs
 class EpisodeIdList(BaseModel):
     episode_ids: List[int]
+
+# Schema for the downsampled equity/drawdown series persisted at episode end
+class EpisodeSeries(BaseModel):
+    episode_id: int
+    n_steps: int
+    total_return: float | None = None
+    mean_return: float | None = None
+    return_std: float | None = None
+    downside_std: float | None = None
+    max_drawdown: float | None = None
+    max_drawdown_step: int | None = None
+    peak_value: float | None = None
+    step: List[int]
+    equity: List[float]
+    drawdown: List[float]
 # Ensure PaginatedResponse is defined, e.g., in schemas/base.py or here
 # from typing import Generic, TypeVar, List
 # T = TypeVar('T')
@@ -7,11 +7,16 @@ data preparation, cross-validation, model training and selection, evaluation,
 visualization, reporting, and model export.
 
 For backward compatibility, the original BacktestingWorkflow class is
-re-exported from this package.
+re-exported from this package. It is imported on first access, so that
+lightweight submodules such as ``export`` can be used without loading Ray.
 """
 
-# Import the main workflow class for backward compatibility
-from reinforcestrategycreator.backtesting.workflow import BacktestingWorkflow
-
 # Export the main class for backward compatibility
-__all__ = ['BacktestingWorkflow']
\ No newline at end of file
+__all__ = ['BacktestingWorkflow']
+
+
+def __getattr__(name):
+    if name == 'BacktestingWorkflow':
+        from reinforcestrategycreator.backtesting.workflow import BacktestingWorkflow
+        return BacktestingWorkflow
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -8,12 +8,158 @@ for comparison with reinforcement learning strategies.
 import logging
 import numpy as np
 import pandas as pd
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Sequence, Tuple
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 
+def simulate_positions(prices: np.ndarray,
+                       positions: np.ndarray,
+                       initial_balance: float = 10000,
+                       transaction_fee: float = 0.001) -> Dict[str, np.ndarray]:
+    """
+    Turn long/flat position series into equity curves, trade counts and fees.
+    
+    Each row of ``positions`` is an independent strategy holding either
+    nothing (0) or the whole portfolio in the asset (1) at the end of each
+    step. Switching from 0 to 1 buys at that step's price, switching back
+    sells, and every switch pays ``transaction_fee`` on the traded value,
+    exactly as the per-step loops of the benchmark strategies do.
+    
+    Args:
+        prices: Price series of shape (T,) or (K, T)
+        positions: Position series of shape (T,) or (K, T) with values 0 or 1
+        initial_balance: Initial portfolio balance
+        transaction_fee: Transaction fee as a fraction of trade value
+        
+    Returns:
+        Dictionary with ``portfolio_values`` (K, T), and per-row ``trades``,
+        ``profitable_trades`` and ``fees`` arrays of shape (K,)
+    """
+    positions = np.atleast_2d(np.asarray(positions, dtype=float))
+    prices = np.broadcast_to(np.asarray(prices, dtype=float), positions.shape)
+    n_steps = positions.shape[1]
+    
+    # Growth factor of each step: price move while long, fee on every switch
+    held = np.zeros_like(positions)
+    held[:, 1:] = positions[:, :-1]
+    price_ratio = np.ones_like(prices)
+    price_ratio[:, 1:] = prices[:, 1:] / prices[:, :-1]
+    market_growth = np.where(held > 0, price_ratio, 1.0)
+    switches = np.zeros_like(positions)
+    switches[:, 1:] = np.abs(np.diff(positions, axis=1))
+    fee_growth = np.where(switches > 0, 1.0 - transaction_fee, 1.0)
+    
+    portfolio_values = initial_balance * np.cumprod(market_growth * fee_growth, axis=1)
+    
+    # Value traded at each switch, before the fee is taken
+    previous_values = np.empty_like(portfolio_values)
+    previous_values[:, 0] = initial_balance
+    previous_values[:, 1:] = portfolio_values[:, :-1]
+    fees = (previous_values * market_growth * switches * transaction_fee).sum(axis=1)
+    
+    # Entry price in force at each step, carried forward from the last buy
+    buys = switches * (positions > 0)
+    sells = switches * (positions == 0)
+    last_buy = np.maximum.accumulate(
+        np.where(buys > 0, np.arange(n_steps), 0), axis=1
+    )
+    entry_prices = np.take_along_axis(prices, last_buy, axis=1)
+    profitable_trades = ((sells > 0) & (prices > entry_prices)).sum(axis=1)
+    # Open positions are marked against the final price
+    open_at_end = positions[:, -1] > 0
+    profitable_trades += open_at_end & (prices[:, -1] > entry_prices[:, -1])
+    
+    return {
+        "portfolio_values": portfolio_values,
+        "trades": buys.sum(axis=1).astype(int),
+        "profitable_trades": profitable_trades.astype(int),
+        "fees": fees
+    }
+
+
+def sma_crossover_positions(prices: np.ndarray,
+                            windows: Sequence[Tuple[int, int]]) -> np.ndarray:
+    """
+    Build SMA crossover position series for a grid of window pairs.
+    
+    Each unique window is averaged once and shared by every pair that uses
+    it. A pair is long while the short average is above the long one, flat
+    while it is below, and keeps its position while they are equal or not
+    yet defined. Nothing is traded on the first step.
+    
+    Args:
+        prices: 1D price series of length T
+        windows: Sequence of (short_window, long_window) pairs
+        
+    Returns:
+        Position array of shape (len(windows), T)
+    """
+    prices = np.asarray(prices, dtype=float)
+    n_steps = len(prices)
+    
+    moving_averages = {}
+    for window in {w for pair in windows for w in pair}:
+        ma = np.full(n_steps, np.nan)
+        ma[window - 1:] = np.convolve(prices, np.ones(window) / window, mode='valid')
+        moving_averages[window] = ma
+    
+    short_ma = np.stack([moving_averages[short] for short, _ in windows])
+    long_ma = np.stack([moving_averages[long] for _, long in windows])
+    
+    # +1 (go long), -1 (go flat) or 0 (keep the current position)
+    signals = np.zeros_like(short_ma)
+    signals[short_ma > long_ma] = 1
+    signals[short_ma < long_ma] = -1
+    signals[:, 0] = -1
+    
+    steps = np.arange(n_steps)
+    last_signal = np.maximum.accumulate(np.where(signals != 0, steps, 0), axis=1)
+    return (np.take_along_axis(signals, last_signal, axis=1) > 0).astype(float)
+
+
+def random_toggle_positions(n_steps: int,
+                            seeds: Sequence[int],
+                            trade_probability: float = 0.05) -> np.ndarray:
+    """
+    Build random-entry/random-exit position series for a set of seeds.
+    
+    Each seed draws the same signal stream as ``np.random.seed(seed)``
+    followed by ``np.random.random(n_steps)``, and every signal after the
+    first step flips the position.
+    
+    Args:
+        n_steps: Length of each series
+        seeds: Random seeds, one row per seed
+        trade_probability: Probability of a signal on each step
+        
+    Returns:
+        Position array of shape (len(seeds), n_steps)
+    """
+    signals = np.stack([
+        np.random.RandomState(seed).random_sample(n_steps) < trade_probability
+        for seed in seeds
+    ])
+    return signals_to_toggle_positions(signals)
+
+
+def signals_to_toggle_positions(signals: np.ndarray) -> np.ndarray:
+    """
+    Convert boolean trade signals into positions that flip on every signal.
+    
+    Args:
+        signals: Boolean array of shape (T,) or (K, T)
+        
+    Returns:
+        Position array of shape (K, T); signals on the first step are ignored
+    """
+    signals = np.atleast_2d(signals).astype(int)
+    positions = np.zeros(signals.shape, dtype=float)
+    positions[:, 1:] = np.cumsum(signals[:, 1:], axis=1) % 2
+    return positions
+
+
 class BenchmarkStrategy:
     """
     Base class for benchmark trading strategies.
@@ -48,6 +194,56 @@ class BenchmarkStrategy:
         """
         raise NotImplementedError("Subclasses must implement run()")
     
+    def _empty_metrics(self) -> Dict[str, Any]:
+        """Metrics reported when the strategy cannot be run."""
+        return {
+            "pnl": 0,
+            "pnl_percentage": 0,
+            "sharpe_ratio": 0,
+            "max_drawdown": 0,
+            "win_rate": 0,
+            "trades": 0
+        }
+    
+    def _get_prices(self, data: pd.DataFrame) -> Optional[np.ndarray]:
+        """
+        Extract the closing price series from the data.
+        
+        Args:
+            data: DataFrame containing price data
+            
+        Returns:
+            1D float array of prices, or None if no price column is found
+        """
+        # Yahoo Finance returns capitalized column names, so try the usual variants
+        for column in ('close', 'Close', 'Adj Close'):
+            if column in data.columns:
+                return np.array(data[column].values, dtype=float).flatten()
+        logger.error(f"Cannot find price data in columns: {data.columns}")
+        return None
+    
+    def _metrics_from_positions(self,
+                                prices: np.ndarray,
+                                positions: np.ndarray) -> List[Dict[str, float]]:
+        """
+        Simulate position series and calculate metrics for every row.
+        
+        Args:
+            prices: 1D price series
+            positions: Position array of shape (K, T)
+            
+        Returns:
+            List of K metric dictionaries
+        """
+        simulation = simulate_positions(
+            prices, positions, self.initial_balance, self.transaction_fee
+        )
+        return self.calculate_metrics_batch(
+            portfolio_values=simulation["portfolio_values"],
+            trades=simulation["trades"],
+            profitable_trades=simulation["profitable_trades"]
+        )
+    
     def calculate_metrics(self, 
                          portfolio_values: List[float],
                          trades: int,
@@ -63,48 +259,70 @@ class BenchmarkStrategy:
         Returns:
             Dictionary of performance metrics
         """
-        # Convert portfolio values to numpy array of float type to ensure consistency
-        portfolio_values = np.array(portfolio_values, dtype=float)
+        metrics = self.calculate_metrics_batch(
+            portfolio_values=np.array(portfolio_values, dtype=float)[np.newaxis, :],
+            trades=np.array([trades]),
+            profitable_trades=np.array([profitable_trades])
+        )
+        return metrics[0]
+    
+    def calculate_metrics_batch(self,
+                                portfolio_values: np.ndarray,
+                                trades: np.ndarray,
+                                profitable_trades: np.ndarray) -> List[Dict[str, float]]:
+        """
+        Calculate performance metrics for many portfolio value series at once.
+        
+        Args:
+            portfolio_values: Array of shape (K, T), one series per row
+            trades: Number of trades executed per row
+            profitable_trades: Number of profitable trades per row
+            
+        Returns:
+            List of K metric dictionaries, as returned by calculate_metrics
+        """
+        portfolio_values = np.atleast_2d(np.asarray(portfolio_values, dtype=float))
+        trades = np.asarray(trades)
+        profitable_trades = np.asarray(profitable_trades)
         
         # Calculate returns
-        returns = np.diff(portfolio_values) / portfolio_values[:-1]
+        returns = np.diff(portfolio_values, axis=1) / portfolio_values[:, :-1]
         
         # Calculate metrics
-        initial_value = portfolio_values[0]
-        final_value = portfolio_values[-1]
+        initial_value = portfolio_values[:, 0]
+        final_value = portfolio_values[:, -1]
         pnl = final_value - initial_value
         pnl_percentage = (pnl / initial_value) * 100
         
         # Calculate Sharpe ratio (annualized)
-        if len(returns) > 1 and np.std(returns) > 0:
-            sharpe_ratio = np.mean(returns) / np.std(returns) * np.sqrt(252)  # Annualized
+        if returns.shape[1] > 1:
+            mean_returns = np.mean(returns, axis=1)
+            std_returns = np.std(returns, axis=1)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                sharpe_ratio = np.where(
+                    std_returns > 0, mean_returns / std_returns * np.sqrt(252), 0
+                )
         else:
-            sharpe_ratio = 0
+            sharpe_ratio = np.zeros(len(portfolio_values))
             
-        # Calculate max drawdown
-        peak = portfolio_values[0]
-        max_drawdown = 0
-        
-        for value in portfolio_values:
-            if value > peak:
-                peak = value
-            drawdown = (peak - value) / peak
-            max_drawdown = max(max_drawdown, drawdown)
+        # Calculate max drawdown against the running peak
+        peak = np.maximum.accumulate(portfolio_values, axis=1)
+        max_drawdown = np.maximum(((peak - portfolio_values) / peak).max(axis=1), 0)
         
         # Calculate win rate
-        if trades > 0:
-            win_rate = profitable_trades / trades
-        else:
-            win_rate = 0
-            
-        return {
-            "pnl": pnl,
-            "pnl_percentage": pnl_percentage,
-            "sharpe_ratio": sharpe_ratio,
-            "max_drawdown": max_drawdown,
-            "win_rate": win_rate,
-            "trades": trades
-        }
+        win_rate = np.where(trades > 0, profitable_trades / np.maximum(trades, 1), 0)
+        
+        return [
+            {
+                "pnl": pnl[i],
+                "pnl_percentage": pnl_percentage[i],
+                "sharpe_ratio": sharpe_ratio[i],
+                "max_drawdown": max_drawdown[i],
+                "win_rate": win_rate[i],
+                "trades": int(trades[i])
+            }
+            for i in range(len(portfolio_values))
+        ]
 
 
 class BuyAndHoldStrategy(BenchmarkStrategy):
@@ -141,38 +359,12 @@ class BuyAndHoldStrategy(BenchmarkStrategy):
         
         if len(data) == 0:
             logger.warning("Empty data provided")
-            return {
-                "pnl": 0,
-                "pnl_percentage": 0,
-                "sharpe_ratio": 0,
-                "max_drawdown": 0,
-                "win_rate": 0,
-                "trades": 0
-            }
+            return self._empty_metrics()
         
         try:
-            # Get price data - Yahoo Finance returns capitalized column names
-            # Try different possible column names
-            if 'close' in data.columns:
-                prices = data['close'].values
-            elif 'Close' in data.columns:
-                prices = data['Close'].values
-            elif 'Adj Close' in data.columns:
-                prices = data['Adj Close'].values
-            else:
-                # If none of the expected columns are found, log available columns and return default
-                logger.error(f"Cannot find price data in columns: {data.columns}")
-                return {
-                    "pnl": 0,
-                    "pnl_percentage": 0,
-                    "sharpe_ratio": 0,
-                    "max_drawdown": 0,
-                    "win_rate": 0,
-                    "trades": 0
-                }
-            
-            # Ensure price data is a 1D numpy array of float type
-            prices = np.array(prices, dtype=float).flatten()
+            prices = self._get_prices(data)
+            if prices is None:
+                return self._empty_metrics()
             
             # Calculate number of shares to buy
             initial_price = float(prices[0])
@@ -180,13 +372,9 @@ class BuyAndHoldStrategy(BenchmarkStrategy):
             shares = shares * (1 - self.transaction_fee)  # Account for transaction fee
             
             # Calculate portfolio value over time
-            portfolio_values = [float(self.initial_balance)]  # Initial balance
-            for price in prices[1:]:
-                portfolio_value = float(shares * price)
-                portfolio_values.append(portfolio_value)
-            
-            # Convert portfolio values to numpy array to ensure consistency
-            portfolio_values = np.array(portfolio_values, dtype=float).tolist()
+            portfolio_values = np.empty(len(prices), dtype=float)
+            portfolio_values[0] = self.initial_balance
+            portfolio_values[1:] = shares * prices[1:]
             
             # Calculate metrics
             metrics = self.calculate_metrics(
@@ -260,105 +448,15 @@ class SMAStrategy(BenchmarkStrategy):
         
         if len(data) < self.long_window:
             logger.warning(f"Insufficient data for {self.name} strategy")
-            return {
-                "pnl": 0,
-                "pnl_percentage": 0,
-                "sharpe_ratio": 0,
-                "max_drawdown": 0,
-                "win_rate": 0,
-                "trades": 0
-            }
+            return self._empty_metrics()
         
         try:
-            # Get price data - Yahoo Finance returns capitalized column names
-            # Try different possible column names
-            if 'close' in data.columns:
-                prices = data['close'].values
-            elif 'Close' in data.columns:
-                prices = data['Close'].values
-            elif 'Adj Close' in data.columns:
-                prices = data['Adj Close'].values
-            else:
-                # If none of the expected columns are found, log available columns and return default
-                logger.error(f"Cannot find price data in columns: {data.columns}")
-                return {
-                    "pnl": 0,
-                    "pnl_percentage": 0,
-                    "sharpe_ratio": 0,
-                    "max_drawdown": 0,
-                    "win_rate": 0,
-                    "trades": 0
-                }
-            
-            # Ensure price data is a 1D numpy array of float type
-            prices = np.array(prices, dtype=float).flatten()
-            
-            # Calculate moving averages
-            short_ma = np.convolve(prices, np.ones(self.short_window)/self.short_window, mode='valid')
-            long_ma = np.convolve(prices, np.ones(self.long_window)/self.long_window, mode='valid')
-            
-            # Align moving averages (they have different lengths)
-            diff = self.long_window - self.short_window
-            if diff > 0:
-                short_ma = short_ma[diff:]
-            
-            # Generate signals
-            signals = np.zeros(len(long_ma))
-            signals[short_ma > long_ma] = 1  # Buy signal
-            signals[short_ma < long_ma] = -1  # Sell signal
-            
-            # Pad signals to match original data length
-            pad_length = len(prices) - len(signals)
-            signals = np.pad(signals, (pad_length, 0), 'constant', constant_values=0)
+            prices = self._get_prices(data)
+            if prices is None:
+                return self._empty_metrics()
             
-            # Initialize portfolio
-            cash = self.initial_balance
-            shares = 0
-            portfolio_values = [cash]
-            position = 0  # 0: no position, 1: long
-            
-            trades = 0
-            profitable_trades = 0
-            entry_price = 0
-            
-            # Simulate trading
-            for i in range(1, len(prices)):
-                signal = signals[i]
-                price = prices[i]
-                
-                # Check for position change
-                if signal == 1 and position == 0:  # Buy
-                    shares = cash / price
-                    shares = shares * (1 - self.transaction_fee)  # Account for transaction fee
-                    cash = 0
-                    position = 1
-                    trades += 1
-                    entry_price = price
-                elif signal == -1 and position == 1:  # Sell
-                    cash = shares * price * (1 - self.transaction_fee)  # Account for transaction fee
-                    if price > entry_price:
-                        profitable_trades += 1
-                    shares = 0
-                    position = 0
-                
-                # Calculate portfolio value
-                portfolio_value = cash + (shares * price)
-                portfolio_values.append(portfolio_value)
-            
-            # Liquidate final position if any
-            if position == 1:
-                cash = shares * prices[-1] * (1 - self.transaction_fee)
-                if prices[-1] > entry_price:
-                    profitable_trades += 1
-            
-            # Calculate metrics
-            metrics = self.calculate_metrics(
-                portfolio_values=portfolio_values,
-                trades=trades,
-                profitable_trades=profitable_trades
-            )
-            
-            return metrics
+            positions = sma_crossover_positions(prices, [(self.short_window, self.long_window)])
+            return self._metrics_from_positions(prices, positions)[0]
             
         except Exception as e:
             logger.error(f"Error running {self.name} strategy: {e}", exc_info=True)
@@ -370,6 +468,40 @@ class SMAStrategy(BenchmarkStrategy):
                 "win_rate": 0,
                 "trades": 0
             }
+    
+    def run_grid(self,
+                 data: pd.DataFrame,
+                 windows: Sequence[Tuple[int, int]]) -> List[Dict[str, Any]]:
+        """
+        Run the SMA strategy for a grid of window pairs in one pass.
+        
+        Args:
+            data: DataFrame containing price data
+            windows: Sequence of (short_window, long_window) pairs
+            
+        Returns:
+            List of metric dictionaries, one per window pair, each including
+            its ``short_window`` and ``long_window``
+        """
+        windows = [(int(short), int(long)) for short, long in windows]
+        logger.info(f"Running SMA grid over {len(windows)} window pairs")
+        
+        prices = self._get_prices(data) if len(data) > 0 else None
+        usable = [
+            prices is not None and long <= len(prices) for _, long in windows
+        ]
+        results = [self._empty_metrics() for _ in windows]
+        
+        runnable = [pair for pair, ok in zip(windows, usable) if ok]
+        if runnable:
+            positions = sma_crossover_positions(prices, runnable)
+            metrics = iter(self._metrics_from_positions(prices, positions))
+            results = [next(metrics) if ok else empty for ok, empty in zip(usable, results)]
+        
+        for (short, long), result in zip(windows, results):
+            result["short_window"] = short
+            result["long_window"] = long
+        return results
 
 
 class RandomStrategy(BenchmarkStrategy):
@@ -416,90 +548,18 @@ class RandomStrategy(BenchmarkStrategy):
         
         if len(data) == 0:
             logger.warning("Empty data provided")
-            return {
-                "pnl": 0,
-                "pnl_percentage": 0,
-                "sharpe_ratio": 0,
-                "max_drawdown": 0,
-                "win_rate": 0,
-                "trades": 0
-            }
+            return self._empty_metrics()
         
         try:
-            # Get price data - Yahoo Finance returns capitalized column names
-            # Try different possible column names
-            if 'close' in data.columns:
-                prices = data['close'].values
-            elif 'Close' in data.columns:
-                prices = data['Close'].values
-            elif 'Adj Close' in data.columns:
-                prices = data['Adj Close'].values
-            else:
-                # If none of the expected columns are found, log available columns and return default
-                logger.error(f"Cannot find price data in columns: {data.columns}")
-                return {
-                    "pnl": 0,
-                    "pnl_percentage": 0,
-                    "sharpe_ratio": 0,
-                    "max_drawdown": 0,
-                    "win_rate": 0,
-                    "trades": 0
-                }
-            
-            # Ensure price data is a 1D numpy array of float type
-            prices = np.array(prices, dtype=float).flatten()
+            prices = self._get_prices(data)
+            if prices is None:
+                return self._empty_metrics()
             
             # Generate random signals
             signals = np.random.random(len(prices)) < self.trade_probability
             
-            # Initialize portfolio
-            cash = self.initial_balance
-            shares = 0
-            portfolio_values = [cash]
-            position = 0  # 0: no position, 1: long
-            
-            trades = 0
-            profitable_trades = 0
-            entry_price = 0
-            
-            # Simulate trading
-            for i in range(1, len(prices)):
-                price = prices[i]
-                
-                # Check for trade signal
-                if signals[i]:
-                    if position == 0:  # Buy
-                        shares = cash / price
-                        shares = shares * (1 - self.transaction_fee)  # Account for transaction fee
-                        cash = 0
-                        position = 1
-                        trades += 1
-                        entry_price = price
-                    else:  # Sell
-                        cash = shares * price * (1 - self.transaction_fee)  # Account for transaction fee
-                        if price > entry_price:
-                            profitable_trades += 1
-                        shares = 0
-                        position = 0
-                
-                # Calculate portfolio value
-                portfolio_value = cash + (shares * price)
-                portfolio_values.append(portfolio_value)
-            
-            # Liquidate final position if any
-            if position == 1:
-                cash = shares * prices[-1] * (1 - self.transaction_fee)
-                if prices[-1] > entry_price:
-                    profitable_trades += 1
-            
-            # Calculate metrics
-            metrics = self.calculate_metrics(
-                portfolio_values=portfolio_values,
-                trades=trades,
-                profitable_trades=profitable_trades
-            )
-            
-            return metrics
+            positions = signals_to_toggle_positions(signals)
+            return self._metrics_from_positions(prices, positions)[0]
             
         except Exception as e:
             logger.error(f"Error running {self.name} strategy: {e}", exc_info=True)
@@ -510,4 +570,35 @@ class RandomStrategy(BenchmarkStrategy):
                 "max_drawdown": 0,
                 "win_rate": 0,
                 "trades": 0
-            }
\ No newline at end of file
+            }
+    
+    def run_seeds(self,
+                  data: pd.DataFrame,
+                  seeds: Sequence[int]) -> List[Dict[str, Any]]:
+        """
+        Run the random strategy once per seed in a single pass.
+        
+        Each seed gives the same result as a fresh ``RandomStrategy`` created
+        with that ``random_seed`` and run once. The global NumPy random state
+        is left untouched.
+        
+        Args:
+            data: DataFrame containing price data
+            seeds: Random seeds to evaluate
+            
+        Returns:
+            List of metric dictionaries, one per seed, each including its ``seed``
+        """
+        seeds = [int(seed) for seed in seeds]
+        logger.info(f"Running random strategy over {len(seeds)} seeds")
+        
+        prices = self._get_prices(data) if len(data) > 0 else None
+        if prices is None or not seeds:
+            results = [self._empty_metrics() for _ in seeds]
+        else:
+            positions = random_toggle_positions(len(prices), seeds, self.trade_probability)
+            results = self._metrics_from_positions(prices, positions)
+        
+        for seed, result in zip(seeds, results):
+            result["seed"] = seed
+        return results
@@ -6,6 +6,9 @@ and hyperparameter optimization for backtesting reinforcement learning trading s
 """
 
 import os
+import json
+import hashlib
+import shutil
 import logging
 import pandas as pd
 import numpy as np
@@ -39,7 +42,8 @@ class CrossValidator:
                  random_seed: int = 42,
                  use_hpo: bool = False,
                  hpo_num_samples: int = 10,
-                 hpo_max_concurrent_trials: int = 4) -> None:
+                 hpo_max_concurrent_trials: int = 4,
+                 cache_dir: Optional[str] = None) -> None:
         """
         Initialize the cross-validator.
         
@@ -52,6 +56,9 @@ class CrossValidator:
             use_hpo: Whether to use hyperparameter optimization
             hpo_num_samples: Number of hyperparameter configurations to try
             hpo_max_concurrent_trials: Maximum number of concurrent trials
+            cache_dir: Directory for cached fold results. When set, completed folds
+                are stored under a hash of the data, fold boundaries, config and
+                seed, and later runs only train the folds that are missing.
         """
         self.train_data = train_data
         self.config = config
@@ -61,9 +68,11 @@ class CrossValidator:
         self.use_hpo = use_hpo
         self.hpo_num_samples = hpo_num_samples
         self.hpo_max_concurrent_trials = hpo_max_concurrent_trials
+        self.cache_dir = cache_dir
         
         # Initialize containers for results
         self.cv_results = []
+        self.cache_stats = {"hits": 0, "misses": 0}
         self.hpo_results = None
         self.best_hpo_params = None
         
@@ -81,7 +90,9 @@ class CrossValidator:
                 models_dir=os.path.join(self.models_dir, "hpo"),
                 random_seed=self.random_seed,
                 num_samples=self.hpo_num_samples,
-                max_concurrent_trials=self.hpo_max_concurrent_trials
+                max_concurrent_trials=self.hpo_max_concurrent_trials,
+                scheduler=self.config.get("hpo_scheduler", "asha"),
+                checkpoint_replay_buffer=self.config.get("hpo_checkpoint_replay_buffer", False)
             )
     
     @ray.remote
@@ -256,27 +267,50 @@ class CrossValidator:
         # Calculate fold size
         fold_size = len(self.train_data) // self.cv_folds
         
-        # Ensure Ray is initialized
-        if not ray.is_initialized():
-            ray.init(ignore_reinit_error=True, log_to_driver=True)
-            logger.info("Ray initialized for parallel cross-validation")
-        
-        # Execute folds in parallel
-        fold_futures = [
-            self._process_fold_remote.remote(
-                fold,
-                self.train_data,
-                fold_size,
-                self.cv_folds,
-                self.config,
-                self.models_dir,
-                self.random_seed
-            ) for fold in range(self.cv_folds)
-        ]
-        
-        # Wait for all fold results and gather them
-        logger.info(f"Launched {self.cv_folds} parallel fold tasks, waiting for completion...")
-        cv_results = ray.get(fold_futures)
+        # Reuse folds completed by earlier runs
+        cv_results = [None] * self.cv_folds
+        fold_keys = {}
+        if self.cache_dir:
+            fingerprint = self._data_fingerprint()
+            for fold in range(self.cv_folds):
+                val_start = fold * fold_size
+                val_end = (fold + 1) * fold_size if fold < self.cv_folds - 1 else len(self.train_data)
+                fold_keys[fold] = self._fold_cache_key(fingerprint, val_start, val_end)
+                cv_results[fold] = self._load_cached_fold(fold_keys[fold])
+        pending = [fold for fold in range(self.cv_folds) if cv_results[fold] is None]
+        self.cache_stats = {"hits": self.cv_folds - len(pending), "misses": len(pending)}
+        if self.cache_dir:
+            logger.info(f"Fold cache: {self.cache_stats['hits']} hits, {self.cache_stats['misses']} misses")
+        
+        if pending:
+            # Ensure Ray is initialized
+            if not ray.is_initialized():
+                ray.init(ignore_reinit_error=True, log_to_driver=True)
+                logger.info("Ray initialized for parallel cross-validation")
+            
+            # Execute missing folds in parallel; the data is put in the object store once
+            train_data_ref = ray.put(self.train_data)
+            future_to_fold = {
+                self._process_fold_remote.remote(
+                    fold,
+                    train_data_ref,
+                    fold_size,
+                    self.cv_folds,
+                    self.config,
+                    self.models_dir,
+                    self.random_seed
+                ): fold for fold in pending
+            }
+            
+            # Gather fold results as they finish, caching each so an interrupted run can resume
+            logger.info(f"Launched {len(pending)} parallel fold tasks, waiting for completion...")
+            remaining = list(future_to_fold)
+            while remaining:
+                done, remaining = ray.wait(remaining, num_returns=1)
+                fold = future_to_fold[done[0]]
+                cv_results[fold] = ray.get(done[0])
+                if fold in fold_keys and "error" not in cv_results[fold]:
+                    self._store_cached_fold(fold_keys[fold], cv_results[fold])
         
         # Store CV results
         self.cv_results = cv_results
@@ -294,6 +328,86 @@ class CrossValidator:
         logger.info(f"Estimated speedup vs sequential: {speedup:.2f}x")
         return cv_results
     
+    def _data_fingerprint(self) -> str:
+        """
+        Hash the contents of the training data, including its index and columns.
+        
+        Returns:
+            Hex digest identifying the training data
+        """
+        digest = hashlib.sha256()
+        digest.update(repr((list(self.train_data.columns), [str(t) for t in self.train_data.dtypes])).encode())
+        digest.update(pd.util.hash_pandas_object(self.train_data, index=True).to_numpy().tobytes())
+        return digest.hexdigest()
+    
+    def _fold_cache_key(self, fingerprint: str, val_start: int, val_end: int) -> str:
+        """
+        Build the cache key of one fold.
+        
+        Args:
+            fingerprint: Hash of the training data
+            val_start: First row of the validation slice
+            val_end: End (exclusive) of the validation slice
+            
+        Returns:
+            Hex digest of the data, fold boundaries, config and seed
+        """
+        # Cross-validation settings only affect model selection, not fold training
+        config = {k: v for k, v in self.config.items() if k != "cross_validation"}
+        payload = json.dumps({
+            "data": fingerprint,
+            "rows": len(self.train_data),
+            "val": [val_start, val_end],
+            "config": config,
+            "random_seed": self.random_seed
+        }, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+    
+    def _load_cached_fold(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a cached fold result.
+        
+        Args:
+            key: Fold cache key
+            
+        Returns:
+            The cached fold result, or None if the fold has not been completed
+        """
+        try:
+            with open(os.path.join(self.cache_dir, key, "result.json")) as f:
+                result = json.load(f)
+        except (OSError, ValueError):
+            return None
+        result["cached"] = True
+        return result
+    
+    def _store_cached_fold(self, key: str, result: Dict[str, Any]) -> None:
+        """
+        Persist a fold result and a copy of its model weights.
+        
+        Args:
+            key: Fold cache key
+            result: Fold result returned by the fold task
+        """
+        entry_dir = os.path.join(self.cache_dir, key)
+        staging_dir = f"{entry_dir}.tmp"
+        try:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            os.makedirs(staging_dir)
+            record = dict(result)
+            model_path = result.get("model_path")
+            if model_path and os.path.exists(model_path):
+                cached_model_path = os.path.join(entry_dir, os.path.basename(model_path))
+                shutil.copy2(model_path, os.path.join(staging_dir, os.path.basename(model_path)))
+                record["model_path"] = cached_model_path
+            with open(os.path.join(staging_dir, "result.json"), "w") as f:
+                json.dump(record, f, indent=2, default=lambda o: o.item() if hasattr(o, "item") else str(o))
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            os.replace(staging_dir, entry_dir)
+        except Exception as e:
+            logger.warning(f"Could not cache result of fold {result.get('fold')}: {e}")
+            shutil.rmtree(staging_dir, ignore_errors=True)
+    
     def _train_evaluate_fold(self, train_data: pd.DataFrame, val_data: pd.DataFrame, fold: int) -> Dict[str, Any]:
         """
         Train and evaluate for a single CV fold.
@@ -621,7 +735,10 @@ class CrossValidator:
         report = "=== Cross-Validation Performance Report ===\n\n"
         report += f"Total folds: {self.cv_folds}\n"
         valid_results = [r for r in self.cv_results if "error" not in r]
-        report += f"Completed folds: {len(valid_results)}/{self.cv_folds}\n\n"
+        report += f"Completed folds: {len(valid_results)}/{self.cv_folds}\n"
+        if self.cache_dir:
+            report += f"Cached folds: {self.cache_stats['hits']}/{self.cv_folds}\n"
+        report += "\n"
         
         # Table header
         report += f"{'Fold':^5}|{'Sharpe':^10}|{'PnL':^12}|{'Win Rate':^10}|{'Max DD':^10}|{'Status':^10}\n"
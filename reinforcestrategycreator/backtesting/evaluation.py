@@ -223,7 +223,10 @@ class BenchmarkEvaluator:
             model_metrics: Dictionary of model performance metrics
             
         Returns:
-            Dictionary of benchmark metrics and relative performance
+            Dictionary of benchmark metrics and relative performance. When the
+            config sets ``sma_window_grid`` (a list of [short, long] pairs) or
+            ``random_seeds``, a ``sweeps`` entry holds the per-member results
+            and a summary for each sweep.
         """
         logger.info("Comparing model performance with benchmarks")
         
@@ -245,7 +248,53 @@ class BenchmarkEvaluator:
                 "sharpe_ratio_difference": model_metrics["sharpe_ratio"] - bench_metrics["sharpe_ratio"]
             }
         
-        return {
+        results = {
             "benchmarks": benchmarks,
             "relative_performance": relative_performance
+        }
+        
+        # Optional parameter sweeps, each evaluated in a single vectorized pass
+        sweeps = {}
+        sma_window_grid = self.config.get("sma_window_grid")
+        if sma_window_grid:
+            sweeps["simple_moving_average"] = self.strategies["simple_moving_average"].run_grid(
+                test_data, sma_window_grid
+            )
+        random_seeds = self.config.get("random_seeds")
+        if random_seeds:
+            sweeps["random"] = self.strategies["random"].run_seeds(test_data, random_seeds)
+        if sweeps:
+            results["sweeps"] = {
+                name: {
+                    "results": sweep_results,
+                    "summary": self._summarize_sweep(sweep_results, model_metrics)
+                }
+                for name, sweep_results in sweeps.items()
+            }
+        
+        return results
+    
+    def _summarize_sweep(self,
+                         sweep_results: List[Dict[str, Any]],
+                         model_metrics: Dict[str, float]) -> Dict[str, float]:
+        """
+        Summarize a benchmark parameter sweep against the model.
+        
+        Args:
+            sweep_results: Metric dictionaries, one per sweep member
+            model_metrics: Dictionary of model performance metrics
+            
+        Returns:
+            Dictionary with the distribution of benchmark PnL and the share
+            of sweep members the model beats
+        """
+        pnls = np.array([result["pnl"] for result in sweep_results], dtype=float)
+        sharpes = np.array([result["sharpe_ratio"] for result in sweep_results], dtype=float)
+        return {
+            "count": len(sweep_results),
+            "mean_pnl": float(np.mean(pnls)),
+            "median_pnl": float(np.median(pnls)),
+            "best_pnl": float(np.max(pnls)),
+            "best_sharpe_ratio": float(np.max(sharpes)),
+            "model_outperformance_rate": float(np.mean(model_metrics["pnl"] > pnls))
         }
\ No newline at end of file
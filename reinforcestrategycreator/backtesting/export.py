@@ -14,6 +14,7 @@ import numpy as np
 from typing import Dict, Any, Optional
 
 from reinforcestrategycreator.rl_agent import StrategyAgent as RLAgent
+from reinforcestrategycreator.inference import InferenceRuntime, export_inference_artifact
 
 # Custom JSON encoder to handle NumPy types
 class NumpyEncoder(json.JSONEncoder):
@@ -95,6 +96,16 @@ class ModelExporter:
                 logger.error("Model doesn't have the expected structure for saving")
                 raise ValueError("Model doesn't have the required structure for saving")
             
+            # Serialized network for InferenceRuntime, loadable without the agent code
+            inference_dir = os.path.join(self.export_dir, f"{model_id}_inference")
+            export_inference_artifact(
+                model.model,
+                input_dim=model.state_size,
+                export_dir=inference_dir,
+                fmt="torchscript",
+                metadata={"model_id": model_id, "asset": asset}
+            )
+            
             # Export model metadata with added model structure information
             metadata = {
                 "model_id": model_id,
@@ -106,7 +117,8 @@ class ModelExporter:
                     "state_size": model.state_size if hasattr(model, 'state_size') else None,
                     "action_size": model.action_size if hasattr(model, 'action_size') else None,
                 },
-                "test_metrics": test_metrics
+                "test_metrics": test_metrics,
+                "inference_artifact": os.path.basename(inference_dir)
             }
             
             # Add benchmark comparison if available
@@ -210,6 +222,35 @@ class ModelExporter:
             logger.error(f"Error loading model {model_id}: {e}", exc_info=True)
             return None
     
+    def load_runtime(self,
+                     model_id: str,
+                     num_threads: Optional[int] = None,
+                     max_batch_size: int = 1024) -> Optional[InferenceRuntime]:
+        """
+        Load the inference artifact of an exported model.
+        
+        Unlike load_model this does not rebuild a StrategyAgent; it serves
+        batched predictions from the serialized network.
+        
+        Args:
+            model_id: ID of the model to load
+            num_threads: Intra-op threads for inference
+            max_batch_size: Rows of the preallocated input buffer
+            
+        Returns:
+            InferenceRuntime or None if the model has no inference artifact
+        """
+        inference_dir = os.path.join(self.export_dir, f"{model_id}_inference")
+        if not os.path.isdir(inference_dir):
+            logger.error(f"Inference artifact not found: {inference_dir}")
+            return None
+        
+        try:
+            return InferenceRuntime(inference_dir, num_threads=num_threads, max_batch_size=max_batch_size)
+        except Exception as e:
+            logger.error(f"Error loading inference runtime for model {model_id}: {e}", exc_info=True)
+            return None
+    
     def get_model_metadata(self, model_id: str) -> Optional[Dict[str, Any]]:
         """
         Get metadata for an exported model.
@@ -7,13 +7,17 @@ for reinforcement learning trading strategies using Ray Tune.
 
 import os
 import logging
+import tempfile
 import pandas as pd
 import numpy as np
 import ray
 import time
 from typing import Dict, List, Any, Optional, Tuple
+import torch
 from ray import tune
-from ray.tune.schedulers import ASHAScheduler
+from ray.tune import Checkpoint
+from ray.tune.schedulers import ASHAScheduler, HyperBandScheduler, PopulationBasedTraining
+from ray.tune.schedulers.pb2 import PB2
 
 from reinforcestrategycreator.trading_environment import TradingEnv as TradingEnvironment
 from reinforcestrategycreator.rl_agent import StrategyAgent as RLAgent
@@ -22,6 +26,12 @@ from reinforcestrategycreator.backtesting.evaluation import MetricsCalculator
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# File holding the agent state inside each trial checkpoint
+TRIAL_CHECKPOINT_FILE = "agent_state.pt"
+
+# Schedulers accepted by HyperparameterOptimizer
+HPO_SCHEDULERS = ("asha", "hyperband", "pbt", "pb2")
+
 
 class HyperparameterOptimizer:
     """
@@ -37,7 +47,9 @@ class HyperparameterOptimizer:
                  models_dir: str = "models",
                  random_seed: int = 42,
                  num_samples: int = 10,
-                 max_concurrent_trials: int = 4) -> None:
+                 max_concurrent_trials: int = 4,
+                 scheduler: str = "asha",
+                 checkpoint_replay_buffer: bool = False) -> None:
         """
         Initialize the hyperparameter optimizer.
         
@@ -48,13 +60,24 @@ class HyperparameterOptimizer:
             random_seed: Random seed for reproducibility
             num_samples: Number of hyperparameter configurations to try
             max_concurrent_trials: Maximum number of concurrent trials
+            scheduler: Trial scheduler, one of "asha" (early stopping), "hyperband"
+                (successive halving that pauses and resumes trials), "pbt" or "pb2"
+                (population-based training that clones the best trials' agents
+                and perturbs their hyperparameters; "pb2" needs GPy and scikit-learn)
+            checkpoint_replay_buffer: Include the replay memory in trial checkpoints,
+                so resumed and cloned agents keep their experience
         """
+        if scheduler not in HPO_SCHEDULERS:
+            raise ValueError(f"Unknown HPO scheduler '{scheduler}'. Choose from {HPO_SCHEDULERS}")
+        
         self.train_data = train_data
         self.config = config
         self.models_dir = models_dir
         self.random_seed = random_seed
         self.num_samples = num_samples
         self.max_concurrent_trials = max_concurrent_trials
+        self.scheduler = scheduler
+        self.checkpoint_replay_buffer = checkpoint_replay_buffer
         
         # Create models directory if it doesn't exist
         os.makedirs(self.models_dir, exist_ok=True)
@@ -66,104 +89,37 @@ class HyperparameterOptimizer:
         self.hpo_results = []
         self.best_params = None
         self.best_score = None
+        self.trial_overhead: Dict[str, Any] = {}
+        self.compute_report: Dict[str, Any] = {}
         
     def _trainable(self, config: Dict[str, Any], checkpoint_dir: Optional[str] = None) -> None:
         """
-        Trainable function for Ray Tune.
+        Trainable function for Ray Tune that reads the data from this optimizer.
+        
+        Kept for direct use; ``optimize_hyperparameters`` registers the data once
+        and runs ``hpo_trial`` instead, so trials do not carry the optimizer.
         
         Args:
             config: Hyperparameter configuration to evaluate
             checkpoint_dir: Directory for checkpoints
         """
-        # Extract hyperparameters from config
-        learning_rate = config["learning_rate"]
-        batch_size = config["batch_size"]
-        layers = config["layers"]
-        gamma = config.get("gamma", self.config.get("gamma", 0.99))
-        epsilon = config.get("epsilon", self.config.get("epsilon", 1.0))
-        epsilon_decay = config.get("epsilon_decay", self.config.get("epsilon_decay", 0.995))
-        epsilon_min = config.get("epsilon_min", self.config.get("epsilon_min", 0.01))
-        
-        # Create environment config
-        env_config = {
-            "df": ray.put(self.train_data),  # Put data in Ray object store
-            "initial_balance": self.config.get("initial_balance", 10000),
-            "transaction_fee_percent": self.config.get("transaction_fee", 0.001),
-            "window_size": self.config.get("window_size", 10),
-            "sharpe_window_size": self.config.get("sharpe_window_size", 100),
-            "use_sharpe_ratio": self.config.get("use_sharpe_ratio", True),
-            "trading_frequency_penalty": self.config.get("trading_frequency_penalty", 0.001),
-            "trading_incentive": self.config.get("trading_incentive", 0.002),
-            "drawdown_penalty": self.config.get("drawdown_penalty", 0.001),
-            "risk_fraction": self.config.get("risk_fraction", 0.1),
-            "normalization_window_size": self.config.get("normalization_window_size", 20)
-        }
-        
-        # Create environment
-        env = TradingEnvironment(env_config=env_config)
-        
-        # Create agent with the hyperparameters to evaluate
-        agent = RLAgent(
-            state_size=env.observation_space.shape[0],
-            action_size=env.action_space.n,
-            learning_rate=learning_rate,
-            gamma=gamma,
-            epsilon=epsilon,
-            epsilon_decay=epsilon_decay,
-            epsilon_min=epsilon_min
+        hpo_trial(
+            config,
+            data_refs={"train": self.train_data, "val": self._validation_data()},
+            base_config=self.config,
+            models_dir=self.models_dir,
+            include_replay_buffer=self.checkpoint_replay_buffer
         )
+    
+    def _validation_data(self) -> pd.DataFrame:
+        """
+        Return the validation slice: the last 20% of the training data.
         
-        # Train agent
-        episodes = self.config.get("episodes", 100)
-        validation_metrics = []
-        
-        for episode in range(episodes):
-            # Handle Gymnasium API which returns (observation, info)
-            reset_result = env.reset()
-            if isinstance(reset_result, tuple):
-                state, _ = reset_result  # Unpack observation and info
-            else:
-                state = reset_result  # Fallback for older gym API
-                
-            done = False
-            
-            while not done:
-                action = agent.select_action(state)
-                step_result = env.step(action)
-                
-                # Handle Gymnasium API which returns (observation, reward, terminated, truncated, info)
-                if len(step_result) == 5:
-                    next_state, reward, terminated, truncated, info = step_result
-                    done = terminated or truncated
-                else:
-                    # Fallback for older gym API
-                    next_state, reward, done, info = step_result
-                    
-                agent.remember(state, action, reward, next_state, done)
-                state = next_state
-                
-                # Train on batch if enough samples
-                if len(agent.memory) > batch_size:
-                    agent.learn()
-            
-            # Evaluate on validation data every 10 episodes
-            if (episode + 1) % 10 == 0 or episode == episodes - 1:
-                metrics = self._evaluate_agent(agent)
-                validation_metrics.append(metrics)
-                
-                # Calculate combined score
-                combined_score = float(self._calculate_combined_score(metrics))
-                
-                # Report metrics to Ray Tune using a dictionary
-                # This is compatible with newer Ray versions
-                tune.report({"score": combined_score})
-        
-        # Save model
-        # Generate a unique filename using timestamp instead of relying on Ray Tune API
-        import time
-        timestamp = int(time.time())
-        model_path = os.path.join(self.models_dir, f"hpo_model_{timestamp}.h5")
-        agent.save_model(model_path)
+        Returns:
+            Validation DataFrame
+        """
+        val_size = int(len(self.train_data) * 0.2)
+        return self.train_data.iloc[-val_size:]
     
     def _evaluate_agent(self, agent: RLAgent) -> Dict[str, float]:
         """
@@ -175,55 +131,8 @@ class HyperparameterOptimizer:
         Returns:
             Dictionary of evaluation metrics
         """
-        # Use a portion of the training data as validation
-        val_size = int(len(self.train_data) * 0.2)
-        val_data = self.train_data.iloc[-val_size:].copy()
-        
-        # Create validation environment
-        val_env_config = {
-            "df": ray.put(val_data),
-            "initial_balance": self.config.get("initial_balance", 10000),
-            "transaction_fee_percent": self.config.get("transaction_fee", 0.001),
-            "window_size": self.config.get("window_size", 10),
-            "sharpe_window_size": self.config.get("sharpe_window_size", 100),
-            "use_sharpe_ratio": self.config.get("use_sharpe_ratio", True),
-            "trading_frequency_penalty": self.config.get("trading_frequency_penalty", 0.001),
-            "trading_incentive": self.config.get("trading_incentive", 0.002),
-            "drawdown_penalty": self.config.get("drawdown_penalty", 0.001),
-            "risk_fraction": self.config.get("risk_fraction", 0.1),
-            "normalization_window_size": self.config.get("normalization_window_size", 20)
-        }
-        
-        val_env = TradingEnvironment(env_config=val_env_config)
-        
-        # Run evaluation episode
-        # Handle Gymnasium API which returns (observation, info)
-        reset_result = val_env.reset()
-        if isinstance(reset_result, tuple):
-            state, _ = reset_result  # Unpack observation and info
-        else:
-            state = reset_result  # Fallback for older gym API
-            
-        done = False
-        
-        while not done:
-            action = agent.select_action(state)
-            step_result = val_env.step(action)
-            
-            # Handle Gymnasium API which returns (observation, reward, terminated, truncated, info)
-            if len(step_result) == 5:
-                next_state, reward, terminated, truncated, info = step_result
-                done = terminated or truncated
-            else:
-                # Fallback for older gym API
-                next_state, reward, done, info = step_result
-                
-            state = next_state
-        
-        # Calculate metrics
-        metrics = self.metrics_calculator.get_episode_metrics(val_env)
-        
-        return metrics
+        val_env = TradingEnvironment(env_config=_env_config(self._validation_data(), self.config))
+        return _evaluate_on_env(agent, val_env, self.metrics_calculator)
     
     def _calculate_combined_score(self, metrics: Dict[str, float]) -> float:
         """
@@ -235,27 +144,110 @@ class HyperparameterOptimizer:
         Returns:
             Combined score
         """
-        # Get metric weights from config or use defaults
-        weights = self.config.get("cross_validation", {}).get("metric_weights", {
-            "sharpe_ratio": 0.4,
-            "pnl": 0.3,
-            "win_rate": 0.2,
-            "max_drawdown": 0.1
-        })
-        
-        # Calculate normalized PnL (as percentage of initial balance)
-        initial_balance = self.config.get("initial_balance", 10000)
-        pnl_pct = metrics["pnl"] / initial_balance if initial_balance > 0 else 0
-        
-        # Calculate combined score
-        score = (
-            weights["sharpe_ratio"] * metrics["sharpe_ratio"] +
-            weights["pnl"] * pnl_pct +
-            weights["win_rate"] * metrics["win_rate"] -
-            weights["max_drawdown"] * metrics["max_drawdown"]
-        )
+        return _combined_score(metrics, self.config)
+    
+    def _register_trial_data(self) -> Dict[str, Any]:
+        """
+        Put the training and validation data in the Ray object store once for all trials.
+        
+        Returns:
+            Dictionary with ``train`` and ``val`` object references
+        """
+        start = time.perf_counter()
+        data_refs = {"train": ray.put(self.train_data), "val": ray.put(self._validation_data())}
+        self.trial_overhead["data_registration_seconds"] = time.perf_counter() - start
+        return data_refs
+    
+    def _summarize_trial_overhead(self, results: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Collect the per-trial data fetch and setup times reported by the trials.
+        
+        Args:
+            results: Last result of each trial, keyed by trial id
+        """
+        per_trial = {
+            trial_id: {key: result[key] for key in ("data_fetch_seconds", "setup_seconds") if key in result}
+            for trial_id, result in results.items()
+            if isinstance(result, dict)
+        }
+        self.trial_overhead["per_trial"] = per_trial
+        for key in ("data_fetch_seconds", "setup_seconds"):
+            values = [t[key] for t in per_trial.values() if key in t]
+            if values:
+                self.trial_overhead[f"mean_{key}"] = float(np.mean(values))
+    
+    def _build_scheduler(self, learning_rates: List[float], bounds: Dict[str, Tuple[float, float]]):
+        """
+        Create the Ray Tune scheduler selected by ``self.scheduler``.
+        
+        All schedulers measure time in training episodes. The successive-halving
+        and population-based schedulers rely on the checkpoints reported by
+        ``hpo_trial`` to resume paused trials and to clone agents.
+        
+        Args:
+            learning_rates: Learning rate choices of the search space
+            bounds: (low, high) range of each continuous hyperparameter
+            
+        Returns:
+            Ray Tune trial scheduler
+        """
+        episodes = self.config.get("episodes", 100)
+        report_interval = self.config.get("report_interval", 10)
+        common = {"time_attr": "episodes", "metric": "score", "mode": "max"}
+        
+        if self.scheduler == "hyperband":
+            return HyperBandScheduler(max_t=episodes, reduction_factor=2, **common)
+        
+        perturbation_interval = self.config.get("perturbation_interval", 2 * report_interval)
+        if self.scheduler == "pbt":
+            mutations = {name: tune.uniform(low, high) for name, (low, high) in bounds.items()}
+            mutations["learning_rate"] = list(learning_rates)
+            return PopulationBasedTraining(
+                perturbation_interval=perturbation_interval,
+                hyperparam_mutations=mutations,
+                **common
+            )
+        if self.scheduler == "pb2":
+            hyperparam_bounds = {name: [low, high] for name, (low, high) in bounds.items()}
+            hyperparam_bounds["learning_rate"] = [min(learning_rates), max(learning_rates)]
+            return PB2(
+                perturbation_interval=perturbation_interval,
+                hyperparam_bounds=hyperparam_bounds,
+                **common
+            )
+        
+        return ASHAScheduler(max_t=episodes, grace_period=10, reduction_factor=2, **common)
+    
+    def _summarize_compute(self, trial_dataframes: Dict[str, pd.DataFrame], best_result: Dict[str, Any]) -> None:
+        """
+        Compare the environment steps actually run with training every trial from scratch.
+        
+        The from-scratch figure is what ``num_samples`` independent trials of
+        ``episodes`` episodes each would cost, at the measured steps per episode.
         
-        return score
+        Args:
+            trial_dataframes: Progress results of every trial, keyed by trial path
+            best_result: Last result of the best trial
+        """
+        frames = [df for df in trial_dataframes.values() if "iteration_env_steps" in df.columns]
+        if not frames:
+            return
+        progress = pd.concat(frames, ignore_index=True)
+        executed_steps = int(progress["iteration_env_steps"].sum())
+        executed_episodes = int(progress["iteration_episodes"].sum())
+        steps_per_episode = executed_steps / executed_episodes if executed_episodes else 0.0
+        from_scratch_steps = int(round(self.num_samples * self.config.get("episodes", 100) * steps_per_episode))
+        saved_steps = max(from_scratch_steps - executed_steps, 0)
+        
+        self.compute_report = {
+            "scheduler": self.scheduler,
+            "executed_env_steps": executed_steps,
+            "from_scratch_env_steps": from_scratch_steps,
+            "saved_env_steps": saved_steps,
+            "saved_fraction": saved_steps / from_scratch_steps if from_scratch_steps else 0.0,
+            "best_trial_env_steps": int(best_result.get("env_steps", 0)),
+            "checkpoint_restores": int(progress["restored"].sum()) if "restored" in progress.columns else 0
+        }
     
     def optimize_hyperparameters(self) -> Dict[str, Any]:
         """
@@ -274,35 +266,43 @@ class HyperparameterOptimizer:
         
         # Define search space from config
         hyperparams = self.config.get("hyperparameters", {})
+        learning_rates = hyperparams.get("learning_rate", [0.001, 0.0001])
+        bounds = {"gamma": (0.95, 0.99), "epsilon_decay": (0.99, 0.999), "epsilon_min": (0.01, 0.1)}
         
         search_space = {
-            "learning_rate": tune.choice(hyperparams.get("learning_rate", [0.001, 0.0001])),
+            "learning_rate": tune.choice(learning_rates),
             "batch_size": tune.choice(hyperparams.get("batch_size", [32, 64])),
             "layers": tune.choice(hyperparams.get("layers", [[64, 32], [128, 64]])),
-            "gamma": tune.uniform(0.95, 0.99),
-            "epsilon_decay": tune.uniform(0.99, 0.999),
-            "epsilon_min": tune.uniform(0.01, 0.1)
+            **{name: tune.uniform(low, high) for name, (low, high) in bounds.items()}
         }
         
         # Define scheduler
-        scheduler = ASHAScheduler(
-            metric="score",  # Use the score key from the metrics dictionary
-            mode="max",
-            max_t=self.config.get("episodes", 100),
-            grace_period=10,
-            reduction_factor=2
+        scheduler = self._build_scheduler(learning_rates, bounds)
+        
+        # Register the data once; trials receive object references, not the optimizer
+        self.trial_overhead = {}
+        trainable = tune.with_parameters(
+            hpo_trial,
+            data_refs=self._register_trial_data(),
+            base_config=self.config,
+            models_dir=self.models_dir,
+            include_replay_buffer=self.checkpoint_replay_buffer
         )
+        self.trial_overhead["trainable_pickle_bytes"] = len(ray.cloudpickle.dumps(trainable))
+        logger.info(f"Trainable pickles to {self.trial_overhead['trainable_pickle_bytes']:,} bytes; "
+                    f"data registered in {self.trial_overhead['data_registration_seconds']:.3f}s")
         
         # Run hyperparameter optimization
         analysis = tune.run(
-            self._trainable,
+            trainable,
             config=search_space,
             num_samples=self.num_samples,
             scheduler=scheduler,
             resources_per_trial={"cpu": 1, "gpu": 0},
+            checkpoint_config=tune.CheckpointConfig(num_to_keep=4),
             verbose=1,
             progress_reporter=tune.CLIReporter(
-                metric_columns=["training_iteration", "pnl", "sharpe_ratio", "max_drawdown", "win_rate", "combined_score"]
+                metric_columns=["training_iteration", "episodes", "env_steps", "pnl", "sharpe_ratio", "max_drawdown", "win_rate", "combined_score"]
             )
         )
         
@@ -328,11 +328,21 @@ class HyperparameterOptimizer:
         
         # Store all results
         self.hpo_results = analysis.results
+        self._summarize_trial_overhead(self.hpo_results)
+        self._summarize_compute(analysis.trial_dataframes, best_result)
         
         elapsed_time = time.time() - start_time
         logger.info(f"Hyperparameter optimization completed in {elapsed_time:.2f} seconds")
         logger.info(f"Best hyperparameters: {self.best_params}")
         logger.info(f"Best score: {self.best_score:.4f}")
+        if "mean_setup_seconds" in self.trial_overhead:
+            logger.info(f"Mean trial overhead - data fetch: {self.trial_overhead.get('mean_data_fetch_seconds', 0.0):.3f}s, "
+                        f"setup: {self.trial_overhead['mean_setup_seconds']:.3f}s")
+        if self.compute_report:
+            logger.info(f"Compute ({self.scheduler}): {self.compute_report['executed_env_steps']:,} env steps run vs "
+                        f"{self.compute_report['from_scratch_env_steps']:,} from scratch "
+                        f"({self.compute_report['saved_fraction']*100:.1f}% saved), "
+                        f"{self.compute_report['checkpoint_restores']} checkpoint restores")
         
         # Log additional metrics if available
         if 'sharpe_ratio' in best_result and 'pnl' in best_result and 'win_rate' in best_result and 'max_drawdown' in best_result:
@@ -388,6 +398,27 @@ class HyperparameterOptimizer:
         
         report += f"\nBest Score: {self.best_score:.4f}\n\n"
         
+        if self.trial_overhead:
+            report += "Per-Trial Overhead:\n"
+            if "trainable_pickle_bytes" in self.trial_overhead:
+                report += f"  Trainable size: {self.trial_overhead['trainable_pickle_bytes']:,} bytes\n"
+            if "data_registration_seconds" in self.trial_overhead:
+                report += f"  Data registration (once): {self.trial_overhead['data_registration_seconds']:.3f}s\n"
+            if "mean_data_fetch_seconds" in self.trial_overhead:
+                report += f"  Mean data fetch: {self.trial_overhead['mean_data_fetch_seconds']:.3f}s\n"
+            if "mean_setup_seconds" in self.trial_overhead:
+                report += f"  Mean setup: {self.trial_overhead['mean_setup_seconds']:.3f}s\n"
+            report += "\n"
+        
+        if self.compute_report:
+            report += f"Compute ({self.compute_report['scheduler']}):\n"
+            report += f"  Env steps run: {self.compute_report['executed_env_steps']:,}\n"
+            report += f"  Env steps from scratch: {self.compute_report['from_scratch_env_steps']:,}\n"
+            report += f"  Saved: {self.compute_report['saved_env_steps']:,} ({self.compute_report['saved_fraction']*100:.1f}%)\n"
+            report += f"  Best trial lineage env steps: {self.compute_report['best_trial_env_steps']:,}\n"
+            report += f"  Checkpoint restores: {self.compute_report['checkpoint_restores']}\n"
+            report += "\n"
+        
         report += "Top 5 Configurations:\n"
         # Sort results by score
         sorted_results = sorted(self.hpo_results.values(), key=lambda x: x.get("score", 0), reverse=True)
@@ -408,4 +439,259 @@ class HyperparameterOptimizer:
                 
             report += f"  Parameters: {result.get('config', {})}\n\n"
         
-        return report
\ No newline at end of file
+        return report
+
+
+def _env_config(df: pd.DataFrame, config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build the TradingEnvironment config used for HPO training and validation.
+    
+    Args:
+        df: Market data for the environment
+        config: Optimizer configuration
+        
+    Returns:
+        Environment config
+    """
+    return {
+        "df": df,
+        "initial_balance": config.get("initial_balance", 10000),
+        "transaction_fee_percent": config.get("transaction_fee", 0.001),
+        "window_size": config.get("window_size", 10),
+        "sharpe_window_size": config.get("sharpe_window_size", 100),
+        "use_sharpe_ratio": config.get("use_sharpe_ratio", True),
+        "trading_frequency_penalty": config.get("trading_frequency_penalty", 0.001),
+        "trading_incentive": config.get("trading_incentive", 0.002),
+        "drawdown_penalty": config.get("drawdown_penalty", 0.001),
+        "risk_fraction": config.get("risk_fraction", 0.1),
+        "normalization_window_size": config.get("normalization_window_size", 20)
+    }
+
+
+def _combined_score(metrics: Dict[str, float], config: Dict[str, Any]) -> float:
+    """
+    Calculate combined score from multiple metrics.
+    
+    Args:
+        metrics: Dictionary of evaluation metrics
+        config: Optimizer configuration holding the metric weights
+        
+    Returns:
+        Combined score
+    """
+    # Get metric weights from config or use defaults
+    weights = config.get("cross_validation", {}).get("metric_weights", {
+        "sharpe_ratio": 0.4,
+        "pnl": 0.3,
+        "win_rate": 0.2,
+        "max_drawdown": 0.1
+    })
+    
+    # Calculate normalized PnL (as percentage of initial balance)
+    initial_balance = config.get("initial_balance", 10000)
+    pnl_pct = metrics["pnl"] / initial_balance if initial_balance > 0 else 0
+    
+    # Calculate combined score
+    score = (
+        weights["sharpe_ratio"] * metrics["sharpe_ratio"] +
+        weights["pnl"] * pnl_pct +
+        weights["win_rate"] * metrics["win_rate"] -
+        weights["max_drawdown"] * metrics["max_drawdown"]
+    )
+    
+    return score
+
+
+def _evaluate_on_env(agent: RLAgent, val_env: TradingEnvironment, metrics_calculator: MetricsCalculator) -> Dict[str, float]:
+    """
+    Run one evaluation episode and return its metrics.
+    
+    Args:
+        agent: Trained RL agent
+        val_env: Validation environment; it is reset first, so it can be reused
+        metrics_calculator: Calculator for the episode metrics
+        
+    Returns:
+        Dictionary of evaluation metrics
+    """
+    # Handle Gymnasium API which returns (observation, info)
+    reset_result = val_env.reset()
+    if isinstance(reset_result, tuple):
+        state, _ = reset_result  # Unpack observation and info
+    else:
+        state = reset_result  # Fallback for older gym API
+        
+    done = False
+    
+    while not done:
+        action = agent.select_action(state)
+        step_result = val_env.step(action)
+        
+        # Handle Gymnasium API which returns (observation, reward, terminated, truncated, info)
+        if len(step_result) == 5:
+            next_state, reward, terminated, truncated, info = step_result
+            done = terminated or truncated
+        else:
+            # Fallback for older gym API
+            next_state, reward, done, info = step_result
+            
+        state = next_state
+    
+    # Calculate metrics
+    return metrics_calculator.get_episode_metrics(val_env)
+
+
+def _restore_trial_state(agent: RLAgent) -> Tuple[int, int]:
+    """
+    Load the agent from the trial's Ray Tune checkpoint, if it has one.
+    
+    The checkpoint is either the trial's own (a paused trial resumed by a
+    successive-halving scheduler) or another trial's (cloned by PBT/PB2, in
+    which case the agent keeps its own, perturbed hyperparameters).
+    
+    Args:
+        agent: Freshly built agent to restore into
+        
+    Returns:
+        Tuple of (episodes already trained, environment steps already taken)
+    """
+    checkpoint = tune.get_checkpoint()
+    if checkpoint is None:
+        return 0, 0
+    with checkpoint.as_directory() as checkpoint_dir:
+        payload = torch.load(os.path.join(checkpoint_dir, TRIAL_CHECKPOINT_FILE), map_location=agent.device, weights_only=False)
+    agent.set_state(payload["agent"])
+    return payload["episode"], payload["env_steps"]
+
+
+def hpo_trial(config: Dict[str, Any],
+              data_refs: Dict[str, Any],
+              base_config: Dict[str, Any],
+              models_dir: str,
+              include_replay_buffer: bool = False) -> None:
+    """
+    Ray Tune trainable for one hyperparameter configuration.
+    
+    Registered with ``tune.with_parameters`` so that each trial is shipped only
+    its hyperparameters plus object references to data put in the object store
+    once by the driver. Every report includes the time spent fetching the data
+    and setting up the environments, so per-trial overhead can be tracked.
+    
+    Training runs in iterations of ``report_interval`` episodes (default 10).
+    Each iteration ends with a validation episode and a report that carries a
+    checkpoint of the agent, so schedulers can pause, resume and clone trials
+    instead of retraining them. Reports count ``episodes`` and ``env_steps``
+    over the agent's whole lineage, including training inherited from a
+    checkpoint, and ``iteration_env_steps`` for the work done in this trial.
+    
+    Args:
+        config: Hyperparameter configuration to evaluate
+        data_refs: ``train`` and ``val`` DataFrames or Ray object references to them
+        base_config: Optimizer configuration (environment settings, episodes, weights)
+        models_dir: Directory to save models
+        include_replay_buffer: Store the replay memory in checkpoints too
+    """
+    trial_start = time.perf_counter()
+    train_data, val_data = (
+        data if isinstance(data, pd.DataFrame) else ray.get(data)
+        for data in (data_refs["train"], data_refs["val"])
+    )
+    data_fetch_seconds = time.perf_counter() - trial_start
+    
+    # Extract hyperparameters from config
+    learning_rate = config["learning_rate"]
+    batch_size = config["batch_size"]
+    gamma = config.get("gamma", base_config.get("gamma", 0.99))
+    epsilon = config.get("epsilon", base_config.get("epsilon", 1.0))
+    epsilon_decay = config.get("epsilon_decay", base_config.get("epsilon_decay", 0.995))
+    epsilon_min = config.get("epsilon_min", base_config.get("epsilon_min", 0.01))
+    
+    # Create the training and validation environments once per trial
+    env = TradingEnvironment(env_config=_env_config(train_data, base_config))
+    val_env = TradingEnvironment(env_config=_env_config(val_data, base_config))
+    metrics_calculator = MetricsCalculator()
+    
+    # Create agent with the hyperparameters to evaluate
+    agent = RLAgent(
+        state_size=env.observation_space.shape[0],
+        action_size=env.action_space.n,
+        learning_rate=learning_rate,
+        gamma=gamma,
+        epsilon=epsilon,
+        epsilon_decay=epsilon_decay,
+        epsilon_min=epsilon_min
+    )
+    start_episode, env_steps = _restore_trial_state(agent)
+    restored = start_episode > 0
+    setup_seconds = time.perf_counter() - trial_start
+    
+    # Train agent
+    episodes = base_config.get("episodes", 100)
+    report_interval = base_config.get("report_interval", 10)
+    iteration_env_steps = 0
+    iteration_episodes = 0
+    
+    for episode in range(start_episode, episodes):
+        # Handle Gymnasium API which returns (observation, info)
+        reset_result = env.reset()
+        if isinstance(reset_result, tuple):
+            state, _ = reset_result  # Unpack observation and info
+        else:
+            state = reset_result  # Fallback for older gym API
+            
+        done = False
+        
+        while not done:
+            action = agent.select_action(state)
+            step_result = env.step(action)
+            iteration_env_steps += 1
+            
+            # Handle Gymnasium API which returns (observation, reward, terminated, truncated, info)
+            if len(step_result) == 5:
+                next_state, reward, terminated, truncated, info = step_result
+                done = terminated or truncated
+            else:
+                # Fallback for older gym API
+                next_state, reward, done, info = step_result
+                
+            agent.remember(state, action, reward, next_state, done)
+            state = next_state
+            
+            # Train on batch if enough samples
+            if len(agent.memory) > batch_size:
+                agent.learn()
+        iteration_episodes += 1
+        
+        # Evaluate on validation data and checkpoint every report_interval episodes
+        if (episode + 1) % report_interval == 0 or episode == episodes - 1:
+            metrics = _evaluate_on_env(agent, val_env, metrics_calculator)
+            env_steps += iteration_env_steps
+            
+            with tempfile.TemporaryDirectory() as checkpoint_dir:
+                torch.save(
+                    {"agent": agent.get_state(include_replay_buffer), "episode": episode + 1, "env_steps": env_steps},
+                    os.path.join(checkpoint_dir, TRIAL_CHECKPOINT_FILE)
+                )
+                # Report the combined score with the trial's data and setup overhead
+                tune.report(
+                    {
+                        "score": float(_combined_score(metrics, base_config)),
+                        "episodes": episode + 1,
+                        "env_steps": env_steps,
+                        "iteration_env_steps": iteration_env_steps,
+                        "iteration_episodes": iteration_episodes,
+                        "restored": int(restored),
+                        "data_fetch_seconds": data_fetch_seconds,
+                        "setup_seconds": setup_seconds
+                    },
+                    checkpoint=Checkpoint.from_directory(checkpoint_dir)
+                )
+            iteration_env_steps = 0
+            iteration_episodes = 0
+            restored = False
+    
+    # Save model
+    # Generate a unique filename using timestamp instead of relying on Ray Tune API
+    timestamp = int(time.time())
+    model_path = os.path.join(models_dir, f"hpo_model_{timestamp}.h5")
+    agent.save_model(model_path)
@@ -7,7 +7,7 @@ for backtesting reinforcement learning trading strategies.
 
 import os
 import logging
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Optional, List
 
 import pandas as pd
 import numpy as np
@@ -23,6 +23,159 @@ from reinforcestrategycreator.backtesting.evaluation import MetricsCalculator
 logger = logging.getLogger(__name__)
 
 
+def run_lockstep_episodes(agent: RLAgent,
+                          test_data: pd.DataFrame,
+                          env_config_base: Dict[str, Any],
+                          num_episodes: int,
+                          epsilon: float) -> List[Dict[str, float]]:
+    """
+    Run several evaluation episodes in lockstep with one forward pass per step.
+    
+    Every episode gets its own environment. At each step the observations of
+    all unfinished episodes are stacked and the agent selects their actions
+    in a single batched call, so the network is evaluated once per step
+    rather than once per episode and step.
+    
+    Args:
+        agent: Agent whose network is used for action selection
+        test_data: Test dataset
+        env_config_base: Base environment configuration
+        num_episodes: Number of episodes to run
+        epsilon: Exploration rate used during evaluation
+        
+    Returns:
+        List of per-episode metric dictionaries
+    """
+    metrics_calculator = MetricsCalculator()
+    
+    env_config = env_config_base.copy()
+    env_config["df"] = test_data
+    envs = [TradingEnvironment(env_config=env_config) for _ in range(num_episodes)]
+    states = [np.asarray(env.reset()[0], dtype=np.float32) for env in envs]
+    active = list(range(num_episodes))
+    
+    while active:
+        actions, confidences = agent.select_actions_batch(
+            np.stack([states[i] for i in active]), epsilon=epsilon
+        )
+        still_active = []
+        for i, action, confidence in zip(active, actions, confidences):
+            next_state, _, terminated, truncated, _ = envs[i].step(int(action), float(confidence))
+            states[i] = np.asarray(next_state, dtype=np.float32)
+            if not (terminated or truncated):
+                still_active.append(i)
+        active = still_active
+    
+    return [metrics_calculator.get_episode_metrics(env) for env in envs]
+
+
+@ray.remote
+class _EvaluationWorker:
+    """
+    Long-lived Ray actor that evaluates a model in lockstep episodes.
+    
+    The agent is built once per worker; each evaluation only loads the new
+    weights, which are shared through the object store.
+    """
+    
+    def __init__(self, state_size: int, action_size: int,
+                 agent_params: Dict[str, Any], random_seed: int) -> None:
+        np.random.seed(random_seed)
+        torch.manual_seed(random_seed)
+        self.agent = RLAgent(
+            state_size=state_size,
+            action_size=action_size,
+            epsilon=0.0,
+            epsilon_decay=1.0,
+            epsilon_min=0.0,
+            use_dueling=agent_params.get("use_dueling", False),
+            use_double_q=agent_params.get("use_double_q", False)
+        )
+    
+    def evaluate(self, model_state_dict: Dict, test_data: pd.DataFrame,
+                 env_config_base: Dict[str, Any], num_episodes: int,
+                 epsilon: float) -> List[Dict[str, float]]:
+        try:
+            self.agent.model.load_state_dict(model_state_dict)
+            return run_lockstep_episodes(
+                self.agent, test_data, env_config_base, num_episodes, epsilon
+            )
+        except Exception as e:
+            logging.getLogger(__name__).error(f"Error in evaluation worker: {e}", exc_info=True)
+            return [{"error": str(e)}]
+
+
+@ray.remote
+class _RolloutWorker:
+    """
+    Long-lived Ray actor that collects training experience.
+    
+    The worker keeps its environment and a policy copy between rollouts. Each
+    rollout loads the latest learner weights and returns the experience of
+    one episode as NumPy arrays.
+    """
+    
+    def __init__(self, worker_id: int, train_data: pd.DataFrame,
+                 env_config_base: Dict[str, Any], state_size: int, action_size: int,
+                 agent_params: Dict[str, Any], random_seed: int) -> None:
+        self.worker_id = worker_id
+        self.logger = logging.getLogger(f"{__name__}.rollout{worker_id}")
+        np.random.seed(random_seed + worker_id)
+        torch.manual_seed(random_seed + worker_id)
+        
+        env_config = env_config_base.copy()
+        env_config["df"] = train_data
+        self.env = TradingEnvironment(env_config=env_config)
+        self.agent = RLAgent(
+            state_size=state_size,
+            action_size=action_size,
+            epsilon_decay=1.0,
+            use_dueling=agent_params.get("use_dueling", True),
+            use_double_q=agent_params.get("use_double_q", True)
+        )
+    
+    def rollout(self, model_state_dict: Dict, epsilon: float) -> Dict[str, np.ndarray]:
+        """
+        Run one episode with the given weights and exploration rate.
+        
+        Args:
+            model_state_dict: Latest learner weights
+            epsilon: Exploration rate for this episode
+            
+        Returns:
+            Dictionary of ``states``, ``actions``, ``rewards``, ``next_states``
+            and ``dones`` arrays, one row per environment step
+        """
+        try:
+            self.agent.model.load_state_dict(model_state_dict)
+            self.agent.epsilon = epsilon
+            
+            states, actions, rewards, next_states, dones = [], [], [], [], []
+            state, _ = self.env.reset()
+            done = False
+            while not done:
+                action, confidence = self.agent.select_action(state, return_confidence=True)
+                next_state, reward, terminated, truncated, _ = self.env.step(action, confidence)
+                done = terminated or truncated
+                states.append(state)
+                actions.append(action)
+                rewards.append(reward)
+                next_states.append(next_state)
+                dones.append(done)
+                state = next_state
+            
+            return {
+                "states": np.asarray(states, dtype=np.float32),
+                "actions": np.asarray(actions, dtype=np.int64),
+                "rewards": np.asarray(rewards, dtype=np.float32),
+                "next_states": np.asarray(next_states, dtype=np.float32),
+                "dones": np.asarray(dones, dtype=bool)
+            }
+        except Exception as e:
+            self.logger.error(f"Error in rollout worker {self.worker_id}: {e}", exc_info=True)
+            return {"states": np.empty((0, self.agent.state_size), dtype=np.float32)}
+
+
 class ModelTrainer:
     """
     Trains and manages reinforcement learning models for trading.
@@ -60,140 +213,13 @@ class ModelTrainer:
         # Initialize containers for models
         self.best_params = None
         self.best_model = None
-    
-    @ray.remote
-    def _train_episode_batch(
-        batch_id: int,
-        batch_size: int,
-        start_episode: int,
-        train_data_ref: ray.ObjectRef,
-        env_config_base: Dict[str, Any],
-        state_size: int,
-        action_size: int,
-        agent_params: Dict[str, Any],
-        random_seed: int
-    ) -> List[Tuple[np.ndarray, int, float, np.ndarray, bool]]:
-        """
-        Train a batch of episodes remotely and collect experiences.
-        
-        Args:
-            batch_id: Batch identification number
-            batch_size: Number of episodes in this batch
-            start_episode: Starting episode number
-            train_data_ref: Reference to training data in Ray object store
-            env_config_base: Base environment configuration
-            state_size: Agent state size
-            action_size: Agent action size
-            agent_params: Agent parameters
-            random_seed: Random seed for reproducibility
-            
-        Returns:
-            List of experience tuples collected during training
-        """
-        batch_logger = logging.getLogger(f"{__name__}.batch{batch_id}")
-        batch_logger.info(f"Starting training batch {batch_id}, episodes {start_episode}-{start_episode+batch_size-1}")
         
-        # Set random seed for reproducibility (unique per batch)
-        batch_seed = random_seed + batch_id
-        np.random.seed(batch_seed)
-        torch.manual_seed(batch_seed)
+        # Throughput statistics of the last train_final_model run
+        self.training_stats = {}
         
-        try:
-            # Create environment config
-            env_config = env_config_base.copy()
-            env_config["df"] = train_data_ref
-            
-            # Create environment
-            env = TradingEnvironment(env_config=env_config)
-            
-            # Create agent with specified parameters and enhanced DQN features
-            agent = RLAgent(
-                state_size=state_size,
-                action_size=action_size,
-                learning_rate=agent_params.get("learning_rate", 0.001),
-                gamma=agent_params.get("gamma", 0.99),
-                epsilon=agent_params.get("epsilon", 1.0),
-                epsilon_decay=agent_params.get("epsilon_decay", 0.995),
-                epsilon_min=agent_params.get("epsilon_min", 0.01),
-                # Enhanced DQN features
-                use_dueling=env_config_base.get("use_dueling", True),
-                use_double_q=env_config_base.get("use_double_q", True),
-                use_prioritized_replay=env_config_base.get("use_prioritized_replay", True),
-                prioritized_replay_alpha=env_config_base.get("prioritized_replay_alpha", 0.6),
-                prioritized_replay_beta=env_config_base.get("prioritized_replay_beta", 0.4),
-                prioritized_replay_beta_annealing=True
-            )
-            
-            # Apply epsilon decay for starting episode (to match sequential training)
-            for i in range(start_episode):
-                agent.epsilon = max(
-                    agent.epsilon_min,
-                    agent.epsilon * agent.epsilon_decay
-                )
-            
-            # Initialize collection of experiences
-            all_experiences = []
-            
-            # Run episodes in this batch
-            for i in range(batch_size):
-                episode = start_episode + i
-                experiences = []
-                
-                state = env.reset()
-                done = False
-                
-                while not done:
-                    # Handle tuple states properly
-                    if isinstance(state, tuple):
-                        # For tuples, extract the first element if it's the observation
-                        # or flatten the tuple structure if needed
-                        if len(state) > 0 and isinstance(state[0], (np.ndarray, list)):
-                            state = state[0]  # Use just the observation part
-                        else:
-                            # Try to convert the tuple elements to a flat list
-                            try:
-                                flat_state = []
-                                for item in state:
-                                    if isinstance(item, (list, np.ndarray)):
-                                        flat_state.extend(item)
-                                    else:
-                                        flat_state.append(item)
-                                state = np.array(flat_state, dtype=np.float32)
-                            except:
-                                # If conversion fails, log and use a random action
-                                batch_logger.warning(f"Could not convert state tuple to array, using random action")
-                                action = np.random.randint(action_size)
-                                continue
-                    # Get action and confidence from agent
-                    action, confidence = agent.select_action(state, return_confidence=True)
-                    # Pass confidence to environment for dynamic position sizing
-                    next_state, reward, terminated, truncated, info = env.step(action, confidence)
-                    done = terminated or truncated
-                    
-                    # Store experience tuple
-                    experience = (state, action, reward, next_state, done)
-                    experiences.append(experience)
-                    
-                    state = next_state
-                
-                # Update epsilon for next episode
-                agent.epsilon = max(
-                    agent.epsilon_min,
-                    agent.epsilon * agent.epsilon_decay
-                )
-                
-                # Collect experiences from this episode
-                all_experiences.extend(experiences)
-                
-                if (i + 1) % 5 == 0 or i == batch_size - 1:
-                    batch_logger.info(f"Batch {batch_id}: {i+1}/{batch_size} episodes completed")
-            
-            batch_logger.info(f"Batch {batch_id} completed, collected {len(all_experiences)} experiences")
-            return all_experiences
-            
-        except Exception as e:
-            batch_logger.error(f"Error in training batch {batch_id}: {e}", exc_info=True)
-            return []  # Return empty experiences list on error
+        # Ray evaluation workers, created on first use and reused afterwards
+        self._eval_workers = []
+        self._eval_workers_key = None
     
     def train_final_model(self, train_data: pd.DataFrame, best_params: Dict[str, Any],
                          use_transfer_learning: bool = True, use_ensemble: bool = False) -> RLAgent:  # Using RLAgent alias
@@ -338,79 +364,117 @@ class ModelTrainer:
             
             # Configure training parameters
             total_episodes = self.config.get("final_episodes", 200)  # Total number of episodes
-            # Get all available CPUs while reserving a few for system operations
-            available_cpus = ray.available_resources().get("CPU", 2)
-            num_cpus = int(max(available_cpus - 4, 4))  # Reserve 4 CPUs for main thread and system, minimum 4
-            num_batches = int(min(num_cpus * 4, total_episodes))  # Create 4 batches per CPU (increased from 2) but don't exceed total_episodes
-            batch_size = max(total_episodes // num_batches, 1)  # Ensure at least 1 episode per batch
-            
-            logger.info(f"Parallel training setup: {total_episodes} episodes across {num_batches} batches "
-                       f"({batch_size} episodes per batch) using {num_cpus} CPUs")
-            
-            # Train in batches
-            batch_futures = []
-            for batch_id in range(num_batches):
-                start_episode = batch_id * batch_size
-                # Adjust batch size for the last batch to account for any remainder
-                current_batch_size = min(batch_size, total_episodes - start_episode)
-                
-                # Skip if no episodes left
-                if current_batch_size <= 0:
-                    continue
-                
-                # Launch the remote batch training
-                batch_future = self._train_episode_batch.remote(
-                    batch_id,
-                    current_batch_size,
-                    start_episode,
+            num_workers = self.config.get("num_rollout_workers")
+            if num_workers is None:
+                available_cpus = ray.available_resources().get("CPU", 2)
+                num_workers = available_cpus - self.config.get("training_reserved_cpus", 1)
+            num_workers = int(max(1, min(num_workers, total_episodes)))
+            learn_batch_size = self.best_params.get("batch_size", 32)
+            
+            logger.info(f"Parallel training setup: {total_episodes} episodes on {num_workers} rollout workers")
+            
+            # Workers keep their environment and policy copy for the whole run
+            workers = [
+                _RolloutWorker.remote(
+                    worker_id,
                     train_data_ref,
                     env_config_base,
                     state_size,
                     action_size,
-                    agent_params,
-                    self.random_seed  # Base random seed
+                    {"use_dueling": agent.use_dueling, "use_double_q": agent.use_double_q},
+                    self.random_seed
+                )
+                for worker_id in range(num_workers)
+            ]
+            
+            def episode_epsilon(episode: int) -> float:
+                return max(
+                    agent_params["epsilon_min"],
+                    agent_params["epsilon"] * agent_params["epsilon_decay"] ** episode
                 )
-                batch_futures.append(batch_future)
-                
-            # Collect experiences from all batches
-            logger.info(f"Launched {len(batch_futures)} training batches, waiting for completion...")
-            batch_results = ray.get(batch_futures)
-            
-            # Aggregate all experiences
-            all_experiences = []
-            for experiences in batch_results:
-                all_experiences.extend(experiences)
-                
-            logger.info(f"Collected {len(all_experiences)} experiences from all batches")
             
-            # Store experiences in agent's memory
+            def broadcast_weights() -> ray.ObjectRef:
+                return ray.put({k: v.cpu() for k, v in agent.model.state_dict().items()})
+            
             # Reset memory first to avoid potential duplication
             agent.memory = []
-            for experience in all_experiences:
-                state, action, reward, next_state, done = experience
-                agent.remember(state, action, reward, next_state, done)
-            
-            # Train agent on collected experiences
-            batch_size = self.best_params.get("batch_size", 32)
-            num_batches_to_train = len(agent.memory) // batch_size
-            logger.info(f"Training main agent on {len(agent.memory)} experiences ({num_batches_to_train} batches)")
             
             # Initialize metrics tracking for PER
             per_loss_values = []
             priority_mean_values = []
             
-            for i in range(num_batches_to_train):
-                result = agent.learn(return_stats=True)  # Get training stats
+            try:
+                weights_ref = broadcast_weights()
+                pending = {}
+                next_episode = 0
+                for worker in workers:
+                    pending[worker.rollout.remote(weights_ref, episode_epsilon(next_episode))] = worker
+                    next_episode += 1
+                
+                env_steps = 0
+                learner_updates = 0
+                unconsumed_experiences = 0
+                learner_time = 0.0
+                rollout_start = time.time()
                 
-                # Extract and track PER metrics if available
-                if isinstance(result, dict) and 'td_error' in result:
-                    per_loss_values.append(result.get('td_error', 0))
-                    priority_mean_values.append(result.get('mean_priority', 0))
+                # Train continuously: learn from each episode as soon as it arrives
+                # and send the worker straight back out with the latest weights
+                while pending:
+                    ready, _ = ray.wait(list(pending), num_returns=1)
+                    worker = pending.pop(ready[0])
+                    batch = ray.get(ready[0])
+                    
+                    num_steps = len(batch["states"])
+                    for i in range(num_steps):
+                        agent.remember(
+                            batch["states"][i], int(batch["actions"][i]), float(batch["rewards"][i]),
+                            batch["next_states"][i], bool(batch["dones"][i])
+                        )
+                    env_steps += num_steps
+                    unconsumed_experiences += num_steps
+                    
+                    learn_start = time.time()
+                    updates_before = learner_updates
+                    while unconsumed_experiences >= learn_batch_size and len(agent.memory) >= learn_batch_size:
+                        result = agent.learn(return_stats=True)  # Get training stats
+                        unconsumed_experiences -= learn_batch_size
+                        learner_updates += 1
+                        
+                        # Extract and track PER metrics if available
+                        if isinstance(result, dict) and 'td_error' in result:
+                            per_loss_values.append(result.get('td_error', 0))
+                            priority_mean_values.append(result.get('mean_priority', 0))
+                        
+                        if learner_updates % 100 == 0:
+                            logger.info(f"Training progress: {learner_updates} learner updates, {env_steps} env steps")
+                            if per_loss_values and priority_mean_values:
+                                logger.info(f"Recent PER metrics - Loss: {per_loss_values[-1]:.4f}, Priority Mean: {priority_mean_values[-1]:.4f}")
+                    learner_time += time.time() - learn_start
+                    
+                    if next_episode < total_episodes:
+                        if learner_updates > updates_before:
+                            weights_ref = broadcast_weights()
+                        pending[worker.rollout.remote(weights_ref, episode_epsilon(next_episode))] = worker
+                        next_episode += 1
                 
-                if (i + 1) % 100 == 0:
-                    logger.info(f"Training progress: {i+1}/{num_batches_to_train} batches completed")
-                    if per_loss_values and priority_mean_values:
-                        logger.info(f"Recent PER metrics - Loss: {per_loss_values[-1]:.4f}, Priority Mean: {priority_mean_values[-1]:.4f}")
+            finally:
+                # Stop the actors even when a rollout or the learner raised
+                for worker in workers:
+                    ray.kill(worker)
+            
+            rollout_time = time.time() - rollout_start
+            self.training_stats = {
+                "episodes": total_episodes,
+                "rollout_workers": num_workers,
+                "env_steps": env_steps,
+                "learner_updates": learner_updates,
+                "wall_time": rollout_time,
+                "env_steps_per_sec": env_steps / rollout_time if rollout_time > 0 else 0.0,
+                "learner_updates_per_sec": learner_updates / learner_time if learner_time > 0 else 0.0
+            }
+            logger.info(f"Collected {env_steps} experiences with {learner_updates} learner updates "
+                        f"({self.training_stats['env_steps_per_sec']:.0f} env steps/s, "
+                        f"{self.training_stats['learner_updates_per_sec']:.0f} learner updates/s)")
             
             # Calculate and log average PER metrics if available
             avg_per_loss = sum(per_loss_values) / len(per_loss_values) if per_loss_values else 0.0
@@ -448,129 +512,34 @@ class ModelTrainer:
             logger.error(f"Error training final model: {e}", exc_info=True)
             raise
     
-    @ray.remote
-    def _evaluate_episode_remotely(
-        episode_id: int,
-        test_data_ref: ray.ObjectRef,
-        model_state_dict: Dict,
-        env_config_base: Dict[str, Any],
-        state_size: int,
-        action_size: int,
-        agent_params: Dict[str, Any],
-    ) -> Dict[str, float]:
-        """
-        Evaluate model in a single episode remotely.
-        
-        Args:
-            episode_id: Episode identification number
-            test_data_ref: Reference to test data in Ray object store
-            model_state_dict: PyTorch model state dictionary
-            env_config_base: Base environment configuration
-            state_size: Agent state size
-            action_size: Agent action size
-            agent_params: Agent parameters
-            
-        Returns:
-            Dictionary of evaluation metrics for this episode
+    def evaluate_model(self, model: RLAgent, test_data: pd.DataFrame) -> Dict[str, float]:  # Using RLAgent alias
         """
-        # Create metrics calculator for this worker
-        metrics_calculator = MetricsCalculator()
+        Evaluate model on test data over several evaluation episodes.
         
-        eval_logger = logging.getLogger(f"{__name__}.eval{episode_id}")
-        eval_logger.info(f"Starting evaluation episode {episode_id}")
+        Episodes are run in lockstep in this process with one batched forward
+        pass per step. Only when the number of episodes reaches
+        ``eval_ray_min_episodes`` are they spread over persistent Ray workers,
+        each running its share in lockstep. With ``eval_epsilon`` set to 0 the
+        policy and environment are deterministic, so a single episode is run.
         
-        try:
-            # Create environment config
-            env_config = env_config_base.copy()
-            env_config["df"] = test_data_ref
-            
-            # Create environment
-            env = TradingEnvironment(env_config=env_config)
-            
-            # Create agent with enhanced DQN features
-            agent = RLAgent(
-                state_size=state_size,
-                action_size=action_size,
-                learning_rate=agent_params.get("learning_rate", 0.001),
-                gamma=agent_params.get("gamma", 0.99),
-                epsilon=agent_params.get("epsilon_min", 0.01),  # Use minimal exploration for evaluation
-                epsilon_decay=1.0,  # No decay during evaluation
-                epsilon_min=agent_params.get("epsilon_min", 0.01),
-                # Enhanced DQN features
-                use_dueling=env_config_base.get("use_dueling", True),
-                use_double_q=env_config_base.get("use_double_q", True),
-                use_prioritized_replay=env_config_base.get("use_prioritized_replay", True),
-                prioritized_replay_alpha=env_config_base.get("prioritized_replay_alpha", 0.6),
-                prioritized_replay_beta=env_config_base.get("prioritized_replay_beta", 0.4),
-                prioritized_replay_beta_annealing=False  # No annealing during evaluation
-            )
-            
-            # Load model state dictionary
-            agent.model.load_state_dict(model_state_dict)
-            agent.model.eval()  # Set to evaluation mode
-            
-            # Run evaluation episode
-            state = env.reset()
-            done = False
-            
-            while not done:
-                # Handle tuple states properly
-                if isinstance(state, tuple):
-                    # For tuples, extract the first element if it's the observation
-                    # or flatten the tuple structure if needed
-                    if len(state) > 0 and isinstance(state[0], (np.ndarray, list)):
-                        state = state[0]  # Use just the observation part
-                    else:
-                        # Try to convert the tuple elements to a flat list
-                        try:
-                            flat_state = []
-                            for item in state:
-                                if isinstance(item, (list, np.ndarray)):
-                                    flat_state.extend(item)
-                                else:
-                                    flat_state.append(item)
-                            state = np.array(flat_state, dtype=np.float32)
-                        except:
-                            # If conversion fails, log and use a random action
-                            eval_logger.warning(f"Could not convert state tuple to array, using random action")
-                            action = np.random.randint(action_size)
-                            continue
-                # Get action and confidence from agent
-                action, confidence = agent.select_action(state, return_confidence=True)
-                # Pass confidence to environment for dynamic position sizing
-                next_state, reward, terminated, truncated, info = env.step(action, confidence)
-                done = terminated or truncated
-                state = next_state
-            
-            # Calculate metrics
-            metrics = metrics_calculator.get_episode_metrics(env)
-            eval_logger.info(f"Episode {episode_id} evaluation completed with PnL: ${metrics['pnl']:.2f}")
-            
-            return metrics
-            
-        except Exception as e:
-            eval_logger.error(f"Error in evaluation episode {episode_id}: {e}", exc_info=True)
-            return {
-                "error": str(e),
-                "pnl": 0.0,
-                "sharpe_ratio": 0.0,
-                "max_drawdown": 0.0,
-                "win_rate": 0.0
-            }
-
-    def evaluate_model(self, model: RLAgent, test_data: pd.DataFrame) -> Dict[str, float]:  # Using RLAgent alias
-        """
-        Evaluate model on test data using multiple parallel evaluation episodes.
+        Relevant config keys:
+            eval_episodes: Number of evaluation episodes (default 10)
+            eval_epsilon: Exploration rate during evaluation (default: the
+                model's epsilon_min)
+            eval_ray_min_episodes: Episode count from which Ray is used (default 64)
+            eval_num_workers: Number of Ray workers (default: available CPUs
+                minus ``eval_reserved_cpus``)
+            eval_reserved_cpus: CPUs left free for the driver (default 0)
         
         Args:
             model: Trained RL agent
             test_data: Test dataset
             
         Returns:
-            Dictionary of evaluation metrics (averaged across multiple evaluation episodes)
+            Dictionary of evaluation metrics (averaged across evaluation episodes)
         """
         start_time = time.time()
-        logger.info("Evaluating model on test data using parallel processing")
+        logger.info("Evaluating model on test data")
         
         if model is None:
             raise ValueError("No model available for evaluation")
@@ -579,14 +548,6 @@ class ModelTrainer:
             raise ValueError("No test data available for evaluation")
             
         try:
-            # Ensure Ray is initialized
-            if not ray.is_initialized():
-                ray.init(ignore_reinit_error=True, log_to_driver=True)
-                logger.info("Ray initialized for parallel model evaluation")
-            
-            # Put the test data into Ray's object store
-            test_data_ref = ray.put(test_data)
-            
             # Base environment configuration
             env_config_base = {
                 "initial_balance": self.config.get("initial_balance", 10000),
@@ -605,48 +566,21 @@ class ModelTrainer:
                 "max_risk_fraction": self.config.get("max_risk_fraction", 0.20)
             }
             
-            # Create a temporary environment to determine state and action sizes
-            tmp_env_config = env_config_base.copy()
-            tmp_env_config["df"] = test_data_ref
-            tmp_env = TradingEnvironment(env_config=tmp_env_config)
-            state_size = tmp_env.observation_space.shape[0]
-            action_size = tmp_env.action_space.n
-            
-            # Get model state dictionary for distribution to workers
-            model_state_dict = model.model.state_dict()
-            
-            # Agent parameters for consistent initialization
-            agent_params = {
-                "learning_rate": model.learning_rate,
-                "gamma": model.gamma,
-                "epsilon": model.epsilon_min,  # Use minimal epsilon for evaluation
-                "epsilon_decay": 1.0,
-                "epsilon_min": model.epsilon_min
-            }
+            epsilon = self.config.get("eval_epsilon", model.epsilon_min)
+            num_eval_episodes = int(self.config.get("eval_episodes", 10))
+            if epsilon <= 0:
+                # Greedy policy on a deterministic environment: every episode is identical
+                num_eval_episodes = 1
             
-            # Perform multiple evaluation episodes in parallel for more stable metrics
-            # Configure evaluation with more parallel episodes
-            max_available_cpus = ray.available_resources().get("CPU", 2) - 4  # Reserve 4 CPUs for main threads
-            num_eval_episodes = int(min(max(max_available_cpus, 10), 30))  # Between 10-30 episodes based on available CPUs
-            logger.info(f"Running {num_eval_episodes} parallel evaluation episodes")
-            
-            # Launch parallel evaluation episodes
-            episode_futures = [
-                self._evaluate_episode_remotely.remote(
-                    i,  # episode_id
-                    test_data_ref,
-                    model_state_dict,
-                    env_config_base,
-                    state_size,
-                    action_size,
-                    agent_params
+            if num_eval_episodes >= self.config.get("eval_ray_min_episodes", 64):
+                episode_metrics = self._evaluate_with_workers(
+                    model, test_data, env_config_base, num_eval_episodes, epsilon
+                )
+            else:
+                logger.info(f"Running {num_eval_episodes} evaluation episodes in lockstep")
+                episode_metrics = run_lockstep_episodes(
+                    model, test_data, env_config_base, num_eval_episodes, epsilon
                 )
-                for i in range(num_eval_episodes)
-            ]
-            
-            # Wait for all episodes to complete
-            logger.info(f"Launched {num_eval_episodes} evaluation episodes, waiting for completion...")
-            episode_metrics = ray.get(episode_futures)
             
             # Filter out episodes with errors
             valid_metrics = [m for m in episode_metrics if "error" not in m]
@@ -677,7 +611,7 @@ class ModelTrainer:
             aggregated_metrics['pnl_percentage'] = (aggregated_metrics['pnl'] / self.config.get('initial_balance', 10000)) * 100
             
             elapsed_time = time.time() - start_time
-            logger.info(f"Parallel model evaluation completed with avg PnL: ${aggregated_metrics['pnl']:.2f} ({elapsed_time:.2f} seconds)")
+            logger.info(f"Model evaluation completed with avg PnL: ${aggregated_metrics['pnl']:.2f} ({elapsed_time:.2f} seconds)")
             
             return aggregated_metrics
             
@@ -685,6 +619,60 @@ class ModelTrainer:
             logger.error(f"Error evaluating model: {e}", exc_info=True)
             raise
     
+    def _evaluate_with_workers(self, model: RLAgent, test_data: pd.DataFrame,
+                               env_config_base: Dict[str, Any], num_episodes: int,
+                               epsilon: float) -> List[Dict[str, float]]:
+        """
+        Spread lockstep evaluation episodes over persistent Ray workers.
+        
+        Workers are created on first use and kept for later evaluations of a
+        model with the same architecture. Weights and test data are put in
+        the object store once per call and shared by all workers.
+        
+        Args:
+            model: Trained RL agent
+            test_data: Test dataset
+            env_config_base: Base environment configuration
+            num_episodes: Total number of episodes to run
+            epsilon: Exploration rate used during evaluation
+            
+        Returns:
+            List of per-episode metric dictionaries
+        """
+        if not ray.is_initialized():
+            ray.init(ignore_reinit_error=True, log_to_driver=True)
+            logger.info("Ray initialized for parallel model evaluation")
+        
+        num_workers = self.config.get("eval_num_workers")
+        if num_workers is None:
+            available_cpus = ray.available_resources().get("CPU", 1)
+            num_workers = available_cpus - self.config.get("eval_reserved_cpus", 0)
+        num_workers = int(max(1, min(num_workers, num_episodes)))
+        
+        workers_key = (model.state_size, model.action_size, model.use_dueling, model.use_double_q)
+        if self._eval_workers_key != workers_key:
+            self._eval_workers = []
+            self._eval_workers_key = workers_key
+        agent_params = {"use_dueling": model.use_dueling, "use_double_q": model.use_double_q}
+        while len(self._eval_workers) < num_workers:
+            self._eval_workers.append(_EvaluationWorker.remote(
+                model.state_size, model.action_size, agent_params,
+                self.random_seed + len(self._eval_workers)
+            ))
+        
+        state_dict_ref = ray.put({k: v.cpu() for k, v in model.model.state_dict().items()})
+        test_data_ref = ray.put(test_data)
+        
+        episodes_per_worker = np.array_split(np.arange(num_episodes), num_workers)
+        logger.info(f"Running {num_episodes} evaluation episodes on {num_workers} Ray workers")
+        futures = [
+            worker.evaluate.remote(
+                state_dict_ref, test_data_ref, env_config_base, len(episodes), epsilon
+            )
+            for worker, episodes in zip(self._eval_workers, episodes_per_worker)
+        ]
+        return [metrics for worker_metrics in ray.get(futures) for metrics in worker_metrics]
+    
     def create_model_ensemble(self, state_size: int, action_size: int) -> Optional[RLAgent]:
         """
         Create an ensemble model from top-performing cross-validation models.
@@ -176,7 +176,8 @@ class BacktestingWorkflow:
             random_seed=self.random_seed,
             use_hpo=self.use_hpo,
             hpo_num_samples=self.hpo_num_samples,
-            hpo_max_concurrent_trials=self.hpo_max_concurrent_trials
+            hpo_max_concurrent_trials=self.hpo_max_concurrent_trials,
+            cache_dir=self.config.get("cross_validation", {}).get("cache_dir")
         )
         
         # Perform cross-validation
@@ -26,7 +26,9 @@ from reinforcestrategycreator.db_models import (
     TrainingRun,
     Step as DbStep, # Added
     TradingOperation as DbTradingOperation, # Added
+    EpisodeSeries as DbEpisodeSeries,
     OperationType) # Added
+from reinforcestrategycreator.episode_series import summarize_equity
 from reinforcestrategycreator.trading_environment import TradingEnv
 
 # Set up a specific logger for this module
@@ -376,6 +378,15 @@ class DatabaseLoggingCallbacks(DefaultCallbacks):
             total_reward_val = last_info_dict.get('total_reward', getattr(episode, 'total_reward', None))
             total_steps_val = last_info_dict.get('total_steps', last_info_dict.get('episode_length', getattr(episode, 'length', None)))
 
+            # Downsample the equity path once here so readers never need the step table for it
+            series_summary = None
+            portfolio_values = last_info_dict.get("portfolio_values")
+            if portfolio_values is not None and len(portfolio_values) > 0:
+                try:
+                    series_summary = summarize_equity(portfolio_values)
+                except Exception as e_series:
+                    logger.warning(f"Could not summarize equity series for RLlib episode {rllib_episode_id_str}: {e_series}")
+
             completed_trades = last_info_dict.get("completed_trades", [])
             if not isinstance(completed_trades, list):
                 logger.warning(f"completed_trades in last_info_dict is not a list: {completed_trades}. Using empty list.")
@@ -410,6 +421,10 @@ class DatabaseLoggingCallbacks(DefaultCallbacks):
                         db_episode.initial_portfolio_value = safe_initial_pf
                         logger.info(f"Updated initial_portfolio_value for episode {db_episode_id} from end_info: {safe_initial_pf}")
 
+                    if series_summary is not None:
+                        # merge() keeps a re-logged episode end idempotent
+                        db.merge(DbEpisodeSeries(episode_id=db_episode.episode_id, **series_summary))
+
                     # Log trades associated with this episode
                     for trade_data in completed_trades:
                         try:
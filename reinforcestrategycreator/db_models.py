@@ -9,6 +9,7 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Enum,
+    LargeBinary,
 )
 from sqlalchemy.orm import relationship, declarative_base
 from sqlalchemy.dialects.postgresql import JSONB
@@ -65,6 +66,28 @@ class Episode(Base):
     operations = relationship(
         "TradingOperation", back_populates="episode", cascade="all, delete-orphan"
     )  # Add this line
+    series = relationship(
+        "EpisodeSeries", back_populates="episode", uselist=False, cascade="all, delete-orphan"
+    )
+
+
+class EpisodeSeries(Base):
+    """Downsampled equity/drawdown series and exact path statistics of one episode."""
+    __tablename__ = "episode_series"
+
+    episode_id = Column(Integer, ForeignKey("episodes.episode_id"), primary_key=True)
+    n_steps = Column(Integer, nullable=False)
+    n_points = Column(Integer, nullable=False)
+    series = Column(LargeBinary, nullable=False)  # float32 (3, n_points): step, equity, drawdown
+    total_return = Column(Float)
+    mean_return = Column(Float)  # Mean step return
+    return_std = Column(Float)
+    downside_std = Column(Float)  # Std. dev. of negative step returns
+    max_drawdown = Column(Float)
+    max_drawdown_step = Column(Integer)
+    peak_value = Column(Float)
+
+    episode = relationship("Episode", back_populates="series")
 
 
 class Step(Base):
@@ -41,15 +41,33 @@ def get_engine(db_url=None):
         print(f"An unexpected error occurred during engine creation: {e}")
         raise
 
-# Create engine instance (can be imported elsewhere)
-# Handle potential errors during initial import/setup
-try:
-    engine = get_engine()
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-except (ValueError, OperationalError, Exception) as e:
-    print(f"Failed to initialize database engine on module load: {e}")
-    engine = None
-    SessionLocal = None # Ensure SessionLocal is None if engine fails
+# The engine and session factory are created on first use rather than at import,
+# so importing this module (or anything that imports it) never touches the database.
+_engine = None
+_session_factory = None
+
+def get_session_factory():
+    """
+    Returns the session factory, creating the global engine on first call.
+    Raises the connection error if the database is unavailable; later calls retry.
+    """
+    global _engine, _session_factory
+    if _session_factory is None:
+        _engine = get_engine()
+        _session_factory = sessionmaker(autocommit=False, autoflush=False, bind=_engine)
+    return _session_factory
+
+def __getattr__(name):
+    # Backward compatibility for `from reinforcestrategycreator.db_utils import engine, SessionLocal`.
+    # Both are None if the engine cannot be created, as they were when created at import.
+    if name in ("engine", "SessionLocal"):
+        try:
+            factory = get_session_factory()
+        except Exception as e:
+            print(f"Failed to initialize database engine: {e}")
+            return None
+        return _engine if name == "engine" else factory
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 @contextmanager # <-- Add this decorator
 def get_db_session():
@@ -61,10 +79,12 @@ def get_db_session():
             # use db session here
             db.query(...)
     """
-    if SessionLocal is None:
-        raise RuntimeError("Database session factory not initialized. Check DATABASE_URL and connection.")
+    try:
+        session_factory = get_session_factory()
+    except Exception as e:
+        raise RuntimeError("Database session factory not initialized. Check DATABASE_URL and connection.") from e
 
-    db = SessionLocal()
+    db = session_factory()
     try:
         yield db
     finally:
@@ -76,10 +96,11 @@ def init_db(engine_instance=None):
     Uses the global engine by default.
     """
     if engine_instance is None:
-        engine_instance = engine
-
-    if engine_instance is None:
-         raise RuntimeError("Database engine not initialized. Cannot create tables.")
+        try:
+            get_session_factory()
+        except Exception as e:
+            raise RuntimeError("Database engine not initialized. Cannot create tables.") from e
+        engine_instance = _engine
 
     print("Attempting to create database tables...")
     try:
@@ -0,0 +1,126 @@
+"""
+Episode Series Module
+
+Builds the compact per-episode equity/drawdown series that is persisted when
+an episode ends. The full portfolio value path is reduced to a fixed number
+of points with Largest-Triangle-Three-Buckets (LTTB) downsampling, which keeps
+the visual shape of the curve (peaks, troughs, sharp moves) far better than
+taking every k-th value. Summary statistics are computed from the full path
+before downsampling, so they are exact.
+
+The series is stored as a single little-endian float32 blob of shape
+(3, n_points): step index, portfolio value and drawdown.
+"""
+from typing import Any, Dict, Sequence
+
+import numpy as np
+
+SERIES_POINTS = 256
+SERIES_ROWS = ("step", "equity", "drawdown")
+
+
+def lttb_indices(values: Sequence[float], n_out: int) -> np.ndarray:
+    """
+    Selects the indices of an LTTB downsample of an evenly spaced series.
+
+    Args:
+        values (Sequence[float]): The series to downsample.
+        n_out (int): Number of points to keep (at least 3).
+
+    Returns:
+        np.ndarray: Sorted indices into ``values``, always including the first and
+            last point. All indices are returned if the series is not longer than n_out.
+    """
+    y = np.asarray(values, dtype=np.float64)
+    n = len(y)
+    if n <= n_out:
+        return np.arange(n)
+    if n_out < 3:
+        raise ValueError(f"n_out must be at least 3 to downsample, got {n_out}")
+
+    # n_out - 2 buckets between the fixed first and last points
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+    selected = 0
+    for bucket in range(n_out - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        if bucket == n_out - 3:
+            next_x, next_y = n - 1.0, y[-1]
+        else:
+            next_end = edges[bucket + 2]
+            next_x, next_y = (end + next_end - 1) / 2.0, y[end:next_end].mean()
+        # Twice the triangle area between the selected point, each candidate and the next bucket's mean
+        candidates = np.arange(start, end)
+        area = np.abs(
+            (selected - next_x) * (y[start:end] - y[selected])
+            - (selected - candidates) * (next_y - y[selected])
+        )
+        selected = start + int(np.argmax(area))
+        indices[bucket + 1] = selected
+    return indices
+
+
+def summarize_equity(portfolio_values: Sequence[float], n_points: int = SERIES_POINTS) -> Dict[str, Any]:
+    """
+    Computes exact summary statistics and a downsampled series for one episode.
+
+    Args:
+        portfolio_values (Sequence[float]): Portfolio value at reset followed by the
+            value after every step.
+        n_points (int): Size of the downsampled series.
+
+    Returns:
+        Dict[str, Any]: 'n_steps', 'total_return', 'mean_return', 'return_std',
+            'downside_std', 'max_drawdown', 'max_drawdown_step', 'peak_value',
+            'n_points' and 'series' (the encoded float32 blob).
+    """
+    values = np.asarray(portfolio_values, dtype=np.float64)
+    if values.size == 0:
+        raise ValueError("portfolio_values must not be empty")
+
+    peaks = np.maximum.accumulate(values)
+    drawdown = np.divide(peaks - values, peaks, out=np.zeros_like(values), where=peaks > 0)
+    previous = values[:-1]
+    returns = np.divide(np.diff(values), previous, out=np.zeros(len(previous)), where=previous != 0)
+    negative = returns[returns < 0]
+
+    indices = lttb_indices(values, n_points)
+    trough = int(np.argmax(drawdown))
+    if trough not in indices:
+        # Keep the deepest point so the drawdown chart shows the true maximum
+        pos = int(np.searchsorted(indices, trough))
+        indices[pos if pos < len(indices) - 1 else pos - 1] = trough
+
+    return {
+        "n_steps": len(values) - 1,
+        "total_return": float(values[-1] / values[0] - 1.0) if values[0] > 0 else 0.0,
+        "mean_return": float(returns.mean()) if len(returns) else 0.0,
+        "return_std": float(returns.std()) if len(returns) else 0.0,
+        "downside_std": float(negative.std()) if len(negative) else 0.0,
+        "max_drawdown": float(drawdown[trough]),
+        "max_drawdown_step": trough,
+        "peak_value": float(peaks[-1]),
+        "n_points": len(indices),
+        "series": encode_series(indices, values[indices], drawdown[indices]),
+    }
+
+
+def encode_series(steps: np.ndarray, equity: np.ndarray, drawdown: np.ndarray) -> bytes:
+    """Packs the three series rows into a little-endian float32 blob."""
+    return np.stack([steps, equity, drawdown]).astype("<f4").tobytes()
+
+
+def decode_series(blob: bytes) -> Dict[str, np.ndarray]:
+    """
+    Unpacks a blob written by ``encode_series``.
+
+    Returns:
+        Dict[str, np.ndarray]: 'step' (int64), 'equity' and 'drawdown' (float32) arrays.
+    """
+    rows = np.frombuffer(blob, dtype="<f4").reshape(len(SERIES_ROWS), -1)
+    return {
+        "step": rows[0].astype(np.int64),
+        "equity": rows[1],
+        "drawdown": rows[2],
+    }
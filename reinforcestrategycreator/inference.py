@@ -0,0 +1,243 @@
+"""
+Inference Runtime Module
+
+Loads a Q-network that was exported as a self-contained TorchScript or ONNX
+artifact and serves batched predictions from it. Loading needs neither the
+training code nor Ray/RLlib. An artifact is a directory with the serialized
+network and an ``inference.json`` manifest that records the input/output
+sizes and the feature order used to flatten dict observations.
+
+Inputs are copied into a float32 buffer that is allocated once at load time,
+so steady-state prediction does not allocate per call. ``torch`` is only
+imported for TorchScript artifacts and ``onnxruntime`` only for ONNX ones.
+"""
+import copy
+import datetime
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE = "inference.json"
+ARTIFACT_FILES = {"torchscript": "model.ts", "onnx": "model.onnx"}
+DEFAULT_ACTION_NAMES = ["HOLD", "BUY", "SELL"]
+
+
+def export_inference_artifact(model: Any,
+                              input_dim: int,
+                              export_dir: str,
+                              fmt: str = "torchscript",
+                              feature_names: Optional[Sequence[str]] = None,
+                              action_names: Optional[Sequence[str]] = None,
+                              metadata: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Serializes a torch Q-network into an artifact directory for InferenceRuntime.
+
+    Args:
+        model: A ``torch.nn.Module`` mapping (batch, input_dim) to (batch, n_actions).
+            It may live on any device; a CPU copy is exported and ``model`` is left as is.
+        input_dim: Number of input features.
+        export_dir: Directory to write the artifact to (created if missing).
+        fmt: "torchscript" or "onnx".
+        feature_names: Order in which dict observations are flattened.
+        action_names: Names of the output actions.
+        metadata: Extra JSON-serializable information stored in the manifest.
+
+    Returns:
+        str: The artifact directory.
+    """
+    import torch
+
+    if fmt not in ARTIFACT_FILES:
+        raise ValueError(f"Unknown artifact format '{fmt}'. Expected one of {sorted(ARTIFACT_FILES)}")
+    if feature_names is not None and len(feature_names) != input_dim:
+        raise ValueError(f"Got {len(feature_names)} feature names for input_dim {input_dim}")
+
+    os.makedirs(export_dir, exist_ok=True)
+    artifact_path = os.path.join(export_dir, ARTIFACT_FILES[fmt])
+    example = torch.zeros(1, input_dim, dtype=torch.float32)
+
+    # InferenceRuntime runs on CPU, so trace a CPU copy in eval mode
+    cpu_model = copy.deepcopy(model).cpu().eval()
+    with torch.no_grad():
+        output_dim = int(cpu_model(example).shape[-1])
+        if fmt == "torchscript":
+            traced = torch.jit.trace(cpu_model, example)
+            torch.jit.save(torch.jit.freeze(traced), artifact_path)
+        else:
+            torch.onnx.export(
+                cpu_model, (example,), artifact_path,
+                input_names=["observations"], output_names=["q_values"],
+                dynamic_axes={"observations": {0: "batch"}, "q_values": {0: "batch"}}
+            )
+
+    manifest = {
+        "format": fmt,
+        "file": ARTIFACT_FILES[fmt],
+        "input_dim": int(input_dim),
+        "output_dim": output_dim,
+        "feature_names": list(feature_names) if feature_names is not None else None,
+        "action_names": list(action_names) if action_names is not None else DEFAULT_ACTION_NAMES[:output_dim],
+        "exported_at": datetime.datetime.now().isoformat(),
+        "metadata": metadata or {},
+    }
+    with open(os.path.join(export_dir, MANIFEST_FILE), "w") as f:
+        json.dump(manifest, f, indent=4)
+
+    logger.info(f"Exported {fmt} inference artifact to {export_dir}")
+    return export_dir
+
+
+class InferenceRuntime:
+    """
+    Batched inference over an exported TorchScript or ONNX Q-network.
+
+    Attributes:
+        backend (str): "torchscript" or "onnx".
+        input_dim (int): Number of input features.
+        output_dim (int): Number of actions.
+        feature_names (Optional[List[str]]): Flattening order for dict observations.
+        action_names (List[str]): Names of the actions.
+        max_batch_size (int): Rows per forward pass; larger inputs are processed in chunks.
+
+    The input buffer is shared by all callers; each chunk's copy and forward
+    pass run under a lock, so concurrent calls from several threads are safe
+    but do not run their forward passes in parallel.
+    """
+
+    def __init__(self, artifact_dir: str, num_threads: Optional[int] = None, max_batch_size: int = 1024) -> None:
+        """
+        Load an artifact written by ``export_inference_artifact``.
+
+        Args:
+            artifact_dir: Directory containing ``inference.json`` and the model file.
+            num_threads: Intra-op threads for the backend. For TorchScript this calls
+                ``torch.set_num_threads``, which is process-wide. None keeps the default.
+            max_batch_size: Rows of the preallocated input buffer.
+        """
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be positive, got {max_batch_size}")
+
+        with open(os.path.join(artifact_dir, MANIFEST_FILE), "r") as f:
+            self.manifest = json.load(f)
+
+        self.artifact_dir = artifact_dir
+        self.backend = self.manifest["format"]
+        self.input_dim = int(self.manifest["input_dim"])
+        self.output_dim = int(self.manifest["output_dim"])
+        self.feature_names: Optional[List[str]] = self.manifest.get("feature_names")
+        self.action_names: List[str] = self.manifest.get("action_names") or DEFAULT_ACTION_NAMES[:self.output_dim]
+        self.metadata: Dict[str, Any] = self.manifest.get("metadata", {})
+        self.max_batch_size = max_batch_size
+        self.num_threads = num_threads
+
+        self._buffer = np.zeros((max_batch_size, self.input_dim), dtype=np.float32)
+        self._buffer_lock = threading.Lock()
+        model_path = os.path.join(artifact_dir, self.manifest["file"])
+        if self.backend == "torchscript":
+            self._load_torchscript(model_path)
+        elif self.backend == "onnx":
+            self._load_onnx(model_path)
+        else:
+            raise ValueError(f"Unsupported artifact format '{self.backend}' in {artifact_dir}")
+
+        logger.info(f"Loaded {self.backend} inference runtime from {artifact_dir} "
+                    f"(input_dim={self.input_dim}, actions={self.output_dim}, threads={num_threads})")
+
+    def _load_torchscript(self, model_path: str) -> None:
+        import torch
+
+        if self.num_threads is not None:
+            torch.set_num_threads(self.num_threads)
+        self._torch = torch
+        self._module = torch.jit.load(model_path, map_location="cpu")
+        self._module.eval()
+        # Shares memory with the numpy buffer, so filling one fills the other
+        self._buffer_tensor = torch.from_numpy(self._buffer)
+
+    def _load_onnx(self, model_path: str) -> None:
+        try:
+            import onnxruntime
+        except ImportError as e:
+            raise ImportError("onnxruntime is required to load ONNX inference artifacts") from e
+
+        options = onnxruntime.SessionOptions()
+        if self.num_threads is not None:
+            options.intra_op_num_threads = self.num_threads
+            options.inter_op_num_threads = 1
+        self._session = onnxruntime.InferenceSession(model_path, options, providers=["CPUExecutionProvider"])
+        self._input_name = self._session.get_inputs()[0].name
+
+    def _forward(self, rows: int) -> np.ndarray:
+        """Q-values for the first ``rows`` rows of the input buffer."""
+        if self.backend == "torchscript":
+            with self._torch.inference_mode():
+                return self._module(self._buffer_tensor[:rows]).numpy()
+        return self._session.run(None, {self._input_name: self._buffer[:rows]})[0]
+
+    def q_values_batch(self, observations: np.ndarray) -> np.ndarray:
+        """
+        Compute Q-values for a batch of flat observations.
+
+        Args:
+            observations: Array of shape (n, input_dim), or (input_dim,) for one row.
+
+        Returns:
+            np.ndarray: Float32 array of shape (n, output_dim).
+        """
+        observations = np.asarray(observations)
+        if observations.ndim == 1:
+            observations = observations[None, :]
+        if observations.ndim != 2 or observations.shape[1] != self.input_dim:
+            raise ValueError(f"Expected observations of shape (n, {self.input_dim}), got {observations.shape}")
+
+        n = len(observations)
+        q_values = np.empty((n, self.output_dim), dtype=np.float32)
+        for start in range(0, n, self.max_batch_size):
+            rows = min(self.max_batch_size, n - start)
+            with self._buffer_lock:
+                np.copyto(self._buffer[:rows], observations[start:start + rows], casting="same_kind")
+                q_values[start:start + rows] = self._forward(rows)
+        return q_values
+
+    def predict_batch(self, observations: np.ndarray) -> np.ndarray:
+        """
+        Greedy actions for a batch of flat observations.
+
+        Args:
+            observations: Array of shape (n, input_dim).
+
+        Returns:
+            np.ndarray: Int64 array of n action indices.
+        """
+        return np.argmax(self.q_values_batch(observations), axis=1)
+
+    def observation_to_array(self, observation: Union[Mapping[str, Any], Sequence[float], np.ndarray]) -> np.ndarray:
+        """
+        Flatten one observation into a float32 row.
+
+        Dict observations are ordered by the manifest's feature names when they
+        were exported, otherwise by insertion order.
+        """
+        if isinstance(observation, Mapping):
+            if self.feature_names is not None:
+                values = [observation[name] for name in self.feature_names]
+            else:
+                values = list(observation.values())
+            return np.asarray(values, dtype=np.float32)
+        return np.asarray(observation, dtype=np.float32).reshape(-1)
+
+    def predict(self, observation: Union[Mapping[str, Any], Sequence[float], np.ndarray]) -> int:
+        """Greedy action for a single observation (dict or flat array)."""
+        return int(self.predict_batch(self.observation_to_array(observation))[0])
+
+    def action_probabilities(self, observation: Union[Mapping[str, Any], Sequence[float], np.ndarray]) -> np.ndarray:
+        """Softmax over the Q-values of a single observation."""
+        q_values = self.q_values_batch(self.observation_to_array(observation))[0].astype(np.float64)
+        exp = np.exp(q_values - q_values.max())
+        return exp / exp.sum()
@@ -0,0 +1,445 @@
+"""
+Portfolio Environment Module
+
+This module provides a multi-asset reinforcement learning environment. The market
+is held as one (time x assets x features) tensor and every per-step operation -
+rebalancing, costs, risk limits, reward and observation - is vectorized across
+assets, so a step over hundreds of assets costs little more than a step over one.
+"""
+
+import logging
+import numpy as np
+import pandas as pd
+import gymnasium as gym
+from gymnasium import spaces
+from typing import Tuple, Dict, Any, Optional, Union, List
+from collections import deque
+
+from reinforcestrategycreator.trading_environment import calculate_reward_components
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+ACTION_MODES = ("weights", "positions")
+
+
+def build_panel(data: Union[np.ndarray, pd.DataFrame, Dict[str, pd.DataFrame]],
+                asset_names: Optional[List[str]] = None,
+                feature_names: Optional[List[str]] = None) -> Tuple[np.ndarray, List[str], List[str]]:
+    """
+    Converts market data into a time-major (time, assets, features) float64 tensor.
+
+    Args:
+        data: One of
+            * an ndarray of shape (assets, time, features),
+            * a dict mapping asset name to a DataFrame, all on the same index,
+            * a long DataFrame with 'symbol' and 'timestamp' columns, as produced by
+              SyntheticDataSource.
+        asset_names (Optional[List[str]]): Asset names for ndarray input.
+        feature_names (Optional[List[str]]): Feature names for ndarray input. For
+            DataFrame input, the numeric columns to use (default: all numeric columns).
+
+    Returns:
+        Tuple[np.ndarray, List[str], List[str]]: The tensor, asset names and feature names.
+
+    Raises:
+        ValueError: If the input has the wrong shape or the assets are not aligned in time.
+    """
+    if isinstance(data, pd.DataFrame):
+        if "symbol" not in data.columns:
+            raise ValueError("A long-format DataFrame needs a 'symbol' column")
+        keys = [c for c in ("symbol", "timestamp") if c in data.columns]
+        frame = data.sort_values(keys, kind="stable")
+        groups = frame.groupby("symbol", observed=True, sort=True)
+        # Index each asset by its timestamps (or bar position) so the alignment check compares times
+        if "timestamp" in keys:
+            data = {str(symbol): group.drop(columns="symbol").set_index("timestamp") for symbol, group in groups}
+        else:
+            data = {str(symbol): group.drop(columns="symbol").reset_index(drop=True) for symbol, group in groups}
+
+    if isinstance(data, dict):
+        if not data:
+            raise ValueError("No assets given")
+        frames = list(data.values())
+        columns = feature_names or [c for c in frames[0].columns if pd.api.types.is_numeric_dtype(frames[0][c])]
+        lengths = {len(frame) for frame in frames}
+        if len(lengths) != 1:
+            raise ValueError(f"All assets must have the same number of rows, got lengths {sorted(lengths)}")
+        misaligned = [str(name) for name, frame in data.items() if not frame.index.equals(frames[0].index)]
+        if misaligned:
+            raise ValueError(f"All assets must share the index of the first asset; misaligned: {misaligned}")
+        panel = np.stack([frame[columns].to_numpy(dtype=np.float64) for frame in frames], axis=1)
+        return panel, [str(name) for name in data], [str(c) for c in columns]
+
+    panel = np.asarray(data, dtype=np.float64)
+    if panel.ndim != 3:
+        raise ValueError(f"Expected an (assets, time, features) array, got shape {panel.shape}")
+    n_assets, _, n_features = panel.shape
+    asset_names = list(asset_names) if asset_names is not None else [f"asset_{i}" for i in range(n_assets)]
+    feature_names = list(feature_names) if feature_names is not None else [f"feature_{i}" for i in range(n_features)]
+    if len(asset_names) != n_assets or len(feature_names) != n_features:
+        raise ValueError("asset_names and feature_names must match the array shape")
+    return np.ascontiguousarray(panel.transpose(1, 0, 2)), asset_names, feature_names
+
+
+class PortfolioTradingEnv(gym.Env):
+    """
+    Multi-asset portfolio environment for reinforcement learning.
+
+    The agent chooses a target allocation for every asset at once. Each step the
+    portfolio is marked to market at the new prices, rebalanced to the target
+    (paying commission and slippage on the traded notional) and rewarded with the
+    same composite Sharpe / PnL / drawdown reward as TradingEnv.
+
+    Actions:
+        * ``action_mode="weights"`` (default): Box of per-asset target weights in
+          [-1, 1] ([0, 1] without shorting), clipped to ``max_position_weight`` and
+          scaled down so gross exposure never exceeds ``max_leverage``.
+        * ``action_mode="positions"``: MultiDiscrete per-asset position as in
+          TradingEnv (0 = Flat, 1 = Long, 2 = Short); every non-flat asset gets an
+          equal share of ``max_leverage``.
+
+    Observation (flat float32 vector):
+        * market window of shape (window_size, assets, features), each asset and
+          feature z-scored with its own rolling statistics and clipped to +/-10,
+        * per asset: current portfolio weight and the cross-sectional z-score of
+          its latest log return (relative strength against the other assets),
+        * portfolio: cash weight, gross exposure and current drawdown.
+
+    Attributes:
+        asset_names (List[str]): Asset names, in action and observation order.
+        feature_names (List[str]): Feature names of the market window.
+        n_assets (int): Number of assets.
+        action_space (gym.spaces.Space): The action space of the environment.
+        observation_space (gym.spaces.Space): The observation space of the environment.
+    """
+
+    def __init__(self, env_config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the portfolio environment.
+
+        Args:
+            env_config (Dict[str, Any]): Configuration dictionary:
+                data: Market data, see build_panel.
+                asset_names (List[str], optional): Asset names for ndarray data.
+                feature_names (List[str], optional): Feature names for ndarray data,
+                    or the DataFrame columns to use.
+                price_feature (str): Feature used as the trading price. Default 'close'.
+                initial_balance (float): Initial account balance. Default 100000.
+                transaction_fee_percent (float or array): Fee percentage of traded notional,
+                    scalar or one value per asset. Default 0.1.
+                slippage_bps (float or array): Slippage in basis points of traded notional,
+                    scalar or one value per asset. Default 3.
+                action_mode (str): 'weights' or 'positions'. Default 'weights'.
+                allow_short (bool): Whether negative weights are allowed. Default True.
+                max_position_weight (float): Cap on the absolute weight of one asset. Default 1.0.
+                max_leverage (float): Cap on gross exposure (sum of absolute weights). Default 1.0.
+                window_size (int): Number of bars in the market window. Default 5.
+                normalization_window_size (int): Window of the rolling z-score. Default 20.
+                sharpe_window_size (int): Window of the Sharpe reward component. Default 60.
+                sharpe_weight (float): Weight of the Sharpe component; PnL gets the rest. Default 0.7.
+                drawdown_threshold (float): Drawdown above which a penalty applies. Default 0.05.
+                drawdown_penalty_coefficient (float): Drawdown penalty coefficient. Default 0.002.
+                risk_free_rate (float): Per-step risk-free rate. Default 0.0.
+
+        Raises:
+            ValueError: If the data or configuration is invalid.
+        """
+        super(PortfolioTradingEnv, self).__init__()
+        env_config = dict(env_config or {})
+        if env_config.get("data") is None:
+            raise ValueError("env_config['data'] is required")
+
+        self._panel, self.asset_names, self.feature_names = build_panel(
+            env_config["data"], env_config.get("asset_names"), env_config.get("feature_names")
+        )
+        self.n_steps, self.n_assets, self.n_features = self._panel.shape
+
+        price_feature = env_config.get("price_feature", "close")
+        lowered = [name.lower() for name in self.feature_names]
+        if price_feature.lower() not in lowered:
+            raise ValueError(f"Price feature '{price_feature}' not in features {self.feature_names}")
+        self._prices = np.ascontiguousarray(self._panel[:, :, lowered.index(price_feature.lower())])
+        if not np.all(np.isfinite(self._prices)) or np.any(self._prices <= 0):
+            raise ValueError("Prices must be finite and positive for every asset and step")
+
+        # Trading parameters
+        self.initial_balance = float(env_config.get("initial_balance", 100000.0))
+        self.transaction_fee_percent = np.broadcast_to(
+            np.asarray(env_config.get("transaction_fee_percent", 0.1), dtype=np.float64), (self.n_assets,))
+        self.slippage_bps = np.broadcast_to(
+            np.asarray(env_config.get("slippage_bps", 3), dtype=np.float64), (self.n_assets,))
+        self._cost_rate = self.transaction_fee_percent / 100 + self.slippage_bps / 10000
+        self.action_mode = env_config.get("action_mode", "weights")
+        if self.action_mode not in ACTION_MODES:
+            raise ValueError(f"Unknown action_mode '{self.action_mode}'. Expected one of {ACTION_MODES}")
+        self.allow_short = bool(env_config.get("allow_short", True))
+        self.max_position_weight = float(env_config.get("max_position_weight", 1.0))
+        self.max_leverage = float(env_config.get("max_leverage", 1.0))
+
+        # Observation parameters
+        self.window_size = int(env_config.get("window_size", 5))
+        self.normalization_window_size = int(env_config.get("normalization_window_size", 20))
+        if self.n_steps <= self.window_size:
+            raise ValueError(f"Need more than window_size={self.window_size} steps, got {self.n_steps}")
+
+        # Reward parameters, shared with TradingEnv
+        self.sharpe_window_size = int(env_config.get("sharpe_window_size", 60))
+        self.sharpe_weight = float(env_config.get("sharpe_weight", 0.7))
+        self.pnl_weight = 1.0 - self.sharpe_weight
+        self.drawdown_threshold = float(env_config.get("drawdown_threshold", 0.05))
+        self.drawdown_penalty_coefficient = float(env_config.get("drawdown_penalty_coefficient", 0.002))
+        self.risk_free_rate = float(env_config.get("risk_free_rate", 0.0))
+
+        self._precompute_features()
+
+        if self.action_mode == "weights":
+            low = -1.0 if self.allow_short else 0.0
+            self.action_space = spaces.Box(low=low, high=1.0, shape=(self.n_assets,), dtype=np.float32)
+        else:
+            self.action_space = spaces.MultiDiscrete([3] * self.n_assets)
+
+        self._market_size = self.window_size * self.n_assets * self.n_features
+        observation_size = self._market_size + 2 * self.n_assets + 3
+        self.observation_space = spaces.Box(low=-np.inf, high=np.inf, shape=(observation_size,), dtype=np.float32)
+
+        self.reset()
+
+        logger.info(f"PortfolioTradingEnv initialized with {self.n_assets} assets x {self.n_steps} steps x "
+                    f"{self.n_features} features, initial balance {self.initial_balance}, action mode {self.action_mode}")
+
+    def _precompute_features(self) -> None:
+        """
+        Precomputes everything the observation needs for all steps at once.
+
+        The rolling z-score of every (asset, feature) column and the cross-sectional
+        z-score of log returns are computed once here, so a step only slices them.
+        """
+        flat = pd.DataFrame(self._panel.reshape(self.n_steps, -1))
+        rolling = flat.rolling(window=self.normalization_window_size, min_periods=1)
+        mean = rolling.mean().to_numpy()
+        std = np.nan_to_num(rolling.std().to_numpy(), nan=0.0) + 1e-8
+        self._rolling_mean = mean.reshape(self._panel.shape)
+        self._rolling_std = std.reshape(self._panel.shape)
+
+        log_returns = np.zeros_like(self._prices)
+        log_returns[1:] = np.log(self._prices[1:] / self._prices[:-1])
+        if self.n_assets > 1:
+            cross_std = log_returns.std(axis=1, keepdims=True)
+            relative = (log_returns - log_returns.mean(axis=1, keepdims=True)) / (cross_std + 1e-8)
+        else:
+            relative = np.zeros_like(log_returns)
+        self._relative_strength = np.clip(relative, -10, 10)
+
+    def reset(self, seed: Optional[int] = None, options: Optional[Dict[str, Any]] = None) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """
+        Reset the environment to an all-cash portfolio at the first full window.
+
+        Args:
+            seed (Optional[int]): Random seed for reproducibility.
+            options (Optional[Dict[str, Any]]): Additional options for reset.
+
+        Returns:
+            Tuple[np.ndarray, Dict[str, Any]]: Initial observation and info dictionary.
+        """
+        super().reset(seed=seed)
+
+        self.current_step = self.window_size - 1
+        self.balance = self.initial_balance
+        self.holdings = np.zeros(self.n_assets, dtype=np.float64)
+        self.weights = np.zeros(self.n_assets, dtype=np.float64)
+        self.portfolio_value = self.initial_balance
+        self.last_portfolio_value = self.initial_balance
+
+        self._portfolio_peak_value = self.initial_balance
+        self._recent_returns = deque(maxlen=self.sharpe_window_size)
+        self._episode_portfolio_returns = []
+        self._episode_portfolio_values = [self.initial_balance]
+        self.episode_max_drawdown = 0.0
+        self._episode_total_reward = 0.0
+        self._episode_costs = 0.0
+        self._episode_turnover = 0.0
+
+        info = {
+            'balance': self.balance,
+            'portfolio_value': self.portfolio_value,
+            'weights': self.weights.copy(),
+            'step': self.current_step,
+        }
+        return self._get_observation(), info
+
+    def step(self, action: Union[np.ndarray, List[float]]) -> Tuple[np.ndarray, float, bool, bool, Dict[str, Any]]:
+        """
+        Advance one bar, rebalance to the target allocation and compute the reward.
+
+        Args:
+            action: Per-asset target weights or positions, see the class docstring.
+
+        Returns:
+            Tuple[np.ndarray, float, bool, bool, Dict[str, Any]]: Observation, reward,
+                terminated flag, truncated flag and info dictionary.
+        """
+        self.current_step += 1
+        prices = self._prices[self.current_step]
+
+        # Mark to market at the new prices
+        self.last_portfolio_value = self.portfolio_value
+        value_before = self.balance + self.holdings @ prices
+
+        # Rebalance to the target weights; commission and slippage are charged on traded notional
+        target_weights = self._target_weights(action)
+        target_holdings = target_weights * max(value_before, 0.0) / prices
+        traded_notional = np.abs(target_holdings - self.holdings) * prices
+        costs = float(traded_notional @ self._cost_rate)
+        self.balance -= (target_holdings - self.holdings) @ prices + costs
+        self.holdings = target_holdings
+
+        self.portfolio_value = self.balance + self.holdings @ prices
+        self.weights = self.holdings * prices / self.portfolio_value if self.portfolio_value > 0 else np.zeros(self.n_assets)
+        turnover = float(traded_notional.sum() / value_before) if value_before > 0 else 0.0
+        self._episode_costs += costs
+        self._episode_turnover += turnover
+
+        self._portfolio_peak_value = max(self._portfolio_peak_value, self.portfolio_value)
+        self._episode_portfolio_values.append(self.portfolio_value)
+        reward = self._calculate_reward()
+        self._episode_total_reward += reward
+
+        terminated = self.current_step >= self.n_steps - 1 or self.portfolio_value <= 0
+        truncated = False
+        observation = self._get_observation()
+
+        info = {
+            'balance': self.balance,
+            'portfolio_value': self.portfolio_value,
+            'weights': self.weights.copy(),
+            'gross_exposure': float(np.abs(self.weights).sum()),
+            'net_exposure': float(self.weights.sum()),
+            'turnover': turnover,
+            'costs': costs,
+            'step': self.current_step,
+            'step_reward': reward,
+        }
+
+        if terminated:
+            info['initial_portfolio_value'] = self.initial_balance
+            info['final_portfolio_value'] = self.portfolio_value
+            info['pnl'] = self.portfolio_value - self.initial_balance
+            info['max_drawdown'] = self.episode_max_drawdown
+            returns = np.asarray(self._episode_portfolio_returns)
+            if len(returns) >= 2 and np.std(returns) > 1e-8:
+                info['sharpe_ratio'] = (np.mean(returns) - self.risk_free_rate) / np.std(returns)
+            else:
+                info['sharpe_ratio'] = 0.0
+            info['total_costs'] = self._episode_costs
+            info['total_turnover'] = self._episode_turnover
+            info['total_reward'] = self._episode_total_reward
+            info['total_steps'] = len(self._episode_portfolio_values) - 1
+            info['portfolio_values'] = np.asarray(self._episode_portfolio_values, dtype=np.float64)
+            logger.info(f"Portfolio episode ended: final_pf={self.portfolio_value:.2f}, pnl={info['pnl']:.2f}, "
+                        f"sharpe={info['sharpe_ratio']:.4f}, mdd={self.episode_max_drawdown:.4f}, costs={self._episode_costs:.2f}")
+
+        return observation, reward, terminated, truncated, info
+
+    def _target_weights(self, action: Union[np.ndarray, List[float]]) -> np.ndarray:
+        """
+        Turns an action into risk-limited target weights.
+
+        Args:
+            action: Per-asset target weights or positions.
+
+        Returns:
+            np.ndarray: Target weight per asset, within the position and leverage limits.
+
+        Raises:
+            ValueError: If the action does not have one entry per asset.
+        """
+        action = np.asarray(action, dtype=np.float64).reshape(-1)
+        if action.shape[0] != self.n_assets:
+            raise ValueError(f"Expected an action for each of {self.n_assets} assets, got {action.shape[0]}")
+
+        if self.action_mode == "positions":
+            # 0 = Flat, 1 = Long, 2 = Short, as in TradingEnv
+            direction = np.where(action == 1, 1.0, np.where(action == 2, -1.0, 0.0))
+            active = np.count_nonzero(direction)
+            weights = direction * (self.max_leverage / active) if active else direction
+        else:
+            weights = np.nan_to_num(action, nan=0.0)
+
+        lower = -self.max_position_weight if self.allow_short else 0.0
+        weights = np.clip(weights, lower, self.max_position_weight)
+        gross = np.abs(weights).sum()
+        if gross > self.max_leverage:
+            weights = weights * (self.max_leverage / gross)
+        return weights
+
+    def _calculate_reward(self) -> float:
+        """
+        Calculate the composite reward from the portfolio's step return.
+
+        Uses the same Sharpe, PnL and drawdown components and weights as TradingEnv.
+
+        Returns:
+            float: The calculated reward value.
+        """
+        if self.last_portfolio_value <= 0:
+            logger.warning("Last portfolio value was not positive, returning 0 reward to avoid division by zero.")
+            return 0.0
+
+        percentage_change = (self.portfolio_value - self.last_portfolio_value) / self.last_portfolio_value
+        self._episode_portfolio_returns.append(percentage_change)
+        self._recent_returns.append(percentage_change)
+
+        components = calculate_reward_components(
+            percentage_change, self._recent_returns, self.portfolio_value, self._portfolio_peak_value,
+            risk_free_rate=self.risk_free_rate,
+            drawdown_threshold=self.drawdown_threshold,
+            drawdown_penalty_coefficient=self.drawdown_penalty_coefficient
+        )
+        self.episode_max_drawdown = max(self.episode_max_drawdown, components["drawdown"])
+        return float(self.sharpe_weight * components["sharpe"] + self.pnl_weight * components["pnl"]
+                     - components["drawdown_penalty"])
+
+    def _get_observation(self) -> np.ndarray:
+        """
+        Get the current cross-asset observation.
+
+        The market window is normalized with the current step's rolling statistics,
+        as in TradingEnv, for all assets and features in one operation.
+
+        Returns:
+            np.ndarray: Flat float32 observation, see the class docstring for the layout.
+        """
+        t = self.current_step
+        window = self._panel[t - self.window_size + 1:t + 1]
+        market = np.clip((window - self._rolling_mean[t]) / self._rolling_std[t], -10, 10)
+
+        observation = np.empty(self.observation_space.shape, dtype=np.float32)
+        observation[:self._market_size] = market.reshape(-1)
+        offset = self._market_size
+        observation[offset:offset + self.n_assets] = self.weights
+        observation[offset + self.n_assets:offset + 2 * self.n_assets] = self._relative_strength[t]
+        drawdown = (self._portfolio_peak_value - self.portfolio_value) / self._portfolio_peak_value
+        observation[-3:] = (self.balance / self.portfolio_value if self.portfolio_value > 0 else 0.0,
+                            np.abs(self.weights).sum(),
+                            max(0.0, drawdown))
+        return np.nan_to_num(observation, copy=False)
+
+    def render(self, mode: str = 'human') -> None:
+        """
+        Print the portfolio value and the largest positions.
+
+        Args:
+            mode (str): The rendering mode.
+        """
+        if mode == 'human':
+            top = np.argsort(-np.abs(self.weights))[:5]
+            positions = ", ".join(f"{self.asset_names[i]}={self.weights[i]:+.2%}" for i in top if self.weights[i] != 0)
+            print(f"Step: {self.current_step}, Portfolio Value: {self.portfolio_value:.2f}, "
+                  f"Cash: {self.balance:.2f}, Positions: {positions or 'none'}")
+
+    def close(self) -> None:
+        """
+        Clean up resources.
+        """
+        pass
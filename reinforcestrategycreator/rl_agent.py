@@ -9,7 +9,7 @@ This module provides a reinforcement learning agent for strategy creation.
 import logging
 import numpy as np
 import random
-from typing import List, Tuple, Any, Union, Dict
+from typing import List, Tuple, Any, Union, Dict, Optional
 from collections import deque
 
 import torch
@@ -354,6 +354,44 @@ class StrategyAgent:
         else:
             return int(action)
 
+    def select_actions_batch(self, states: np.ndarray,
+                             epsilon: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Select actions for a batch of states with a single forward pass.
+
+        Applies the same epsilon-greedy rule and confidence scaling as
+        select_action, independently for each row.
+
+        Args:
+            states: Array of shape (batch_size, state_size)
+            epsilon: Exploration rate to use instead of self.epsilon
+
+        Returns:
+            Tuple of (actions, confidences), each of shape (batch_size,)
+        """
+        epsilon = self.epsilon if epsilon is None else epsilon
+        states = np.asarray(states, dtype=np.float32)
+        batch_size = len(states)
+
+        state_tensor = torch.from_numpy(states).to(self.device)
+        self.model.eval()
+        with torch.no_grad():
+            q_values_np = self.model(state_tensor).cpu().numpy()
+        self.model.train()
+
+        actions = np.argmax(q_values_np, axis=1)
+        exp_q_values = np.exp(q_values_np - q_values_np.max(axis=1, keepdims=True))
+        softmax_probs = exp_q_values / exp_q_values.sum(axis=1, keepdims=True)
+        confidences = np.minimum(0.9, softmax_probs[np.arange(batch_size), actions])
+
+        # Exploration - random actions with low confidence
+        explore = np.random.rand(batch_size) <= epsilon
+        if explore.any():
+            actions[explore] = np.random.randint(self.action_size, size=int(explore.sum()))
+            confidences[explore] = 0.1
+
+        return actions.astype(int), confidences.astype(float)
+
     def learn(self, return_stats: bool = False) -> Union[None, dict]:
         """
         Samples a batch from memory, calculates target Q-values, and trains the Q-network.
@@ -547,7 +585,67 @@ class StrategyAgent:
         # self.update_target_model() # Ensure target model is also updated
         # logger.info(f"PyTorch model loaded from {path}")
         pass # RLlib handles loading
-        
+
+    def get_state(self, include_replay_buffer: bool = False) -> Dict[str, Any]:
+        """
+        Capture everything needed to continue training this agent elsewhere.
+
+        Used for Ray Tune checkpoints, so a paused trial can resume and a
+        population-based scheduler can clone a trial into another one.
+
+        Args:
+            include_replay_buffer (bool): Also capture the replay memory (and PER
+                priorities). Resuming without it refills the buffer from scratch.
+
+        Returns:
+            Dict[str, Any]: Network, target network and optimizer state dicts plus
+            exploration and step counters.
+        """
+        state = {
+            "model": self.model.state_dict(),
+            "target_model": self.target_model.state_dict(),
+            "optimizer": self.optimizer.state_dict(),
+            "epsilon": self.epsilon,
+            "update_counter": self.update_counter,
+            "beta_step": self.beta_step,
+            "prioritized_replay_beta": self.prioritized_replay_beta
+        }
+        if include_replay_buffer:
+            state["memory"] = list(self.memory)
+            if self.use_prioritized_replay:
+                state["priorities"] = np.array(self.priorities, copy=True)
+        return state
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        """
+        Restore a state captured by ``get_state``.
+
+        The agent's own hyperparameters win over the checkpointed ones: the
+        optimizer's learning rate is reset to ``self.learning_rate`` and the
+        epsilon decay settings are left untouched, so a cloned trial continues
+        with its perturbed configuration.
+
+        Args:
+            state (Dict[str, Any]): State returned by ``get_state``.
+        """
+        self.model.load_state_dict(state["model"])
+        self.target_model.load_state_dict(state["target_model"])
+        self.optimizer.load_state_dict(state["optimizer"])
+        for param_group in self.optimizer.param_groups:
+            param_group["lr"] = self.learning_rate
+        self.epsilon = max(self.epsilon_min, state["epsilon"])
+        self.update_counter = state["update_counter"]
+        self.beta_step = state.get("beta_step", 0)
+        self.prioritized_replay_beta = state.get("prioritized_replay_beta", self.prioritized_replay_beta)
+        if "memory" in state:
+            if self.use_prioritized_replay:
+                self.memory = list(state["memory"])
+                if "priorities" in state:
+                    self.priorities = np.array(state["priorities"], copy=True)
+            else:
+                self.memory = deque(state["memory"], maxlen=self.memory_size)
+
+
     def get_per_metrics(self) -> Dict[str, float]:
         """
         Returns metrics related to Prioritized Experience Replay.
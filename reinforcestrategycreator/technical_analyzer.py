@@ -6,18 +6,29 @@ This module provides functionality to calculate technical indicators on financia
 :Context TA Layer (Req 2.2)
 """
 
+import importlib
 import logging
 import pandas as pd
-import pandas_ta as pta # Import pandas_ta
-from ta.momentum import RSIIndicator
-from ta.trend import MACD
-from ta.volatility import BollingerBands
 from typing import Optional
 import numpy as np # For historical volatility calculation
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# ta and pandas_ta take about half a second to import, so they are loaded on
+# first use. The indicator classes stay reachable as module attributes.
+_TA_INDICATORS = {
+    "RSIIndicator": "ta.momentum",
+    "MACD": "ta.trend",
+    "BollingerBands": "ta.volatility",
+}
+
+
+def __getattr__(name):
+    if name in _TA_INDICATORS:
+        return getattr(importlib.import_module(_TA_INDICATORS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 class TechnicalAnalyzer:
     """
@@ -82,6 +93,11 @@ def calculate_indicators(data: pd.DataFrame) -> pd.DataFrame:
         - AROONOSC_14: Aroon Oscillator (14)
         - ATR_14: Average True Range (14)
     """
+    import pandas_ta  # noqa: F401 - registers the DataFrame.ta accessor
+    from ta.momentum import RSIIndicator
+    from ta.trend import MACD
+    from ta.volatility import BollingerBands
+
     # Create a copy of the input DataFrame to avoid modifying the original
     result_df = data.copy()
     
@@ -0,0 +1,135 @@
+"""Compare memory and wall-clock time of materialized versus shared-data parallel CV.
+
+Runs 10-fold cross-validation over a random float feature frame with
+``CrossValidator(use_multiprocessing=True)``, once with materialized folds
+(every fold pickled to a worker) and once with ``shared_data=True`` (the
+frame published once to shared memory, workers receive fold indices). The
+fold "training" only computes column means, so the numbers isolate data
+movement. Each mode runs ``compare_models`` over two models so the second
+model shows the warm pool. The parent's peak private memory (``RssAnon``,
+Linux only) is sampled during each run, and the bytes that each mode pickles
+into the pool are computed from the fold payloads.
+
+Usage (from the repository root):
+    python -m reinforcestrategycreator_pipeline.benchmarks.bench_cross_validator --rows 4000000 --columns 64
+"""
+
+import argparse
+import logging
+import pickle
+import tempfile
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from reinforcestrategycreator_pipeline.src.evaluation.cross_validator import CrossValidator, CVFoldResult
+from reinforcestrategycreator_pipeline.src.pipeline.shared_store import SharedValueStore
+
+
+def anon_rss_mb() -> float:
+    """Anonymous resident memory of this process in MiB, or NaN off Linux."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("RssAnon:"):
+                    return int(line.split()[1]) / 1024.0
+    except OSError:
+        pass
+    return float("nan")
+
+
+class FoldStatsValidator(CrossValidator):
+    """CrossValidator whose folds only compute column means."""
+
+    def _train_fold(self, fold_idx, train_data, val_data, model_config, training_config,
+                    metrics, save_models, callbacks):
+        start = time.perf_counter()
+        train_mean = float(train_data.mean().mean())
+        val_mean = float(val_data.mean().mean())
+        return CVFoldResult(
+            fold_idx=fold_idx,
+            train_metrics={"loss": train_mean},
+            val_metrics={"loss": val_mean},
+            training_time=time.perf_counter() - start
+        )
+
+
+class PeakSampler:
+    """Samples this process's private memory in a background thread."""
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.peak = 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.peak = max(self.peak, anon_rss_mb())
+            time.sleep(self.interval)
+
+    def __enter__(self) -> "PeakSampler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+
+
+def pipe_megabytes(validator: CrossValidator, frame: pd.DataFrame, cv_config: dict) -> tuple:
+    """MiB pickled into the pool per CV run with materialized folds and with shared data."""
+    materialized = sum(
+        len(pickle.dumps(fold, protocol=pickle.HIGHEST_PROTOCOL)) for fold in validator._create_folds(frame, cv_config)
+    )
+    store = SharedValueStore(min_bytes=0)
+    try:
+        handle = store.spill(frame, "frame")
+        shared = sum(
+            len(pickle.dumps((handle, *fold), protocol=pickle.HIGHEST_PROTOCOL))
+            for fold in validator._create_fold_indices(frame, cv_config)
+        )
+    finally:
+        store.close()
+    return materialized / 2**20, shared / 2**20
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--columns", type=int, default=32)
+    parser.add_argument("--folds", type=int, default=10)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--method", choices=["kfold", "time_series"], default="time_series")
+    args = parser.parse_args()
+    logging.disable(logging.ERROR)
+
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame(rng.standard_normal((args.rows, args.columns)), columns=[f"f{i}" for i in range(args.columns)])
+    data_config = {"data": frame}
+    cv_config = {"n_folds": args.folds, "method": args.method}
+    models = [{"name": "first"}, {"name": "second"}]
+    print(f"frame: {frame.memory_usage().sum() / 2**20:,.0f} MiB, {args.folds} folds ({args.method}), {args.workers} workers")
+
+    with tempfile.TemporaryDirectory() as checkpoint_dir:
+        pipe_mb = dict(zip(("materialized", "shared"), pipe_megabytes(FoldStatsValidator(checkpoint_dir=checkpoint_dir), frame, cv_config)))
+        print(f"{'mode':>12} {'model':>8} {'seconds':>9} {'parent peak MiB':>16} {'MiB through pool':>17}")
+        for mode, shared in (("materialized", False), ("shared", True)):
+            with FoldStatsValidator(
+                checkpoint_dir=checkpoint_dir, n_jobs=args.workers,
+                use_multiprocessing=True, shared_data=shared
+            ) as validator:
+                for model_config in models:
+                    baseline = anon_rss_mb()
+                    with PeakSampler() as sampler:
+                        start = time.perf_counter()
+                        validator.compare_models([model_config], data_config, cv_config)
+                        elapsed = time.perf_counter() - start
+                    print(f"{mode:>12} {model_config['name']:>8} {elapsed:>9.2f} "
+                          f"{sampler.peak - baseline:>16,.0f} {pipe_mb[mode]:>17,.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Benchmark sequential vs batched backtesting in EvaluationEngine.
+
+Runs both backtest modes of ``EvaluationEngine._evaluate_model`` on the same
+synthetic frame with a DQN model, checks that trades and metrics match, and
+reports rows per second.
+
+Usage (from the repository root):
+    python -m reinforcestrategycreator_pipeline.benchmarks.bench_evaluation_backtest --rows 100000
+"""
+
+import argparse
+import time
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+
+from reinforcestrategycreator_pipeline.src.evaluation.engine import EvaluationEngine
+from reinforcestrategycreator_pipeline.src.models.implementations.dqn import DQN
+
+
+def make_data(n_rows: int, n_features: int, seed: int = 0) -> pd.DataFrame:
+    """Create a random-walk price series with random feature columns.
+
+    Prices stay close to 1.0 so that the untrained network's actions are
+    driven by the features rather than by the price level, which keeps the
+    trade count realistic.
+    """
+    rng = np.random.default_rng(seed)
+    data = {"Close": np.exp(0.001 * rng.standard_normal(n_rows).cumsum())}
+    for i in range(n_features):
+        data[f"feature_{i}"] = rng.standard_normal(n_rows)
+    return pd.DataFrame(data, index=pd.date_range("2000-01-01", periods=n_rows, freq="min"))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--features", type=int, default=4)
+    args = parser.parse_args()
+
+    data = make_data(args.rows, args.features)
+    np.random.seed(0)
+    model = DQN({"hyperparameters": {"hidden_layers": [64, 64]}, "hidden_dims": [64, 64]})
+    model.build(input_shape=(data.shape[1],), output_shape=(3,))
+
+    engine = EvaluationEngine(
+        model_registry=MagicMock(), data_manager=MagicMock(), artifact_store=MagicMock()
+    )
+
+    results = {}
+    for mode in ("sequential", "batched"):
+        start = time.perf_counter()
+        history, trades = (
+            engine._run_sequential_backtest(model, data, 100000.0)
+            if mode == "sequential"
+            else engine._run_batched_backtest(model, data, 100000.0)
+        )
+        elapsed = time.perf_counter() - start
+        results[mode] = (history, trades)
+        print(f"{mode:>10}: {elapsed:8.3f}s  {args.rows / elapsed:12,.0f} rows/s  {len(trades)} trades")
+
+    assert results["batched"][1] == results["sequential"][1], "trade lists differ"
+    np.testing.assert_allclose(results["batched"][0], results["sequential"][0])
+    print("parity: trades and portfolio values match")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Benchmark MonitoringService.log_metric with and without client-side aggregation.
+
+The per-call path writes a structured log line and sends one statsd packet
+for every metric. The aggregated path records metrics in process and flushes
+packed datagrams. Both paths send real UDP packets to a local socket and log
+to a temporary file, and the script reports metric calls per second and the
+number of datagrams sent.
+
+Usage (from the repository root):
+    python -m reinforcestrategycreator_pipeline.benchmarks.bench_metric_logging --calls 50000
+"""
+
+import argparse
+import os
+import socket
+import tempfile
+import time
+
+from reinforcestrategycreator_pipeline.src.config.models import MetricsAggregationConfig, MonitoringConfig
+from reinforcestrategycreator_pipeline.src.monitoring.datadog_client import datadog_client
+from reinforcestrategycreator_pipeline.src.monitoring.logger import configure_logging
+from reinforcestrategycreator_pipeline.src.monitoring.service import MonitoringService
+
+
+def drain(receiver: socket.socket) -> int:
+    """Count and discard the datagrams waiting on a socket."""
+    count = 0
+    while True:
+        try:
+            receiver.recv(65535)
+        except BlockingIOError:
+            return count
+        count += 1
+
+
+def run(service: MonitoringService, calls: int, receiver: socket.socket) -> None:
+    """Log a mix of training metrics and report throughput."""
+    drain(receiver)
+    datagrams = 0
+    start = time.perf_counter()
+    for step in range(calls // 3):
+        service.log_metric("training.loss", 1.0 / (step + 1), model_id="dqn", environment="paper")
+        service.log_metric("training.steps", 1, metric_type="increment", model_id="dqn", environment="paper")
+        service.log_metric("training.reward", step % 17, metric_type="histogram", model_id="dqn", environment="paper")
+        if step % 1000 == 0:
+            datagrams += drain(receiver)
+    service.flush_metrics()
+    elapsed = time.perf_counter() - start
+    datagrams += drain(receiver)
+    mode = "aggregated" if datadog_client.aggregator is not None else "per-call"
+    print(f"{mode:>10}: {calls / elapsed:12,.0f} metric calls/s  {datagrams:8,} datagrams received")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=30_000)
+    args = parser.parse_args()
+
+    receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    receiver.bind(("127.0.0.1", 0))
+    receiver.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 8 * 1024 * 1024)
+    receiver.setblocking(False)
+    os.environ["DATADOG_STATSD_HOST"] = "127.0.0.1"
+    os.environ["DATADOG_STATSD_PORT"] = str(receiver.getsockname()[1])
+
+    with tempfile.TemporaryDirectory() as log_dir:
+        log_file = os.path.join(log_dir, "pipeline.log")
+        for aggregation in (None, MetricsAggregationConfig()):
+            service = MonitoringService(
+                MonitoringConfig(datadog_api_key="benchmark", metrics_aggregation=aggregation)
+            )
+            configure_logging(log_file=log_file, enable_console=False)
+            run(service, args.calls, receiver)
+        datadog_client.configure_aggregation(enabled=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Benchmark paper trading throughput with the standard and vectorized engines.
+
+Replays the same random-walk price ticks through ``PaperTradingDeployer`` for
+10, 100 and 1000 symbols. The standard engine goes through
+``process_market_update`` with one model call per symbol; the vectorized
+engine goes through ``process_market_arrays`` with one batched model call per
+tick. The model is a fixed linear policy over random features, so both
+engines see the same signals. The script reports ticks per second and
+symbol updates per second.
+
+Usage (from the repository root):
+    python -m reinforcestrategycreator_pipeline.benchmarks.bench_paper_trading --ticks 500
+"""
+
+import argparse
+import logging
+import tempfile
+import time
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from reinforcestrategycreator_pipeline.src.deployment.paper_trading import PaperTradingDeployer
+
+
+class LinearPolicy:
+    """Picks buy/sell/hold ids from a fixed linear scoring of the features."""
+
+    def __init__(self, n_features: int, seed: int = 0):
+        self.weights = np.random.default_rng(seed).standard_normal((n_features, 3))
+
+    def predict(self, features: np.ndarray) -> np.ndarray:
+        return np.argmax(np.atleast_2d(features) @ self.weights, axis=1)
+
+
+def start_simulation(deployer: PaperTradingDeployer, symbols, engine: str, n_features: int) -> str:
+    """Deploy a simulation with the given engine and swap in the linear policy."""
+    simulation_id = deployer.deploy_to_paper_trading(
+        model_id="bench_model",
+        simulation_config={
+            "engine": engine,
+            "symbols": symbols,
+            "initial_capital": 1e9,
+            "max_position_size": 0.001,
+            "daily_stop_loss": 1.0
+        }
+    )
+    deployer.active_simulations[simulation_id]["model"] = LinearPolicy(n_features)
+    deployer.start_simulation(simulation_id)
+    return simulation_id
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ticks", type=int, default=500)
+    parser.add_argument("--standard-ticks", type=int, default=50, help="Ticks replayed with the standard engine")
+    parser.add_argument("--features", type=int, default=8)
+    parser.add_argument("--symbols", type=int, nargs="+", default=[10, 100, 1000])
+    args = parser.parse_args()
+    logging.disable(logging.ERROR)
+
+    deployment_manager = MagicMock()
+    deployment_manager.deploy.side_effect = lambda **kwargs: f"deploy_{time.perf_counter_ns()}"
+    deployment_manager.get_deployment_status.side_effect = lambda deployment_id: {
+        "deployment_id": deployment_id, "model_id": "bench_model", "model_version": "v1"
+    }
+
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as root:
+        deployer = PaperTradingDeployer(deployment_manager, None, MagicMock(), paper_trading_root=root)
+        print(f"{'symbols':>8} {'engine':>10} {'ticks/s':>12} {'symbol updates/s':>18} {'trades':>8}")
+        for n_symbols in args.symbols:
+            symbols = [f"SYM{i}" for i in range(n_symbols)]
+            prices = 100 * np.exp(np.cumsum(0.01 * rng.standard_normal((args.ticks, n_symbols)), axis=0))
+            features = rng.standard_normal((args.ticks, n_symbols, args.features))
+
+            simulation_id = start_simulation(deployer, symbols, "standard", args.features)
+            ticks = min(args.standard_ticks, args.ticks)
+            start = time.perf_counter()
+            for t in range(ticks):
+                deployer.process_market_update(
+                    simulation_id, dict(zip(symbols, prices[t])), dict(zip(symbols, features[t]))
+                )
+            elapsed = time.perf_counter() - start
+            trades = len(deployer.active_simulations[simulation_id]["engine"].trades)
+            print(f"{n_symbols:>8} {'standard':>10} {ticks / elapsed:12,.1f} {ticks * n_symbols / elapsed:18,.0f} {trades:>8}")
+
+            simulation_id = start_simulation(deployer, symbols, "vectorized", args.features)
+            start = time.perf_counter()
+            for t in range(args.ticks):
+                deployer.process_market_arrays(simulation_id, prices[t], features[t])
+            elapsed = time.perf_counter() - start
+            trades = len(deployer.active_simulations[simulation_id]["engine"].trade_records)
+            print(f"{n_symbols:>8} {'vectorized':>10} {args.ticks / elapsed:12,.1f} {args.ticks * n_symbols / elapsed:18,.0f} {trades:>8}")
+
+
+if __name__ == "__main__":
+    main()
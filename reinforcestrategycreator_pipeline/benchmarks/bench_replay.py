@@ -0,0 +1,89 @@
+"""Load test paper trading by replaying recorded ticks through PaperTradingDeployer.
+
+Streams a Parquet or CSV feed (one row per symbol and timestamp, with a
+``close`` column and feature columns) through ``process_market_update`` on a
+simulated clock and prints throughput plus latency histograms for signal
+generation, order submission and fill processing. Without ``--file`` a
+synthetic feed is generated with ``SyntheticDataSource``.
+
+Usage (from the repository root):
+    python -m reinforcestrategycreator_pipeline.benchmarks.bench_replay --symbols 100 --ticks 1000
+    python -m reinforcestrategycreator_pipeline.benchmarks.bench_replay --file ticks.parquet --speed 60
+"""
+
+import argparse
+import logging
+import tempfile
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+
+from reinforcestrategycreator_pipeline.src.data.synthetic_source import SyntheticDataSource
+from reinforcestrategycreator_pipeline.src.deployment.paper_trading import PaperTradingDeployer
+from reinforcestrategycreator_pipeline.src.deployment.replay import MarketReplay, load_market_data
+
+
+class LinearPolicy:
+    """Picks buy/sell/hold ids from a fixed linear scoring of the features."""
+
+    def __init__(self, n_features: int, seed: int = 0):
+        self.weights = np.random.default_rng(seed).standard_normal((n_features, 3))
+
+    def predict(self, features: np.ndarray) -> np.ndarray:
+        return np.argmax(np.atleast_2d(features) @ self.weights, axis=1)
+
+
+def make_feed(n_symbols: int, n_ticks: int, n_features: int, seed: int = 0) -> pd.DataFrame:
+    """Create a long-format feed with one-minute ticks from the synthetic data source."""
+    source = SyntheticDataSource("replay_feed", {
+        "symbols": [f"SYM{i}" for i in range(n_symbols)], "n_bars": n_ticks,
+        "start_date": "2024-01-02 09:30", "interval": "1m", "seed": seed
+    })
+    feed = source.load_data()[["timestamp", "symbol", "close"]]
+    rng = np.random.default_rng(seed)
+    for i in range(n_features):
+        feed[f"feature_{i}"] = rng.standard_normal(len(feed))
+    return feed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--file", help="Parquet or CSV feed to replay")
+    parser.add_argument("--symbols", type=int, default=100)
+    parser.add_argument("--ticks", type=int, default=500)
+    parser.add_argument("--features", type=int, default=8)
+    parser.add_argument("--engine", choices=["standard", "vectorized", "both"], default="both")
+    parser.add_argument("--speed", type=float, default=None, help="Simulated seconds per wall second (default: as fast as possible)")
+    args = parser.parse_args()
+    logging.disable(logging.ERROR)
+
+    feed = load_market_data(args.file) if args.file else make_feed(args.symbols, args.ticks, args.features)
+    symbols = sorted(feed["symbol"].astype(str).unique())
+    feature_columns = [c for c in feed.select_dtypes(include="number").columns if c != "close"]
+
+    deployment_manager = MagicMock()
+    deployment_manager.get_deployment_status.side_effect = lambda deployment_id: {
+        "deployment_id": deployment_id, "model_id": "replay_model", "model_version": "v1"
+    }
+    engines = ["standard", "vectorized"] if args.engine == "both" else [args.engine]
+    with tempfile.TemporaryDirectory() as root:
+        deployer = PaperTradingDeployer(deployment_manager, None, MagicMock(), paper_trading_root=root)
+        for engine in engines:
+            deployment_manager.deploy.return_value = f"replay_{engine}"
+            simulation_id = deployer.deploy_to_paper_trading(
+                model_id="replay_model",
+                simulation_config={"engine": engine, "symbols": symbols, "initial_capital": 1e9, "max_position_size": 0.001}
+            )
+            deployer.active_simulations[simulation_id]["model"] = LinearPolicy(len(feature_columns))
+            deployer.start_simulation(simulation_id)
+
+            replay = MarketReplay(deployer, simulation_id, feed, feature_columns=feature_columns, speed=args.speed)
+            report = replay.run()
+            print(f"=== {engine} engine, {len(symbols)} symbols ===")
+            print(report.format())
+            print(f"trades: {report.final_status['total_trades']:,}\n")
+
+
+if __name__ == "__main__":
+    main()
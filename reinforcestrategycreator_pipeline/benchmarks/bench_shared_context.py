@@ -0,0 +1,89 @@
+"""Compare handing a large DataFrame to worker processes pickled versus as a shared handle.
+
+Each worker receives the same frame, sums every column and reports its
+private (anonymous) resident memory. Pickling gives every worker its own
+copy; a ``SharedValueHandle`` from the context's shared store is a few
+hundred bytes and all workers map the same file. Memory figures come from
+``RssAnon`` in ``/proc/self/status`` and are only available on Linux.
+
+Usage (from the repository root):
+    python -m reinforcestrategycreator_pipeline.benchmarks.bench_shared_context --rows 2000000 --workers 4
+"""
+
+import argparse
+import multiprocessing
+import os
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from reinforcestrategycreator_pipeline.src.pipeline.shared_store import SharedValueHandle, SharedValueStore
+
+
+def anon_rss_mb() -> float:
+    """Anonymous resident memory of this process in MiB, or NaN off Linux."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("RssAnon:"):
+                    return int(line.split()[1]) / 1024.0
+    except OSError:
+        pass
+    return float("nan")
+
+
+def warm_up(_) -> tuple:
+    """Worker task: report the process and its private memory before any payload arrives."""
+    time.sleep(0.2)
+    return os.getpid(), anon_rss_mb()
+
+
+def summarize(value) -> tuple:
+    """Worker task: sum every column and report private memory while the frame is alive."""
+    frame = value.load() if isinstance(value, SharedValueHandle) else value
+    frame.sum().sum()
+    return os.getpid(), anon_rss_mb()
+
+
+def run(payload, workers: int) -> tuple:
+    """Send the payload to every worker; return (seconds, mean extra private MiB per worker)."""
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        baseline = dict(pool.map(warm_up, range(workers)))
+        start = time.perf_counter()
+        results = list(pool.map(summarize, [payload] * workers))
+        elapsed = time.perf_counter() - start
+    return elapsed, float(np.mean([rss - baseline.get(pid, rss) for pid, rss in results]))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--columns", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame(rng.standard_normal((args.rows, args.columns)), columns=[f"f{i}" for i in range(args.columns)])
+    print(f"frame: {frame.memory_usage().sum() / 2**20:,.0f} MiB, {args.workers} workers")
+
+    store = SharedValueStore()
+    try:
+        start = time.perf_counter()
+        handle = store.spill(frame, "frame")
+        spill_seconds = time.perf_counter() - start
+
+        print(f"{'transfer':>10} {'payload':>12} {'seconds':>9} {'private MiB/worker':>20}")
+        for label, payload in (("pickled", frame), ("handle", handle)):
+            size = len(pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL))
+            seconds, extra = run(payload, args.workers)
+            print(f"{label:>10} {size:>12,} {seconds:>9.3f} {extra:>20,.1f}")
+        print(f"one-off spill to shared memory: {spill_seconds:.3f}s")
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Benchmark SyntheticDataSource generation and Parquet streaming.
+
+Generates ``--symbols`` x ``--bars`` rows chunk by chunk and reports rows
+per second and output bandwidth next to a plain memory copy of the same
+size, then streams the same data to a Parquet file and reports its
+throughput, file size and the process's peak resident memory.
+
+Usage (from the repository root):
+    python -m reinforcestrategycreator_pipeline.benchmarks.bench_synthetic_data --symbols 1000 --bars 10000
+    python -m reinforcestrategycreator_pipeline.benchmarks.bench_synthetic_data --symbols 1 --bars 10000000 --no-parquet
+"""
+
+import argparse
+import logging
+import os
+import resource
+import tempfile
+import time
+
+import numpy as np
+
+from reinforcestrategycreator_pipeline.src.data.synthetic_source import SyntheticDataSource
+
+REGIMES = [{"drift": 0.0005, "volatility": 0.01}, {"drift": -0.001, "volatility": 0.03}]
+
+
+def copy_bandwidth(n_bytes: int) -> float:
+    """Bytes per second of np.copyto over a buffer of n_bytes (read plus write)."""
+    src = np.ones(n_bytes // 8)
+    dst = np.empty_like(src)
+    np.copyto(dst, src)
+    start = time.perf_counter()
+    np.copyto(dst, src)
+    return 2 * src.nbytes / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--symbols", type=int, default=1000)
+    parser.add_argument("--bars", type=int, default=10_000)
+    parser.add_argument("--chunk-size", type=int, default=1_000_000)
+    parser.add_argument("--no-parquet", action="store_true")
+    args = parser.parse_args()
+    logging.disable(logging.ERROR)
+
+    source = SyntheticDataSource("bench", {
+        "symbols": args.symbols, "n_bars": args.bars, "interval": "1m",
+        "regimes": REGIMES, "switch_probability": 0.01, "chunk_size": args.chunk_size
+    })
+
+    rows = 0
+    output_bytes = 0
+    start = time.perf_counter()
+    for chunk in source.iter_chunks():
+        rows += len(chunk)
+        output_bytes += chunk.memory_usage(index=False).sum()
+    elapsed = time.perf_counter() - start
+    chunk_bytes = output_bytes * min(1.0, args.chunk_size / rows)
+    bandwidth = copy_bandwidth(int(chunk_bytes))
+
+    print(f"{args.symbols} symbols x {args.bars} bars = {rows:,} rows in chunks of ~{args.chunk_size:,}")
+    print(f"{'generate':>10}: {elapsed:8.2f}s  {rows / elapsed / 1e6:8.2f} M rows/s  "
+          f"{output_bytes / elapsed / 1e9:6.2f} GB/s  ({output_bytes / rows:.0f} bytes/row)")
+    print(f"{'memcpy':>10}: {'':8}   {'':8}               {bandwidth / 1e9:6.2f} GB/s  (same chunk size)")
+
+    if not args.no_parquet:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "bars.parquet")
+            start = time.perf_counter()
+            source.write_parquet(path)
+            elapsed = time.perf_counter() - start
+            size = os.path.getsize(path)
+        print(f"{'parquet':>10}: {elapsed:8.2f}s  {rows / elapsed / 1e6:8.2f} M rows/s  "
+              f"{size / 1e6:8.1f} MB on disk")
+
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"peak RSS {peak_mb:.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,10 +6,12 @@ artifacts produced by the pipeline (datasets, models, evaluation reports, etc.).
 
 from .base import ArtifactStore, ArtifactMetadata, ArtifactType
 from .local_adapter import LocalFileSystemStore
+from .content_addressed import ContentAddressedStore
 
 __all__ = [
     "ArtifactStore",
     "ArtifactMetadata", 
     "ArtifactType",
     "LocalFileSystemStore",
+    "ContentAddressedStore",
 ]
\ No newline at end of file
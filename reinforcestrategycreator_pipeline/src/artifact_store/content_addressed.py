@@ -0,0 +1,391 @@
+"""Content-addressed, deduplicating implementation of the ArtifactStore interface."""
+
+import hashlib
+import json
+import os
+import shutil
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+try:
+    import fcntl  # Only available on POSIX; used for reflink (FICLONE)
+except ImportError:  # pragma: no cover - platform dependent
+    fcntl = None
+
+from .base import ArtifactMetadata, ArtifactType
+from .local_adapter import LocalFileSystemStore, NumpyEncoder
+
+
+CHUNK_SIZE = 1024 * 1024  # 1 MiB read/write chunks for streaming hashes
+
+# ioctl request number for FICLONE (copy-on-write clone) on Linux
+_FICLONE = 0x40049409
+
+
+def hash_file(path: Union[str, Path], chunk_size: int = CHUNK_SIZE) -> str:
+    """Calculate the SHA256 digest of a file by streaming it in chunks.
+
+    Args:
+        path: File to hash
+        chunk_size: Number of bytes read per chunk
+
+    Returns:
+        Hex string of the SHA256 digest
+    """
+    sha256_hash = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            sha256_hash.update(chunk)
+    return sha256_hash.hexdigest()
+
+
+def copy_and_hash(
+    source: Union[str, Path],
+    destination: Union[str, Path],
+    chunk_size: int = CHUNK_SIZE
+) -> Tuple[str, int]:
+    """Copy a file while computing its SHA256 digest in the same pass.
+
+    Args:
+        source: File to copy
+        destination: Target file path
+        chunk_size: Number of bytes read per chunk
+
+    Returns:
+        Tuple of (hex digest, number of bytes copied)
+    """
+    sha256_hash = hashlib.sha256()
+    size = 0
+    with open(source, "rb") as src, open(destination, "wb") as dst:
+        for chunk in iter(lambda: src.read(chunk_size), b""):
+            sha256_hash.update(chunk)
+            dst.write(chunk)
+            size += len(chunk)
+    return sha256_hash.hexdigest(), size
+
+
+def tree_digest(file_digests: Dict[str, str]) -> str:
+    """Combine per-file digests into a single digest for a file tree.
+
+    The result depends only on relative paths and file contents, so two trees
+    with identical files always produce the same digest.
+
+    Args:
+        file_digests: Mapping of relative path to SHA256 hex digest
+
+    Returns:
+        Hex string of the combined SHA256 digest
+    """
+    sha256_hash = hashlib.sha256()
+    for relative_path in sorted(file_digests):
+        sha256_hash.update(relative_path.encode())
+        sha256_hash.update(b"\0")
+        sha256_hash.update(file_digests[relative_path].encode())
+        sha256_hash.update(b"\n")
+    return sha256_hash.hexdigest()
+
+
+def _reflink(source: Path, destination: Path) -> bool:
+    """Try to create a copy-on-write clone of a file. Returns True on success."""
+    if fcntl is None:
+        return False
+    try:
+        with open(source, "rb") as src, open(destination, "wb") as dst:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+        return True
+    except OSError:
+        destination.unlink(missing_ok=True)
+        return False
+
+
+def link_or_copy(source: Path, destination: Path) -> str:
+    """Materialize a file using the cheapest available mechanism.
+
+    Tries a hardlink first, then a reflink, and finally falls back to a copy.
+
+    Args:
+        source: Existing file
+        destination: Path to create
+
+    Returns:
+        The method used: "hardlink", "reflink" or "copy"
+    """
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    if destination.exists() or destination.is_symlink():
+        destination.unlink()
+    try:
+        os.link(source, destination)
+        return "hardlink"
+    except OSError:
+        pass
+    if _reflink(source, destination):
+        return "reflink"
+    shutil.copyfile(source, destination)
+    return "copy"
+
+
+class ContentAddressedStore(LocalFileSystemStore):
+    """Artifact store that keeps each distinct file exactly once.
+
+    Files are stored as blobs named by their SHA256 digest; a version is a
+    manifest listing the blobs it references. The familiar ``data/`` layout of
+    ``LocalFileSystemStore`` is still produced for every version, but as
+    hardlinks (or reflinks) into the blob store, so the existing
+    ``ArtifactStore`` API keeps working while identical content costs no
+    additional disk space.
+
+    Directory structure:
+    artifacts_root/
+    ├── blobs/
+    │   ├── tmp/                     # In-flight writes
+    │   └── {digest[:2]}/{digest}    # Immutable content blobs
+    └── {artifact_type}/{artifact_id}/
+        ├── versions/
+        │   └── {version}/
+        │       ├── data/            # Links into blobs/
+        │       ├── manifest.json    # Files and blob digests of this version
+        │       └── metadata.json    # Version metadata
+        └── latest.json
+
+    Files under ``data/`` share storage with the blobs and must be treated as
+    read-only. Blobs are never removed on delete; call ``collect_garbage`` to
+    reclaim space from blobs no longer referenced by any manifest.
+    """
+
+    BLOBS_DIR = "blobs"
+    MANIFEST_FILE = "manifest.json"
+
+    def __init__(self, root_path: Union[str, Path]):
+        """Initialize the content-addressed store.
+
+        Args:
+            root_path: Root directory for storing artifacts and blobs
+        """
+        super().__init__(root_path)
+        self.blobs_path = self.root_path / self.BLOBS_DIR
+        self._tmp_path = self.blobs_path / "tmp"
+        self._tmp_path.mkdir(parents=True, exist_ok=True)
+
+    def _get_blob_path(self, digest: str) -> Path:
+        """Get the path of the blob holding content with the given digest."""
+        return self.blobs_path / digest[:2] / digest
+
+    def _get_manifest_path(self, artifact_id: str, version: str, artifact_type: ArtifactType) -> Path:
+        """Get the manifest path for a specific version."""
+        return self._get_version_path(artifact_id, version, artifact_type) / self.MANIFEST_FILE
+
+    def _store_blob(self, source: Path) -> Tuple[str, int, bool]:
+        """Stream a file into the blob store, hashing it as it is written.
+
+        Args:
+            source: File to ingest
+
+        Returns:
+            Tuple of (digest, size, is_new) where ``is_new`` is False when the
+            content was already present and nothing new was stored
+        """
+        tmp_file = self._tmp_path / uuid.uuid4().hex
+        try:
+            digest, size = copy_and_hash(source, tmp_file)
+            blob_path = self._get_blob_path(digest)
+            if blob_path.exists():
+                return digest, size, False
+            blob_path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(tmp_file, blob_path)
+            return digest, size, True
+        finally:
+            tmp_file.unlink(missing_ok=True)
+
+    def save_artifact(
+        self,
+        artifact_id: str,
+        artifact_path: Union[str, Path],
+        artifact_type: ArtifactType,
+        version: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        tags: Optional[List[str]] = None,
+        description: Optional[str] = None
+    ) -> ArtifactMetadata:
+        """Save an artifact, storing only content not already in the store."""
+        artifact_path = Path(artifact_path)
+        if not artifact_path.exists():
+            raise FileNotFoundError(f"Artifact path does not exist: {artifact_path}")
+
+        if version is None:
+            version = self._generate_version()
+
+        is_directory = artifact_path.is_dir()
+        if is_directory:
+            sources = {
+                file_path.relative_to(artifact_path).as_posix(): file_path
+                for file_path in sorted(artifact_path.rglob("*"))
+                if file_path.is_file()
+            }
+        else:
+            sources = {".": artifact_path}
+
+        # Ingest content first so a failed save never leaves a dangling manifest
+        files = {}
+        new_bytes = 0
+        for relative_path, source in sources.items():
+            digest, size, is_new = self._store_blob(source)
+            files[relative_path] = {"sha256": digest, "size": size}
+            if is_new:
+                new_bytes += size
+
+        content_digest = tree_digest({path: entry["sha256"] for path, entry in files.items()})
+        total_size = sum(entry["size"] for entry in files.values())
+
+        artifact_metadata = ArtifactMetadata(
+            artifact_id=artifact_id,
+            artifact_type=artifact_type,
+            version=version,
+            created_at=datetime.now(),
+            created_by=os.environ.get("USER", "unknown"),
+            description=description,
+            tags=tags or [],
+            properties=metadata or {},
+            source_info={
+                "original_path": str(artifact_path),
+                "is_directory": is_directory,
+                "content_digest": content_digest,
+                "size_bytes": total_size,
+                "deduplicated_bytes": total_size - new_bytes
+            }
+        )
+
+        version_path = self._get_version_path(artifact_id, version, artifact_type)
+        version_path.mkdir(parents=True, exist_ok=True)
+
+        # Materialize the data/ view as links into the blob store
+        data_path = self._get_data_path(artifact_id, version, artifact_type)
+        if data_path.is_dir():
+            shutil.rmtree(data_path)
+        elif data_path.exists():
+            data_path.unlink()
+        link_methods = set()
+        for relative_path, entry in files.items():
+            target = data_path if relative_path == "." else data_path / relative_path
+            link_methods.add(link_or_copy(self._get_blob_path(entry["sha256"]), target))
+        if is_directory:
+            data_path.mkdir(parents=True, exist_ok=True)  # Keep empty directories loadable
+
+        manifest = {
+            "artifact_id": artifact_id,
+            "artifact_type": artifact_type.value,
+            "version": version,
+            "is_directory": is_directory,
+            "content_digest": content_digest,
+            "size_bytes": total_size,
+            "link_methods": sorted(link_methods),
+            "files": files
+        }
+        with open(self._get_manifest_path(artifact_id, version, artifact_type), 'w') as f:
+            json.dump(manifest, f, indent=2)
+
+        with open(self._get_metadata_path(artifact_id, version, artifact_type), 'w') as f:
+            json.dump(artifact_metadata.to_dict(), f, indent=2, cls=NumpyEncoder)
+
+        self._update_latest_version(artifact_id, version, artifact_type)
+
+        return artifact_metadata
+
+    def get_manifest(
+        self,
+        artifact_id: str,
+        artifact_type: ArtifactType,
+        version: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Get the content manifest of an artifact version.
+
+        Args:
+            artifact_id: Unique identifier for the artifact
+            artifact_type: Type of the artifact
+            version: Specific version (latest if not provided)
+
+        Returns:
+            Manifest dictionary; ``files`` maps each relative path (``"."`` for
+            single-file artifacts) to its ``sha256`` digest and ``size``
+        """
+        if version is None:
+            version = self._get_latest_version(artifact_id, artifact_type)
+            if version is None:
+                raise ValueError(f"No versions found for artifact: {artifact_id} of type {artifact_type.value}")
+
+        manifest_path = self._get_manifest_path(artifact_id, version, artifact_type)
+        if not manifest_path.exists():
+            raise FileNotFoundError(
+                f"Manifest not found for artifact: {artifact_id} (type: {artifact_type.value}) version {version}"
+            )
+
+        with open(manifest_path, 'r') as f:
+            return json.load(f)
+
+    def get_file_digests(
+        self,
+        artifact_id: str,
+        artifact_type: ArtifactType,
+        version: Optional[str] = None
+    ) -> Dict[str, str]:
+        """Get the SHA256 digest of every file in an artifact version without reading it.
+
+        Args:
+            artifact_id: Unique identifier for the artifact
+            artifact_type: Type of the artifact
+            version: Specific version (latest if not provided)
+
+        Returns:
+            Mapping of relative path (``"."`` for single-file artifacts) to digest
+        """
+        manifest = self.get_manifest(artifact_id, artifact_type, version)
+        return {path: entry["sha256"] for path, entry in manifest["files"].items()}
+
+    def _referenced_digests(self) -> set:
+        """Collect the digests referenced by every manifest in the store."""
+        referenced = set()
+        for type_dir in self.root_path.iterdir():
+            if not type_dir.is_dir() or type_dir.name == self.BLOBS_DIR:
+                continue
+            for manifest_path in type_dir.glob(f"*/versions/*/{self.MANIFEST_FILE}"):
+                with open(manifest_path, 'r') as f:
+                    manifest = json.load(f)
+                referenced.update(entry["sha256"] for entry in manifest["files"].values())
+        return referenced
+
+    def collect_garbage(self, dry_run: bool = False) -> Dict[str, int]:
+        """Remove blobs that are no longer referenced by any version manifest.
+
+        Must not run concurrently with saves to the same store, since a blob
+        being ingested is unreferenced until its manifest is written.
+
+        Args:
+            dry_run: Only report what would be removed
+
+        Returns:
+            Dictionary with ``blobs_scanned``, ``blobs_removed`` and ``bytes_freed``
+        """
+        referenced = self._referenced_digests()
+        stats = {"blobs_scanned": 0, "blobs_removed": 0, "bytes_freed": 0}
+
+        for shard_dir in self.blobs_path.iterdir():
+            if not shard_dir.is_dir() or shard_dir == self._tmp_path:
+                continue
+            for blob_path in shard_dir.iterdir():
+                stats["blobs_scanned"] += 1
+                if blob_path.name in referenced:
+                    continue
+                stats["blobs_removed"] += 1
+                stats["bytes_freed"] += blob_path.stat().st_size
+                if not dry_run:
+                    blob_path.unlink()
+            if not dry_run and not any(shard_dir.iterdir()):
+                shard_dir.rmdir()
+
+        # Leftovers from interrupted saves
+        if not dry_run:
+            for tmp_file in self._tmp_path.iterdir():
+                tmp_file.unlink(missing_ok=True)
+
+        return stats
@@ -180,6 +180,7 @@ class LocalFileSystemStore(ArtifactStore):
             # Create temporary directory
             temp_dir = tempfile.mkdtemp(prefix=f"{artifact_id}_{version}_")
             destination_path = Path(temp_dir) / data_path.name
+            is_dest_dir = False
         else:
             destination_path = Path(destination_path)
             # If destination_path is a directory, the actual file will be inside it
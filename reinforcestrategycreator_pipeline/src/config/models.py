@@ -20,6 +20,7 @@ class DataSourceType(str, Enum):
     API = "api"
     DATABASE = "database"
     YFINANCE = "yfinance"
+    SYNTHETIC = "synthetic"
 
 
 class ModelType(str, Enum):
@@ -83,6 +84,11 @@ class DataConfig(BaseModel):
         default=None,
         description="Start date for data (YYYY-MM-DD)"
     )
+
+    synthetic: Optional[Dict[str, Any]] = Field(
+        default=None,
+        description="Generator parameters for the synthetic source (n_bars, seed, regimes, ...)"
+    )
     
     end_date: Optional[str] = Field(
         default=None,
@@ -377,6 +383,22 @@ class MonitoringConfig(BaseModel):
         description="Configuration for the alert manager"
     )
 
+    metrics_aggregation: Optional[MetricsAggregationConfig] = Field(
+        default=None,
+        description="Client-side aggregation of metrics before they are sent to Datadog"
+    )
+
+    streaming_drift: Optional[StreamingDriftConfig] = Field(
+        default=None,
+        description="Configuration for streaming drift monitoring of live feature and prediction feeds"
+    )
+
+    deployment_tag_cache_ttl_seconds: float = Field(
+        default=60.0,
+        ge=0,
+        description="How long deployment tags looked up per (model_id, environment) are reused"
+    )
+
 
 class DataDriftDetectionMethod(str, Enum):
     """Supported data drift detection methods."""
@@ -414,6 +436,33 @@ class DataDriftConfig(BaseModel):
     )
 
 
+class StreamingDriftConfig(BaseModel):
+    """Configuration for streaming drift monitoring."""
+    enabled: bool = Field(default=True, description="Enable streaming drift monitoring")
+    window_size: int = Field(default=1000, ge=2, description="Number of recent observations in the sliding window")
+    num_blocks: int = Field(
+        default=10, ge=1,
+        description="Number of blocks the window is split into; the window slides one block at a time"
+    )
+    warmup_size: int = Field(
+        default=500, ge=1,
+        description="Observations used as reference when no reference profile is given"
+    )
+    check_interval: int = Field(default=100, ge=1, description="Compute drift scores every this many observations")
+    n_bins: int = Field(default=10, ge=2, description="Number of reference quantile bins per feature")
+    psi_threshold: float = Field(default=0.2, description="PSI above which a feature is considered drifted")
+    ks_threshold: float = Field(default=0.15, description="Binned KS distance above which a feature is considered drifted")
+    prediction_categories: List[str] = Field(
+        default_factory=lambda: ["buy", "sell", "hold"],
+        description="Known prediction labels for monitoring the prediction distribution"
+    )
+    sketch_relative_accuracy: float = Field(
+        default=0.01, gt=0, lt=1,
+        description="Relative accuracy of the per-feature quantile sketches"
+    )
+    alert_severity: str = Field(default="warning", description="Severity of streaming drift alerts")
+
+
 class ModelDriftDetectionMethod(str, Enum):
     """Supported model drift detection methods."""
     PERFORMANCE_DEGRADATION = "performance_degradation"
@@ -495,6 +544,39 @@ class AlertManagerConfig(BaseModel):
         default_factory=list,
         description="List of configured alert rules"
     )
+    async_dispatch: bool = Field(
+        default=True,
+        description="Deliver alerts from a background queue instead of the caller's thread"
+    )
+    dispatch_queue_size: int = Field(default=1000, ge=1, description="Maximum number of queued alerts before new ones are dropped")
+    dispatch_workers: int = Field(default=2, ge=1, description="Number of background dispatch threads")
+    dispatch_batch_size: int = Field(default=50, ge=1, description="Maximum number of alerts delivered per batch")
+    dispatch_batch_window_seconds: float = Field(
+        default=0.5, ge=0,
+        description="How long a dispatch thread waits for more alerts to batch and coalesce"
+    )
+    dispatch_max_retries: int = Field(default=3, ge=0, description="Retries per channel batch after a failed delivery")
+    dispatch_backoff_seconds: float = Field(default=1.0, ge=0, description="Initial retry delay, doubled on each retry")
+
+
+class MetricsAggregationConfig(BaseModel):
+    """Configuration for client-side metric aggregation."""
+    enabled: bool = Field(default=True, description="Aggregate metrics in process and flush them in batches")
+    flush_interval_seconds: float = Field(default=10.0, gt=0, description="Flush aggregated metrics at least this often")
+    max_pending_metrics: int = Field(default=1000, ge=1, description="Flush when this many distinct series are pending")
+    max_packet_size: int = Field(default=1432, ge=64, description="Maximum size in bytes of one statsd datagram")
+    histogram_relative_accuracy: float = Field(
+        default=0.01, gt=0, lt=1,
+        description="Relative accuracy of histogram percentiles"
+    )
+    histogram_percentiles: List[float] = Field(
+        default_factory=lambda: [0.5, 0.95, 0.99],
+        description="Histogram percentiles to report, between 0 and 1"
+    )
+    log_each_metric: bool = Field(
+        default=False,
+        description="Also write a structured log line for every metric call"
+    )
 
 
 class ArtifactStoreType(str, Enum):
@@ -548,6 +630,11 @@ class ArtifactStoreConfig(BaseModel):
         default=True,
         description="Enable artifact versioning"
     )
+
+    content_addressed: bool = Field(
+        default=False,
+        description="Store files once by SHA256 and deduplicate identical content across versions"
+    )
     
     metadata_backend: MetadataBackend = Field(
         default=MetadataBackend.JSON,
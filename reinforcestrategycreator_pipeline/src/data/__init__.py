@@ -1,24 +1,39 @@
-"""Data management module for the ML pipeline."""
-
-from .base import DataSource, DataSourceMetadata
-from .csv_source import CsvDataSource
-from .api_source import ApiDataSource
-from .manager import DataManager
-from .transformer import DataTransformer, TechnicalIndicatorTransformer, ScalingTransformer
-from .validator import DataValidator, ValidationResult, ValidationStatus
-from .splitter import DataSplitter
-
-__all__ = [
-    'DataSource',
-    'DataSourceMetadata',
-    'CsvDataSource',
-    'ApiDataSource',
-    'DataManager',
-    'DataTransformer',
-    'TechnicalIndicatorTransformer',
-    'ScalingTransformer',
-    'DataValidator',
-    'ValidationResult',
-    'ValidationStatus',
-    'DataSplitter'
-]
\ No newline at end of file
+"""Data management module for the ML pipeline.
+
+Exports are imported from their submodules on first access, so that light
+modules such as ``synthetic_source`` can be used without loading the
+transformer's technical-analysis dependencies (``ta``, ``pandas_ta``).
+"""
+
+import importlib
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    'DataSource': 'base',
+    'DataSourceMetadata': 'base',
+    'CsvDataSource': 'csv_source',
+    'ApiDataSource': 'api_source',
+    'SyntheticDataSource': 'synthetic_source',
+    'DataManager': 'manager',
+    'DataTransformer': 'transformer',
+    'TechnicalIndicatorTransformer': 'transformer',
+    'ScalingTransformer': 'transformer',
+    'DataValidator': 'validator',
+    'ValidationResult': 'validator',
+    'ValidationStatus': 'validator',
+    'DataSplitter': 'splitter'
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
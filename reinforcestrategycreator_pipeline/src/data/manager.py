@@ -15,6 +15,7 @@ from .base import DataSource, DataSourceMetadata
 from .csv_source import CsvDataSource
 from .api_source import ApiDataSource
 from .yfinance_source import YFinanceDataSource
+from .synthetic_source import SyntheticDataSource
 
 
 class DataManager:
@@ -25,6 +26,7 @@ class DataManager:
         "csv": CsvDataSource,
         "api": ApiDataSource,
         "yfinance": YFinanceDataSource,
+        "synthetic": SyntheticDataSource,
     }
     
     def __init__(
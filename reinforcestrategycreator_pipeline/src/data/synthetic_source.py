@@ -0,0 +1,295 @@
+"""Synthetic OHLCV data source for offline testing and benchmarking."""
+
+import math
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from .base import DataSource
+
+# Independent random streams. Each has its own generator and is drawn in
+# (bars, symbols[, k]) row-major blocks, so the values of a bar do not depend
+# on how the series is split into chunks.
+_STREAMS = ("returns", "regimes", "gaps", "gap_sizes", "ranges", "volumes")
+
+# yfinance-style intervals, as used by the ``interval`` field of DataConfig
+_INTERVAL_UNITS = {"m": "min", "h": "h", "d": "D", "wk": "W"}
+
+DEFAULT_REGIMES = [{"drift": 0.0002, "volatility": 0.01}]
+OHLCV_COLUMNS = ["open", "high", "low", "close", "volume"]
+
+
+class SyntheticDataSource(DataSource):
+    """Deterministic, seeded generator of OHLCV bars.
+
+    Log prices follow geometric Brownian motion whose drift and volatility
+    switch between regimes (a Markov chain that leaves its regime with
+    ``switch_probability`` per bar). Opening gaps jump the open away from the
+    previous close, highs and lows extend the open/close range by an
+    exponentially distributed amount scaled with the regime volatility, and
+    volume is log-normal and rises with the size of the move.
+
+    Data is produced in long format (``timestamp, symbol, open, high, low,
+    close, volume``), one row per symbol and bar, ordered by time. This is the
+    layout ``MarketReplay`` streams; ``load_data(symbol=...)`` returns a single
+    symbol indexed by timestamp for ``TradingEnv``. Large datasets can be
+    streamed chunk by chunk with ``iter_chunks`` or ``write_parquet``.
+    """
+
+    def __init__(self, source_id: str, config: Dict[str, Any]):
+        """Initialize synthetic data source.
+
+        Args:
+            source_id: Unique identifier for this data source
+            config: Configuration dictionary containing:
+                - symbols: Number of symbols or list of symbol names (default: 1)
+                - n_bars: Bars per symbol (default: 10000, or derived from end_date)
+                - start_date: Timestamp of the first bar (default: '2020-01-01')
+                - end_date: Last timestamp, used when n_bars is not given
+                - interval: Bar spacing, e.g. '1m', '1h', '1d' or a pandas offset like '5min'
+                - seed: Random seed (default: 0)
+                - initial_price: Price at the first bar (default: 100.0)
+                - regimes: List of {'drift', 'volatility'} dicts, per-bar arithmetic
+                  drift and volatility of each regime (default: one GBM regime)
+                - switch_probability: Per-bar probability of leaving the regime (default: 0.01)
+                - gap_probability: Per-bar probability of an opening gap (default: 0.01)
+                - gap_volatility: Standard deviation of the log gap size (default: 0.02)
+                - volume_mean: Mean volume per bar (default: 1e6)
+                - volume_volatility: Log-normal sigma of the volume noise (default: 0.3)
+                - volume_sensitivity: Extra volume per standard deviation of move (default: 1.0)
+                - chunk_size: Approximate rows per generated chunk (default: 1000000)
+                - synthetic: Optional dict with any of the keys above, taking
+                  precedence (the ``synthetic`` block of a pipeline data config)
+        """
+        super().__init__(source_id, config)
+        params = {**config, **(config.get("synthetic") or {})}
+
+        symbols = params.get("symbols") or 1
+        if isinstance(symbols, int):
+            symbols = [f"SYN{i:0{max(1, len(str(symbols - 1)))}d}" for i in range(symbols)]
+        self.symbols: List[str] = [str(s) for s in symbols]
+        self.interval: str = params.get("interval") or "1d"
+        self.start_date = pd.Timestamp(params.get("start_date") or "2020-01-01")
+        self.end_date = params.get("end_date")
+        self.n_bars: Optional[int] = params.get("n_bars")
+        self.seed: int = params.get("seed", 0)
+        self.initial_price: float = params.get("initial_price", 100.0)
+        self.regimes: List[Dict[str, float]] = params.get("regimes") or DEFAULT_REGIMES
+        self.switch_probability: float = params.get("switch_probability", 0.01)
+        self.gap_probability: float = params.get("gap_probability", 0.01)
+        self.gap_volatility: float = params.get("gap_volatility", 0.02)
+        self.volume_mean: float = params.get("volume_mean", 1e6)
+        self.volume_volatility: float = params.get("volume_volatility", 0.3)
+        self.volume_sensitivity: float = params.get("volume_sensitivity", 1.0)
+        self.chunk_size: int = params.get("chunk_size", 1_000_000)
+
+        self.validate_config()
+
+    def validate_config(self) -> bool:
+        """Validate the synthetic data source configuration.
+
+        Returns:
+            True if configuration is valid
+
+        Raises:
+            ValueError: If configuration is invalid
+        """
+        if not self.symbols or len(set(self.symbols)) != len(self.symbols):
+            raise ValueError(f"Synthetic source '{self.source_id}' needs at least one symbol and unique names")
+        self.step = _parse_interval(self.interval)
+        if self.n_bars is None:
+            if self.end_date is not None:
+                span = pd.Timestamp(self.end_date) - self.start_date
+                self.n_bars = int(span // self.step) + 1
+            else:
+                self.n_bars = 10_000
+        if self.n_bars < 1:
+            raise ValueError(f"n_bars must be positive, got {self.n_bars}")
+        if self.initial_price <= 0:
+            raise ValueError(f"initial_price must be positive, got {self.initial_price}")
+        for regime in self.regimes:
+            if "drift" not in regime or "volatility" not in regime or regime["volatility"] < 0:
+                raise ValueError(f"Each regime needs 'drift' and a non-negative 'volatility', got {regime}")
+        for name in ("switch_probability", "gap_probability"):
+            if not 0.0 <= getattr(self, name) <= 1.0:
+                raise ValueError(f"{name} must be between 0 and 1, got {getattr(self, name)}")
+        if self.chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {self.chunk_size}")
+        return True
+
+    def iter_chunks(self, n_bars: Optional[int] = None, chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Generate the series chunk by chunk.
+
+        Args:
+            n_bars: Bars per symbol (default: configured n_bars)
+            chunk_size: Approximate rows per chunk; always whole bars of all symbols
+
+        Yields:
+            Long-format DataFrames of consecutive bars
+        """
+        n_bars = self.n_bars if n_bars is None else n_bars
+        chunk_size = chunk_size or self.chunk_size
+        n_symbols = len(self.symbols)
+        bars_per_chunk = max(1, chunk_size // n_symbols)
+
+        rngs = dict(zip(_STREAMS, (np.random.default_rng(s) for s in np.random.SeedSequence(self.seed).spawn(len(_STREAMS)))))
+        drift = np.array([r["drift"] for r in self.regimes], dtype=np.float64)
+        volatility = np.array([r["volatility"] for r in self.regimes], dtype=np.float64)
+        log_drift = drift - 0.5 * volatility ** 2
+        n_regimes = len(self.regimes)
+        symbol_codes = np.arange(n_symbols, dtype=np.int32)
+        step_ns = self.step.value
+        start_ns = self.start_date.value
+
+        # State carried from one chunk to the next
+        last_log_close = np.full(n_symbols, math.log(self.initial_price))
+        regime = np.zeros(n_symbols, dtype=np.int64)
+
+        for offset in range(0, n_bars, bars_per_chunk):
+            bars = min(bars_per_chunk, n_bars - offset)
+            shape = (bars, n_symbols)
+
+            if n_regimes > 1:
+                # Leave the regime with switch_probability, to a uniformly chosen other regime
+                u = rngs["regimes"].random(shape + (2,), dtype=np.float32)
+                jumps = np.where(u[..., 0] < self.switch_probability,
+                                 1 + (u[..., 1] * (n_regimes - 1)).astype(np.int64), 0)
+                regimes = (regime + np.cumsum(jumps, axis=0)) % n_regimes
+                regime = regimes[-1]
+                sigma = volatility[regimes]
+                log_return = log_drift[regimes]
+            else:
+                sigma = volatility[0]
+                log_return = np.full(shape, log_drift[0])
+
+            z = rngs["returns"].standard_normal(shape)
+            log_return += sigma * z
+            # Gap sizes are drawn only for the bars that gap, in time order
+            gap_index = np.flatnonzero(rngs["gaps"].random(shape, dtype=np.float32) < self.gap_probability)
+            gap = self.gap_volatility * rngs["gap_sizes"].standard_normal(len(gap_index))
+            log_return.ravel()[gap_index] += gap
+
+            log_close = np.cumsum(log_return, out=log_return, axis=0)
+            log_close += last_log_close
+            close = np.exp(log_close)
+            open_ = np.empty_like(close)
+            open_[0] = np.exp(last_log_close)
+            open_[1:] = close[:-1]
+            open_.ravel()[gap_index] *= np.exp(gap)
+            last_log_close = log_close[-1].copy()
+
+            # High and low extend the open/close range by exponential amounts, -log(1 - u)
+            extension = np.log1p(-rngs["ranges"].random(shape + (2,), dtype=np.float32))
+            extension *= -0.5 * (sigma if np.ndim(sigma) == 0 else sigma[..., None])
+            np.exp(extension, out=extension)
+            high = np.maximum(open_, close)
+            high *= extension[..., 0]
+            low = np.minimum(open_, close)
+            low /= extension[..., 1]
+
+            # Log-normal noise, normalized so the mean stays volume_mean (E|z| = sqrt(2/pi))
+            volume = rngs["volumes"].standard_normal(shape, dtype=np.float32).astype(np.float64)
+            volume *= self.volume_volatility
+            volume += math.log(self.volume_mean) - 0.5 * self.volume_volatility ** 2
+            np.exp(volume, out=volume)
+            volume *= (1.0 + self.volume_sensitivity * np.abs(z)) / (1.0 + self.volume_sensitivity * math.sqrt(2 / math.pi))
+
+            timestamps = start_ns + (offset + np.arange(bars, dtype=np.int64)) * step_ns
+            yield pd.DataFrame({
+                "timestamp": np.repeat(timestamps, n_symbols).view("datetime64[ns]"),
+                "symbol": pd.Categorical.from_codes(np.tile(symbol_codes, bars), categories=self.symbols),
+                "open": open_.ravel(),
+                "high": high.ravel(),
+                "low": low.ravel(),
+                "close": close.ravel(),
+                "volume": volume.ravel(),
+            }, copy=False)
+
+    def load_data(self, **kwargs) -> pd.DataFrame:
+        """Generate the whole series in memory.
+
+        Args:
+            **kwargs: Optional 'n_bars' and 'chunk_size' overrides, and 'symbol'
+                to return one symbol's bars indexed by timestamp with OHLCV columns
+
+        Returns:
+            DataFrame containing the generated data
+        """
+        symbol = kwargs.get("symbol")
+        if symbol is not None and symbol not in self.symbols:
+            raise ValueError(f"Unknown symbol '{symbol}' for synthetic source '{self.source_id}'")
+        self.update_lineage("load_data", {"kwargs": kwargs, "seed": self.seed, "symbols": len(self.symbols)})
+
+        chunks = []
+        for chunk in self.iter_chunks(kwargs.get("n_bars"), kwargs.get("chunk_size")):
+            if symbol is not None:
+                chunk = chunk[chunk["symbol"] == symbol].set_index("timestamp")[OHLCV_COLUMNS]
+            chunks.append(chunk)
+        df = chunks[0] if len(chunks) == 1 else pd.concat(chunks, ignore_index=symbol is None)
+
+        self.update_lineage("load_complete", {"rows": len(df), "columns": list(df.columns)})
+        return df
+
+    def write_parquet(self, path: Union[str, Path], n_bars: Optional[int] = None,
+                      chunk_size: Optional[int] = None, compression: str = "snappy") -> Path:
+        """Stream the series to a Parquet file, one row group per chunk.
+
+        Memory use is bounded by the chunk size, so the dataset can be far
+        larger than RAM.
+
+        Args:
+            path: Output file
+            n_bars: Bars per symbol (default: configured n_bars)
+            chunk_size: Approximate rows per chunk and row group
+            compression: Parquet compression codec
+
+        Returns:
+            Path of the written file
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        writer = None
+        rows = 0
+        try:
+            for chunk in self.iter_chunks(n_bars, chunk_size):
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(path, table.schema, compression=compression)
+                writer.write_table(table)
+                rows += len(chunk)
+        finally:
+            if writer is not None:
+                writer.close()
+
+        self.update_lineage("write_parquet", {"path": str(path), "rows": rows})
+        return path
+
+    def get_schema(self) -> Dict[str, str]:
+        """Get the schema of the generated data.
+
+        Returns:
+            Dictionary mapping column names to data types
+        """
+        return {
+            "timestamp": "datetime64[ns]",
+            "symbol": "category",
+            **{column: "float64" for column in OHLCV_COLUMNS},
+        }
+
+
+def _parse_interval(interval: str) -> pd.Timedelta:
+    """Convert a yfinance-style interval ('1m', '1h', '1d', '1wk') or pandas offset to a Timedelta."""
+    match = re.fullmatch(r"(\d+)(m|h|d|wk)", interval)
+    try:
+        step = pd.Timedelta(f"{match.group(1)}{_INTERVAL_UNITS[match.group(2)]}") if match else pd.Timedelta(interval)
+    except ValueError as e:
+        raise ValueError(f"Unsupported interval '{interval}': must be a fixed duration") from e
+    if step <= pd.Timedelta(0):
+        raise ValueError(f"interval must be positive, got '{interval}'")
+    return step
@@ -5,12 +5,14 @@ from .packager import ModelPackager
 from .paper_trading import (
     PaperTradingDeployer,
     TradingSimulationEngine,
+    VectorizedTradingEngine,
     Order,
     OrderType,
     OrderSide,
     OrderStatus,
     Position
 )
+from .replay import MarketReplay, ReplayReport, SimulatedClock
 
 __all__ = [
     "DeploymentManager",
@@ -19,9 +21,13 @@ __all__ = [
     "ModelPackager",
     "PaperTradingDeployer",
     "TradingSimulationEngine",
+    "VectorizedTradingEngine",
     "Order",
     "OrderType",
     "OrderSide",
     "OrderStatus",
-    "Position"
+    "Position",
+    "MarketReplay",
+    "ReplayReport",
+    "SimulatedClock"
 ]
\ No newline at end of file
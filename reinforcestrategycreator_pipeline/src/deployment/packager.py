@@ -7,10 +7,10 @@ import tempfile
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
-import hashlib
 
 from ..models.registry import ModelRegistry
 from ..artifact_store.base import ArtifactStore, ArtifactType
+from ..artifact_store.content_addressed import ContentAddressedStore, hash_file, tree_digest
 
 
 class ModelPackager:
@@ -110,8 +110,9 @@ class ModelPackager:
             # Create README
             self._create_readme(package_path, manifest)
             
-            # Calculate package checksum
-            checksum = self._calculate_checksum(package_path)
+            # Calculate package checksum, reusing stored digests for model files
+            known_digests = self._get_known_digests(model_id, model_version, model_path, package_path)
+            checksum = self._calculate_checksum(package_path, known_digests)
             manifest["checksum"] = checksum
             
             # Update manifest with checksum
@@ -416,30 +417,65 @@ python run.py
         with open(readme_path, "w") as f:
             f.write(readme_content)
     
-    def _calculate_checksum(self, directory: Path) -> str:
+    def _get_known_digests(
+        self,
+        model_id: str,
+        model_version: Optional[str],
+        model_path: Path,
+        package_path: Path
+    ) -> Dict[str, str]:
+        """Look up digests of the packaged model files from a content-addressed store.
+
+        Args:
+            model_id: Model identifier
+            model_version: Model version (latest if None)
+            model_path: Path the model was loaded to
+            package_path: Root of the package directory
+
+        Returns:
+            Mapping of path relative to ``package_path`` to SHA256 digest; empty
+            if the model store does not track content digests
+        """
+        store = self.model_registry.artifact_store
+        if not isinstance(store, ContentAddressedStore):
+            return {}
+
+        file_digests = store.get_file_digests(model_id, ArtifactType.MODEL, model_version)
+        model_path = Path(model_path)
+        if model_path.is_file():
+            paths = {".": model_path}
+        else:
+            paths = {relative: model_path / relative for relative in file_digests}
+
+        return {
+            paths[relative].relative_to(package_path).as_posix(): digest
+            for relative, digest in file_digests.items()
+            if relative in paths
+        }
+
+    def _calculate_checksum(self, directory: Path, known_digests: Optional[Dict[str, str]] = None) -> str:
         """Calculate SHA256 checksum of directory contents.
         
+        The checksum combines the relative path and content digest of every
+        file, so files whose digests are already known are not read again.
+        
         Args:
             directory: Directory to checksum
+            known_digests: Precomputed digests keyed by path relative to ``directory``
             
         Returns:
             Hex string of SHA256 checksum
         """
-        sha256_hash = hashlib.sha256()
+        known_digests = known_digests or {}
+        file_digests = {}
         
-        # Sort files for consistent ordering
-        for file_path in sorted(directory.rglob("*")):
+        for file_path in directory.rglob("*"):
             if file_path.is_file():
-                # Include relative path in hash
-                relative_path = file_path.relative_to(directory)
-                sha256_hash.update(str(relative_path).encode())
-                
-                # Include file contents
-                with open(file_path, "rb") as f:
-                    for chunk in iter(lambda: f.read(4096), b""):
-                        sha256_hash.update(chunk)
+                relative_path = file_path.relative_to(directory).as_posix()
+                digest = known_digests.get(relative_path)
+                file_digests[relative_path] = digest if digest is not None else hash_file(file_path)
         
-        return sha256_hash.hexdigest()
+        return tree_digest(file_digests)
     
     def list_packages(
         self,
@@ -2,10 +2,11 @@
 
 import json
 import logging
+import time
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 import numpy as np
 import pandas as pd
 from dataclasses import dataclass, field
@@ -14,6 +15,8 @@ from collections import defaultdict
 from ..models.base import ModelBase
 from ..models.registry import ModelRegistry
 from ..artifact_store.base import ArtifactStore, ArtifactType
+from ..config.models import StreamingDriftConfig
+from ..monitoring.streaming_drift import StreamingDriftMonitor
 from .manager import DeploymentManager, DeploymentStatus
 
 
@@ -75,6 +78,70 @@ class Position:
         self.unrealized_pnl = (new_price - self.average_price) * self.quantity
 
 
+def compute_performance_metrics(portfolio_values: np.ndarray, trade_pnls: np.ndarray) -> Dict[str, float]:
+    """Calculate performance metrics from a portfolio value series and trade P&Ls.
+    
+    Args:
+        portfolio_values: Portfolio value after each update, starting with the initial capital
+        trade_pnls: Realized P&L of every trade (0 for trades that opened a position)
+        
+    Returns:
+        Dictionary of performance metrics
+    """
+    if len(portfolio_values) < 2:
+        return {
+            "total_return": 0.0,
+            "sharpe_ratio": 0.0,
+            "max_drawdown": 0.0,
+            "win_rate": 0.0,
+            "profit_factor": 0.0,
+            "total_trades": 0
+        }
+    
+    # Calculate returns
+    values = np.asarray(portfolio_values, dtype=float)
+    returns = np.diff(values) / values[:-1]
+    
+    # Total return
+    total_return = (values[-1] - values[0]) / values[0]
+    
+    # Sharpe ratio (assuming 252 trading days)
+    if len(returns) > 0 and np.std(returns) > 0:
+        sharpe_ratio = np.sqrt(252) * np.mean(returns) / np.std(returns)
+    else:
+        sharpe_ratio = 0.0
+    
+    # Maximum drawdown
+    cumulative = np.cumprod(1 + returns)
+    running_max = np.maximum.accumulate(cumulative)
+    drawdown = (cumulative - running_max) / running_max
+    max_drawdown = np.min(drawdown) if len(drawdown) > 0 else 0.0
+    
+    # Trade statistics
+    winning_trades = trade_pnls[trade_pnls > 0]
+    losing_trades = trade_pnls[trade_pnls < 0]
+    
+    win_rate = len(winning_trades) / len(trade_pnls) if len(trade_pnls) else 0.0
+    
+    # Profit factor
+    gross_profit = float(np.sum(winning_trades))
+    gross_loss = abs(float(np.sum(losing_trades)))
+    profit_factor = gross_profit / gross_loss if gross_loss > 0 else float('inf')
+    
+    return {
+        "total_return": total_return,
+        "sharpe_ratio": sharpe_ratio,
+        "max_drawdown": max_drawdown,
+        "win_rate": win_rate,
+        "profit_factor": profit_factor,
+        "total_trades": len(trade_pnls),
+        "winning_trades": len(winning_trades),
+        "losing_trades": len(losing_trades),
+        "avg_win": np.mean(winning_trades) if len(winning_trades) else 0.0,
+        "avg_loss": np.mean(losing_trades) if len(losing_trades) else 0.0
+    }
+
+
 class TradingSimulationEngine:
     """Simulates trading execution and portfolio management.
     
@@ -92,7 +159,8 @@ class TradingSimulationEngine:
         slippage_rate: float = 0.0005,  # 0.05% slippage
         max_position_size: float = 0.1,  # Max 10% of capital per position
         daily_stop_loss: float = 0.02,  # 2% daily stop loss
-        enable_shorting: bool = False
+        enable_shorting: bool = False,
+        clock: Optional[Callable[[], datetime]] = None
     ):
         """Initialize the trading simulation engine.
         
@@ -103,7 +171,9 @@ class TradingSimulationEngine:
             max_position_size: Maximum position size as fraction of capital
             daily_stop_loss: Daily stop loss as fraction of capital
             enable_shorting: Whether to allow short selling
+            clock: Returns the current time (default: datetime.now); replays pass a simulated clock
         """
+        self.clock = clock or datetime.now
         self.initial_capital = initial_capital
         self.cash = initial_capital
         self.commission_rate = commission_rate
@@ -118,7 +188,7 @@ class TradingSimulationEngine:
         self.order_history: List[Order] = []
         
         # Performance tracking
-        self.portfolio_values: List[Tuple[datetime, float]] = [(datetime.now(), initial_capital)]
+        self.portfolio_values: List[Tuple[datetime, float]] = [(self.clock(), initial_capital)]
         self.daily_pnl: List[Tuple[datetime, float]] = []
         self.trades: List[Dict[str, Any]] = []
         
@@ -190,7 +260,7 @@ class TradingSimulationEngine:
         
         # Update portfolio value
         portfolio_value = self.get_portfolio_value(market_data)
-        self.portfolio_values.append((datetime.now(), portfolio_value))
+        self.portfolio_values.append((self.clock(), portfolio_value))
         
         # Check daily stop loss
         self._check_daily_stop_loss(portfolio_value)
@@ -220,58 +290,10 @@ class TradingSimulationEngine:
         Returns:
             Dictionary of performance metrics
         """
-        if len(self.portfolio_values) < 2:
-            return {
-                "total_return": 0.0,
-                "sharpe_ratio": 0.0,
-                "max_drawdown": 0.0,
-                "win_rate": 0.0,
-                "profit_factor": 0.0,
-                "total_trades": 0
-            }
-        
-        # Calculate returns
-        values = np.array([v[1] for v in self.portfolio_values])
-        returns = np.diff(values) / values[:-1]
-        
-        # Total return
-        total_return = (values[-1] - values[0]) / values[0]
-        
-        # Sharpe ratio (assuming 252 trading days)
-        if len(returns) > 0 and np.std(returns) > 0:
-            sharpe_ratio = np.sqrt(252) * np.mean(returns) / np.std(returns)
-        else:
-            sharpe_ratio = 0.0
-        
-        # Maximum drawdown
-        cumulative = np.cumprod(1 + returns)
-        running_max = np.maximum.accumulate(cumulative)
-        drawdown = (cumulative - running_max) / running_max
-        max_drawdown = np.min(drawdown) if len(drawdown) > 0 else 0.0
-        
-        # Trade statistics
-        winning_trades = [t for t in self.trades if t["pnl"] > 0]
-        losing_trades = [t for t in self.trades if t["pnl"] < 0]
-        
-        win_rate = len(winning_trades) / len(self.trades) if self.trades else 0.0
-        
-        # Profit factor
-        gross_profit = sum(t["pnl"] for t in winning_trades)
-        gross_loss = abs(sum(t["pnl"] for t in losing_trades))
-        profit_factor = gross_profit / gross_loss if gross_loss > 0 else float('inf')
-        
-        return {
-            "total_return": total_return,
-            "sharpe_ratio": sharpe_ratio,
-            "max_drawdown": max_drawdown,
-            "win_rate": win_rate,
-            "profit_factor": profit_factor,
-            "total_trades": len(self.trades),
-            "winning_trades": len(winning_trades),
-            "losing_trades": len(losing_trades),
-            "avg_win": np.mean([t["pnl"] for t in winning_trades]) if winning_trades else 0.0,
-            "avg_loss": np.mean([t["pnl"] for t in losing_trades]) if losing_trades else 0.0
-        }
+        return compute_performance_metrics(
+            np.array([v[1] for v in self.portfolio_values]),
+            np.array([t["pnl"] for t in self.trades], dtype=float)
+        )
     
     def reset_daily_limits(self) -> None:
         """Reset daily risk limits."""
@@ -381,7 +403,7 @@ class TradingSimulationEngine:
         order.status = OrderStatus.FILLED
         order.filled_quantity = order.quantity
         order.average_fill_price = fill_price
-        order.filled_at = datetime.now()
+        order.filled_at = self.clock()
         order.commission = commission
         order.slippage = abs(fill_price - market_price) * order.quantity
         
@@ -474,6 +496,417 @@ class TradingSimulationEngine:
                     self.logger.info(f"Order {order.order_id} cancelled due to risk limit")
 
 
+ORDER_TYPE_CODES = {
+    OrderType.MARKET: 0,
+    OrderType.LIMIT: 1,
+    OrderType.STOP: 2,
+    OrderType.STOP_LIMIT: 3
+}
+_ORDER_TYPES = {code: order_type for order_type, code in ORDER_TYPE_CODES.items()}
+
+TRADE_DTYPE = np.dtype([
+    ("tick", np.int64),
+    ("symbol_id", np.int32),
+    ("side", np.int8),
+    ("quantity", np.float64),
+    ("fill_price", np.float64),
+    ("commission", np.float64),
+    ("pnl", np.float64),
+    ("timestamp", np.float64)
+])
+
+
+class VectorizedTradingEngine:
+    """Trading simulation engine that keeps all state in arrays indexed by symbol id.
+
+    Positions and pending orders are NumPy arrays with one slot per symbol, so
+    a tick updates prices, evaluates fills, books P&L and checks the daily
+    stop loss with a handful of array operations instead of Python loops over
+    order and position objects. Each symbol holds at most one pending order.
+
+    Fill prices, commissions, order validation and the daily stop loss follow
+    ``TradingSimulationEngine``. Unlike that engine, sells past a flat position
+    open a short when shorting is enabled.
+    """
+
+    def __init__(
+        self,
+        symbols: Sequence[str],
+        initial_capital: float = 100000.0,
+        commission_rate: float = 0.001,
+        slippage_rate: float = 0.0005,
+        max_position_size: float = 0.1,
+        daily_stop_loss: float = 0.02,
+        enable_shorting: bool = False,
+        clock: Optional[Callable[[], datetime]] = None
+    ):
+        """Initialize the engine.
+
+        Args:
+            symbols: Tradable symbols; their order defines the symbol ids
+            initial_capital: Starting capital for simulation
+            commission_rate: Commission rate per trade
+            slippage_rate: Simulated slippage rate
+            max_position_size: Maximum position size as fraction of capital
+            daily_stop_loss: Daily stop loss as fraction of capital
+            enable_shorting: Whether to allow short selling
+            clock: Returns the current time (default: wall clock); replays pass a simulated clock
+        """
+        self.clock = clock
+        self.symbols = list(symbols)
+        self.symbol_ids = {symbol: i for i, symbol in enumerate(self.symbols)}
+        self.initial_capital = initial_capital
+        self.cash = initial_capital
+        self.commission_rate = commission_rate
+        self.slippage_rate = slippage_rate
+        self.max_position_size = max_position_size
+        self.daily_stop_loss = daily_stop_loss
+        self.enable_shorting = enable_shorting
+
+        n = len(self.symbols)
+        # Positions
+        self.position_qty = np.zeros(n)
+        self.average_price = np.zeros(n)
+        self.realized_pnl = np.zeros(n)
+        self.last_price = np.full(n, np.nan)
+
+        # Pending orders, one slot per symbol (side 0 means empty)
+        self.order_side = np.zeros(n, dtype=np.int8)
+        self.order_type = np.zeros(n, dtype=np.int8)
+        self.order_qty = np.zeros(n)
+        self.order_limit = np.full(n, np.nan)
+        self.order_stop = np.full(n, np.nan)
+
+        # Performance tracking, grown by doubling
+        self._values = np.empty(1024)
+        self._timestamps = np.empty(1024)
+        self._values[0] = initial_capital
+        self._timestamps[0] = self._now()
+        self.num_ticks = 0
+        self._trade_chunks: List[np.ndarray] = []
+        self.rejected_orders = 0
+        self.cancelled_orders = 0
+
+        # Risk management state
+        self.daily_start_value = initial_capital
+        self.risk_limit_hit = False
+
+        self.logger = logging.getLogger(__name__)
+
+    def price_array(self, market_data: Dict[str, float]) -> np.ndarray:
+        """Convert a symbol -> price mapping to an array, NaN for missing symbols."""
+        prices = np.full(len(self.symbols), np.nan)
+        for symbol, price in market_data.items():
+            symbol_id = self.symbol_ids.get(symbol)
+            if symbol_id is not None:
+                prices[symbol_id] = price
+        return prices
+
+    def submit_orders(
+        self,
+        symbol_ids: np.ndarray,
+        sides: np.ndarray,
+        quantities: np.ndarray,
+        order_type: Union[OrderType, np.ndarray] = OrderType.MARKET,
+        limit_prices: Optional[np.ndarray] = None,
+        stop_prices: Optional[np.ndarray] = None,
+        current_prices: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Validate and queue a batch of orders.
+
+        Orders are rejected, not raised on, when they fail the same checks as
+        ``TradingSimulationEngine._validate_order``, when the symbol already
+        has a pending order, or when the daily risk limit has been hit.
+
+        Args:
+            symbol_ids: Symbol id of each order (unique within the batch)
+            sides: +1 for buy, -1 for sell
+            quantities: Order quantities
+            order_type: One OrderType for all orders, or an array of type codes
+            limit_prices: Limit prices for LIMIT and STOP_LIMIT orders
+            stop_prices: Stop prices for STOP and STOP_LIMIT orders
+            current_prices: Prices used to value market orders (default: last tick)
+
+        Returns:
+            Boolean mask of accepted orders
+        """
+        symbol_ids = np.asarray(symbol_ids, dtype=np.int64)
+        sides = np.asarray(sides, dtype=np.int8)
+        quantities = np.asarray(quantities, dtype=float)
+        n_orders = len(symbol_ids)
+        if isinstance(order_type, OrderType):
+            types = np.full(n_orders, ORDER_TYPE_CODES[order_type], dtype=np.int8)
+        else:
+            types = np.asarray(order_type, dtype=np.int8)
+        limits = np.full(n_orders, np.nan) if limit_prices is None else np.asarray(limit_prices, dtype=float)
+        stops = np.full(n_orders, np.nan) if stop_prices is None else np.asarray(stop_prices, dtype=float)
+
+        if self.risk_limit_hit:
+            self.rejected_orders += n_orders
+            self.logger.warning(f"{n_orders} orders rejected due to risk limit being hit.")
+            return np.zeros(n_orders, dtype=bool)
+
+        if current_prices is None:
+            current_prices = self.last_price[symbol_ids]
+        # Same valuation price as TradingSimulationEngine: market price for market orders, else the limit
+        value_price = np.where(types == ORDER_TYPE_CODES[OrderType.MARKET], current_prices, limits)
+        order_value = np.abs(quantities * np.nan_to_num(value_price))
+
+        accepted = self.order_side[symbol_ids] == 0
+        accepted &= quantities > 0
+        is_buy = sides > 0
+        if self.cash <= 0:
+            accepted &= ~(is_buy & (order_value > 0))
+        else:
+            accepted &= ~(is_buy & (order_value > self.initial_capital * self.max_position_size))
+        if not self.enable_shorting:
+            accepted &= is_buy | (quantities <= self.position_qty[symbol_ids])
+        needs_limit = (types == ORDER_TYPE_CODES[OrderType.LIMIT]) | (types == ORDER_TYPE_CODES[OrderType.STOP_LIMIT])
+        needs_stop = (types == ORDER_TYPE_CODES[OrderType.STOP]) | (types == ORDER_TYPE_CODES[OrderType.STOP_LIMIT])
+        accepted &= ~(needs_limit & np.isnan(limits)) & ~(needs_stop & np.isnan(stops))
+
+        ids = symbol_ids[accepted]
+        self.order_side[ids] = sides[accepted]
+        self.order_type[ids] = types[accepted]
+        self.order_qty[ids] = quantities[accepted]
+        self.order_limit[ids] = limits[accepted]
+        self.order_stop[ids] = stops[accepted]
+
+        rejected = n_orders - int(accepted.sum())
+        if rejected:
+            self.rejected_orders += rejected
+            self.logger.debug(f"{rejected} of {n_orders} orders rejected by validation")
+        return accepted
+
+    def submit_order(self, order: Order, current_market_price: Optional[float] = None) -> str:
+        """Submit a single order object.
+
+        Args:
+            order: Order to submit
+            current_market_price: Current price of the order's symbol
+
+        Returns:
+            Order ID
+
+        Raises:
+            ValueError: If the order is rejected
+        """
+        symbol_id = self.symbol_ids.get(order.symbol)
+        if symbol_id is None:
+            raise ValueError(f"Unknown symbol {order.symbol}")
+        accepted = self.submit_orders(
+            np.array([symbol_id]),
+            np.array([1 if order.side == OrderSide.BUY else -1]),
+            np.array([order.quantity]),
+            order_type=order.order_type,
+            limit_prices=np.array([np.nan if order.price is None else order.price]),
+            stop_prices=np.array([np.nan if order.stop_price is None else order.stop_price]),
+            current_prices=None if current_market_price is None else np.array([current_market_price])
+        )
+        if not accepted[0]:
+            raise ValueError(f"Order {order.order_id} for {order.symbol} rejected")
+        return order.order_id
+
+    def process_tick(self, prices: np.ndarray, timestamp: Optional[float] = None) -> None:
+        """Apply one tick of prices: fill pending orders, update P&L and risk state.
+
+        Args:
+            prices: Price per symbol id; NaN for symbols without a quote this tick
+            timestamp: Tick time as a POSIX timestamp (default: the engine clock)
+        """
+        if timestamp is None:
+            timestamp = self._now()
+        prices = np.asarray(prices, dtype=float)
+        quoted = ~np.isnan(prices)
+        self.last_price = np.where(quoted, prices, self.last_price)
+
+        fills = self._fillable(prices, quoted)
+        if fills.size:
+            self._execute(fills, prices[fills], timestamp)
+
+        value = self.cash + np.dot(self.position_qty, np.nan_to_num(self.last_price))
+        self._record_value(value, timestamp)
+        self._check_daily_stop_loss(value)
+
+    def process_market_data(self, market_data: Dict[str, float]) -> None:
+        """Process a symbol -> price mapping, like ``TradingSimulationEngine``."""
+        self.process_tick(self.price_array(market_data))
+
+    def get_portfolio_value(self, market_data: Optional[Dict[str, float]] = None) -> float:
+        """Calculate total portfolio value at the given or the last known prices."""
+        prices = self.last_price
+        if market_data is not None:
+            quoted = self.price_array(market_data)
+            prices = np.where(np.isnan(quoted), self.last_price, quoted)
+        return float(self.cash + np.dot(self.position_qty, np.nan_to_num(prices)))
+
+    @property
+    def portfolio_value_history(self) -> np.ndarray:
+        """Portfolio value after every tick, starting with the initial capital."""
+        return self._values[:self.num_ticks + 1]
+
+    @property
+    def portfolio_values(self) -> List[tuple]:
+        """Portfolio values as (datetime, value) tuples, as in ``TradingSimulationEngine``."""
+        return [
+            (datetime.fromtimestamp(ts), float(value))
+            for ts, value in zip(self._timestamps[:self.num_ticks + 1], self.portfolio_value_history)
+        ]
+
+    @property
+    def trade_records(self) -> np.ndarray:
+        """All fills as a structured array with TRADE_DTYPE fields."""
+        if not self._trade_chunks:
+            return np.empty(0, dtype=TRADE_DTYPE)
+        if len(self._trade_chunks) > 1:
+            self._trade_chunks = [np.concatenate(self._trade_chunks)]
+        return self._trade_chunks[0]
+
+    @property
+    def trades(self) -> List[Dict[str, Any]]:
+        """Fills as trade dictionaries, as in ``TradingSimulationEngine``."""
+        return [
+            {
+                "symbol": self.symbols[record["symbol_id"]],
+                "side": "buy" if record["side"] > 0 else "sell",
+                "quantity": float(record["quantity"]),
+                "fill_price": float(record["fill_price"]),
+                "commission": float(record["commission"]),
+                "timestamp": datetime.fromtimestamp(record["timestamp"]),
+                "pnl": float(record["pnl"])
+            }
+            for record in self.trade_records
+        ]
+
+    @property
+    def orders(self) -> Dict[str, Order]:
+        """Pending orders as Order objects keyed by symbol."""
+        orders = {}
+        for symbol_id in np.flatnonzero(self.order_side):
+            symbol = self.symbols[symbol_id]
+            limit, stop = self.order_limit[symbol_id], self.order_stop[symbol_id]
+            orders[symbol] = Order(
+                order_id=f"pending_{symbol}",
+                symbol=symbol,
+                side=OrderSide.BUY if self.order_side[symbol_id] > 0 else OrderSide.SELL,
+                order_type=_ORDER_TYPES[int(self.order_type[symbol_id])],
+                quantity=float(self.order_qty[symbol_id]),
+                price=None if np.isnan(limit) else float(limit),
+                stop_price=None if np.isnan(stop) else float(stop)
+            )
+        return orders
+
+    def get_positions(self) -> Dict[str, Position]:
+        """Get open positions as Position objects."""
+        positions = {}
+        for symbol_id in np.flatnonzero(self.position_qty):
+            price = self.last_price[symbol_id]
+            quantity = float(self.position_qty[symbol_id])
+            average_price = float(self.average_price[symbol_id])
+            positions[self.symbols[symbol_id]] = Position(
+                symbol=self.symbols[symbol_id],
+                quantity=quantity,
+                average_price=average_price,
+                current_price=float(price),
+                unrealized_pnl=float((price - average_price) * quantity),
+                realized_pnl=float(self.realized_pnl[symbol_id])
+            )
+        return positions
+
+    def get_performance_metrics(self) -> Dict[str, float]:
+        """Calculate performance metrics, as in ``TradingSimulationEngine``."""
+        return compute_performance_metrics(self.portfolio_value_history, self.trade_records["pnl"])
+
+    def reset_daily_limits(self) -> None:
+        """Reset daily risk limits."""
+        self.daily_start_value = float(self._values[self.num_ticks])
+        self.risk_limit_hit = False
+        self.logger.info("Daily risk limits reset")
+
+    def _now(self) -> float:
+        return self.clock().timestamp() if self.clock is not None else time.time()
+
+    def _fillable(self, prices: np.ndarray, quoted: np.ndarray) -> np.ndarray:
+        """Symbol ids whose pending order fills at this tick's price."""
+        side = self.order_side
+        buy = side > 0
+        with np.errstate(invalid='ignore'):
+            limit_ok = np.where(buy, prices <= self.order_limit, prices >= self.order_limit)
+            stop_ok = np.where(buy, prices >= self.order_stop, prices <= self.order_stop)
+        order_type = self.order_type
+        fill = np.select(
+            [
+                order_type == ORDER_TYPE_CODES[OrderType.MARKET],
+                order_type == ORDER_TYPE_CODES[OrderType.LIMIT],
+                order_type == ORDER_TYPE_CODES[OrderType.STOP]
+            ],
+            [True, limit_ok, stop_ok],
+            default=stop_ok & limit_ok
+        )
+        return np.flatnonzero(fill & (side != 0) & quoted)
+
+    def _execute(self, ids: np.ndarray, market_prices: np.ndarray, timestamp: float) -> None:
+        """Fill the pending orders of the given symbols and update positions and cash."""
+        side = self.order_side[ids].astype(float)
+        quantity = self.order_qty[ids]
+        fill_price = market_prices * (1 + side * self.slippage_rate)
+        commission = quantity * fill_price * self.commission_rate
+        self.cash -= float(np.sum(side * quantity * fill_price) + np.sum(commission))
+
+        position = self.position_qty[ids]
+        average = self.average_price[ids]
+        trade = side * quantity
+        new_position = position + trade
+        adding = (position == 0) | (np.sign(position) == side)
+        closed = np.where(adding, 0.0, np.minimum(quantity, np.abs(position)))
+        realized = (fill_price - average) * closed * np.sign(position)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            averaged = (np.abs(position) * average + quantity * fill_price) / np.abs(new_position)
+        new_average = np.select(
+            [adding, new_position == 0, np.sign(new_position) == np.sign(position)],
+            [averaged, 0.0, average],
+            default=fill_price  # Position flipped: the remainder opened at the fill price
+        )
+        self.position_qty[ids] = new_position
+        self.average_price[ids] = new_average
+        self.realized_pnl[ids] += realized
+        self.order_side[ids] = 0
+
+        records = np.empty(len(ids), dtype=TRADE_DTYPE)
+        records["tick"] = self.num_ticks + 1
+        records["symbol_id"] = ids
+        records["side"] = side
+        records["quantity"] = quantity
+        records["fill_price"] = fill_price
+        records["commission"] = commission
+        records["pnl"] = realized
+        records["timestamp"] = timestamp
+        self._trade_chunks.append(records)
+
+    def _record_value(self, value: float, timestamp: float) -> None:
+        self.num_ticks += 1
+        if self.num_ticks == len(self._values):
+            self._values = np.concatenate([self._values, np.empty_like(self._values)])
+            self._timestamps = np.concatenate([self._timestamps, np.empty_like(self._timestamps)])
+        self._values[self.num_ticks] = value
+        self._timestamps[self.num_ticks] = timestamp
+
+    def _check_daily_stop_loss(self, current_value: float) -> None:
+        """Check the daily stop loss and cancel all pending orders when it is hit."""
+        daily_loss = (self.daily_start_value - current_value) / self.daily_start_value
+        if daily_loss >= self.daily_stop_loss and not self.risk_limit_hit:
+            self.risk_limit_hit = True
+            self.logger.warning(
+                f"Daily stop loss hit: {daily_loss:.2%} loss "
+                f"(limit: {self.daily_stop_loss:.2%})"
+            )
+            pending = int(np.count_nonzero(self.order_side))
+            self.order_side[:] = 0
+            self.cancelled_orders += pending
+            if pending:
+                self.logger.info(f"{pending} pending orders cancelled due to risk limit")
+
+
 class PaperTradingDeployer:
     """Handles deployment of models to paper trading environment.
     
@@ -489,7 +922,8 @@ class PaperTradingDeployer:
         deployment_manager: DeploymentManager,
         model_registry: ModelRegistry,
         artifact_store: ArtifactStore,
-        paper_trading_root: Optional[Union[str, Path]] = None
+        paper_trading_root: Optional[Union[str, Path]] = None,
+        alert_manager: Optional[Any] = None
     ):
         """Initialize the paper trading deployer.
         
@@ -498,10 +932,12 @@ class PaperTradingDeployer:
             model_registry: Registry for accessing models
             artifact_store: Store for artifacts
             paper_trading_root: Root directory for paper trading (default: ./paper_trading)
+            alert_manager: AlertManager that receives streaming drift alerts
         """
         self.deployment_manager = deployment_manager
         self.model_registry = model_registry
         self.artifact_store = artifact_store
+        self.alert_manager = alert_manager
         
         # Set paper trading root directory
         if paper_trading_root is None:
@@ -546,7 +982,9 @@ class PaperTradingDeployer:
             "enable_shorting": simulation_config.get("enable_shorting", False),
             "data_source": simulation_config.get("data_source", "simulated"),
             "symbols": simulation_config.get("symbols", ["AAPL", "GOOGL", "MSFT"]),
-            "update_frequency": simulation_config.get("update_frequency", "1min")
+            "update_frequency": simulation_config.get("update_frequency", "1min"),
+            "engine": simulation_config.get("engine", "standard"),
+            "drift_monitoring": simulation_config.get("drift_monitoring")
         }
         
         # Deploy using deployment manager
@@ -572,6 +1010,13 @@ class PaperTradingDeployer:
         # Store active simulation
         self.active_simulations[simulation_id] = simulation
         
+        if sim_config["drift_monitoring"]:
+            drift_settings = sim_config["drift_monitoring"]
+            self.enable_drift_monitoring(
+                simulation_id,
+                StreamingDriftConfig(**drift_settings) if isinstance(drift_settings, dict) else None
+            )
+        
         self.logger.info(
             f"Model {model_id} deployed to paper trading "
             f"(deployment_id: {deployment_id}, simulation_id: {simulation_id})"
@@ -579,6 +1024,44 @@ class PaperTradingDeployer:
         
         return simulation_id
     
+    def enable_drift_monitoring(
+        self,
+        simulation_id: str,
+        config: Optional[StreamingDriftConfig] = None,
+        feature_names: Optional[List[str]] = None,
+        reference_profile: Optional[Any] = None
+    ) -> StreamingDriftMonitor:
+        """Attach a streaming drift monitor to a simulation.
+        
+        Every market update then feeds each symbol's features and predicted
+        action to the monitor, which alerts through the deployer's AlertManager.
+        
+        Args:
+            simulation_id: ID of the simulation
+            config: Streaming drift configuration (defaults are used if None)
+            feature_names: Names of the prepared features
+            reference_profile: ReferenceProfile to compare against; if None the
+                monitor warms up on the first observations
+            
+        Returns:
+            The attached monitor
+        """
+        if simulation_id not in self.active_simulations:
+            raise ValueError(f"Simulation {simulation_id} not found")
+        
+        simulation = self.active_simulations[simulation_id]
+        monitor = StreamingDriftMonitor(
+            config or StreamingDriftConfig(),
+            feature_names=feature_names,
+            reference_profile=reference_profile,
+            alert_manager=self.alert_manager,
+            tags=[f"simulation_id:{simulation_id}", f"model_id:{simulation['model_id']}"]
+        )
+        simulation["drift_monitor"] = monitor
+        
+        self.logger.info(f"Enabled streaming drift monitoring for simulation {simulation_id}")
+        return monitor
+    
     def start_simulation(self, simulation_id: str) -> None:
         """Start a paper trading simulation.
         
@@ -691,14 +1174,16 @@ class PaperTradingDeployer:
                 for symbol, pos in engine.get_positions().items()
             },
             "pending_orders": len(engine.orders),
-            "total_trades": len(engine.trades)
+            "total_trades": len(engine.trades),
+            "drift_report": simulation["drift_monitor"].last_report if "drift_monitor" in simulation else None
         }
     
     def process_market_update(
         self,
         simulation_id: str,
         market_data: Dict[str, float],
-        prepared_features_map: Dict[str, np.ndarray] # New parameter
+        prepared_features_map: Dict[str, np.ndarray], # New parameter
+        timings: Optional[Dict[str, float]] = None
     ) -> None:
         """Process market data update for a simulation.
         
@@ -706,6 +1191,8 @@ class PaperTradingDeployer:
             simulation_id: ID of the simulation
             market_data: Dictionary of symbol -> price
             prepared_features_map: Dictionary of symbol -> prepared numpy array of features
+            timings: If given, filled with the seconds spent in each phase of the
+                update ("signal_generation", "order_submission", "fill_processing")
         """
         if simulation_id not in self.active_simulations:
             raise ValueError(f"Simulation {simulation_id} not found")
@@ -717,6 +1204,27 @@ class PaperTradingDeployer:
         
         engine = simulation["engine"]
         model = simulation["model"]
+        drift_monitor = simulation.get("drift_monitor")
+        phase_start = time.perf_counter()
+        
+        if isinstance(engine, VectorizedTradingEngine):
+            prices = engine.price_array(market_data)
+            has_features = np.array([symbol in prepared_features_map for symbol in engine.symbols])
+            missing = [symbol for symbol in market_data if symbol not in prepared_features_map]
+            if missing:
+                self.logger.warning(
+                    f"No prepared features for symbols {missing} in process_market_update. "
+                    f"Skipping signal generation for these symbols."
+                )
+            features = None
+            if has_features.any():
+                width = np.asarray(next(iter(prepared_features_map.values()))).size
+                features = np.full((len(engine.symbols), width), np.nan)
+                for symbol, symbol_features in prepared_features_map.items():
+                    if symbol in engine.symbol_ids:
+                        features[engine.symbol_ids[symbol]] = np.asarray(symbol_features).ravel()
+            self._process_vectorized_update(simulation, prices, features, has_features, timings, phase_start)
+            return
         
         # Get model predictions/signals
         signals_to_submit: List[Dict[str, Any]] = []
@@ -732,6 +1240,14 @@ class PaperTradingDeployer:
 
             symbol_features = prepared_features_map[symbol]
             
+            prediction_action = None
+            if drift_monitor is not None:
+                # Predict here so the monitor sees the same action the signal is based on
+                prediction_action = self._predict_action(model, symbol, symbol_features)
+                if prediction_action is None:
+                    continue
+                drift_monitor.observe(symbol_features, prediction=prediction_action)
+            
             # Call _get_model_signals for each symbol
             signal = self._get_model_signals(
                 model,
@@ -740,22 +1256,26 @@ class PaperTradingDeployer:
                 symbol_features,
                 current_engine_positions,
                 engine.initial_capital,
-                engine.max_position_size # This is the ratio, consistent with _get_model_signals
+                engine.max_position_size, # This is the ratio, consistent with _get_model_signals
+                prediction_action=prediction_action
             )
 
             if signal:
                 signals_to_submit.append(signal)
         
+        phase_start = self._record_phase(timings, "signal_generation", phase_start)
+        
         # Submit orders based on signals
         for signal_data in signals_to_submit:
             order = Order(
-                order_id=f"order_{simulation_id}_{datetime.now().strftime('%Y%m%d%H%M%S%f')}",
-                symbol=signal["symbol"],
-                side=OrderSide(signal["side"]),
-                order_type=OrderType(signal.get("order_type", "market")),
-                quantity=signal["quantity"],
-                price=signal.get("price"),
-                stop_price=signal.get("stop_price")
+                order_id=f"order_{simulation_id}_{signal_data['symbol']}_{engine.clock().strftime('%Y%m%d%H%M%S%f')}",
+                symbol=signal_data["symbol"],
+                side=OrderSide(signal_data["side"]),
+                order_type=OrderType(signal_data.get("order_type", "market")),
+                quantity=signal_data["quantity"],
+                price=signal_data.get("price"),
+                stop_price=signal_data.get("stop_price"),
+                created_at=engine.clock()
             )
             
             try:
@@ -770,8 +1290,141 @@ class PaperTradingDeployer:
             except ValueError as e:
                 self.logger.error(f"Failed to submit order for {order.symbol}: {e}") # Added symbol to log
         
+        phase_start = self._record_phase(timings, "order_submission", phase_start)
+        
         # Process market data
         engine.process_market_data(market_data)
+        self._record_phase(timings, "fill_processing", phase_start)
+    
+    @staticmethod
+    def _record_phase(timings: Optional[Dict[str, float]], phase: str, phase_start: float) -> float:
+        """Store the seconds since phase_start under phase and return the current time."""
+        now = time.perf_counter()
+        if timings is not None:
+            timings[phase] = now - phase_start
+        return now
+    
+    def process_market_arrays(
+        self,
+        simulation_id: str,
+        prices: np.ndarray,
+        features: np.ndarray,
+        timings: Optional[Dict[str, float]] = None
+    ) -> None:
+        """Process one tick for a simulation running the vectorized engine.
+        
+        This is the array counterpart of ``process_market_update``: signals for
+        all quoted symbols come from a single batched ``model.predict`` call and
+        are submitted and filled with array operations.
+        
+        Args:
+            simulation_id: ID of the simulation
+            prices: Price per symbol id (engine symbol order); NaN if not quoted
+            features: Feature matrix of shape (n_symbols, n_features) in the same order
+            timings: If given, filled with the seconds spent in each phase, as in
+                ``process_market_update``
+        """
+        if simulation_id not in self.active_simulations:
+            raise ValueError(f"Simulation {simulation_id} not found")
+        
+        simulation = self.active_simulations[simulation_id]
+        if not isinstance(simulation["engine"], VectorizedTradingEngine):
+            raise ValueError(f"Simulation {simulation_id} does not use the vectorized engine")
+        if simulation["status"] != "running":
+            self.logger.warning(f"Simulation {simulation_id} is not running")
+            return
+        
+        self._process_vectorized_update(
+            simulation, np.asarray(prices, dtype=float), features, np.ones(len(prices), dtype=bool),
+            timings, time.perf_counter()
+        )
+    
+    def _process_vectorized_update(
+        self,
+        simulation: Dict[str, Any],
+        prices: np.ndarray,
+        features: Optional[np.ndarray],
+        has_features: np.ndarray,
+        timings: Optional[Dict[str, float]],
+        phase_start: float
+    ) -> None:
+        """Generate signals for all symbols at once, submit them and apply the tick."""
+        engine = simulation["engine"]
+        ids = np.flatnonzero(~np.isnan(prices) & has_features)
+        submit = np.zeros(len(ids), dtype=bool)
+        
+        if len(ids) and features is not None:
+            symbols = [engine.symbols[i] for i in ids]
+            symbol_features = features[ids]
+            actions = self._predict_actions(simulation["model"], symbols, symbol_features)
+            
+            drift_monitor = simulation.get("drift_monitor")
+            if drift_monitor is not None:
+                for row, action in zip(symbol_features, actions):
+                    drift_monitor.observe(row, prediction=action)
+            
+            symbol_prices = prices[ids]
+            positions = engine.position_qty[ids]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                buy_quantity = np.floor(
+                    engine.initial_capital * engine.max_position_size / np.where(symbol_prices > 0, symbol_prices, np.nan)
+                )
+            buy = (actions == "buy") & (positions == 0) & (buy_quantity > 0)
+            sell = (actions == "sell") & (positions > 0)
+            submit = buy | sell
+        
+        phase_start = self._record_phase(timings, "signal_generation", phase_start)
+        if submit.any():
+            engine.submit_orders(
+                ids[submit],
+                np.where(buy, 1, -1)[submit],
+                np.where(buy, buy_quantity, positions)[submit],
+                current_prices=symbol_prices[submit]
+            )
+        phase_start = self._record_phase(timings, "order_submission", phase_start)
+        
+        engine.process_tick(prices)
+        self._record_phase(timings, "fill_processing", phase_start)
+    
+    def _predict_actions(self, model: Any, symbols: List[str], features: np.ndarray) -> np.ndarray:
+        """Predict actions for many symbols with one ``model.predict`` call.
+        
+        Models whose output cannot be read as one action per row (e.g. models
+        that return a single string) are called once per symbol instead.
+        
+        Args:
+            model: The trading model.
+            symbols: Symbols in row order.
+            features: Feature matrix with one row per symbol.
+            
+        Returns:
+            Array of action strings, one per symbol.
+        """
+        n_rows = len(symbols)
+        output = None
+        try:
+            output = model.predict(features)
+        except Exception as e:
+            self.logger.error(f"Error during batched model prediction: {e}. Predicting per symbol.", exc_info=True)
+        
+        if isinstance(output, (list, np.ndarray)):
+            output = np.asarray(output)
+            if output.ndim == 2 and output.shape[0] == n_rows:
+                # Column of action ids, or one row of action scores per symbol
+                output = output[:, 0] if output.shape[1] == 1 else np.argmax(output, axis=1)
+            if output.shape == (n_rows,):
+                if output.dtype.kind in "US":
+                    return output.astype(str)
+                if output.dtype.kind in "iuf":
+                    action_map = {0: "buy", 1: "sell", 2: "hold"}
+                    if hasattr(model, 'action_space_map') and isinstance(model.action_space_map, dict):
+                        action_map = model.action_space_map
+                    codes = output.astype(int)
+                    lookup = np.array([action_map.get(i, "hold") for i in range(max(int(codes.max()), 0) + 1)])
+                    return np.where(codes >= 0, lookup[np.clip(codes, 0, None)], "hold")
+        
+        actions = [self._predict_action(model, symbol, row) for symbol, row in zip(symbols, features)]
+        return np.array([action or "hold" for action in actions])
     
     def _initialize_simulation(
         self,
@@ -785,7 +1438,7 @@ class PaperTradingDeployer:
         sim_dir.mkdir(parents=True, exist_ok=True)
         
         # Initialize trading engine
-        engine = TradingSimulationEngine(
+        engine_settings = dict(
             initial_capital=simulation_config["initial_capital"],
             commission_rate=simulation_config["commission_rate"],
             slippage_rate=simulation_config["slippage_rate"],
@@ -793,6 +1446,10 @@ class PaperTradingDeployer:
             daily_stop_loss=simulation_config["daily_stop_loss"],
             enable_shorting=simulation_config["enable_shorting"]
         )
+        if simulation_config.get("engine", "standard") == "vectorized":
+            engine = VectorizedTradingEngine(symbols=simulation_config["symbols"], **engine_settings)
+        else:
+            engine = TradingSimulationEngine(**engine_settings)
         
         # Load model
         model = self._load_deployed_model(deployment_info)
@@ -873,31 +1530,22 @@ class PaperTradingDeployer:
             )
             return self._create_mock_model()
     
-    def _get_model_signals(
+    def _predict_action(
         self,
         model: Any,
-        symbol: str,  # Process one symbol at a time
-        price: float, # Current price for this symbol
-        prepared_symbol_features: np.ndarray, # Prepared features for this symbol
-        current_positions: Dict[str, Position], # Current overall positions
-        engine_initial_capital: float,
-        engine_max_position_size_ratio: float
-    ) -> Optional[Dict[str, Any]]: # Returns a single signal or None
-        """Get a trading signal from the model for a single symbol.
+        symbol: str,
+        prepared_symbol_features: np.ndarray
+    ) -> Optional[str]:
+        """Predict the trading action for a single symbol.
         
         Args:
             model: The trading model.
-            symbol: The symbol to generate a signal for.
-            price: The current market price of the symbol.
+            symbol: The symbol to predict for.
             prepared_symbol_features: NumPy array of features for the model.
-            current_positions: Dictionary of current portfolio positions.
-            engine_initial_capital: Initial capital of the trading engine.
-            engine_max_position_size_ratio: Max position size ratio from the engine.
             
         Returns:
-            A signal dictionary if a trade is advised, otherwise None.
+            The action ("buy", "sell", "hold", ...), or None if the features are unusable.
         """
-        
         prediction_action: str
         try:
             # Ensure features are in the correct shape for the model, e.g., (1, num_features)
@@ -950,6 +1598,41 @@ class PaperTradingDeployer:
             self.logger.error(f"Error during model prediction for {symbol}: {e}", exc_info=True)
             prediction_action = "hold" # Default to hold on error
         
+        return prediction_action
+    
+    def _get_model_signals(
+        self,
+        model: Any,
+        symbol: str,  # Process one symbol at a time
+        price: float, # Current price for this symbol
+        prepared_symbol_features: np.ndarray, # Prepared features for this symbol
+        current_positions: Dict[str, Position], # Current overall positions
+        engine_initial_capital: float,
+        engine_max_position_size_ratio: float,
+        prediction_action: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]: # Returns a single signal or None
+        """Get a trading signal from the model for a single symbol.
+        
+        Args:
+            model: The trading model.
+            symbol: The symbol to generate a signal for.
+            price: The current market price of the symbol.
+            prepared_symbol_features: NumPy array of features for the model.
+            current_positions: Dictionary of current portfolio positions.
+            engine_initial_capital: Initial capital of the trading engine.
+            engine_max_position_size_ratio: Max position size ratio from the engine.
+            prediction_action: Action already predicted for these features. If None,
+                the model is called here.
+            
+        Returns:
+            A signal dictionary if a trade is advised, otherwise None.
+        """
+        
+        if prediction_action is None:
+            prediction_action = self._predict_action(model, symbol, prepared_symbol_features)
+            if prediction_action is None:
+                return None
+        
         if prediction_action == "buy" and symbol not in current_positions:
             if price > 0:
                 max_allowed_value = engine_initial_capital * engine_max_position_size_ratio
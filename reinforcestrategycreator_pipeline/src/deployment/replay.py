@@ -0,0 +1,284 @@
+"""Replay of recorded market data through paper trading simulations."""
+
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from ..data.base import DataSource
+from ..data.csv_source import CsvDataSource
+from .paper_trading import PaperTradingDeployer
+
+REPLAY_PHASES = ("signal_generation", "order_submission", "fill_processing", "tick")
+
+
+class SimulatedClock:
+    """Clock that only moves when the replay sets it to the next tick's time."""
+
+    def __init__(self, start: Optional[datetime] = None):
+        """Initialize the clock.
+
+        Args:
+            start: Initial time (default: the Unix epoch)
+        """
+        self._now = start or datetime(1970, 1, 1)
+
+    def now(self) -> datetime:
+        """Return the simulated current time."""
+        return self._now
+
+    def set(self, when: datetime) -> None:
+        """Move the clock to the given time."""
+        self._now = when
+
+
+@dataclass
+class ReplayReport:
+    """Throughput and per-tick latency of a market replay."""
+    ticks: int
+    symbol_updates: int
+    wall_seconds: float
+    simulated_seconds: float
+    latencies: Dict[str, np.ndarray]  # Seconds per tick for each phase in REPLAY_PHASES
+    final_status: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def ticks_per_second(self) -> float:
+        """Ticks replayed per wall-clock second."""
+        return self.ticks / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    @property
+    def speedup(self) -> float:
+        """Simulated seconds covered per wall-clock second."""
+        return self.simulated_seconds / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    def latency_summary(self) -> Dict[str, Dict[str, float]]:
+        """Latency statistics in milliseconds for each phase."""
+        summary = {}
+        for phase, values in self.latencies.items():
+            if len(values) == 0:
+                continue
+            ms = values * 1000.0
+            p50, p90, p99 = np.percentile(ms, [50, 90, 99])
+            summary[phase] = {
+                "count": int(len(ms)),
+                "mean_ms": float(ms.mean()),
+                "p50_ms": float(p50),
+                "p90_ms": float(p90),
+                "p99_ms": float(p99),
+                "max_ms": float(ms.max())
+            }
+        return summary
+
+    def latency_histogram(
+        self,
+        phase: str,
+        edges_ms: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Histogram of one phase's latencies.
+
+        Args:
+            phase: One of REPLAY_PHASES
+            edges_ms: Bucket edges in milliseconds (default: powers of two from 1/64 ms to 4 s)
+
+        Returns:
+            Tuple of (edges_ms, counts); values outside the edges go to the end buckets
+        """
+        if edges_ms is None:
+            edges_ms = 2.0 ** np.arange(-6, 13)
+        ms = np.clip(self.latencies[phase] * 1000.0, edges_ms[0], edges_ms[-1])
+        counts, _ = np.histogram(ms, bins=edges_ms)
+        return edges_ms, counts
+
+    def format(self, width: int = 40) -> str:
+        """Render throughput, latency statistics and histograms as text."""
+        lines = [
+            f"ticks: {self.ticks:,}  symbol updates: {self.symbol_updates:,}  "
+            f"wall: {self.wall_seconds:.2f}s  simulated: {self.simulated_seconds:,.0f}s",
+            f"throughput: {self.ticks_per_second:,.1f} ticks/s  speedup: {self.speedup:,.0f}x",
+        ]
+        for phase, stats in self.latency_summary().items():
+            lines.append(
+                f"{phase:>18}: mean {stats['mean_ms']:.3f}ms  p50 {stats['p50_ms']:.3f}ms  "
+                f"p90 {stats['p90_ms']:.3f}ms  p99 {stats['p99_ms']:.3f}ms  max {stats['max_ms']:.3f}ms"
+            )
+        for phase in self.latencies:
+            if len(self.latencies[phase]) == 0:
+                continue
+            edges, counts = self.latency_histogram(phase)
+            lines.append(f"{phase} latency histogram (ms):")
+            peak = max(int(counts.max()), 1)
+            for low, high, count in zip(edges[:-1], edges[1:], counts):
+                if count:
+                    bar = "#" * max(1, round(width * count / peak))
+                    lines.append(f"  {low:>9.4g} - {high:<9.4g} {count:>8,} {bar}")
+        return "\n".join(lines)
+
+
+def load_market_data(source: Union[str, Path, pd.DataFrame, DataSource], **kwargs) -> pd.DataFrame:
+    """Load recorded market data for a replay.
+
+    Args:
+        source: A DataFrame, a DataSource, or a path to a Parquet or CSV file.
+            CSV files are read through ``CsvDataSource``.
+        **kwargs: Passed to the data source's ``load_data`` or ``pd.read_parquet``
+
+    Returns:
+        The loaded DataFrame
+    """
+    if isinstance(source, pd.DataFrame):
+        return source
+    if isinstance(source, DataSource):
+        return source.load_data(**kwargs)
+    path = Path(source)
+    if path.suffix.lower() in (".parquet", ".pq"):
+        return pd.read_parquet(path, **kwargs)
+    return CsvDataSource(f"replay_{path.stem}", {"file_path": str(path)}).load_data(**kwargs)
+
+
+class MarketReplay:
+    """Streams recorded ticks through ``PaperTradingDeployer.process_market_update``.
+
+    The data is in long format: one row per symbol and timestamp with a price
+    column and feature columns. Rows sharing a timestamp form one tick. The
+    simulation's engine runs on a ``SimulatedClock`` that is set to each
+    tick's timestamp, so fills and portfolio values carry recorded times.
+
+    With ``speed=None`` ticks are replayed as fast as possible; with a speed
+    multiplier the replay sleeps so that simulated time advances ``speed``
+    times faster than wall time.
+    """
+
+    def __init__(
+        self,
+        deployer: PaperTradingDeployer,
+        simulation_id: str,
+        data: Union[str, Path, pd.DataFrame, DataSource],
+        timestamp_column: str = "timestamp",
+        symbol_column: str = "symbol",
+        price_column: str = "close",
+        feature_columns: Optional[List[str]] = None,
+        symbol: Optional[str] = None,
+        speed: Optional[float] = None,
+        clock: Optional[SimulatedClock] = None
+    ):
+        """Initialize the replay.
+
+        Args:
+            deployer: Deployer that owns the simulation
+            simulation_id: ID of a deployed simulation
+            data: Recorded data, or a path/DataSource to load it from
+            timestamp_column: Column (or index name) holding tick times
+            symbol_column: Column holding the symbol of each row
+            price_column: Column holding the price passed as market data
+            feature_columns: Columns passed as the prepared features
+                (default: every numeric column except timestamp and symbol)
+            symbol: Symbol to use when the data has no symbol column
+            speed: Simulated seconds per wall second, or None for as fast as possible
+            clock: Clock to drive (default: a new SimulatedClock)
+        """
+        self.deployer = deployer
+        self.simulation_id = simulation_id
+        self.speed = speed if speed and speed > 0 else None
+        self.clock = clock or SimulatedClock()
+        self.logger = logging.getLogger(__name__)
+
+        frame = load_market_data(data)
+        if timestamp_column not in frame.columns:
+            frame = frame.reset_index()
+            if timestamp_column not in frame.columns:
+                frame = frame.rename(columns={frame.columns[0]: timestamp_column})
+        if symbol_column not in frame.columns:
+            if symbol is None:
+                raise ValueError(f"Data has no '{symbol_column}' column; pass symbol= for single-symbol data")
+            frame = frame.assign(**{symbol_column: symbol})
+        frame = frame.assign(**{timestamp_column: pd.to_datetime(frame[timestamp_column])})
+        frame = frame.sort_values(timestamp_column, kind="stable")
+
+        if feature_columns is None:
+            feature_columns = [
+                column for column in frame.select_dtypes(include="number").columns
+                if column not in (timestamp_column, symbol_column)
+            ]
+        self.feature_columns = list(feature_columns)
+
+        self._timestamps = frame[timestamp_column].to_numpy()
+        self._symbols = frame[symbol_column].astype(str).to_numpy()
+        self._prices = frame[price_column].to_numpy(dtype=float)
+        self._features = frame[self.feature_columns].to_numpy(dtype=float)
+        changes = np.flatnonzero(self._timestamps[1:] != self._timestamps[:-1]) + 1
+        self._tick_bounds = np.concatenate([[0], changes, [len(frame)]])
+
+    @property
+    def num_ticks(self) -> int:
+        """Number of distinct timestamps in the data."""
+        return len(self._tick_bounds) - 1 if len(self._timestamps) else 0
+
+    def run(self, max_ticks: Optional[int] = None) -> ReplayReport:
+        """Replay the data and measure latency per tick.
+
+        Args:
+            max_ticks: Stop after this many ticks
+
+        Returns:
+            Throughput and latency report
+        """
+        num_ticks = self.num_ticks if max_ticks is None else min(max_ticks, self.num_ticks)
+        latencies = {phase: np.zeros(num_ticks) for phase in REPLAY_PHASES}
+        engine = self.deployer.active_simulations[self.simulation_id]["engine"]
+
+        timings: Dict[str, float] = {}
+        symbol_updates = 0
+        first_time = pd.Timestamp(self._timestamps[0]) if num_ticks else None
+        # Drive the engine from the simulated clock for this run only, so later
+        # live updates are stamped with wall time again
+        previous_clock = engine.clock
+        engine.clock = self.clock.now
+        try:
+            wall_start = time.perf_counter()
+            for tick in range(num_ticks):
+                start, end = self._tick_bounds[tick], self._tick_bounds[tick + 1]
+                tick_time = pd.Timestamp(self._timestamps[start])
+                if self.speed is not None:
+                    delay = wall_start + (tick_time - first_time).total_seconds() / self.speed - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+                self.clock.set(tick_time.to_pydatetime())
+
+                symbols = self._symbols[start:end]
+                market_data = dict(zip(symbols, self._prices[start:end]))
+                features = dict(zip(symbols, self._features[start:end]))
+
+                timings.clear()
+                tick_start = time.perf_counter()
+                self.deployer.process_market_update(self.simulation_id, market_data, features, timings=timings)
+                latencies["tick"][tick] = time.perf_counter() - tick_start
+                for phase, seconds in timings.items():
+                    latencies[phase][tick] = seconds
+                symbol_updates += end - start
+            wall_seconds = time.perf_counter() - wall_start
+        finally:
+            engine.clock = previous_clock
+
+        simulated_seconds = 0.0
+        if num_ticks:
+            last_time = pd.Timestamp(self._timestamps[self._tick_bounds[num_ticks] - 1])
+            simulated_seconds = (last_time - first_time).total_seconds()
+        report = ReplayReport(
+            ticks=num_ticks,
+            symbol_updates=int(symbol_updates),
+            wall_seconds=wall_seconds,
+            simulated_seconds=simulated_seconds,
+            latencies=latencies,
+            final_status=self.deployer.get_simulation_status(self.simulation_id)
+        )
+        self.logger.info(
+            f"Replayed {num_ticks} ticks for {self.simulation_id} in {wall_seconds:.2f}s "
+            f"({report.ticks_per_second:,.1f} ticks/s)"
+        )
+        return report
@@ -5,7 +5,7 @@ reinforcement learning models against traditional approaches.
 """
 
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Sequence, Tuple
 import numpy as np
 import pandas as pd
 
@@ -15,6 +15,144 @@ from .metrics import MetricsCalculator
 logger = logging.getLogger(__name__)
 
 
+def simulate_positions(
+    prices: np.ndarray,
+    positions: np.ndarray,
+    initial_balance: float = 10000,
+    transaction_fee: float = 0.001
+) -> Dict[str, np.ndarray]:
+    """Turn long/flat position series into equity curves, trades and fees.
+    
+    Each row of ``positions`` is an independent strategy that holds either
+    nothing (0) or the whole portfolio in the asset (1) at the end of each
+    step. Switching from 0 to 1 buys at that step's price, switching back
+    sells, and every switch pays ``transaction_fee`` on the traded value.
+    
+    Args:
+        prices: Price series of shape (T,) or (K, T)
+        positions: Position series of shape (T,) or (K, T) with values 0 or 1
+        initial_balance: Initial portfolio balance
+        transaction_fee: Transaction fee as a fraction of trade value
+        
+    Returns:
+        Dictionary with ``portfolio_values`` (K, T) and per-row ``trades``,
+        ``profitable_trades`` and ``fees`` arrays of shape (K,)
+    """
+    positions = np.atleast_2d(np.asarray(positions, dtype=float))
+    prices = np.broadcast_to(np.asarray(prices, dtype=float), positions.shape)
+    n_steps = positions.shape[1]
+    
+    # Growth factor of each step: price move while long, fee on every switch
+    held = np.zeros_like(positions)
+    held[:, 1:] = positions[:, :-1]
+    price_ratio = np.ones_like(prices)
+    price_ratio[:, 1:] = prices[:, 1:] / prices[:, :-1]
+    market_growth = np.where(held > 0, price_ratio, 1.0)
+    switches = np.zeros_like(positions)
+    switches[:, 1:] = np.abs(np.diff(positions, axis=1))
+    fee_growth = np.where(switches > 0, 1.0 - transaction_fee, 1.0)
+    
+    portfolio_values = initial_balance * np.cumprod(market_growth * fee_growth, axis=1)
+    
+    # Value traded at each switch, before the fee is taken
+    previous_values = np.empty_like(portfolio_values)
+    previous_values[:, 0] = initial_balance
+    previous_values[:, 1:] = portfolio_values[:, :-1]
+    fees = (previous_values * market_growth * switches * transaction_fee).sum(axis=1)
+    
+    # Entry price in force at each step, carried forward from the last buy
+    buys = switches * (positions > 0)
+    sells = switches * (positions == 0)
+    last_buy = np.maximum.accumulate(
+        np.where(buys > 0, np.arange(n_steps), 0), axis=1
+    )
+    entry_prices = np.take_along_axis(prices, last_buy, axis=1)
+    profitable_trades = ((sells > 0) & (prices > entry_prices)).sum(axis=1)
+    # Open positions are marked against the final price
+    open_at_end = positions[:, -1] > 0
+    profitable_trades += open_at_end & (prices[:, -1] > entry_prices[:, -1])
+    
+    return {
+        "portfolio_values": portfolio_values,
+        "trades": buys.sum(axis=1).astype(int),
+        "profitable_trades": profitable_trades.astype(int),
+        "fees": fees
+    }
+
+
+def sma_crossover_positions(
+    prices: np.ndarray,
+    windows: Sequence[Tuple[int, int]]
+) -> np.ndarray:
+    """Build SMA crossover position series for a grid of window pairs.
+    
+    Each unique window is averaged once and shared by every pair that uses
+    it. A pair is long while the short average is above the long one. As in
+    the per-step strategy, nothing is traded on the first step and a pair
+    only enters once its signal has changed at least once.
+    
+    Args:
+        prices: 1D price series of length T
+        windows: Sequence of (short_window, long_window) pairs
+        
+    Returns:
+        Position array of shape (len(windows), T)
+    """
+    price_series = pd.Series(np.asarray(prices, dtype=float))
+    moving_averages = {
+        window: price_series.rolling(window=window).mean().to_numpy()
+        for window in {w for pair in windows for w in pair}
+    }
+    
+    short_ma = np.stack([moving_averages[short] for short, _ in windows])
+    long_ma = np.stack([moving_averages[long] for _, long in windows])
+    signals = (short_ma > long_ma).astype(float)
+    
+    changes = np.zeros_like(signals)
+    changes[:, 1:] = np.abs(np.diff(signals, axis=1))
+    return np.where(np.cumsum(changes, axis=1) > 0, signals, 0.0)
+
+
+def signals_to_toggle_positions(signals: np.ndarray) -> np.ndarray:
+    """Convert boolean trade signals into positions that flip on every signal.
+    
+    Args:
+        signals: Boolean array of shape (T,) or (K, T)
+        
+    Returns:
+        Position array of shape (K, T); signals on the first step are ignored
+    """
+    signals = np.atleast_2d(signals).astype(int)
+    positions = np.zeros(signals.shape, dtype=float)
+    positions[:, 1:] = np.cumsum(signals[:, 1:], axis=1) % 2
+    return positions
+
+
+def random_toggle_positions(
+    n_steps: int,
+    seeds: Sequence[int],
+    trade_probability: float = 0.05
+) -> np.ndarray:
+    """Build random-entry/random-exit position series for a set of seeds.
+    
+    Each seed draws the same signal stream as ``np.random.seed(seed)``
+    followed by ``np.random.random(n_steps)``.
+    
+    Args:
+        n_steps: Length of each series
+        seeds: Random seeds, one row per seed
+        trade_probability: Probability of a signal on each step
+        
+    Returns:
+        Position array of shape (len(seeds), n_steps)
+    """
+    signals = np.stack([
+        np.random.RandomState(seed).random_sample(n_steps) < trade_probability
+        for seed in seeds
+    ])
+    return signals_to_toggle_positions(signals)
+
+
 class BenchmarkStrategy:
     """Base class for benchmark trading strategies."""
     
@@ -113,6 +251,47 @@ class BenchmarkStrategy:
         metrics['trades'] = trades_info.get('trades_count', 0)
         
         return metrics
+    
+    def _empty_metrics(self) -> Dict[str, Any]:
+        """Metrics reported when the strategy cannot be run."""
+        return {
+            "pnl": 0.0,
+            "pnl_percentage": 0.0,
+            "sharpe_ratio": 0.0,
+            "max_drawdown": 0.0,
+            "win_rate": 0.0,
+            "trades": 0
+        }
+    
+    def _metrics_from_positions(
+        self,
+        prices: np.ndarray,
+        positions: np.ndarray
+    ) -> List[Dict[str, Any]]:
+        """Simulate position series and calculate metrics for every row.
+        
+        Args:
+            prices: 1D price series
+            positions: Position array of shape (K, T)
+            
+        Returns:
+            List of K metric dictionaries
+        """
+        simulation = simulate_positions(
+            prices, positions, self.initial_balance, self.transaction_fee
+        )
+        results = []
+        for values, trades_count, profitable_trades in zip(
+            simulation["portfolio_values"],
+            simulation["trades"],
+            simulation["profitable_trades"]
+        ):
+            trades_info = {
+                'trades_count': int(trades_count),
+                'win_rate': profitable_trades / trades_count if trades_count > 0 else 0.0
+            }
+            results.append(self._calculate_metrics(values, trades_info))
+        return results
 
 
 class BuyAndHoldStrategy(BenchmarkStrategy):
@@ -158,10 +337,9 @@ class BuyAndHoldStrategy(BenchmarkStrategy):
             shares = shares * (1 - self.transaction_fee)  # Account for transaction fee
             
             # Calculate portfolio value over time
-            portfolio_values = [float(self.initial_balance)]  # Initial balance
-            for price in prices[1:]:
-                portfolio_value = float(shares * price)
-                portfolio_values.append(portfolio_value)
+            portfolio_values = np.empty(len(prices), dtype=float)
+            portfolio_values[0] = self.initial_balance
+            portfolio_values[1:] = shares * prices[1:]
             
             # Determine if the single trade was profitable
             final_value = portfolio_values[-1]
@@ -243,73 +421,11 @@ class SimpleMovingAverageStrategy(BenchmarkStrategy):
             # Get price data
             prices = self._get_price_column(data)
             
-            # Calculate moving averages using pandas for efficiency
-            price_series = pd.Series(prices)
-            short_ma = price_series.rolling(window=self.short_window).mean()
-            long_ma = price_series.rolling(window=self.long_window).mean()
-            
-            # Generate signals
-            signals = pd.Series(index=price_series.index, dtype=float)
-            signals[short_ma > long_ma] = 1.0  # Buy signal
-            signals[short_ma <= long_ma] = 0.0  # Sell/no position signal
-            
-            # Forward fill NaN values at the beginning
-            signals = signals.fillna(0)
-            
-            # Detect position changes
-            positions = signals.diff()
-            
-            # Initialize portfolio tracking
-            cash = self.initial_balance
-            shares = 0
-            portfolio_values = []
-            
-            trades_count = 0
-            profitable_trades = 0
-            entry_price = 0
-            
-            # Simulate trading
-            for i in range(len(prices)):
-                price = prices[i]
-                
-                # Check for position change
-                if i > 0 and positions.iloc[i] != 0:
-                    if positions.iloc[i] > 0:  # Buy signal
-                        if cash > 0:
-                            # Buy shares
-                            shares = cash / price
-                            shares = shares * (1 - self.transaction_fee)
-                            cash = 0
-                            entry_price = price
-                            trades_count += 1
-                    else:  # Sell signal
-                        if shares > 0:
-                            # Sell shares
-                            cash = shares * price * (1 - self.transaction_fee)
-                            if price > entry_price:
-                                profitable_trades += 1
-                            shares = 0
-                
-                # Calculate portfolio value
-                portfolio_value = cash + (shares * price)
-                portfolio_values.append(portfolio_value)
-            
-            # Close any open position at the end
-            if shares > 0:
-                final_price = prices[-1]
-                if final_price > entry_price:
-                    profitable_trades += 1
-            
-            # Calculate win rate
-            win_rate = profitable_trades / trades_count if trades_count > 0 else 0.0
-            
-            # Calculate metrics
-            trades_info = {
-                'trades_count': trades_count,
-                'win_rate': win_rate
-            }
-            
-            metrics = self._calculate_metrics(portfolio_values, trades_info)
+            positions = sma_crossover_positions(
+                prices, [(self.short_window, self.long_window)]
+            )
+            metrics = self._metrics_from_positions(prices, positions)[0]
+            trades_count = metrics['trades']
             
             logger.debug(f"{self.name} completed - Trades: {trades_count}, PnL: {metrics['pnl']:.2f}")
             
@@ -325,6 +441,39 @@ class SimpleMovingAverageStrategy(BenchmarkStrategy):
                 "win_rate": 0.0,
                 "trades": 0
             }
+    
+    def run_grid(
+        self,
+        data: pd.DataFrame,
+        windows: Sequence[Tuple[int, int]]
+    ) -> List[Dict[str, Any]]:
+        """Run the SMA crossover strategy for a grid of window pairs in one pass.
+        
+        Args:
+            data: DataFrame containing price data
+            windows: Sequence of (short_window, long_window) pairs
+            
+        Returns:
+            List of metric dictionaries, one per window pair, each including
+            its ``short_window`` and ``long_window``
+        """
+        windows = [(int(short), int(long)) for short, long in windows]
+        logger.info(f"Running SMA grid over {len(windows)} window pairs")
+        
+        usable = [long <= len(data) for _, long in windows]
+        results = [self._empty_metrics() for _ in windows]
+        
+        runnable = [pair for pair, ok in zip(windows, usable) if ok]
+        if runnable:
+            prices = self._get_price_column(data)
+            positions = sma_crossover_positions(prices, runnable)
+            metrics = iter(self._metrics_from_positions(prices, positions))
+            results = [next(metrics) if ok else empty for ok, empty in zip(usable, results)]
+        
+        for (short, long), result in zip(windows, results):
+            result["short_window"] = short
+            result["long_window"] = long
+        return results
 
 
 class RandomStrategy(BenchmarkStrategy):
@@ -382,58 +531,9 @@ class RandomStrategy(BenchmarkStrategy):
             # Generate random signals
             signals = np.random.random(len(prices)) < self.trade_probability
             
-            # Initialize portfolio tracking
-            cash = self.initial_balance
-            shares = 0
-            portfolio_values = []
-            position = 0  # 0: no position, 1: long
-            
-            trades_count = 0
-            profitable_trades = 0
-            entry_price = 0
-            
-            # Simulate trading
-            for i in range(len(prices)):
-                price = prices[i]
-                
-                # Check for trade signal
-                if signals[i] and i > 0:  # Don't trade on first step
-                    if position == 0:  # Buy
-                        if cash > 0:
-                            shares = cash / price
-                            shares = shares * (1 - self.transaction_fee)
-                            cash = 0
-                            position = 1
-                            trades_count += 1
-                            entry_price = price
-                    else:  # Sell
-                        if shares > 0:
-                            cash = shares * price * (1 - self.transaction_fee)
-                            if price > entry_price:
-                                profitable_trades += 1
-                            shares = 0
-                            position = 0
-                
-                # Calculate portfolio value
-                portfolio_value = cash + (shares * price)
-                portfolio_values.append(portfolio_value)
-            
-            # Close any open position at the end
-            if position == 1 and shares > 0:
-                final_price = prices[-1]
-                if final_price > entry_price:
-                    profitable_trades += 1
-            
-            # Calculate win rate
-            win_rate = profitable_trades / trades_count if trades_count > 0 else 0.0
-            
-            # Calculate metrics
-            trades_info = {
-                'trades_count': trades_count,
-                'win_rate': win_rate
-            }
-            
-            metrics = self._calculate_metrics(portfolio_values, trades_info)
+            positions = signals_to_toggle_positions(signals)
+            metrics = self._metrics_from_positions(prices, positions)[0]
+            trades_count = metrics['trades']
             
             logger.debug(f"{self.name} completed - Trades: {trades_count}, PnL: {metrics['pnl']:.2f}")
             
@@ -449,6 +549,37 @@ class RandomStrategy(BenchmarkStrategy):
                 "win_rate": 0.0,
                 "trades": 0
             }
+    
+    def run_seeds(
+        self,
+        data: pd.DataFrame,
+        seeds: Sequence[int]
+    ) -> List[Dict[str, Any]]:
+        """Run the random strategy once per seed in a single pass.
+        
+        Each seed gives the same result as ``run`` with that ``random_seed``,
+        without touching the global NumPy random state.
+        
+        Args:
+            data: DataFrame containing price data
+            seeds: Random seeds to evaluate
+            
+        Returns:
+            List of metric dictionaries, one per seed, each including its ``seed``
+        """
+        seeds = [int(seed) for seed in seeds]
+        logger.info(f"Running random strategy over {len(seeds)} seeds")
+        
+        if len(data) == 0 or not seeds:
+            results = [self._empty_metrics() for _ in seeds]
+        else:
+            prices = self._get_price_column(data)
+            positions = random_toggle_positions(len(prices), seeds, self.trade_probability)
+            results = self._metrics_from_positions(prices, positions)
+        
+        for seed, result in zip(seeds, results):
+            result["seed"] = seed
+        return results
 
 
 class BenchmarkEvaluator:
@@ -500,7 +631,10 @@ class BenchmarkEvaluator:
             model_metrics: Dictionary of model performance metrics
             
         Returns:
-            Dictionary containing benchmark results and comparisons
+            Dictionary containing benchmark results and comparisons. When the
+            config sets ``sma_window_grid`` (a list of [short, long] pairs) or
+            ``random_seeds``, a ``sweeps`` entry holds the per-member results
+            and a summary for each sweep.
         """
         logger.info("Running benchmark strategies for comparison")
         
@@ -545,7 +679,56 @@ class BenchmarkEvaluator:
                 )
             }
         
-        return {
+        results = {
             "benchmarks": benchmarks,
             "relative_performance": relative_performance
+        }
+        
+        # Optional parameter sweeps, each evaluated in a single vectorized pass
+        sweeps = {}
+        sma_window_grid = self.config.get("sma_window_grid")
+        if sma_window_grid:
+            sweeps["simple_moving_average"] = self.strategies["simple_moving_average"].run_grid(
+                test_data, sma_window_grid
+            )
+        random_seeds = self.config.get("random_seeds")
+        if random_seeds:
+            sweeps["random"] = self.strategies["random"].run_seeds(test_data, random_seeds)
+        if sweeps:
+            results["sweeps"] = {
+                name: {
+                    "results": sweep_results,
+                    "summary": self._summarize_sweep(sweep_results, model_metrics)
+                }
+                for name, sweep_results in sweeps.items()
+            }
+        
+        return results
+    
+    def _summarize_sweep(
+        self,
+        sweep_results: List[Dict[str, Any]],
+        model_metrics: Dict[str, float]
+    ) -> Dict[str, float]:
+        """Summarize a benchmark parameter sweep against the model.
+        
+        Args:
+            sweep_results: Metric dictionaries, one per sweep member
+            model_metrics: Dictionary of model performance metrics
+            
+        Returns:
+            Dictionary with the distribution of benchmark PnL and the share
+            of sweep members the model beats
+        """
+        pnls = np.array([result.get("pnl", 0.0) for result in sweep_results], dtype=float)
+        sharpes = np.array(
+            [result.get("sharpe_ratio", 0.0) for result in sweep_results], dtype=float
+        )
+        return {
+            "count": len(sweep_results),
+            "mean_pnl": float(np.mean(pnls)),
+            "median_pnl": float(np.median(pnls)),
+            "best_pnl": float(np.max(pnls)),
+            "best_sharpe_ratio": float(np.max(sharpes)),
+            "model_outperformance_rate": float(np.mean(model_metrics.get("pnl", 0) > pnls))
         }
\ No newline at end of file
@@ -1,6 +1,8 @@
 """Cross-Validation system for model evaluation and selection."""
 
 import logging
+import multiprocessing
+import shutil
 import time
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
@@ -19,6 +21,42 @@ from ..training.engine import TrainingEngine
 from ..data.splitter import DataSplitter
 from ..data.manager import DataManager
 from ..artifact_store.base import ArtifactStore
+from ..pipeline.shared_store import SharedValueHandle, SharedValueStore
+from .fold_cache import FoldResultCache
+
+FoldIndex = Union[slice, np.ndarray]
+
+# Per-process state of shared-data CV workers, set up by _init_cv_worker.
+_WORKER_VALIDATOR: Optional["CrossValidator"] = None
+_WORKER_DATA: Dict[str, Any] = {}
+
+
+def _init_cv_worker(validator: "CrossValidator") -> None:
+    """Pool initializer: receive the validator once per worker instead of once per fold."""
+    global _WORKER_VALIDATOR
+    _WORKER_VALIDATOR = validator
+
+
+def _train_shared_fold(
+    handle: SharedValueHandle,
+    fold_idx: int,
+    train_index: FoldIndex,
+    val_index: FoldIndex,
+    *train_args: Any
+) -> "CVFoldResult":
+    """Train one fold in a pool worker against the memory-mapped dataset.
+
+    The dataset is mapped once per worker and kept until a different one is
+    published, so only fold indices travel through the pool for each task.
+    """
+    data = _WORKER_DATA.get(handle.path)
+    if data is None:
+        _WORKER_DATA.clear()
+        data = _WORKER_DATA[handle.path] = handle.load()
+    validator = _WORKER_VALIDATOR
+    return validator._train_fold(
+        fold_idx, validator._take(data, train_index), validator._take(data, val_index), *train_args
+    )
 
 
 @dataclass
@@ -82,6 +120,18 @@ class CrossValidator:
     
     Supports multiple splitting strategies, parallel execution,
     and multi-metric evaluation.
+
+    With ``shared_data=True`` parallel runs do not materialize every fold up
+    front. Multiprocessing runs publish the dataset once to a shared-memory
+    file, and each task carries only fold indices. Contiguous folds (e.g. time
+    series) become zero-copy views in the workers. The process pool stays warm
+    across ``cross_validate`` and ``compare_models`` calls until
+    :meth:`close`. Shared data is read-only in the workers.
+
+    With ``fold_cache_dir`` set, every completed fold is persisted under a
+    hash of the data, its row positions, the model and training config, the
+    metrics and the seed. Later runs reuse matching folds and only train the
+    missing ones, so an interrupted run resumes where it stopped.
     """
     
     def __init__(
@@ -92,7 +142,9 @@ class CrossValidator:
         data_manager: Optional[DataManager] = None,
         checkpoint_dir: Optional[Union[str, Path]] = None,
         n_jobs: int = 1,
-        use_multiprocessing: bool = False
+        use_multiprocessing: bool = False,
+        shared_data: bool = False,
+        fold_cache_dir: Optional[Union[str, Path]] = None
     ):
         """Initialize the CrossValidator.
         
@@ -104,6 +156,10 @@ class CrossValidator:
             checkpoint_dir: Directory for saving checkpoints
             n_jobs: Number of parallel jobs (-1 for all CPUs)
             use_multiprocessing: Use multiprocessing instead of threading
+            shared_data: Pass fold indices over a dataset published once in
+                shared memory instead of materialized folds (parallel runs only)
+            fold_cache_dir: Directory for cached fold results and weights
+                (caching is disabled when not provided)
         """
         self.model_factory = model_factory or get_factory()
         self.model_registry = model_registry
@@ -120,6 +176,15 @@ class CrossValidator:
         # Parallel execution settings
         self.n_jobs = n_jobs if n_jobs > 0 else None  # None uses all CPUs
         self.use_multiprocessing = use_multiprocessing
+        self.shared_data = shared_data
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._shared_store: Optional[SharedValueStore] = None
+        self._published: Optional[Tuple[Any, SharedValueHandle]] = None
+        
+        # Fold result cache
+        self.fold_cache = FoldResultCache(fold_cache_dir) if fold_cache_dir else None
+        self._fingerprint: Optional[Tuple[Any, str]] = None
+        self._fold_keys: Dict[int, str] = {}
         
         # Logger
         self.logger = logging.getLogger("CrossValidator")
@@ -178,27 +243,59 @@ class CrossValidator:
         
         # Create folds
         self.logger.info("Creating cross-validation folds")
-        folds = self._create_folds(data, cv_config)
-        n_folds = len(folds)
+        use_shared = self.shared_data and self.n_jobs != 1
+        if use_shared or self.fold_cache is not None:
+            # Folds stay as index ranges over the published dataset and feed the cache keys
+            fold_indices = self._create_fold_indices(data, cv_config)
+            n_folds = len(fold_indices)
+        else:
+            folds = self._create_folds(data, cv_config)
+            n_folds = len(folds)
         self.logger.info(f"Created {n_folds} folds")
         
+        # Reuse folds completed by earlier runs
+        fold_results = []
+        pending = list(range(n_folds))
+        cache_stats = None
+        if self.fold_cache is not None:
+            fold_results, pending = self._load_cached_folds(
+                data, fold_indices, model_config, training_config, cv_config, metrics
+            )
+            cache_stats = {"hits": n_folds - len(pending), "misses": len(pending)}
+            self.logger.info(
+                f"Fold cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses"
+                + (f" (training folds {[i + 1 for i in pending]})" if 0 < len(pending) < n_folds else "")
+            )
+            if not use_shared:
+                folds = [(self._take(data, fold_indices[i][0]), self._take(data, fold_indices[i][1])) for i in pending]
+        
         # Run cross-validation
-        if self.n_jobs == 1:
-            # Sequential execution
-            fold_results = []
-            for i, (train_data, val_data) in enumerate(folds):
-                self.logger.info(f"Training fold {i+1}/{n_folds}")
-                result = self._train_fold(
-                    i, train_data, val_data, model_config, 
-                    training_config, metrics, save_models, callbacks
+        try:
+            if not pending:
+                pass
+            elif use_shared:
+                fold_results += self._parallel_cv_shared(
+                    data, [fold_indices[i] for i in pending], model_config, training_config,
+                    metrics, save_models, callbacks, fold_ids=pending
                 )
-                fold_results.append(result)
-        else:
-            # Parallel execution
-            fold_results = self._parallel_cv(
-                folds, model_config, training_config, 
-                metrics, save_models, callbacks
-            )
+            elif self.n_jobs == 1:
+                # Sequential execution
+                for i, (train_data, val_data) in zip(pending, folds):
+                    self.logger.info(f"Training fold {i+1}/{n_folds}")
+                    result = self._train_fold(
+                        i, train_data, val_data, model_config, 
+                        training_config, metrics, save_models, callbacks
+                    )
+                    self._record_fold(result)
+                    fold_results.append(result)
+            else:
+                # Parallel execution
+                fold_results += self._parallel_cv(
+                    folds, model_config, training_config, 
+                    metrics, save_models, callbacks, fold_ids=pending
+                )
+        finally:
+            self._fold_keys = {}
         
         # Sort results by fold index
         fold_results.sort(key=lambda x: x.fold_idx)
@@ -228,6 +325,8 @@ class CrossValidator:
                 "n_folds": n_folds
             }
         )
+        if cache_stats is not None:
+            cv_results.config["fold_cache"] = cache_stats
         
         # Save results
         self._save_cv_results(cv_results)
@@ -251,12 +350,8 @@ class CrossValidator:
                 raise ValueError("No data provided in data_config")
             return data
     
-    def _create_folds(
-        self, 
-        data: Any, 
-        cv_config: Dict[str, Any]
-    ) -> List[Tuple[Any, Any]]:
-        """Create cross-validation folds."""
+    def _create_splitter(self, cv_config: Dict[str, Any]) -> Tuple[str, int, int, DataSplitter]:
+        """Resolve the CV method, fold count and seed, and build the DataSplitter."""
         method = cv_config.get("method", "kfold")
         n_folds = cv_config.get("n_folds", 5)
         random_seed = cv_config.get("random_seed", 42)
@@ -270,6 +365,52 @@ class CrossValidator:
         
         splitter_method = splitter_method_map.get(method, "random")
         splitter = DataSplitter(method=splitter_method, random_seed=random_seed)
+        return method, n_folds, random_seed, splitter
+
+    def _index_folds(
+        self,
+        n_samples: int,
+        method: str,
+        n_folds: int,
+        random_seed: int,
+        shuffle: bool
+    ) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """Create (train, val) position arrays for non-DataFrame data."""
+        indices = np.arange(n_samples)
+        folds = []
+        
+        if method == "time_series":
+            # Time series CV: expanding window
+            fold_size = n_samples // (n_folds + 1)
+            for i in range(n_folds):
+                train_end = (i + 1) * fold_size
+                val_start = train_end
+                val_end = val_start + fold_size
+                folds.append((indices[:train_end], indices[val_start:val_end]))
+        else:
+            # Standard k-fold
+            np.random.seed(random_seed)
+            if shuffle:
+                np.random.shuffle(indices)
+            
+            fold_size = n_samples // n_folds
+            for i in range(n_folds):
+                start = i * fold_size
+                end = start + fold_size if i < n_folds - 1 else n_samples
+                
+                val_indices = indices[start:end]
+                train_indices = np.concatenate([indices[:start], indices[end:]])
+                folds.append((train_indices, val_indices))
+        
+        return folds
+
+    def _create_folds(
+        self, 
+        data: Any, 
+        cv_config: Dict[str, Any]
+    ) -> List[Tuple[Any, Any]]:
+        """Create cross-validation folds."""
+        method, n_folds, random_seed, splitter = self._create_splitter(cv_config)
         
         # Handle different data types
         if isinstance(data, pd.DataFrame):
@@ -278,46 +419,61 @@ class CrossValidator:
         else:
             # For non-DataFrame data, create simple index-based folds
             n_samples = len(data) if hasattr(data, '__len__') else data.shape[0]
-            indices = np.arange(n_samples)
-            
-            if method == "time_series":
-                # Time series CV: expanding window
-                folds = []
-                fold_size = n_samples // (n_folds + 1)
-                for i in range(n_folds):
-                    train_end = (i + 1) * fold_size
-                    val_start = train_end
-                    val_end = val_start + fold_size
-                    
-                    train_indices = indices[:train_end]
-                    val_indices = indices[val_start:val_end]
-                    
-                    train_data = self._subset_data(data, train_indices)
-                    val_data = self._subset_data(data, val_indices)
-                    
-                    folds.append((train_data, val_data))
-            else:
-                # Standard k-fold
-                np.random.seed(random_seed)
-                if cv_config.get("shuffle", True):
-                    np.random.shuffle(indices)
-                
-                fold_size = n_samples // n_folds
-                folds = []
-                
-                for i in range(n_folds):
-                    start = i * fold_size
-                    end = start + fold_size if i < n_folds - 1 else n_samples
-                    
-                    val_indices = indices[start:end]
-                    train_indices = np.concatenate([indices[:start], indices[end:]])
-                    
-                    train_data = self._subset_data(data, train_indices)
-                    val_data = self._subset_data(data, val_indices)
-                    
-                    folds.append((train_data, val_data))
-            
-            return folds
+            index_folds = self._index_folds(
+                n_samples, method, n_folds, random_seed, cv_config.get("shuffle", True)
+            )
+            return [
+                (self._subset_data(data, train_indices), self._subset_data(data, val_indices))
+                for train_indices, val_indices in index_folds
+            ]
+
+    def _create_fold_indices(
+        self,
+        data: Any,
+        cv_config: Dict[str, Any]
+    ) -> List[Tuple[FoldIndex, FoldIndex]]:
+        """Create the same folds as _create_folds, as row positions instead of data.
+        
+        Contiguous position runs are returned as slices so that they can be
+        taken as views.
+        """
+        method, n_folds, random_seed, splitter = self._create_splitter(cv_config)
+        
+        if isinstance(data, pd.DataFrame):
+            # Split a positions-only proxy so the folds match the DataFrame splitter exactly
+            target_column = cv_config.get("target_column")
+            proxy = pd.DataFrame({"__position__": np.arange(len(data))}, index=data.index)
+            if target_column and target_column in data.columns:
+                proxy[target_column] = data[target_column].to_numpy()
+            index_folds = [
+                (train["__position__"].to_numpy(), val["__position__"].to_numpy())
+                for train, val in splitter.create_folds(proxy, n_folds, target_column)
+            ]
+        else:
+            n_samples = len(data) if hasattr(data, '__len__') else data.shape[0]
+            index_folds = self._index_folds(
+                n_samples, method, n_folds, random_seed, cv_config.get("shuffle", True)
+            )
+        
+        return [
+            (self._compact_index(train_indices), self._compact_index(val_indices))
+            for train_indices, val_indices in index_folds
+        ]
+
+    @staticmethod
+    def _compact_index(indices: np.ndarray) -> FoldIndex:
+        """Turn an ascending run of consecutive positions into a slice."""
+        if len(indices) == 0:
+            return slice(0, 0)
+        if indices[-1] - indices[0] == len(indices) - 1 and np.all(np.diff(indices) == 1):
+            return slice(int(indices[0]), int(indices[-1]) + 1)
+        return np.asarray(indices)
+
+    def _take(self, data: Any, index: FoldIndex) -> Any:
+        """Select fold rows: a view for slices, a copy of the selected rows otherwise."""
+        if isinstance(index, slice):
+            return data.iloc[index] if hasattr(data, 'iloc') else data[index]
+        return self._subset_data(data, index)
     
     def _subset_data(self, data: Any, indices: np.ndarray) -> Any:
         """Subset data based on indices."""
@@ -398,6 +554,15 @@ class CrossValidator:
             }
         )
         
+        if self.fold_cache is not None and result.get("model") is not None:
+            # Staged next to the fold checkpoints; the parent moves it into the cache entry
+            weights_path = self.checkpoint_dir / f"fold_{fold_idx}" / "cache_weights"
+            try:
+                shutil.rmtree(weights_path, ignore_errors=True)
+                fold_result.additional_info["weights_path"] = result["model"].save(weights_path)
+            except Exception as e:
+                self.logger.warning(f"Could not save weights of fold {fold_idx} for the fold cache: {e}")
+        
         return fold_result
     
     def _parallel_cv(
@@ -407,10 +572,17 @@ class CrossValidator:
         training_config: Dict[str, Any],
         metrics: List[str],
         save_models: bool,
-        callbacks: Optional[List[Any]]
+        callbacks: Optional[List[Any]],
+        fold_ids: Optional[List[int]] = None
     ) -> List[CVFoldResult]:
-        """Run cross-validation in parallel."""
+        """Run cross-validation in parallel.
+        
+        ``fold_ids`` gives the fold index of each entry in ``folds`` when only
+        some folds are run (defaults to their position).
+        """
         fold_results = []
+        if fold_ids is None:
+            fold_ids = list(range(len(folds)))
         
         # Choose executor based on settings
         executor_class = ProcessPoolExecutor if self.use_multiprocessing else ThreadPoolExecutor
@@ -418,7 +590,7 @@ class CrossValidator:
         with executor_class(max_workers=self.n_jobs) as executor:
             # Submit all fold training jobs
             future_to_fold = {}
-            for i, (train_data, val_data) in enumerate(folds):
+            for i, (train_data, val_data) in zip(fold_ids, folds):
                 future = executor.submit(
                     self._train_fold,
                     i, train_data, val_data, model_config,
@@ -427,17 +599,206 @@ class CrossValidator:
                 future_to_fold[future] = i
             
             # Collect results as they complete
-            for future in as_completed(future_to_fold):
-                fold_idx = future_to_fold[future]
-                try:
-                    result = future.result()
-                    fold_results.append(result)
-                    self.logger.info(f"Completed fold {fold_idx + 1}/{len(folds)}")
-                except Exception as e:
-                    self.logger.error(f"Fold {fold_idx} failed: {str(e)}")
-                    raise
+            self._collect_folds(future_to_fold, fold_results)
+        
+        return fold_results
+    
+    def _parallel_cv_shared(
+        self,
+        data: Any,
+        fold_indices: List[Tuple[FoldIndex, FoldIndex]],
+        model_config: Dict[str, Any],
+        training_config: Dict[str, Any],
+        metrics: List[str],
+        save_models: bool,
+        callbacks: Optional[List[Any]],
+        fold_ids: Optional[List[int]] = None
+    ) -> List[CVFoldResult]:
+        """Run cross-validation in parallel, sending fold indices instead of fold data."""
+        train_args = (model_config, training_config, metrics, save_models, callbacks)
+        fold_results = []
+        if fold_ids is None:
+            fold_ids = list(range(len(fold_indices)))
+        
+        if self.use_multiprocessing:
+            handle = self._publish(data)
+            if handle is None:
+                self.logger.warning("Data cannot be placed in shared memory; falling back to materialized folds")
+                folds = [(self._take(data, train), self._take(data, val)) for train, val in fold_indices]
+                return self._parallel_cv(folds, *train_args, fold_ids=fold_ids)
+            executor = self._get_pool()
+            future_to_fold = {
+                executor.submit(_train_shared_fold, handle, i, train_index, val_index, *train_args): i
+                for i, (train_index, val_index) in zip(fold_ids, fold_indices)
+            }
+            thread_pool = None
+        else:
+            # Threads share the data already; only avoid materializing every fold up front
+            thread_pool = ThreadPoolExecutor(max_workers=self.n_jobs)
+            future_to_fold = {
+                thread_pool.submit(
+                    self._train_fold, i, self._take(data, train_index), self._take(data, val_index), *train_args
+                ): i
+                for i, (train_index, val_index) in zip(fold_ids, fold_indices)
+            }
+        
+        try:
+            self._collect_folds(future_to_fold, fold_results)
+        finally:
+            if thread_pool is not None:
+                thread_pool.shutdown()
         
         return fold_results
+
+    def _collect_folds(self, future_to_fold: Dict[Any, int], fold_results: List[CVFoldResult]) -> None:
+        """Gather fold results as they complete, caching each one.
+        
+        A failed fold does not discard the others: the remaining folds still
+        finish (and are cached), then the first error is raised.
+        """
+        first_error = None
+        for future in as_completed(future_to_fold):
+            fold_idx = future_to_fold[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                self.logger.error(f"Fold {fold_idx} failed: {str(e)}")
+                first_error = first_error or e
+                continue
+            self._record_fold(result)
+            fold_results.append(result)
+            self.logger.info(f"Completed fold {fold_idx + 1} ({len(fold_results)}/{len(future_to_fold)})")
+        if first_error is not None:
+            raise first_error
+
+    def _load_cached_folds(
+        self,
+        data: Any,
+        fold_indices: List[Tuple[FoldIndex, FoldIndex]],
+        model_config: Dict[str, Any],
+        training_config: Dict[str, Any],
+        cv_config: Dict[str, Any],
+        metrics: List[str]
+    ) -> Tuple[List[CVFoldResult], List[int]]:
+        """Look up every fold in the cache.
+        
+        Returns:
+            Tuple of (cached fold results, indices of the folds still to train)
+        """
+        if self._fingerprint is None or self._fingerprint[0] is not data:
+            self._fingerprint = (data, self.fold_cache.data_fingerprint(data))
+        settings = {
+            "model_config": model_config,
+            "training_config": training_config,
+            "metrics": sorted(metrics),
+            "random_seed": cv_config.get("random_seed", 42)
+        }
+        
+        cached, pending = [], []
+        self._fold_keys = {}
+        for i, (train_index, val_index) in enumerate(fold_indices):
+            key = self.fold_cache.fold_key(self._fingerprint[1], train_index, val_index, settings)
+            record = self.fold_cache.load(key)
+            if record is None:
+                self._fold_keys[i] = key
+                pending.append(i)
+                continue
+            additional_info = dict(record.get("additional_info") or {})
+            additional_info.update(cached=True, cache_key=key, weights_path=record["weights_path"])
+            cached.append(CVFoldResult(
+                fold_idx=i,
+                train_metrics=record["train_metrics"],
+                val_metrics=record["val_metrics"],
+                training_time=record["training_time"],
+                model_id=record.get("model_id"),
+                model_path=Path(record["model_path"]) if record.get("model_path") else None,
+                additional_info=additional_info
+            ))
+        return cached, pending
+
+    def _record_fold(self, result: CVFoldResult) -> None:
+        """Persist a freshly trained fold in the cache, if caching is enabled for this run."""
+        key = self._fold_keys.get(result.fold_idx)
+        if key is None:
+            return
+        additional_info = dict(result.additional_info)
+        weights_path = additional_info.pop("weights_path", None)
+        record = {
+            "train_metrics": result.train_metrics,
+            "val_metrics": result.val_metrics,
+            "training_time": result.training_time,
+            "model_id": result.model_id,
+            "model_path": str(result.model_path) if result.model_path else None,
+            "additional_info": additional_info
+        }
+        try:
+            entry = self.fold_cache.store(key, record, weights_path)
+        except Exception as e:
+            self.logger.warning(f"Could not cache fold {result.fold_idx}: {e}")
+            return
+        if weights_path is not None:
+            result.additional_info["weights_path"] = str(entry / "model") if (entry / "model").is_dir() else None
+        result.additional_info["cache_key"] = key
+
+    def _publish(self, data: Any) -> Optional[SharedValueHandle]:
+        """Write the dataset to shared memory once; repeated calls with the same object reuse it.
+        
+        The object is not re-published if it is mutated in place between calls.
+        
+        Returns:
+            Handle to the shared copy, or None if the data type cannot be shared
+        """
+        if self._published is not None and self._published[0] is data:
+            return self._published[1]
+        if self._shared_store is None:
+            self._shared_store = SharedValueStore(min_bytes=0)
+        if not self._shared_store.should_spill(data):
+            return None
+        handle = self._shared_store.spill(data, "cv_data")
+        if handle is None:
+            return None
+        if self._published is not None:
+            self._shared_store.release(self._published[1])
+        self._published = (data, handle)
+        self.logger.info(f"Published {handle.nbytes / 2**20:.1f} MiB of CV data to {self._shared_store.directory}")
+        return handle
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Return the warm worker pool, starting it on first use.
+        
+        Workers are spawned rather than forked: they live across calls, so the
+        start-up cost is paid once, and the parent may already run threads.
+        """
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.n_jobs,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_cv_worker,
+                initargs=(self,)
+            )
+        return self._pool
+
+    def close(self) -> None:
+        """Shut down the warm worker pool and delete the shared copy of the data."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        if self._shared_store is not None:
+            self._shared_store.close()
+            self._shared_store = None
+        self._published = None
+
+    def __enter__(self) -> "CrossValidator":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Workers get a copy of the validator without the parent's pool, shared store or data
+        state = self.__dict__.copy()
+        state.update(_pool=None, _shared_store=None, _published=None, _fingerprint=None, _fold_keys={})
+        return state
     
     def _aggregate_metrics(
         self, 
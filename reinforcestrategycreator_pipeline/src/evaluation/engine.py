@@ -177,6 +177,8 @@ class EvaluationEngine:
                 results["benchmarks"] = benchmark_results["benchmarks"]
                 results["benchmarks"] = benchmark_results["benchmarks"]
                 results["relative_performance"] = benchmark_results["relative_performance"]
+                if "sweeps" in benchmark_results:
+                    results["benchmark_sweeps"] = benchmark_results["sweeps"]
             
             # Generate visualizations if requested
             visualization_paths = {}
@@ -277,7 +279,8 @@ class EvaluationEngine:
             model: Model to evaluate
             data: Data to evaluate on
             metrics: Specific metrics to calculate
-            **kwargs: Additional evaluation parameters
+            **kwargs: Additional evaluation parameters. ``backtest_mode`` selects
+                "batched" (default) or "sequential" backtesting.
             
         Returns:
             Tuple of (metrics dictionary, portfolio values list)
@@ -293,6 +296,58 @@ class EvaluationEngine:
         logger.info("Starting basic backtesting simulation for model evaluation...")
         
         initial_capital = 100000.0
+
+        if 'Close' not in data.columns:
+            logger.error("Backtesting requires a 'Close' column in the evaluation data.")
+            # Return empty metrics and initial portfolio if data is unsuitable
+            return {}, [initial_capital]
+
+        # "batched" predicts every action in one call and simulates over NumPy
+        # arrays; it falls back to the row-by-row loop when batching fails.
+        backtest_mode = kwargs.get("backtest_mode", "batched")
+        backtest = None
+        if backtest_mode == "batched":
+            backtest = self._run_batched_backtest(model, data, initial_capital)
+        if backtest is None:
+            backtest = self._run_sequential_backtest(model, data, initial_capital)
+        portfolio_history, trades = backtest
+
+        portfolio_values_np = np.array(portfolio_history, dtype=float)
+        
+        if len(portfolio_values_np) > 1:
+            # Calculate returns based on the change from one step to the next
+            returns_np = np.diff(portfolio_values_np) / portfolio_values_np[:-1]
+        else:
+            returns_np = np.array([])
+            
+        logger.info(f"Backtest simulation complete. Trades executed: {len(trades)}. Final portfolio value: {portfolio_values_np[-1]:.2f}")
+
+        # Calculate metrics using the metrics calculator, now with actual trades
+        calculated_metrics = self.metrics_calculator.calculate_all_metrics(
+            portfolio_values=portfolio_values_np,
+            returns=returns_np,
+            trades=trades,  # Pass the list of actual trades
+            requested_metrics=metrics
+        )
+        
+        return calculated_metrics, list(portfolio_values_np) # Return as list for consistency
+    
+    def _run_sequential_backtest(
+        self,
+        model: ModelBase,
+        data: pd.DataFrame,
+        initial_capital: float
+    ) -> Tuple[List[float], List[Dict[str, Any]]]:
+        """Backtest by predicting and trading one row at a time.
+        
+        Args:
+            model: Model to evaluate
+            data: Data with a 'Close' column; all columns are model features
+            initial_capital: Starting cash
+            
+        Returns:
+            Tuple of (portfolio history including the initial value, trades list)
+        """
         cash = initial_capital
         current_position_units = 0.0
         entry_price = 0.0
@@ -306,11 +361,6 @@ class EvaluationEngine:
         portfolio_history = [initial_capital]
         trades = []
 
-        if 'Close' not in data.columns:
-            logger.error("Backtesting requires a 'Close' column in the evaluation data.")
-            # Return empty metrics and initial portfolio if data is unsuitable
-            return {}, [initial_capital]
-
         for i in range(len(data)):
             current_timestamp = data.index[i] if has_datetime_index else i
             current_price = data['Close'].iloc[i]
@@ -400,25 +450,145 @@ class EvaluationEngine:
             current_position_units = 0.0 # Position closed
             portfolio_history[-1] = cash # Update the last portfolio value to reflect final cash after liquidation
 
-        portfolio_values_np = np.array(portfolio_history, dtype=float)
+        return portfolio_history, trades
+
+    def _predict_actions_batched(self, model: ModelBase, data: pd.DataFrame) -> Optional[np.ndarray]:
+        """Predict the greedy action for every row of the frame in one call.
         
-        if len(portfolio_values_np) > 1:
-            # Calculate returns based on the change from one step to the next
-            returns_np = np.diff(portfolio_values_np) / portfolio_values_np[:-1]
-        else:
-            returns_np = np.array([])
+        Args:
+            model: Model to evaluate
+            data: Evaluation data; all columns are model features
             
-        logger.info(f"Backtest simulation complete. Trades executed: {len(trades)}. Final portfolio value: {portfolio_values_np[-1]:.2f}")
-
-        # Calculate metrics using the metrics calculator, now with actual trades
-        calculated_metrics = self.metrics_calculator.calculate_all_metrics(
-            portfolio_values=portfolio_values_np,
-            returns=returns_np,
-            trades=trades,  # Pass the list of actual trades
-            requested_metrics=metrics
-        )
+        Returns:
+            Integer action per row, or None if the frame or the model output
+            cannot be handled as a batch
+        """
+        try:
+            states = np.array(data.values, dtype=float)
+        except (ValueError, TypeError) as e:
+            logger.info(f"Batched backtest unavailable, features are not numeric: {e}")
+            return None
         
-        return calculated_metrics, list(portfolio_values_np) # Return as list for consistency
+        try:
+            q_values = np.asarray(model.predict(states, deterministic=True), dtype=float)
+        except Exception as e:
+            logger.info(f"Batched backtest unavailable, batch prediction failed: {e}")
+            return None
+        
+        if q_values.ndim == 0 or q_values.shape[0] != len(data):
+            logger.info(f"Batched backtest unavailable, unexpected prediction shape {q_values.shape}")
+            return None
+        
+        return np.argmax(q_values.reshape(len(data), -1), axis=1)
+    
+    def _run_batched_backtest(
+        self,
+        model: ModelBase,
+        data: pd.DataFrame,
+        initial_capital: float
+    ) -> Optional[Tuple[List[float], List[Dict[str, Any]]]]:
+        """Backtest from actions predicted up front for the whole frame.
+        
+        Actions depend only on the features of each row, so they can all be
+        predicted before the simulation. The simulation then only visits rows
+        with a buy or sell action and fills the portfolio values between them
+        with NumPy. Results match ``_run_sequential_backtest`` exactly.
+        
+        Args:
+            model: Model to evaluate
+            data: Data with a 'Close' column; all columns are model features
+            initial_capital: Starting cash
+            
+        Returns:
+            Tuple of (portfolio history including the initial value, trades
+            list), or None if actions cannot be predicted as a batch
+        """
+        actions = self._predict_actions_batched(model, data)
+        if actions is None:
+            return None
+        
+        n_rows = len(data)
+        prices = data['Close'].to_numpy(dtype=float)
+        has_datetime_index = isinstance(data.index, pd.DatetimeIndex)
+        
+        def timestamp_at(i: int) -> Any:
+            return data.index[i] if has_datetime_index else i
+        
+        cash = initial_capital
+        current_position_units = 0.0
+        entry_price = 0.0
+        entry_timestamp_for_trade = None
+        trades = []
+        
+        # Holdings only change on buy/sell rows; record (row, units, cash) after each change
+        change_rows = []
+        units_after = []
+        cash_after = []
+        
+        event_rows = np.flatnonzero((actions == 1) | (actions == 2))
+        for i, action, current_price in zip(
+            event_rows.tolist(), actions[event_rows].tolist(), prices[event_rows].tolist()
+        ):
+            if action == 1:  # Buy
+                if current_position_units == 0 and cash > current_price and current_price > 0:
+                    current_position_units = cash / current_price
+                    cash = 0.0
+                    entry_price = current_price
+                    entry_timestamp_for_trade = timestamp_at(i)
+                else:
+                    continue
+            else:  # Sell
+                if current_position_units > 0:
+                    pnl = (current_price - entry_price) * current_position_units
+                    cash += current_position_units * current_price
+                    trades.append({
+                        'pnl': pnl,
+                        'entry_price': entry_price,
+                        'exit_price': current_price,
+                        'units': current_position_units,
+                        'entry_timestamp': entry_timestamp_for_trade,
+                        'exit_timestamp': timestamp_at(i),
+                        'action_type': 'sell'
+                    })
+                    current_position_units = 0.0
+                    entry_price = 0.0
+                    entry_timestamp_for_trade = None
+                else:
+                    continue
+            change_rows.append(i)
+            units_after.append(current_position_units)
+            cash_after.append(cash)
+        
+        # Expand the piecewise-constant holdings to every row and value them
+        segment_bounds = np.array([0] + change_rows + [n_rows])
+        segment_lengths = np.diff(segment_bounds)
+        units = np.repeat(np.array([0.0] + units_after), segment_lengths)
+        cash_held = np.repeat(np.array([initial_capital] + cash_after), segment_lengths)
+        portfolio_values = cash_held + units * prices
+        
+        portfolio_history = [initial_capital]
+        portfolio_history.extend(portfolio_values.tolist())
+        
+        # Liquidate any open position at the end of the data
+        if current_position_units > 0:
+            last_price = prices[-1]
+            pnl = (last_price - entry_price) * current_position_units
+            cash += current_position_units * last_price
+            trades.append({
+                'pnl': pnl,
+                'entry_price': entry_price,
+                'exit_price': last_price,
+                'units': current_position_units,
+                'entry_timestamp': entry_timestamp_for_trade,
+                'exit_timestamp': timestamp_at(n_rows - 1),
+                'action_type': 'liquidate_at_end'
+            })
+            portfolio_history[-1] = cash
+        
+        logger.info(
+            f"Batched backtest: {n_rows} rows, {len(event_rows)} buy/sell signals, {len(trades)} trades."
+        )
+        return portfolio_history, trades
     
     def _save_results(
         self,
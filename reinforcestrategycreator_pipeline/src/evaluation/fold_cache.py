@@ -0,0 +1,173 @@
+"""On-disk cache of cross-validation fold results."""
+
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from ..artifact_store.local_adapter import NumpyEncoder
+
+# Bump when the cached record layout or the meaning of a key changes.
+CACHE_FORMAT_VERSION = 1
+
+
+class FoldResultCache:
+    """Persists fold results and trained weights under a hash of their inputs.
+
+    A fold's key covers the data fingerprint, the fold's row positions, the
+    model and training configuration, the requested metrics and the seed, so
+    a fold is reused only when retraining it would see exactly the same
+    inputs. Each entry is a directory holding ``result.json`` and, when the
+    fold produced one, a ``model/`` checkpoint. Entries are written to a
+    temporary directory and renamed into place, so an interrupted run never
+    leaves a half-written entry behind.
+
+    Layout::
+
+        cache_dir/
+        └── {key[:2]}/
+            └── {key}/
+                ├── result.json
+                └── model/
+    """
+
+    def __init__(self, cache_dir: Union[str, Path]):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding cache entries (created if missing)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def data_fingerprint(data: Any) -> str:
+        """Hash the contents of a dataset.
+
+        DataFrames and Series are hashed row by row with their index, column
+        names and dtypes; arrays by shape, dtype and raw bytes. Anything else
+        is hashed through its pickle.
+
+        Args:
+            data: Dataset passed to cross-validation
+
+        Returns:
+            Hex digest identifying the data
+        """
+        digest = hashlib.sha256()
+        if isinstance(data, (pd.DataFrame, pd.Series)):
+            columns = list(data.columns) if isinstance(data, pd.DataFrame) else [data.name]
+            dtypes = [str(t) for t in (data.dtypes if isinstance(data, pd.DataFrame) else [data.dtype])]
+            digest.update(repr((type(data).__name__, columns, dtypes)).encode())
+            digest.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+        elif isinstance(data, np.ndarray) and data.dtype != object:
+            digest.update(repr((data.shape, str(data.dtype))).encode())
+            digest.update(np.ascontiguousarray(data).tobytes())
+        else:
+            digest.update(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+        return digest.hexdigest()
+
+    @staticmethod
+    def _index_digest(index: Union[slice, np.ndarray]) -> str:
+        if isinstance(index, slice):
+            return f"{index.start}:{index.stop}"
+        return hashlib.sha256(np.asarray(index, dtype=np.int64).tobytes()).hexdigest()
+
+    def fold_key(
+        self,
+        data_fingerprint: str,
+        train_index: Union[slice, np.ndarray],
+        val_index: Union[slice, np.ndarray],
+        settings: Dict[str, Any]
+    ) -> str:
+        """Build the cache key of one fold.
+
+        Args:
+            data_fingerprint: Result of :meth:`data_fingerprint`
+            train_index: Training row positions of the fold
+            val_index: Validation row positions of the fold
+            settings: Everything else that determines the result (model and
+                training config, metrics, seed); must be JSON-serializable or
+                have a stable ``repr``
+
+        Returns:
+            Hex digest identifying the fold
+        """
+        payload = {
+            "version": CACHE_FORMAT_VERSION,
+            "data": data_fingerprint,
+            "train": self._index_digest(train_index),
+            "val": self._index_digest(val_index),
+            "settings": settings
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=repr)
+        return hashlib.sha256(encoded.encode()).hexdigest()
+
+    def entry_dir(self, key: str) -> Path:
+        """Directory of the entry for a key."""
+        return self.cache_dir / key[:2] / key
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached record for a key and count the hit or miss.
+
+        Args:
+            key: Fold key
+
+        Returns:
+            The stored record, with ``weights_path`` pointing into the cache
+            when weights were stored, or None on a miss
+        """
+        result_file = self.entry_dir(key) / "result.json"
+        try:
+            with open(result_file) as f:
+                record = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        model_dir = self.entry_dir(key) / "model"
+        record["weights_path"] = str(model_dir) if model_dir.is_dir() else None
+        return record
+
+    def store(self, key: str, record: Dict[str, Any], weights_path: Optional[Union[str, Path]] = None) -> Path:
+        """Persist a fold record and, optionally, its trained weights.
+
+        Args:
+            key: Fold key
+            record: JSON-serializable fold result
+            weights_path: Checkpoint directory to move into the entry
+
+        Returns:
+            The entry directory
+        """
+        entry = self.entry_dir(key)
+        staging = entry.parent / f".{key}.{uuid.uuid4().hex}.tmp"
+        staging.mkdir(parents=True)
+        try:
+            if weights_path is not None and Path(weights_path).exists():
+                shutil.move(str(weights_path), str(staging / "model"))
+            with open(staging / "result.json", "w") as f:
+                json.dump(record, f, indent=2, cls=NumpyEncoder)
+            if entry.exists():
+                shutil.rmtree(entry)
+            os.replace(staging, entry)
+        except Exception:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        return entry
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit and miss counts since the cache was created."""
+        return {"hits": self.hits, "misses": self.misses, "cache_dir": str(self.cache_dir)}
+
+    def __repr__(self) -> str:
+        return f"<FoldResultCache(cache_dir='{self.cache_dir}', hits={self.hits}, misses={self.misses})>"
@@ -265,15 +265,14 @@ class DQN(ModelBase):
                 k: v.copy() for k, v in self.q_network["weights"].items()
             }
     
-    def _forward(self, state: np.ndarray, network: Dict[str, Any]) -> np.ndarray:
-        """Forward pass through network.
+    def _validated_weights(self, network: Dict[str, Any]) -> Dict[str, np.ndarray]:
+        """Return the network's weights after checking every layer key is present.
         
         Args:
-            state: Input state
             network: Network to use (q_network or target_network)
             
         Returns:
-            Q-values for all actions
+            The network's weight dictionary
         """
         # Ensure network has proper structure
         if not network or "weights" not in network:
@@ -293,6 +292,20 @@ class DQN(ModelBase):
         if "W_out" not in weights or "b_out" not in weights:
             raise KeyError(f"Missing output layer weights. Available keys: {list(weights.keys())}")
         
+        return weights
+    
+    def _forward(self, state: np.ndarray, network: Dict[str, Any]) -> np.ndarray:
+        """Forward pass through network.
+        
+        Args:
+            state: Input state
+            network: Network to use (q_network or target_network)
+            
+        Returns:
+            Q-values for all actions
+        """
+        weights = self._validated_weights(network)
+        
         # Simplified forward pass
         x = state.flatten()
         self.logger.debug(f"_forward: input state flattened sample: {x[:5]}")
@@ -335,6 +348,31 @@ class DQN(ModelBase):
         
         return q_values
     
+    def _forward_batch(self, states: np.ndarray, network: Dict[str, Any]) -> np.ndarray:
+        """Forward pass for a batch of states as one matrix product per layer.
+        
+        Args:
+            states: Batch of input states, first dimension is the batch
+            network: Network to use (q_network or target_network)
+            
+        Returns:
+            Q-values with shape (batch_size, n_actions)
+        """
+        weights = self._validated_weights(network)
+        x = states.reshape(len(states), -1)
+        for i in range(len(self.hidden_dims)):
+            x = x @ weights[f"W{i}"] + weights[f"b{i}"]
+            if self.activation == "relu":
+                x = np.maximum(0, x)
+            elif self.activation == "tanh":
+                x = np.tanh(x)
+        q_values = x @ weights["W_out"] + weights["b_out"]
+        
+        if np.isnan(q_values).any():
+            # _forward handles NaNs row by row (with diagnostics); keep its behaviour
+            return np.array([self._forward(s, network) for s in states])
+        return q_values
+    
     def predict(self, data: Any, **kwargs) -> Any:
         """Predict Q-values for given states.
         
@@ -358,7 +396,7 @@ class DQN(ModelBase):
                 return self._forward(data, network)
             else:
                 # Batch of states
-                return np.array([self._forward(s, network) for s in data])
+                return self._forward_batch(data, network)
         else:
             raise ValueError("Data must be numpy array")
     
@@ -883,8 +921,14 @@ class DQN(ModelBase):
         state_to_save = {
             "creation_config": self.model_init_config, # The full config dict used at __init__
             "model_weights": model_weights,
-            "is_model_built": self.is_model_built
+            "is_model_built": self.is_model_built,
+            "steps": self.steps,
+            "episodes": self.episodes
         }
+        # The replay buffer can be large; only checkpoint it when asked to (e.g. for HPO trials
+        # that are paused and resumed or cloned by population-based schedulers)
+        if self.hyperparameters.get("checkpoint_replay_buffer", False):
+            state_to_save["replay_buffer"] = list(self.replay_buffer.buffer)
         self.logger.debug(f"DQN.get_model_state: Returning state with keys: {list(state_to_save.keys())}")
         return state_to_save
 
@@ -996,6 +1040,12 @@ class DQN(ModelBase):
         else:
             self.logger.warning("DQN.set_model_state: No weights_to_load_source identified or q_network structure invalid. Weights not loaded.")
         
+        # Restore step counters (they drive the update and target-sync schedule) and the replay buffer
+        self.steps = state.get("steps", self.steps)
+        self.episodes = state.get("episodes", self.episodes)
+        if "replay_buffer" in state:
+            self.replay_buffer.buffer.extend(state["replay_buffer"])
+        
         # Restore built status from state if available, otherwise rely on self.build() outcome
         # self.is_model_built should be True if self.build() was successful and q_network exists
         self.is_model_built = state.get("is_model_built", self.q_network is not None)
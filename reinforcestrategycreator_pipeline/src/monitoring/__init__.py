@@ -16,6 +16,15 @@ from .datadog_client import (
     track_pipeline_event
 )
 
+from .metrics_aggregator import (
+    HistogramSketch,
+    MetricsAggregator,
+    InMemoryMetricsSink,
+    UDPMetricsSink
+)
+
+from .streaming_drift import StreamingDriftMonitor
+
 from .service import (
     MonitoringService,
     get_monitoring_service,
@@ -37,6 +46,15 @@ __all__ = [
     "track_model_metrics",
     "track_pipeline_event",
     
+    # Metrics aggregation exports
+    "HistogramSketch",
+    "MetricsAggregator",
+    "InMemoryMetricsSink",
+    "UDPMetricsSink",
+    
+    # Streaming drift exports
+    "StreamingDriftMonitor",
+    
     # Service exports
     "MonitoringService",
     "get_monitoring_service",
@@ -0,0 +1,339 @@
+"""
+Background dispatch queue for alert notifications.
+
+Alerts are handed to a bounded queue and delivered by a small pool of worker
+threads, so the thread that raised the event never waits on SMTP or HTTP.
+Workers drain the queue in batches, group alerts per channel, retry failed
+deliveries with exponential backoff, and keep their HTTP session and SMTP
+connections open between batches.
+"""
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import atexit
+import queue
+import smtplib
+import threading
+import time
+
+import requests
+
+from ..config.models import AlertChannelConfig, AlertRuleConfig
+from .logger import get_logger
+
+logger = get_logger("monitoring.alert_dispatcher")
+
+
+@dataclass
+class PendingAlert:
+    """An alert waiting to be delivered through one channel."""
+    channel_config: AlertChannelConfig
+    rule: AlertRuleConfig
+    title: str
+    body: str
+    event_data: Dict[str, Any]
+    tags: Optional[List[str]] = None
+    created_at: float = field(default_factory=time.time)
+    count: int = 1
+    # Set by senders that deliver a batch one alert at a time, so a retried
+    # batch skips the alerts that already went out
+    delivered: bool = False
+
+
+class DispatchConnections:
+    """
+    Connections owned by one dispatch worker and reused across batches.
+
+    Each worker gets its own instance, so nothing here is shared between
+    threads.
+    """
+
+    def __init__(self):
+        self._http_session: Optional[requests.Session] = None
+        self._smtp_connections: Dict[Tuple[Any, ...], smtplib.SMTP] = {}
+
+    @property
+    def http_session(self) -> requests.Session:
+        """HTTP session shared by all webhook deliveries of this worker."""
+        if self._http_session is None:
+            self._http_session = requests.Session()
+        return self._http_session
+
+    def smtp(self, details: Dict[str, Any]) -> smtplib.SMTP:
+        """
+        Return an open, authenticated SMTP connection for the channel details.
+
+        Args:
+            details: Email channel details (smtp_host, smtp_port, use_tls, ...)
+
+        Returns:
+            A connected SMTP client, opened on first use
+        """
+        smtp_host = details.get("smtp_host", "localhost")
+        smtp_port = details.get("smtp_port", 587)
+        smtp_username = details.get("smtp_username")
+        key = (smtp_host, smtp_port, smtp_username)
+
+        server = self._smtp_connections.get(key)
+        if server is None:
+            server = smtplib.SMTP(smtp_host, smtp_port)
+            if details.get("use_tls", True):
+                server.starttls()
+            smtp_password = details.get("smtp_password")
+            if smtp_username and smtp_password:
+                server.login(smtp_username, smtp_password)
+            self._smtp_connections[key] = server
+        return server
+
+    def discard_smtp(self, details: Dict[str, Any]) -> None:
+        """Drop a cached SMTP connection, e.g. after a delivery failure."""
+        key = (details.get("smtp_host", "localhost"), details.get("smtp_port", 587), details.get("smtp_username"))
+        server = self._smtp_connections.pop(key, None)
+        if server is not None:
+            self._close_smtp(server)
+
+    def close(self) -> None:
+        """Close every open connection."""
+        for server in self._smtp_connections.values():
+            self._close_smtp(server)
+        self._smtp_connections.clear()
+        if self._http_session is not None:
+            self._http_session.close()
+            self._http_session = None
+
+    @staticmethod
+    def _close_smtp(server: smtplib.SMTP) -> None:
+        try:
+            server.quit()
+        except Exception:
+            try:
+                server.close()
+            except Exception:
+                pass
+
+
+# Sends all alerts of one channel; raises on failure so the batch is retried
+BatchSender = Callable[[AlertChannelConfig, List[PendingAlert], DispatchConnections], None]
+
+
+class AlertDispatcher:
+    """
+    Bounded background queue with a worker pool for alert delivery.
+
+    ``submit`` never blocks: when the queue is full the alert is dropped and
+    counted. Workers pick up to ``batch_size`` alerts at a time, waiting at
+    most ``batch_window_seconds`` for more to arrive, merge repeats of the
+    same rule on the same channel, and hand each channel's alerts to the
+    sender in one call. Once started, the dispatcher is closed at interpreter
+    exit, so alerts still queued then are delivered rather than lost with the
+    daemon workers.
+    """
+
+    def __init__(
+        self,
+        sender: BatchSender,
+        max_queue_size: int = 1000,
+        num_workers: int = 2,
+        batch_size: int = 50,
+        batch_window_seconds: float = 0.5,
+        max_retries: int = 3,
+        backoff_seconds: float = 1.0,
+        max_backoff_seconds: float = 30.0
+    ):
+        """
+        Initialize the dispatcher. Worker threads start on the first submit.
+
+        Args:
+            sender: Callable that delivers one channel's batch of alerts
+            max_queue_size: Maximum number of queued alerts
+            num_workers: Number of worker threads
+            batch_size: Maximum number of alerts taken from the queue at once
+            batch_window_seconds: How long a worker waits to fill a batch
+            max_retries: Retries per channel batch after the first attempt
+            backoff_seconds: Delay before the first retry, doubled each time
+            max_backoff_seconds: Upper bound on the retry delay
+        """
+        self.sender = sender
+        self.batch_size = max(1, batch_size)
+        self.batch_window_seconds = batch_window_seconds
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.num_workers = max(1, num_workers)
+
+        self._queue: "queue.Queue[PendingAlert]" = queue.Queue(maxsize=max_queue_size)
+        self._workers: List[threading.Thread] = []
+        self._stop = threading.Event()
+        self._start_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "submitted": 0,
+            "dropped": 0,
+            "sent": 0,
+            "failed": 0,
+            "retries": 0,
+            "coalesced": 0,
+            "batches": 0,
+            "queue_high_watermark": 0,
+        }
+
+    def submit(self, alert: PendingAlert) -> bool:
+        """
+        Queue an alert for delivery without blocking.
+
+        Args:
+            alert: The alert to deliver
+
+        Returns:
+            True if the alert was queued, False if it was dropped
+        """
+        if not self._workers:
+            self._start()
+        try:
+            self._queue.put_nowait(alert)
+        except queue.Full:
+            self._increment("dropped")
+            logger.warning(f"Alert queue full; dropped alert for rule '{alert.rule.name}' on channel '{alert.channel_config.name}'")
+            return False
+        with self._stats_lock:
+            self._stats["submitted"] += 1
+            self._stats["queue_high_watermark"] = max(self._stats["queue_high_watermark"], self._queue.qsize())
+        return True
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Return delivery counters and the current queue depth.
+
+        ``queue_depth`` against ``max_queue_size`` shows backpressure;
+        ``dropped`` counts alerts rejected because the queue was full.
+        """
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats["queue_depth"] = self._queue.qsize()
+        # Alerts stay unfinished from submit until a worker calls task_done
+        stats["in_flight"] = max(0, self._queue.unfinished_tasks - stats["queue_depth"])
+        stats["max_queue_size"] = self._queue.maxsize
+        return stats
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued alert has been delivered or given up on.
+
+        Args:
+            timeout: Maximum number of seconds to wait, or None to wait forever
+
+        Returns:
+            True if the queue drained within the timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        # unfinished_tasks rises on put and falls only on task_done, after the
+        # alert's delivery ended, so an alert a worker has just taken off the
+        # queue still counts
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+            return True
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """
+        Deliver what is queued, then stop the workers and close connections.
+
+        Args:
+            timeout: Maximum number of seconds to wait for the queue to drain
+        """
+        if self._workers:
+            self.flush(timeout)
+        self._stop.set()
+        for worker in self._workers:
+            worker.join(timeout=1.0)
+        self._workers = []
+        self._stop.clear()
+        atexit.unregister(self.close)
+
+    def _start(self) -> None:
+        with self._start_lock:
+            if self._workers:
+                return
+            for i in range(self.num_workers):
+                worker = threading.Thread(target=self._worker_loop, name=f"alert-dispatch-{i}", daemon=True)
+                worker.start()
+                self._workers.append(worker)
+            atexit.register(self.close)
+
+    def _increment(self, key: str, amount: int = 1) -> None:
+        with self._stats_lock:
+            self._stats[key] += amount
+
+    def _worker_loop(self) -> None:
+        connections = DispatchConnections()
+        try:
+            while not self._stop.is_set():
+                batch = self._next_batch()
+                if not batch:
+                    continue
+                try:
+                    self._deliver(batch, connections)
+                finally:
+                    for _ in batch:
+                        self._queue.task_done()
+        finally:
+            connections.close()
+
+    def _next_batch(self) -> List[PendingAlert]:
+        """Take up to batch_size alerts, waiting briefly for more to arrive."""
+        try:
+            first = self._queue.get(timeout=0.1)
+        except queue.Empty:
+            return []
+        batch = [first]
+
+        deadline = time.monotonic() + self.batch_window_seconds
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                alert = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            batch.append(alert)
+        return batch
+
+    def _deliver(self, batch: List[PendingAlert], connections: DispatchConnections) -> None:
+        """Coalesce the batch per channel and send each channel's alerts."""
+        by_channel: Dict[str, List[PendingAlert]] = {}
+        for alert in batch:
+            by_channel.setdefault(alert.channel_config.name, []).append(alert)
+
+        for channel_alerts in by_channel.values():
+            coalesced = self._coalesce(channel_alerts)
+            self._increment("coalesced", len(channel_alerts) - len(coalesced))
+            self._increment("batches")
+            self._send_with_retry(coalesced, connections, sum(a.count for a in coalesced))
+
+    @staticmethod
+    def _coalesce(alerts: List[PendingAlert]) -> List[PendingAlert]:
+        """Merge alerts of the same rule, keeping the latest event and a count."""
+        merged: Dict[str, PendingAlert] = {}
+        for alert in alerts:
+            previous = merged.get(alert.rule.name)
+            if previous is not None:
+                alert.count += previous.count
+            merged[alert.rule.name] = alert
+        return list(merged.values())
+
+    def _send_with_retry(self, alerts: List[PendingAlert], connections: DispatchConnections, num_alerts: int) -> None:
+        channel_config = alerts[0].channel_config
+        for attempt in range(self.max_retries + 1):
+            try:
+                self.sender(channel_config, alerts, connections)
+                self._increment("sent", num_alerts)
+                return
+            except Exception as e:
+                logger.error(f"Alert delivery via '{channel_config.name}' failed (attempt {attempt + 1}): {str(e)}")
+                if attempt == self.max_retries or self._stop.is_set():
+                    break
+                self._increment("retries")
+                delay = min(self.backoff_seconds * (2 ** attempt), self.max_backoff_seconds)
+                self._stop.wait(delay)
+        self._increment("failed", num_alerts)
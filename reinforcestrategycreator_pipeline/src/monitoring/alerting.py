@@ -10,10 +10,13 @@ import json
 import requests
 
 from ..config.models import AlertManagerConfig, AlertRuleConfig, AlertChannelConfig, AlertChannelType
+from .alert_dispatcher import AlertDispatcher, DispatchConnections, PendingAlert
 from .logger import get_logger
 
 logger = get_logger("monitoring.alerting")
 
+SEVERITY_ORDER = ["info", "warning", "error", "critical"]
+
 class AlertManager:
     """
     Handles incoming events, matches them against rules, and sends alerts
@@ -29,7 +32,18 @@ class AlertManager:
         """
         self.config = config
         self.active_alerts: Dict[str, float] = {} # To track active alerts for deduplication: rule_name -> last_alert_timestamp
-        logger.info("AlertManager initialized.")
+        self.dispatcher: Optional[AlertDispatcher] = None
+        if config.async_dispatch:
+            self.dispatcher = AlertDispatcher(
+                self._send_batch,
+                max_queue_size=config.dispatch_queue_size,
+                num_workers=config.dispatch_workers,
+                batch_size=config.dispatch_batch_size,
+                batch_window_seconds=config.dispatch_batch_window_seconds,
+                max_retries=config.dispatch_max_retries,
+                backoff_seconds=config.dispatch_backoff_seconds
+            )
+        logger.info(f"AlertManager initialized ({'async' if self.dispatcher else 'inline'} dispatch).")
         for channel in config.channels:
             logger.info(f"Alert channel loaded: {channel.name} (Type: {channel.type.value}), Enabled: {channel.enabled}")
             if channel.type == AlertChannelType.EMAIL and not channel.details.get("email_to"):
@@ -159,27 +173,107 @@ class AlertManager:
         if tags:
             alert_body += f"Tags: {', '.join(tags)}\n"
         
-        logger.info(f"Dispatching alert via channel '{channel_config.name}' (Type: {channel_config.type.value})")
         logger.debug(f"Alert Title: {alert_title}")
         logger.debug(f"Alert Body:\n{alert_body}")
 
+        if self.dispatcher is not None:
+            # Hand off to the background queue; the caller never waits on delivery
+            self.dispatcher.submit(PendingAlert(channel_config, rule, alert_title, alert_body, event_data, tags))
+            return
+
+        logger.info(f"Dispatching alert via channel '{channel_config.name}' (Type: {channel_config.type.value})")
         try:
-            if channel_config.type == AlertChannelType.EMAIL:
-                self._send_email_alert(channel_config, alert_title, alert_body, rule)
-            elif channel_config.type == AlertChannelType.SLACK:
-                self._send_slack_alert(channel_config, alert_title, alert_body, rule)
-            elif channel_config.type == AlertChannelType.PAGERDUTY:
-                self._send_pagerduty_alert(channel_config, alert_title, alert_body, rule, event_data)
-            elif channel_config.type == AlertChannelType.DATADOG_EVENT:
-                # This is typically handled by MonitoringService.log_event directly
-                logger.info(f"Datadog event for rule '{rule.name}' should be handled by MonitoringService.log_event.")
-            else:
-                logger.warning(f"Alert channel type '{channel_config.type.value}' dispatch not implemented for rule '{rule.name}'.")
+            self._send_alert(channel_config, rule, alert_title, alert_body, event_data)
         except Exception as e:
             logger.error(f"Failed to dispatch alert via {channel_config.type.value}: {str(e)}")
+
+    def _send_alert(
+        self,
+        channel_config: AlertChannelConfig,
+        rule: AlertRuleConfig,
+        title: str,
+        body: str,
+        event_data: Dict[str, Any],
+        connections: Optional[DispatchConnections] = None
+    ) -> None:
+        """
+        Send one alert through a channel, raising on delivery failure.
+
+        Args:
+            connections: Reusable connections of a dispatch worker; when None a
+                fresh connection is opened for this alert.
+        """
+        session = connections.http_session if connections is not None else None
+        if channel_config.type == AlertChannelType.EMAIL:
+            if connections is None:
+                self._send_email_alert(channel_config, title, body, rule)
+                return
+            try:
+                self._send_email_alert(channel_config, title, body, rule, server=connections.smtp(channel_config.details))
+            except Exception:
+                # The cached connection may be stale; reconnect on the next attempt
+                connections.discard_smtp(channel_config.details)
+                raise
+        elif channel_config.type == AlertChannelType.SLACK:
+            self._send_slack_alert(channel_config, title, body, rule, session=session)
+        elif channel_config.type == AlertChannelType.PAGERDUTY:
+            self._send_pagerduty_alert(channel_config, title, body, rule, event_data, session=session)
+        elif channel_config.type == AlertChannelType.DATADOG_EVENT:
+            # This is typically handled by MonitoringService.log_event directly
+            logger.info(f"Datadog event for rule '{rule.name}' should be handled by MonitoringService.log_event.")
+        else:
+            logger.warning(f"Alert channel type '{channel_config.type.value}' dispatch not implemented for rule '{rule.name}'.")
+
+    def _send_batch(
+        self,
+        channel_config: AlertChannelConfig,
+        alerts: List[PendingAlert],
+        connections: DispatchConnections
+    ) -> None:
+        """
+        Deliver a coalesced batch of alerts for one channel.
+
+        Email and Slack receive a single digest message. PagerDuty keeps one
+        event per rule so that incidents stay deduplicated per rule; events
+        already sent are marked delivered, so a retry after a later event
+        fails does not trigger them again.
+        """
+        logger.info(f"Dispatching {len(alerts)} alert(s) via channel '{channel_config.name}' (Type: {channel_config.type.value})")
+        if len(alerts) == 1 or channel_config.type == AlertChannelType.PAGERDUTY:
+            for alert in alerts:
+                if alert.delivered:
+                    continue
+                title = alert.title if alert.count == 1 else f"{alert.title} (x{alert.count})"
+                self._send_alert(channel_config, alert.rule, title, alert.body, alert.event_data, connections)
+                alert.delivered = True
+            return
+
+        total = sum(alert.count for alert in alerts)
+        top = max(alerts, key=lambda a: SEVERITY_ORDER.index(a.rule.severity) if a.rule.severity in SEVERITY_ORDER else 0)
+        title = f"ALERT DIGEST [{top.rule.severity.upper()}]: {total} alerts from {len(alerts)} rules"
+        sections = []
+        for alert in alerts:
+            header = alert.title if alert.count == 1 else f"{alert.title} (x{alert.count})"
+            sections.append(f"{header}\n{alert.body}")
+        body = "\n\n".join(sections)
+        self._send_alert(channel_config, top.rule, title, body, top.event_data, connections)
+
+    def get_dispatch_stats(self) -> Dict[str, int]:
+        """Return background dispatch counters (empty when dispatching inline)."""
+        return self.dispatcher.get_stats() if self.dispatcher is not None else {}
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait for queued alerts to be delivered. Returns True if the queue drained."""
+        return self.dispatcher.flush(timeout) if self.dispatcher is not None else True
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """Deliver queued alerts and stop the background dispatch threads."""
+        if self.dispatcher is not None:
+            self.dispatcher.close(timeout)
     
-    def _send_email_alert(self, channel_config: AlertChannelConfig, title: str, body: str, rule: AlertRuleConfig) -> None:
-        """Send an email alert."""
+    def _send_email_alert(self, channel_config: AlertChannelConfig, title: str, body: str, rule: AlertRuleConfig,
+                          server: Optional[smtplib.SMTP] = None) -> None:
+        """Send an email alert, over ``server`` if an open connection is given."""
         email_to = channel_config.details.get("email_to")
         email_from = channel_config.details.get("email_from", "noreply@monitoring.local")
         smtp_host = channel_config.details.get("smtp_host", "localhost")
@@ -203,22 +297,26 @@ class AlertManager:
         
         # Send email
         try:
-            with smtplib.SMTP(smtp_host, smtp_port) as server:
-                if use_tls:
-                    server.starttls()
-                if smtp_username and smtp_password:
-                    server.login(smtp_username, smtp_password)
-                
-                recipients = [email_to] if isinstance(email_to, str) else email_to
+            if server is not None:
                 server.send_message(msg)
+            else:
+                with smtplib.SMTP(smtp_host, smtp_port) as server:
+                    if use_tls:
+                        server.starttls()
+                    if smtp_username and smtp_password:
+                        server.login(smtp_username, smtp_password)
+                    
+                    recipients = [email_to] if isinstance(email_to, str) else email_to
+                    server.send_message(msg)
                 
             logger.info(f"Email alert sent successfully to {email_to} for rule '{rule.name}'")
         except Exception as e:
             logger.error(f"Failed to send email alert: {str(e)}")
             raise
     
-    def _send_slack_alert(self, channel_config: AlertChannelConfig, title: str, body: str, rule: AlertRuleConfig) -> None:
-        """Send a Slack alert via webhook."""
+    def _send_slack_alert(self, channel_config: AlertChannelConfig, title: str, body: str, rule: AlertRuleConfig,
+                          session: Optional[requests.Session] = None) -> None:
+        """Send a Slack alert via webhook, reusing ``session`` if given."""
         webhook_url = channel_config.details.get("slack_webhook_url")
         channel = channel_config.details.get("slack_channel")  # Optional channel override
         username = channel_config.details.get("slack_username", "Monitoring Alert")
@@ -248,7 +346,8 @@ class AlertManager:
         
         # Send to Slack
         try:
-            response = requests.post(webhook_url, json=slack_message, timeout=10)
+            post = session.post if session is not None else requests.post
+            response = post(webhook_url, json=slack_message, timeout=10)
             response.raise_for_status()
             logger.info(f"Slack alert sent successfully for rule '{rule.name}'")
         except requests.exceptions.RequestException as e:
@@ -256,8 +355,9 @@ class AlertManager:
             raise
     
     def _send_pagerduty_alert(self, channel_config: AlertChannelConfig, title: str, body: str, 
-                             rule: AlertRuleConfig, event_data: Dict[str, Any]) -> None:
-        """Send a PagerDuty alert."""
+                             rule: AlertRuleConfig, event_data: Dict[str, Any],
+                             session: Optional[requests.Session] = None) -> None:
+        """Send a PagerDuty alert, reusing ``session`` if given."""
         service_key = channel_config.details.get("pagerduty_service_key")
         api_url = channel_config.details.get("pagerduty_api_url", "https://events.pagerduty.com/v2/enqueue")
         
@@ -284,7 +384,8 @@ class AlertManager:
         
         # Send to PagerDuty
         try:
-            response = requests.post(api_url, json=pagerduty_event, timeout=10)
+            post = session.post if session is not None else requests.post
+            response = post(api_url, json=pagerduty_event, timeout=10)
             response.raise_for_status()
             logger.info(f"PagerDuty alert sent successfully for rule '{rule.name}'")
         except requests.exceptions.RequestException as e:
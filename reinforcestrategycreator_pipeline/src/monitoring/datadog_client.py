@@ -1,5 +1,6 @@
 """Datadog integration for monitoring metrics and events."""
 
+import atexit
 import os
 import time
 from typing import Optional, Dict, Any, List, Union
@@ -26,6 +27,7 @@ except ImportError:
     statsd = MockStatsd()
 
 from .logger import get_logger
+from .metrics_aggregator import MetricsAggregator, UDPMetricsSink
 
 
 class DatadogClient:
@@ -46,6 +48,8 @@ class DatadogClient:
             self.logger = get_logger("datadog")
             self.enabled = False
             self.metrics_prefix = "model_pipeline"
+            self.aggregator: Optional[MetricsAggregator] = None
+            self._flush_at_exit_registered = False
             self._initialized = True
     
     def configure(
@@ -103,6 +107,53 @@ class DatadogClient:
             self.logger.error(f"Failed to initialize Datadog: {e}")
             self.enabled = False
     
+    def configure_aggregation(
+        self,
+        enabled: bool = True,
+        sink: Optional[Any] = None,
+        **aggregator_options: Any
+    ) -> None:
+        """
+        Aggregate metrics in process and send them in batches.
+
+        While aggregation is configured, increment, gauge, histogram and
+        timing calls are recorded by a MetricsAggregator and flushed as packed
+        DogStatsD datagrams instead of being sent one packet per call.
+
+        Args:
+            enabled: Whether to aggregate; False flushes and removes the aggregator
+            sink: Destination with a send(datagram) method. Defaults to UDP
+                to DATADOG_STATSD_HOST:DATADOG_STATSD_PORT
+            **aggregator_options: Options passed to MetricsAggregator
+        """
+        if self.aggregator is not None:
+            self.aggregator.close()
+            self.aggregator = None
+        if not enabled:
+            return
+
+        if sink is None:
+            sink = UDPMetricsSink(
+                os.getenv("DATADOG_STATSD_HOST", "localhost"),
+                int(os.getenv("DATADOG_STATSD_PORT", "8125"))
+            )
+        self.aggregator = MetricsAggregator(sink, **aggregator_options)
+        if not self._flush_at_exit_registered:
+            atexit.register(self.flush)
+            self._flush_at_exit_registered = True
+        self.logger.info("Client-side metric aggregation enabled")
+
+    def flush(self) -> int:
+        """
+        Send all aggregated metrics now.
+
+        Returns:
+            Number of metric lines sent (0 when aggregation is not configured)
+        """
+        if self.aggregator is None:
+            return 0
+        return self.aggregator.flush()
+
     def _format_metric_name(self, metric: str) -> str:
         """Format metric name with prefix."""
         return f"{self.metrics_prefix}.{metric}"
@@ -123,6 +174,9 @@ class DatadogClient:
         """
         if not self.enabled:
             return
+        if self.aggregator is not None:
+            self.aggregator.increment(self._format_metric_name(metric), value, tags)
+            return
         
         try:
             statsd.increment(
@@ -149,6 +203,9 @@ class DatadogClient:
         """
         if not self.enabled:
             return
+        if self.aggregator is not None:
+            self.aggregator.gauge(self._format_metric_name(metric), value, tags)
+            return
         
         try:
             statsd.gauge(
@@ -175,6 +232,9 @@ class DatadogClient:
         """
         if not self.enabled:
             return
+        if self.aggregator is not None:
+            self.aggregator.histogram(self._format_metric_name(metric), value, tags)
+            return
         
         try:
             statsd.histogram(
@@ -201,6 +261,9 @@ class DatadogClient:
         """
         if not self.enabled:
             return
+        if self.aggregator is not None:
+            self.aggregator.histogram(self._format_metric_name(metric), value, tags)
+            return
         
         try:
             statsd.timing(
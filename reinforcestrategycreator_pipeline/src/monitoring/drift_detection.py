@@ -1,7 +1,11 @@
 """
 Mechanisms for detecting data and model drift.
 """
+from dataclasses import dataclass
+from pathlib import Path
 from typing import Any, Dict, Optional, List, Union
+import json
+import tempfile
 import numpy as np
 import pandas as pd
 
@@ -41,6 +45,279 @@ from .logger import get_logger
 
 logger = get_logger("monitoring.drift_detection")
 
+
+@dataclass
+class NumericFeatureProfile:
+    """Reference statistics of one numerical feature."""
+    bin_edges: np.ndarray  # PSI bin edges from reference deciles (empty if the feature cannot be binned)
+    bin_counts: np.ndarray  # Reference counts per PSI bin
+    values: np.ndarray  # Sorted unique reference values
+    ecdf: np.ndarray  # Reference ECDF evaluated at ``values``
+    count: int  # Number of non-missing reference values
+
+
+@dataclass
+class CategoricalFeatureProfile:
+    """Reference statistics of one categorical feature."""
+    categories: List[Any]
+    counts: np.ndarray
+
+
+@dataclass
+class ReferenceProfile:
+    """
+    Reference statistics for drift detection, computed once per reference window.
+
+    Holds everything PSI, KS and Chi-squared need from the reference data, so
+    scoring a batch only has to bin the current data.
+    """
+    numeric: Dict[str, NumericFeatureProfile]
+    categorical: Dict[str, CategoricalFeatureProfile]
+    n_samples: int
+
+    @classmethod
+    def fit(cls, reference_data: pd.DataFrame, n_bins: int = 10) -> "ReferenceProfile":
+        """
+        Compute a profile from reference data.
+
+        Args:
+            reference_data: Reference dataset
+            n_bins: Number of quantile bins for PSI
+
+        Returns:
+            The fitted profile
+        """
+        numeric = {}
+        for column in reference_data.select_dtypes(include=[np.number]).columns:
+            values = reference_data[column].dropna().to_numpy(dtype=float)
+            try:
+                _, bin_edges = pd.qcut(values, q=n_bins, retbins=True, duplicates='drop')
+                bin_counts, _ = np.histogram(values, bins=bin_edges)
+            except Exception as e:
+                logger.warning(f"Could not compute PSI bins for column {column}: {str(e)}")
+                bin_edges, bin_counts = np.empty(0), np.empty(0, dtype=np.int64)
+            unique_values, unique_counts = np.unique(values, return_counts=True)
+            numeric[column] = NumericFeatureProfile(
+                bin_edges=np.asarray(bin_edges, dtype=float),
+                bin_counts=np.asarray(bin_counts, dtype=np.int64),
+                values=unique_values,
+                ecdf=np.cumsum(unique_counts) / max(len(values), 1),
+                count=len(values)
+            )
+
+        categorical = {}
+        for column in reference_data.select_dtypes(include=['object', 'category']).columns:
+            counts = reference_data[column].value_counts()
+            categorical[column] = CategoricalFeatureProfile(
+                categories=counts.index.tolist(),
+                counts=counts.to_numpy(dtype=np.int64)
+            )
+
+        return cls(numeric=numeric, categorical=categorical, n_samples=len(reference_data))
+
+    def save(self, path: Union[str, Path]) -> Path:
+        """
+        Save the profile as a single ``.npz`` file.
+
+        Args:
+            path: Destination file path
+
+        Returns:
+            Path of the written file
+        """
+        path = Path(path)
+        arrays = {}
+        for i, (name, feature) in enumerate(self.numeric.items()):
+            arrays[f"numeric_{i}_bin_edges"] = feature.bin_edges
+            arrays[f"numeric_{i}_bin_counts"] = feature.bin_counts
+            arrays[f"numeric_{i}_values"] = feature.values
+            arrays[f"numeric_{i}_ecdf"] = feature.ecdf
+        for i, feature in enumerate(self.categorical.values()):
+            arrays[f"categorical_{i}_counts"] = feature.counts
+        meta = {
+            "n_samples": self.n_samples,
+            "numeric": [[name, feature.count] for name, feature in self.numeric.items()],
+            "categorical": [[name, feature.categories] for name, feature in self.categorical.items()]
+        }
+        arrays["meta"] = np.array(json.dumps(meta, default=str))
+        with open(path, "wb") as f:
+            np.savez(f, **arrays)
+        return path
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "ReferenceProfile":
+        """
+        Load a profile written by ``save``.
+
+        Args:
+            path: Path to the ``.npz`` file
+
+        Returns:
+            The loaded profile
+        """
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(str(data["meta"]))
+            numeric = {
+                name: NumericFeatureProfile(
+                    bin_edges=data[f"numeric_{i}_bin_edges"],
+                    bin_counts=data[f"numeric_{i}_bin_counts"],
+                    values=data[f"numeric_{i}_values"],
+                    ecdf=data[f"numeric_{i}_ecdf"],
+                    count=count
+                )
+                for i, (name, count) in enumerate(meta["numeric"])
+            }
+            categorical = {
+                name: CategoricalFeatureProfile(categories=categories, counts=data[f"categorical_{i}_counts"])
+                for i, (name, categories) in enumerate(meta["categorical"])
+            }
+        return cls(numeric=numeric, categorical=categorical, n_samples=meta["n_samples"])
+
+
+class DriftAccumulator:
+    """
+    Running counts of current data against a reference profile.
+
+    Each batch is mapped onto the profile's PSI bins, its KS grid (the sorted
+    reference values, with separate slots for values between and equal to
+    them) and its categories, and all counts are added with a single
+    ``np.bincount``. PSI, KS and Chi-squared scores are computed from the
+    counts, so scoring batches one at a time gives the same result as scoring
+    them concatenated.
+    """
+
+    def __init__(self, profile: ReferenceProfile, methods: Optional[List[str]] = None):
+        """
+        Initialize empty counts for a profile.
+
+        Args:
+            profile: Reference profile to score against
+            methods: Methods to keep counts for ("psi", "ks", "chi2"); all if None
+        """
+        self.profile = profile
+        methods = set(methods or ["psi", "ks", "chi2"])
+        self._slices: Dict[str, Dict[str, slice]] = {"psi": {}, "ks": {}, "chi2": {}}
+        offset = 0
+        for name, feature in profile.numeric.items():
+            n_bins = max(len(feature.bin_edges) - 1, 0)
+            if "psi" in methods and n_bins > 0:
+                self._slices["psi"][name] = slice(offset, offset + n_bins)
+                offset += n_bins
+            if "ks" in methods:
+                self._slices["ks"][name] = slice(offset, offset + 2 * len(feature.values) + 1)
+                offset += 2 * len(feature.values) + 1
+        for name, feature in profile.categorical.items() if "chi2" in methods else []:
+            # Last slot counts categories not seen in the reference data
+            self._slices["chi2"][name] = slice(offset, offset + len(feature.categories) + 1)
+            offset += len(feature.categories) + 1
+        self._size = offset
+        self.counts = np.zeros(self._size, dtype=np.int64)
+        self.n_samples = 0
+        self._category_codes = {
+            name: {category: code for code, category in enumerate(feature.categories)}
+            for name, feature in profile.categorical.items()
+        }
+
+    def reset(self) -> None:
+        """Forget all accumulated data."""
+        self.counts[:] = 0
+        self.n_samples = 0
+
+    def update(self, current_data: pd.DataFrame) -> None:
+        """
+        Add a batch of current data to the counts.
+
+        Args:
+            current_data: Batch with (a subset of) the profiled columns
+        """
+        indices = []
+        for name, feature in self.profile.numeric.items():
+            psi_slice = self._slices["psi"].get(name)
+            ks_slice = self._slices["ks"].get(name)
+            if name not in current_data.columns or (psi_slice is None and ks_slice is None):
+                continue
+            values = current_data[name].to_numpy(dtype=float)
+            values = values[~np.isnan(values)]
+
+            if psi_slice is not None:
+                edges = feature.bin_edges
+                bins = np.searchsorted(edges, values, side='right') - 1
+                bins[values == edges[-1]] = len(edges) - 2  # Last bin is closed, as in np.histogram
+                in_range = (bins >= 0) & (bins < len(edges) - 1)
+                indices.append(bins[in_range] + psi_slice.start)
+
+            if ks_slice is not None:
+                grid = feature.values
+                position = np.searchsorted(grid, values, side='left')
+                equal = grid[np.minimum(position, len(grid) - 1)] == values if len(grid) else np.zeros(len(values), bool)
+                indices.append(2 * position + equal + ks_slice.start)
+
+        for name in self._slices["chi2"]:
+            if name not in current_data.columns:
+                continue
+            column = current_data[name].dropna()
+            codes = self._category_codes[name]
+            unseen = len(codes)
+            mapped = column.map(codes).fillna(unseen).to_numpy(dtype=np.int64)
+            indices.append(mapped + self._slices["chi2"][name].start)
+
+        if indices:
+            self.counts += np.bincount(np.concatenate(indices), minlength=self._size)
+        self.n_samples += len(current_data)
+
+    def psi_scores(self) -> Dict[str, float]:
+        """PSI per numerical feature, with the same smoothing as the per-call calculation."""
+        scores = {}
+        for name, feature_slice in self._slices["psi"].items():
+            curr_counts = self.counts[feature_slice]
+            ref_counts = self.profile.numeric[name].bin_counts
+            n_bins = len(ref_counts)
+            ref_props = (ref_counts + 1) / (ref_counts.sum() + n_bins)
+            curr_props = (curr_counts + 1) / (curr_counts.sum() + n_bins)
+            scores[name] = float(np.sum((curr_props - ref_props) * np.log(curr_props / ref_props)))
+        return scores
+
+    def ks_results(self) -> Dict[str, Dict[str, float]]:
+        """Two-sample KS statistic and asymptotic p-value per numerical feature."""
+        results = {}
+        for name, feature_slice in self._slices["ks"].items():
+            feature = self.profile.numeric[name]
+            slots = self.counts[feature_slice]
+            m, n = slots.sum(), feature.count
+            if m == 0 or n == 0:
+                continue
+            cumulative = np.cumsum(slots) / m
+            below = cumulative[0::2]  # Share of current values < each reference value (and overall)
+            at_or_below = np.concatenate([[0.0], cumulative[1::2]])
+            ref_before = np.concatenate([[0.0], feature.ecdf])
+            statistic = float(max(
+                np.max(np.abs(ref_before - at_or_below)),
+                np.max(np.abs(ref_before - below))
+            ))
+            p_value = float(stats.kstwo.sf(statistic, np.round(m * n / (m + n))))
+            results[name] = {"statistic": statistic, "p_value": p_value}
+        return results
+
+    def chi2_results(self) -> Dict[str, Dict[str, float]]:
+        """Chi-squared statistic and p-value per categorical feature."""
+        results = {}
+        for name, feature_slice in self._slices["chi2"].items():
+            observed = self.counts[feature_slice]
+            ref_counts = self.profile.categorical[name].counts
+            curr_total, ref_total = observed.sum(), ref_counts.sum()
+            if curr_total == 0 or ref_total == 0:
+                continue
+            if observed[-1] > 0:
+                # Categories missing from the reference have zero expected frequency
+                results[name] = {"statistic": float("inf"), "p_value": 0.0}
+                continue
+            expected = ref_counts * (curr_total / ref_total)
+            statistic = float(np.sum((observed[:-1] - expected) ** 2 / expected))
+            p_value = float(stats.chi2.sf(statistic, len(expected) - 1))
+            results[name] = {"statistic": statistic, "p_value": p_value}
+        return results
+
+
 class DataDriftDetector:
     """Detects drift in input data distributions."""
 
@@ -52,15 +329,118 @@ class DataDriftDetector:
             config: Configuration for data drift detection.
         """
         self.config = config
+        self.reference_profile: Optional[ReferenceProfile] = None
+        self._accumulator: Optional[DriftAccumulator] = None
         logger.info(f"DataDriftDetector initialized with method: {config.method.value}, threshold: {config.threshold}")
 
-    def detect(self, current_data: Any, reference_data: Any) -> Dict[str, Any]:
+    def fit_reference(self, reference_data: Any) -> ReferenceProfile:
+        """
+        Compute and keep a reference profile for repeated drift checks.
+
+        Args:
+            reference_data: The reference dataset (e.g., pandas DataFrame).
+
+        Returns:
+            The fitted reference profile
+        """
+        if not isinstance(reference_data, pd.DataFrame):
+            reference_data = pd.DataFrame(reference_data)
+        features = self.config.features_to_monitor
+        if features:
+            reference_data = reference_data[[f for f in features if f in reference_data.columns]]
+        self.set_reference_profile(ReferenceProfile.fit(reference_data))
+        logger.info(f"Reference profile fitted on {len(reference_data)} samples")
+        return self.reference_profile
+
+    def set_reference_profile(self, profile: ReferenceProfile) -> None:
+        """Use a previously fitted profile and reset incremental scoring."""
+        self.reference_profile = profile
+        self._accumulator = DriftAccumulator(profile, methods=[self.config.method.value])
+
+    def save_reference_profile(self, artifact_store: Any, artifact_id: str, version: Optional[str] = None) -> Any:
+        """
+        Persist the fitted reference profile in an artifact store.
+
+        Args:
+            artifact_store: Artifact store to save to
+            artifact_id: Artifact ID for the profile
+            version: Optional artifact version
+
+        Returns:
+            Metadata of the saved artifact
+        """
+        from ..artifact_store.base import ArtifactType
+
+        if self.reference_profile is None:
+            raise ValueError("No reference profile fitted")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = self.reference_profile.save(Path(tmp_dir) / "reference_profile.npz")
+            return artifact_store.save_artifact(
+                artifact_id=artifact_id,
+                artifact_path=path,
+                artifact_type=ArtifactType.OTHER,
+                version=version,
+                metadata={
+                    "kind": "drift_reference_profile",
+                    "n_samples": self.reference_profile.n_samples,
+                    "numeric_features": list(self.reference_profile.numeric),
+                    "categorical_features": list(self.reference_profile.categorical)
+                },
+                description="Reference profile for data drift detection"
+            )
+
+    def load_reference_profile(self, artifact_store: Any, artifact_id: str, version: Optional[str] = None) -> ReferenceProfile:
+        """
+        Load a reference profile from an artifact store and use it.
+
+        Args:
+            artifact_store: Artifact store to load from
+            artifact_id: Artifact ID of the profile
+            version: Optional artifact version (latest if not provided)
+
+        Returns:
+            The loaded reference profile
+        """
+        from ..artifact_store.base import ArtifactType
+
+        path = Path(artifact_store.load_artifact(artifact_id, ArtifactType.OTHER, version=version))
+        if path.is_dir():
+            path = path / "reference_profile.npz"
+        self.set_reference_profile(ReferenceProfile.load(path))
+        return self.reference_profile
+
+    def update(self, current_batch: Any) -> Dict[str, Any]:
+        """
+        Add a streaming batch and score all data seen since the last reset.
+
+        Args:
+            current_batch: The next batch of current data.
+
+        Returns:
+            Drift detection results in the same format as ``detect``
+        """
+        if self._accumulator is None:
+            raise ValueError("No reference profile fitted; call fit_reference first")
+        if not isinstance(current_batch, pd.DataFrame):
+            current_batch = pd.DataFrame(current_batch)
+        self._accumulator.update(current_batch)
+        return self._score(self._accumulator)
+
+    def reset_stream(self) -> None:
+        """Forget the batches accumulated by ``update``."""
+        if self._accumulator is not None:
+            self._accumulator.reset()
+
+    def detect(self, current_data: Any, reference_data: Any = None) -> Dict[str, Any]:
         """
         Detects data drift between current and reference data.
 
         Args:
             current_data: The current batch of data (e.g., pandas DataFrame).
-            reference_data: The reference dataset (e.g., pandas DataFrame).
+            reference_data: The reference dataset (e.g., pandas DataFrame), a
+                ReferenceProfile, or None to use the profile from ``fit_reference``.
+                Profiles are scored in one vectorized pass; KS p-values are then
+                asymptotic.
 
         Returns:
             A dictionary containing drift detection results:
@@ -76,6 +456,24 @@ class DataDriftDetector:
         # Convert to pandas DataFrames if not already
         if not isinstance(current_data, pd.DataFrame):
             current_data = pd.DataFrame(current_data)
+
+        if reference_data is None or isinstance(reference_data, ReferenceProfile):
+            profile = reference_data if reference_data is not None else self.reference_profile
+            if profile is None:
+                raise ValueError("No reference data given and no reference profile fitted")
+            try:
+                accumulator = DriftAccumulator(profile, methods=[self.config.method.value])
+                accumulator.update(current_data)
+                return self._score(accumulator)
+            except Exception as e:
+                logger.error(f"Error during drift detection: {str(e)}")
+                return {
+                    "drift_detected": False,
+                    "score": 0.0,
+                    "method": self.config.method.value,
+                    "details": {"error": str(e)}
+                }
+
         if not isinstance(reference_data, pd.DataFrame):
             reference_data = pd.DataFrame(reference_data)
         
@@ -118,6 +516,60 @@ class DataDriftDetector:
                 "details": {"error": str(e)}
             }
     
+    def _score(self, accumulator: DriftAccumulator) -> Dict[str, Any]:
+        """Turn accumulated counts into a drift result for the configured method."""
+        method = self.config.method
+        if method == DataDriftDetectionMethod.PSI:
+            psi_scores = accumulator.psi_scores()
+            avg_psi = sum(psi_scores.values()) / len(psi_scores) if psi_scores else 0.0
+            return {
+                "drift_detected": avg_psi > self.config.threshold,
+                "score": avg_psi,
+                "method": method.value,
+                "details": {
+                    "feature_scores": psi_scores,
+                    "message": f"Average PSI: {avg_psi:.4f}"
+                }
+            }
+
+        if method not in (DataDriftDetectionMethod.KS, DataDriftDetectionMethod.CHI2):
+            logger.warning(f"Unsupported data drift detection method: {method.value}")
+            return {
+                "drift_detected": False,
+                "score": 0.0,
+                "method": method.value,
+                "details": {"error": "Unsupported method"}
+            }
+        if not _import_scipy():
+            return {
+                "drift_detected": False,
+                "score": 1.0,
+                "method": method.value,
+                "details": {"error": f"scipy not available for {method.value} test"}
+            }
+
+        if method == DataDriftDetectionMethod.KS:
+            results = accumulator.ks_results()
+        else:
+            if not accumulator.profile.categorical:
+                return {
+                    "drift_detected": False,
+                    "score": 1.0,
+                    "method": method.value,
+                    "details": {"error": "No categorical features found"}
+                }
+            results = accumulator.chi2_results()
+        min_p_value = min([r["p_value"] for r in results.values()] + [1.0])
+        return {
+            "drift_detected": min_p_value < self.config.threshold,
+            "score": min_p_value,
+            "method": method.value,
+            "details": {
+                "feature_results": results,
+                "message": f"Minimum p-value: {min_p_value:.4f}"
+            }
+        }
+
     def _calculate_psi(self, current_data: pd.DataFrame, reference_data: pd.DataFrame) -> Dict[str, Any]:
         """Calculate Population Stability Index (PSI) for numerical features."""
         psi_scores = {}
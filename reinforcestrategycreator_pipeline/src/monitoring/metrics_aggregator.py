@@ -0,0 +1,412 @@
+"""Client-side aggregation of statsd metrics.
+
+Instead of sending one UDP packet per metric call, metrics are aggregated in
+process and flushed periodically as packed multi-metric DogStatsD datagrams:
+
+- counters are summed,
+- gauges keep the last, minimum and maximum value,
+- histograms are recorded in a mergeable relative-error sketch and reported
+  as count/avg/min/max and configured percentiles.
+
+A flush happens when the flush interval has elapsed or when the number of
+distinct pending series reaches a threshold, and can be forced with
+``MetricsAggregator.flush``. A background timer also flushes once the interval
+has elapsed, so a rarely updated series is not held back until the next call.
+"""
+
+import math
+import socket
+import threading
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .logger import get_logger
+
+logger = get_logger("monitoring.metrics_aggregator")
+
+# (metric name, tags) identifies one aggregated series
+SeriesKey = Tuple[str, Tuple[str, ...]]
+
+
+class HistogramSketch:
+    """
+    Mergeable quantile sketch with bounded relative error.
+
+    Values are counted in logarithmically sized buckets so that any quantile
+    is returned within ``relative_accuracy`` of the true value. Two sketches
+    with the same accuracy can be merged by adding their bucket counts, which
+    makes it possible to combine histograms from several workers or flush
+    intervals.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        """
+        Initialize an empty sketch.
+
+        Args:
+            relative_accuracy: Maximum relative error of reported quantiles
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.positive: Dict[int, int] = {}
+        self.negative: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        """Record a value."""
+        if value > 0:
+            key = math.ceil(math.log(value) / self._log_gamma)
+            self.positive[key] = self.positive.get(key, 0) + 1
+        elif value < 0:
+            key = math.ceil(math.log(-value) / self._log_gamma)
+            self.negative[key] = self.negative.get(key, 0) + 1
+        else:
+            self.zero_count += 1
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def add_many(self, values: np.ndarray) -> None:
+        """Record an array of values with one vectorized bucket computation."""
+        values = np.asarray(values, dtype=float)
+        if values.size == 0:
+            return
+        for sign, store in ((1, self.positive), (-1, self.negative)):
+            magnitudes = values[values * sign > 0] * sign
+            if magnitudes.size:
+                keys, counts = np.unique(np.ceil(np.log(magnitudes) / self._log_gamma), return_counts=True)
+                for key, count in zip(keys.astype(int).tolist(), counts.tolist()):
+                    store[key] = store.get(key, 0) + count
+        self.zero_count += int(np.count_nonzero(values == 0))
+        self.count += values.size
+        self.sum += float(values.sum())
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+
+    def merge(self, other: "HistogramSketch") -> None:
+        """
+        Add the values recorded in another sketch to this one.
+
+        Args:
+            other: Sketch with the same relative accuracy
+
+        Raises:
+            ValueError: If the sketches use different accuracies
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        for key, count in other.positive.items():
+            self.positive[key] = self.positive.get(key, 0) + count
+        for key, count in other.negative.items():
+            self.negative[key] = self.negative.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def avg(self) -> float:
+        """Mean of the recorded values."""
+        return self.sum / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a quantile of the recorded values.
+
+        Args:
+            q: Quantile between 0 and 1
+
+        Returns:
+            Estimated value, or None if the sketch is empty
+        """
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+
+        # Most negative values sit in the largest negative buckets
+        for key in sorted(self.negative, reverse=True):
+            seen += self.negative[key]
+            if seen > rank:
+                return self._clamp(-self._bucket_value(key))
+        seen += self.zero_count
+        if seen > rank:
+            return self._clamp(0.0)
+        for key in sorted(self.positive):
+            seen += self.positive[key]
+            if seen > rank:
+                return self._clamp(self._bucket_value(key))
+        return self.max
+
+    def _bucket_value(self, key: int) -> float:
+        return 2 * self._gamma ** key / (self._gamma + 1)
+
+    def _clamp(self, value: float) -> float:
+        return min(max(value, self.min), self.max)
+
+
+class InMemoryMetricsSink:
+    """Sink that keeps flushed datagrams in memory, for tests and benchmarks."""
+
+    def __init__(self):
+        self.datagrams: List[str] = []
+
+    def send(self, datagram: str) -> None:
+        """Store a datagram."""
+        self.datagrams.append(datagram)
+
+    @property
+    def lines(self) -> List[str]:
+        """All metric lines across the stored datagrams."""
+        return [line for datagram in self.datagrams for line in datagram.split("\n")]
+
+    def clear(self) -> None:
+        """Forget all stored datagrams."""
+        self.datagrams.clear()
+
+
+class UDPMetricsSink:
+    """Sink that sends datagrams to a DogStatsD agent over UDP."""
+
+    def __init__(self, host: str = "localhost", port: int = 8125):
+        """
+        Initialize the sink.
+
+        Args:
+            host: Statsd agent host
+            port: Statsd agent port
+        """
+        self.address = (host, port)
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._socket.setblocking(False)
+
+    def send(self, datagram: str) -> None:
+        """Send a datagram, logging instead of raising on socket errors."""
+        try:
+            self._socket.sendto(datagram.encode("utf-8"), self.address)
+        except OSError as e:
+            logger.debug(f"Failed to send metrics datagram: {e}")
+
+    def close(self) -> None:
+        """Close the socket."""
+        self._socket.close()
+
+
+class MetricsAggregator:
+    """
+    Aggregates counters, gauges and histograms and flushes them in batches.
+
+    The aggregator is thread-safe. Sinks only need a ``send(datagram: str)``
+    method. Call ``close`` to stop the background flush timer and send what is
+    still pending.
+    """
+
+    def __init__(
+        self,
+        sink,
+        flush_interval_seconds: float = 10.0,
+        max_pending_metrics: int = 1000,
+        max_packet_size: int = 1432,
+        relative_accuracy: float = 0.01,
+        percentiles: Sequence[float] = (0.5, 0.95, 0.99),
+        background_flush: bool = True
+    ):
+        """
+        Initialize the aggregator.
+
+        Args:
+            sink: Destination for flushed datagrams
+            flush_interval_seconds: Flush when this much time has passed since the last flush
+            max_pending_metrics: Flush when this many distinct series are pending
+            max_packet_size: Maximum size in bytes of one datagram
+            relative_accuracy: Relative accuracy of histogram sketches
+            percentiles: Histogram percentiles to report, between 0 and 1
+            background_flush: Run a timer thread that flushes pending metrics
+                once flush_interval_seconds has passed without a flush
+        """
+        self.sink = sink
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_pending_metrics = max(1, max_pending_metrics)
+        self.max_packet_size = max_packet_size
+        self.relative_accuracy = relative_accuracy
+        self.percentiles = tuple(percentiles)
+
+        self._lock = threading.Lock()
+        self._counters: Dict[SeriesKey, float] = {}
+        self._gauges: Dict[SeriesKey, List[float]] = {}
+        self._histograms: Dict[SeriesKey, HistogramSketch] = {}
+        self._last_flush = time.monotonic()
+        self.stats = {"calls": 0, "flushes": 0, "datagrams": 0, "lines": 0}
+
+        self._closed = threading.Event()
+        self._timer: Optional[threading.Thread] = None
+        if background_flush:
+            self._timer = threading.Thread(target=self._flush_loop, name="metrics-flush", daemon=True)
+            self._timer.start()
+
+    def increment(self, name: str, value: float = 1, tags: Optional[Sequence[str]] = None) -> None:
+        """Add to a counter."""
+        key = (name, tuple(tags) if tags else ())
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+            due = self._record_call()
+        if due:
+            self.flush()
+
+    def gauge(self, name: str, value: float, tags: Optional[Sequence[str]] = None) -> None:
+        """Set a gauge, keeping its minimum and maximum since the last flush."""
+        key = (name, tuple(tags) if tags else ())
+        with self._lock:
+            current = self._gauges.get(key)
+            if current is None:
+                self._gauges[key] = [value, value, value]
+            else:
+                current[0] = value
+                if value < current[1]:
+                    current[1] = value
+                if value > current[2]:
+                    current[2] = value
+            due = self._record_call()
+        if due:
+            self.flush()
+
+    def histogram(self, name: str, value: float, tags: Optional[Sequence[str]] = None) -> None:
+        """Record a value in a histogram."""
+        key = (name, tuple(tags) if tags else ())
+        with self._lock:
+            sketch = self._histograms.get(key)
+            if sketch is None:
+                sketch = self._histograms[key] = HistogramSketch(self.relative_accuracy)
+            sketch.add(value)
+            due = self._record_call()
+        if due:
+            self.flush()
+
+    @property
+    def pending(self) -> int:
+        """Number of distinct series waiting to be flushed."""
+        with self._lock:
+            return len(self._counters) + len(self._gauges) + len(self._histograms)
+
+    def flush(self) -> int:
+        """
+        Send all pending metrics to the sink.
+
+        Returns:
+            Number of metric lines sent
+        """
+        with self._lock:
+            counters, self._counters = self._counters, {}
+            gauges, self._gauges = self._gauges, {}
+            histograms, self._histograms = self._histograms, {}
+            self._last_flush = time.monotonic()
+
+        lines = []
+        for (name, tags), value in counters.items():
+            lines.append(self._format_line(name, value, "c", tags))
+        for (name, tags), (last, low, high) in gauges.items():
+            lines.append(self._format_line(name, last, "g", tags))
+            lines.append(self._format_line(f"{name}.min", low, "g", tags))
+            lines.append(self._format_line(f"{name}.max", high, "g", tags))
+        for (name, tags), sketch in histograms.items():
+            lines.append(self._format_line(f"{name}.count", sketch.count, "c", tags))
+            lines.append(self._format_line(f"{name}.avg", sketch.avg, "g", tags))
+            lines.append(self._format_line(f"{name}.min", sketch.min, "g", tags))
+            lines.append(self._format_line(f"{name}.max", sketch.max, "g", tags))
+            for q in self.percentiles:
+                suffix = "median" if q == 0.5 else f"{round(q * 100):g}percentile"
+                lines.append(self._format_line(f"{name}.{suffix}", sketch.quantile(q), "g", tags))
+
+        datagrams = self._pack(lines)
+        for datagram in datagrams:
+            try:
+                self.sink.send(datagram)
+            except Exception as e:
+                logger.error(f"Failed to send metrics datagram: {e}")
+
+        with self._lock:
+            self.stats["flushes"] += 1
+            self.stats["datagrams"] += len(datagrams)
+            self.stats["lines"] += len(lines)
+        return len(lines)
+
+    def close(self) -> int:
+        """
+        Stop the background flush timer and send all pending metrics.
+
+        Returns:
+            Number of metric lines sent by the final flush
+        """
+        self._closed.set()
+        if self._timer is not None and self._timer is not threading.current_thread():
+            self._timer.join(timeout=1.0)
+        return self.flush()
+
+    def _flush_loop(self) -> None:
+        """Flush pending metrics whenever the interval passes without a call-triggered flush."""
+        while True:
+            with self._lock:
+                wait = self._last_flush + self.flush_interval_seconds - time.monotonic()
+            if self._closed.wait(max(wait, 0.01)):
+                return
+            with self._lock:
+                due = (
+                    time.monotonic() - self._last_flush >= self.flush_interval_seconds
+                    and (self._counters or self._gauges or self._histograms)
+                )
+            if due:
+                self.flush()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Return call, flush, datagram and line counters plus the pending series count."""
+        with self._lock:
+            stats = dict(self.stats)
+            stats["pending"] = len(self._counters) + len(self._gauges) + len(self._histograms)
+        return stats
+
+    def _record_call(self) -> bool:
+        """Count a call and decide whether a flush is due. Caller holds the lock."""
+        self.stats["calls"] += 1
+        pending = len(self._counters) + len(self._gauges) + len(self._histograms)
+        return (
+            pending >= self.max_pending_metrics
+            or time.monotonic() - self._last_flush >= self.flush_interval_seconds
+        )
+
+    @staticmethod
+    def _format_line(name: str, value: float, metric_type: str, tags: Tuple[str, ...]) -> str:
+        value = float(value)
+        formatted = str(int(value)) if value.is_integer() else repr(value)
+        line = f"{name}:{formatted}|{metric_type}"
+        if tags:
+            line += "|#" + ",".join(tags)
+        return line
+
+    def _pack(self, lines: List[str]) -> List[str]:
+        """Join lines into newline-separated datagrams no larger than max_packet_size."""
+        datagrams = []
+        current: List[str] = []
+        size = 0
+        for line in lines:
+            line_size = len(line.encode("utf-8"))
+            if current and size + 1 + line_size > self.max_packet_size:
+                datagrams.append("\n".join(current))
+                current, size = [], 0
+            size += line_size + (1 if current else 0)
+            current.append(line)
+        if current:
+            datagrams.append("\n".join(current))
+        return datagrams
@@ -1,7 +1,9 @@
 """Main monitoring service that integrates logging and metrics."""
 
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 import os
+import time
+from datetime import datetime
 from pathlib import Path
 
 from ..config.models import (
@@ -14,12 +16,14 @@ from ..config.models import (
     AlertManagerConfig,
     AlertRuleConfig,
     AlertChannelConfig,
-    AlertChannelType
+    AlertChannelType,
+    StreamingDriftConfig
 )
 from .logger import configure_logging, get_logger, log_with_context
 from .datadog_client import configure_datadog, datadog_client, track_pipeline_event
 from .drift_detection import DataDriftDetector, ModelDriftDetector
 from .alerting import AlertManager
+from .streaming_drift import StreamingDriftMonitor
 
 
 class MonitoringService:
@@ -43,6 +47,8 @@ class MonitoringService:
         self.alert_manager_config: Optional[AlertManagerConfig] = None
         self.alert_manager: Optional[AlertManager] = None
         self.deployment_manager = deployment_manager
+        self._deployment_tags_cache: Dict[Tuple[str, str], Tuple[float, List[str]]] = {}
+        self._log_each_metric = True
         
         if config:
             self.initialize(config)
@@ -133,6 +139,18 @@ class MonitoringService:
             self.logger.info("Datadog integration configured")
         else:
             self.logger.warning("Datadog API key not provided")
+        
+        # Aggregate metrics client-side if configured; a disabled client sends nothing
+        aggregation_config = self.config.metrics_aggregation
+        if aggregation_config and aggregation_config.enabled and datadog_client.enabled:
+            datadog_client.configure_aggregation(
+                flush_interval_seconds=aggregation_config.flush_interval_seconds,
+                max_pending_metrics=aggregation_config.max_pending_metrics,
+                max_packet_size=aggregation_config.max_packet_size,
+                relative_accuracy=aggregation_config.histogram_relative_accuracy,
+                percentiles=aggregation_config.histogram_percentiles
+            )
+            self._log_each_metric = aggregation_config.log_each_metric
     
     def _resolve_env_var(self, value: Optional[str]) -> Optional[str]:
         """
@@ -180,28 +198,18 @@ class MonitoringService:
         # Enrich tags with deployment info if available
         enriched_tags = tags.copy() if tags else []
         if model_id and environment and self.deployment_manager:
-            try:
-                current_deployment = self.deployment_manager.get_current_deployment(
-                    model_id=model_id,
-                    target_environment=environment
-                )
-                if current_deployment:
-                    enriched_tags.extend([
-                        f"model_version:{current_deployment.get('model_version')}",
-                        f"deployment_id:{current_deployment.get('deployment_id')}"
-                    ])
-            except Exception as e:
-                self.logger.debug(f"Could not enrich metric with deployment info: {e}")
-        
-        # Log to structured logs
-        log_with_context(
-            "info",
-            f"Metric: {metric_name}",
-            metric_name=metric_name,
-            metric_value=value,
-            metric_type=metric_type,
-            tags=enriched_tags
-        )
+            enriched_tags.extend(self._get_deployment_tags(model_id, environment))
+        
+        # Log to structured logs (skipped when metrics are aggregated)
+        if self._log_each_metric:
+            log_with_context(
+                "info",
+                f"Metric: {metric_name}",
+                metric_name=metric_name,
+                metric_value=value,
+                metric_type=metric_type,
+                tags=enriched_tags
+            )
         
         # Send to Datadog
         if metric_type == "gauge":
@@ -211,6 +219,65 @@ class MonitoringService:
         elif metric_type == "histogram":
             datadog_client.histogram(metric_name, value, tags=enriched_tags)
     
+    def _get_deployment_tags(self, model_id: str, environment: str) -> List[str]:
+        """
+        Get the deployment tags for a model, cached per (model_id, environment).
+        
+        Args:
+            model_id: Model ID
+            environment: Deployment environment
+            
+        Returns:
+            Tags describing the current deployment, or an empty list
+        """
+        key = (model_id, environment)
+        ttl = self.config.deployment_tag_cache_ttl_seconds if self.config else 60.0
+        cached = self._deployment_tags_cache.get(key)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < ttl:
+            return cached[1]
+        
+        deployment_tags: List[str] = []
+        try:
+            current_deployment = self.deployment_manager.get_current_deployment(
+                model_id=model_id,
+                target_environment=environment
+            )
+            if current_deployment:
+                deployment_tags = [
+                    f"model_version:{current_deployment.get('model_version')}",
+                    f"deployment_id:{current_deployment.get('deployment_id')}"
+                ]
+        except Exception as e:
+            self.logger.debug(f"Could not enrich metric with deployment info: {e}")
+            return deployment_tags
+        
+        self._deployment_tags_cache[key] = (now, deployment_tags)
+        return deployment_tags
+    
+    def flush_metrics(self) -> int:
+        """
+        Send any client-side aggregated metrics now.
+        
+        Returns:
+            Number of metric lines sent
+        """
+        sent = datadog_client.flush()
+        if sent:
+            self.logger.debug(f"Flushed {sent} aggregated metric lines")
+        return sent
+    
+    def shutdown(self, timeout: Optional[float] = 5.0) -> None:
+        """
+        Deliver queued alerts and aggregated metrics, then stop the alert dispatch threads.
+        
+        Args:
+            timeout: Maximum number of seconds to wait for queued alerts
+        """
+        if self.alert_manager:
+            self.alert_manager.close(timeout)
+        self.flush_metrics()
+    
     def log_event(
         self,
         event_type: str,
@@ -325,6 +392,10 @@ class MonitoringService:
         health_status["data_drift_detection_enabled"] = self.data_drift_config.enabled if self.data_drift_config else False
         health_status["model_drift_detection_enabled"] = self.model_drift_config.enabled if self.model_drift_config else False
         health_status["alert_manager_enabled"] = self.alert_manager_config.enabled if self.alert_manager_config else False
+        if self.alert_manager:
+            health_status["alert_dispatch"] = self.alert_manager.get_dispatch_stats()
+        if datadog_client.aggregator is not None:
+            health_status["metrics_aggregation"] = datadog_client.aggregator.get_stats()
         health_status["deployment_tracking_enabled"] = self.deployment_manager is not None
         
         return health_status
@@ -371,14 +442,15 @@ class MonitoringService:
             self.logger.info("Alert manager not configured or is disabled in configuration.")
             self.alert_manager = None
 
-    def check_data_drift(self, current_data: Any, reference_data: Any, model_version: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    def check_data_drift(self, current_data: Any, reference_data: Any = None, model_version: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         Perform data drift check.
         Actual implementation will call self.data_drift_detector.
         
         Args:
             current_data: The current batch of data.
-            reference_data: The reference dataset.
+            reference_data: The reference dataset or ReferenceProfile. If None, the
+                profile fitted with ``data_drift_detector.fit_reference`` is used.
             model_version: Optional version of the model being monitored.
             
         Returns:
@@ -525,6 +597,43 @@ class MonitoringService:
 
         return drift_result
 
+    def create_streaming_drift_monitor(
+        self,
+        feature_names: Optional[List[str]] = None,
+        reference_profile: Optional[Any] = None,
+        tags: Optional[List[str]] = None
+    ) -> StreamingDriftMonitor:
+        """
+        Create a streaming drift monitor wired to this service.
+
+        The monitor uses ``config.streaming_drift`` (or defaults), raises alerts
+        through the service's AlertManager and logs the score of every check
+        as the ``streaming_drift_score`` metric.
+
+        Args:
+            feature_names: Names of the features in each observation.
+            reference_profile: Optional ReferenceProfile to compare against.
+            tags: Optional tags for alerts and metrics.
+
+        Returns:
+            A new StreamingDriftMonitor.
+        """
+        streaming_config = (self.config.streaming_drift if self.config else None) or StreamingDriftConfig()
+        tags = list(tags or [])
+
+        def log_report(report: Dict[str, Any]) -> None:
+            self.log_metric("streaming_drift_score", report["score"], tags=tags)
+            self.log_metric("streaming_drift_features", len(report["details"]["drifted_features"]), tags=tags)
+
+        return StreamingDriftMonitor(
+            streaming_config,
+            feature_names=feature_names,
+            reference_profile=reference_profile,
+            alert_manager=self.alert_manager,
+            report_callback=log_report,
+            tags=tags
+        )
+
     def process_alert(self, event_type: str, event_data: Dict[str, Any], severity: str = "info", tags: Optional[List[str]] = None) -> None:
         """
         Process an event through the alert manager.
@@ -583,6 +692,9 @@ class MonitoringService:
             }
         )
         
+        # The deployment changed, so cached tags for it are stale
+        self._deployment_tags_cache.pop((model_id, environment), None)
+        
         # Track deployment metric
         self.log_metric("model_deployment", 1, metric_type="increment", tags=tags)
         
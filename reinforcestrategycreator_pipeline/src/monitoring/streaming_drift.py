@@ -0,0 +1,358 @@
+"""
+Streaming drift monitoring for live feature and prediction feeds.
+
+``StreamingDriftMonitor`` consumes one feature vector (and optionally one
+prediction) at a time. Recent observations are kept in a sliding window made
+of fixed-size blocks: the block being filled holds raw values, and every
+completed block is reduced to per-feature fixed-bin counts, sums for the
+running mean and variance, and a mergeable quantile sketch. Memory therefore
+stays bounded by the number of blocks, not the number of observations.
+
+Every ``check_interval`` observations the window is compared with the
+reference distribution (PSI and a binned KS distance per feature, PSI of the
+prediction labels) and drift is reported through the ``AlertManager``.
+"""
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence
+import numpy as np
+import pandas as pd
+
+from ..config.models import StreamingDriftConfig
+from .drift_detection import ReferenceProfile
+from .logger import get_logger
+from .metrics_aggregator import HistogramSketch
+
+logger = get_logger("monitoring.streaming_drift")
+
+
+@dataclass
+class _FeatureReference:
+    """Reference bins and moments for all monitored features, padded to a common bin count."""
+    inner_edges: np.ndarray  # (features, max_bins - 1), padded with +inf
+    counts: np.ndarray  # (features, max_bins), zero padded
+    bin_mask: np.ndarray  # (features, max_bins), True for real bins
+    mean: np.ndarray
+    std: np.ndarray
+
+    @classmethod
+    def from_profile(cls, profile: ReferenceProfile, feature_names: Sequence[str]) -> "_FeatureReference":
+        features = [profile.numeric[name] for name in feature_names]
+        n_bins = [max(len(f.bin_edges) - 1, 1) for f in features]
+        max_bins = max(n_bins)
+        inner_edges = np.full((len(features), max_bins - 1), np.inf)
+        counts = np.zeros((len(features), max_bins))
+        mean = np.zeros(len(features))
+        std = np.zeros(len(features))
+        for i, feature in enumerate(features):
+            if len(feature.bin_edges) > 1:
+                inner_edges[i, :n_bins[i] - 1] = feature.bin_edges[1:-1]
+                counts[i, :n_bins[i]] = feature.bin_counts
+            else:
+                counts[i, 0] = feature.count
+            # Moments from the reference ECDF over the unique values
+            weights = np.diff(np.concatenate([[0.0], feature.ecdf]))
+            mean[i] = np.sum(weights * feature.values)
+            std[i] = np.sqrt(max(np.sum(weights * feature.values ** 2) - mean[i] ** 2, 0.0))
+        bin_mask = np.arange(max_bins)[None, :] < np.array(n_bins)[:, None]
+        return cls(inner_edges=inner_edges, counts=counts, bin_mask=bin_mask, mean=mean, std=std)
+
+    def bin_counts(self, values: np.ndarray) -> np.ndarray:
+        """Count a (rows, features) block into the reference bins; NaNs are ignored."""
+        n_features, max_bins = self.counts.shape
+        valid = ~np.isnan(values)
+        # Values outside the reference range fall into the first or last bin
+        bins = (values[:, :, None] >= self.inner_edges[None, :, :]).sum(axis=2)
+        flat = (bins + np.arange(n_features)[None, :] * max_bins)[valid]
+        return np.bincount(flat, minlength=n_features * max_bins).reshape(n_features, max_bins)
+
+
+class StreamingDriftMonitor:
+    """Sliding-window drift monitor fed one observation at a time."""
+
+    def __init__(
+        self,
+        config: StreamingDriftConfig,
+        feature_names: Optional[Sequence[str]] = None,
+        reference_profile: Optional[ReferenceProfile] = None,
+        alert_manager: Optional[Any] = None,
+        report_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        tags: Optional[List[str]] = None
+    ):
+        """
+        Initialize the monitor.
+
+        Args:
+            config: Streaming drift configuration
+            feature_names: Names of the features in each observed vector.
+                Defaults to the profile's numerical features, or f0, f1, ...
+            reference_profile: Reference to compare against. If None, the first
+                ``warmup_size`` observations become the reference.
+            alert_manager: AlertManager that receives "streaming_drift_detected" events
+            report_callback: Called with every drift report, e.g. to log metrics
+            tags: Tags attached to alerts
+        """
+        self.config = config
+        self.alert_manager = alert_manager
+        self.report_callback = report_callback
+        self.tags = list(tags or [])
+        self.block_size = max(1, config.window_size // config.num_blocks)
+        self.categories = list(config.prediction_categories)
+        self._category_codes = {category: i for i, category in enumerate(self.categories)}
+
+        if feature_names is None and reference_profile is not None:
+            feature_names = list(reference_profile.numeric)
+        self.feature_names: Optional[List[str]] = list(feature_names) if feature_names is not None else None
+
+        self.n_observations = 0
+        self.last_report: Optional[Dict[str, Any]] = None
+        self._since_check = 0
+        self._reference: Optional[_FeatureReference] = None
+        self._warmup_rows: List[np.ndarray] = []
+        # Last slot counts labels outside prediction_categories
+        self._prediction_reference = np.zeros(len(self.categories) + 1)
+        self._prediction_reference_ready = False
+
+        if reference_profile is not None:
+            self._reference = _FeatureReference.from_profile(reference_profile, self.feature_names)
+            self._allocate_window()
+
+    @property
+    def is_warming_up(self) -> bool:
+        """Whether the feature reference is still being collected."""
+        return self._reference is None
+
+    def observe(
+        self,
+        features: Any,
+        prediction: Optional[Any] = None,
+        confidence: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Add one observation.
+
+        Args:
+            features: Feature vector (array-like of length n_features, or shape (1, n_features))
+            prediction: Optional model prediction label for this observation
+            confidence: Optional model confidence for this observation
+
+        Returns:
+            A drift report if a check ran on this observation, otherwise None
+        """
+        values = np.asarray(features, dtype=float).ravel()
+        if self.feature_names is None:
+            self.feature_names = [f"f{i}" for i in range(len(values))]
+        if len(values) != len(self.feature_names):
+            raise ValueError(f"Expected {len(self.feature_names)} features, got {len(values)}")
+
+        code = -1
+        if prediction is not None:
+            code = self._category_codes.get(prediction, len(self.categories))
+            if not self._prediction_reference_ready:
+                self._prediction_reference[code] += 1
+                self._prediction_reference_ready = self._prediction_reference.sum() >= self.config.warmup_size
+        self.n_observations += 1
+
+        if self._reference is None:
+            self._warmup_rows.append(values)
+            if len(self._warmup_rows) >= self.config.warmup_size:
+                self._fit_reference_from_warmup()
+            return None
+
+        self._buffer[self._fill] = values
+        self._buffer_predictions[self._fill] = code
+        self._buffer_confidence[self._fill] = np.nan if confidence is None else confidence
+        self._fill += 1
+        if self._fill == self.block_size:
+            self._close_block()
+
+        self._since_check += 1
+        if self._since_check >= self.config.check_interval:
+            self._since_check = 0
+            return self.check()
+        return None
+
+    def check(self) -> Optional[Dict[str, Any]]:
+        """
+        Score the current window against the reference and alert on drift.
+
+        Returns:
+            Drift report, or None while the monitor is warming up
+        """
+        if self._reference is None:
+            return None
+        reference = self._reference
+        partial = self._buffer[:self._fill]
+
+        counts = self._hist.sum(axis=0) + reference.bin_counts(partial)
+        totals = self._sum.sum(axis=0) + np.nansum(partial, axis=0)
+        squares = self._sumsq.sum(axis=0) + np.nansum(partial ** 2, axis=0)
+        n = self._count.sum(axis=0) + (~np.isnan(partial)).sum(axis=0)
+
+        mask = reference.bin_mask
+        n_bins = mask.sum(axis=1, keepdims=True)
+        ref_total = reference.counts.sum(axis=1, keepdims=True)
+        # Same add-one smoothing as DataDriftDetector's PSI
+        window_props = np.where(mask, (counts + 1) / (n[:, None] + n_bins), 1.0)
+        ref_props = np.where(mask, (reference.counts + 1) / (ref_total + n_bins), 1.0)
+        psi = np.sum((window_props - ref_props) * np.log(window_props / ref_props), axis=1)
+        ks = np.max(np.abs(
+            np.cumsum(counts, axis=1) / np.maximum(n[:, None], 1) - np.cumsum(reference.counts, axis=1) / ref_total
+        ), axis=1)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean = np.where(n > 0, totals / np.maximum(n, 1), np.nan)
+            std = np.sqrt(np.maximum(squares / np.maximum(n, 1) - mean ** 2, 0.0))
+            mean_shift = np.where(reference.std > 0, (mean - reference.mean) / reference.std, 0.0)
+        drifted = (psi > self.config.psi_threshold) | (ks > self.config.ks_threshold)
+
+        sketches = self._window_sketches(partial)
+        feature_results = {}
+        for i, name in enumerate(self.feature_names):
+            feature_results[name] = {
+                "psi": float(psi[i]),
+                "ks_statistic": float(ks[i]),
+                "mean": float(mean[i]),
+                "std": float(std[i]),
+                "mean_shift": float(mean_shift[i]),
+                "p05": sketches[i].quantile(0.05),
+                "median": sketches[i].quantile(0.5),
+                "p95": sketches[i].quantile(0.95),
+                "drift": bool(drifted[i])
+            }
+        drifted_features = [name for name, result in feature_results.items() if result["drift"]]
+
+        prediction_psi, prediction_distribution, mean_confidence = self._prediction_scores(partial_size=self._fill)
+        prediction_drift = prediction_psi is not None and prediction_psi > self.config.psi_threshold
+        avg_psi = float(np.mean(psi)) if len(psi) else 0.0
+
+        message = (
+            f"Streaming drift in {len(drifted_features)} feature(s)"
+            + (f": {', '.join(drifted_features)}" if drifted_features else "")
+            + (f"; prediction PSI {prediction_psi:.4f}" if prediction_drift else "")
+        )
+        report = {
+            "drift_detected": bool(drifted_features) or prediction_drift,
+            "score": avg_psi,
+            "method": "streaming",
+            "n_observations": self.n_observations,
+            "window_observations": int(n.max()) if len(n) else 0,
+            "details": {
+                "feature_scores": {name: result["psi"] for name, result in feature_results.items()},
+                "feature_results": feature_results,
+                "drifted_features": drifted_features,
+                "prediction_psi": prediction_psi,
+                "prediction_distribution": prediction_distribution,
+                "mean_confidence": mean_confidence,
+                "message": message
+            }
+        }
+        self.last_report = report
+
+        if report["drift_detected"]:
+            logger.warning(message)
+            if self.alert_manager is not None:
+                self.alert_manager.handle_event(
+                    "streaming_drift_detected",
+                    {
+                        "score": avg_psi,
+                        "drifted_features": drifted_features,
+                        "prediction_psi": prediction_psi,
+                        "n_observations": self.n_observations,
+                        "message": message
+                    },
+                    severity=self.config.alert_severity,
+                    tags=self.tags
+                )
+        if self.report_callback is not None:
+            self.report_callback(report)
+        return report
+
+    def _fit_reference_from_warmup(self) -> None:
+        warmup = pd.DataFrame(np.vstack(self._warmup_rows), columns=self.feature_names)
+        profile = ReferenceProfile.fit(warmup, n_bins=self.config.n_bins)
+        self._reference = _FeatureReference.from_profile(profile, self.feature_names)
+        self._warmup_rows = []
+        self._allocate_window()
+        logger.info(f"Streaming drift reference fitted on {len(warmup)} warm-up observations")
+
+    def _allocate_window(self) -> None:
+        n_features, max_bins = self._reference.counts.shape
+        num_blocks = self.config.num_blocks
+        self._buffer = np.full((self.block_size, n_features), np.nan)
+        self._buffer_predictions = np.full(self.block_size, -1, dtype=np.int64)
+        self._buffer_confidence = np.full(self.block_size, np.nan)
+        self._fill = 0
+
+        self._hist = np.zeros((num_blocks, n_features, max_bins), dtype=np.int64)
+        self._sum = np.zeros((num_blocks, n_features))
+        self._sumsq = np.zeros((num_blocks, n_features))
+        self._count = np.zeros((num_blocks, n_features), dtype=np.int64)
+        self._prediction_counts = np.zeros((num_blocks, len(self.categories) + 1), dtype=np.int64)
+        self._confidence_sum = np.zeros(num_blocks)
+        self._confidence_count = np.zeros(num_blocks, dtype=np.int64)
+        self._sketches: List[Optional[List[HistogramSketch]]] = [None] * num_blocks
+        self._next_block = 0
+
+    def _close_block(self) -> None:
+        """Reduce the filled block to counts and sketches, replacing the oldest block."""
+        block, slot = self._buffer, self._next_block
+        self._hist[slot] = self._reference.bin_counts(block)
+        self._sum[slot] = np.nansum(block, axis=0)
+        self._sumsq[slot] = np.nansum(block ** 2, axis=0)
+        self._count[slot] = (~np.isnan(block)).sum(axis=0)
+        self._prediction_counts[slot] = self._count_predictions(self._buffer_predictions)
+        confidence = self._buffer_confidence[~np.isnan(self._buffer_confidence)]
+        self._confidence_sum[slot] = confidence.sum()
+        self._confidence_count[slot] = len(confidence)
+        self._sketches[slot] = self._build_sketches(block)
+
+        self._next_block = (slot + 1) % self.config.num_blocks
+        self._buffer[:] = np.nan
+        self._buffer_predictions[:] = -1
+        self._buffer_confidence[:] = np.nan
+        self._fill = 0
+
+    def _build_sketches(self, block: np.ndarray) -> List[HistogramSketch]:
+        sketches = []
+        for column in block.T:
+            sketch = HistogramSketch(self.config.sketch_relative_accuracy)
+            sketch.add_many(column[~np.isnan(column)])
+            sketches.append(sketch)
+        return sketches
+
+    def _window_sketches(self, partial: np.ndarray) -> List[HistogramSketch]:
+        merged = self._build_sketches(partial)
+        for block_sketches in self._sketches:
+            if block_sketches is None:
+                continue
+            for target, sketch in zip(merged, block_sketches):
+                target.merge(sketch)
+        return merged
+
+    def _count_predictions(self, codes: np.ndarray) -> np.ndarray:
+        return np.bincount(codes[codes >= 0], minlength=len(self.categories) + 1)
+
+    def _prediction_scores(self, partial_size: int):
+        """PSI of the window's prediction labels, their distribution and the mean confidence."""
+        counts = self._prediction_counts.sum(axis=0) + self._count_predictions(self._buffer_predictions[:partial_size])
+        total = counts.sum()
+        if total == 0:
+            return None, {}, None
+        labels = self.categories + ["other"]
+        distribution = {label: float(count / total) for label, count in zip(labels, counts)}
+
+        partial_confidence = self._buffer_confidence[:partial_size]
+        partial_confidence = partial_confidence[~np.isnan(partial_confidence)]
+        confidence_count = self._confidence_count.sum() + len(partial_confidence)
+        mean_confidence = (
+            float((self._confidence_sum.sum() + partial_confidence.sum()) / confidence_count)
+            if confidence_count else None
+        )
+
+        prediction_psi = None
+        if self._prediction_reference_ready:
+            k = len(counts)
+            window_props = (counts + 1) / (total + k)
+            ref_props = (self._prediction_reference + 1) / (self._prediction_reference.sum() + k)
+            prediction_psi = float(np.sum((window_props - ref_props) * np.log(window_props / ref_props)))
+        return prediction_psi, distribution, mean_confidence
@@ -1,6 +1,10 @@
 from typing import Any, Dict, Optional
 import threading
 
+from reinforcestrategycreator_pipeline.src.pipeline.shared_store import (
+    DEFAULT_MIN_BYTES, SharedValueHandle, SharedValueStore
+)
+
 class PipelineContextError(Exception):
     """Custom exception for PipelineContext errors.
     
@@ -20,12 +24,20 @@ class PipelineContext:
     
     The singleton pattern ensures that all pipeline stages access the same context
     instance, maintaining consistency throughout the pipeline execution.
+
+    With a shared store enabled (:meth:`enable_shared_store`), large arrays and
+    DataFrames are spilled to memory-mapped files when set, and only a
+    :class:`SharedValueHandle` is kept. ``get`` transparently maps the value
+    back in; ``get_handle`` returns the handle itself, which is cheap to send
+    to another process. Spilled files live until the key is overwritten or
+    deleted, or the context is reset.
     
     Attributes:
         _instance: The singleton instance of PipelineContext
         _lock: Threading lock for thread-safe operations
         _data: Dictionary storing pipeline data
         _metadata: Dictionary storing pipeline metadata
+        _shared_store: Store for spilled values, if enabled
     
     Example:
         >>> context = PipelineContext.get_instance()
@@ -41,6 +53,7 @@ class PipelineContext:
             raise PipelineContextError("PipelineContext is a singleton and has already been instantiated.")
         self._data: Dict[str, Any] = {}
         self._metadata: Dict[str, Any] = {} # For storing pipeline run info, etc.
+        self._shared_store: Optional[SharedValueStore] = None
         PipelineContext._instance = self
 
     @classmethod
@@ -67,8 +80,13 @@ class PipelineContext:
         :param value: The value to store (can be any type)
         :type value: Any
         """
+        store = self._shared_store
+        if store is not None and not isinstance(value, SharedValueHandle) and store.should_spill(value):
+            value = store.spill(value, key) or value
         with self._lock:
+            previous = self._data.get(key)
             self._data[key] = value
+        self._release(previous)
 
     def get(self, key: str, default: Optional[Any] = None) -> Optional[Any]:
         """Get a value from the context data dictionary.
@@ -81,9 +99,108 @@ class PipelineContext:
         :return: The value associated with the key, or the default value if not found
         :rtype: Optional[Any]
         """
+        with self._lock:
+            value = self._data.get(key, default)
+        return value.load() if isinstance(value, SharedValueHandle) else value
+
+    def get_handle(self, key: str, default: Optional[Any] = None) -> Optional[Any]:
+        """Get a value as stored, without mapping spilled values back in.
+
+        :param key: The key of the value to retrieve
+        :type key: str
+        :param default: The default value to return if the key is not found
+        :type default: Optional[Any]
+
+        :return: A :class:`SharedValueHandle` for spilled values, otherwise the value itself
+        :rtype: Optional[Any]
+        """
         with self._lock:
             return self._data.get(key, default)
 
+    def adopt_handle(self, key: str, handle: SharedValueHandle) -> None:
+        """Store a handle written elsewhere (e.g. by a worker process) and take ownership of its file.
+
+        :param key: The key to store the handle under
+        :type key: str
+        :param handle: Handle to a value in this context's shared store directory
+        :type handle: SharedValueHandle
+        """
+        if self._shared_store is not None:
+            self._shared_store.adopt(handle)
+        self.set(key, handle)
+
+    def export_handle(self, key: str) -> Any:
+        """Hand a stored value over to another process's context.
+
+        For spilled values the context gives up ownership of the file, so it
+        outlives this context; the receiver should :meth:`adopt_handle` it.
+
+        :param key: The key of the value to export
+        :type key: str
+
+        :return: The handle or in-memory value stored under ``key``
+        :rtype: Any
+        """
+        value = self.get_handle(key)
+        if isinstance(value, SharedValueHandle) and self._shared_store is not None:
+            self._shared_store.disown(value)
+        return value
+
+    def _release(self, value: Any) -> None:
+        """Delete the spilled file behind a value that is no longer referenced."""
+        if isinstance(value, SharedValueHandle) and self._shared_store is not None:
+            self._shared_store.release(value)
+
+    @property
+    def shared_store(self) -> Optional[SharedValueStore]:
+        """The store for spilled values, or None if spilling is disabled."""
+        return self._shared_store
+
+    def enable_shared_store(
+        self,
+        directory: Optional[str] = None,
+        min_bytes: int = DEFAULT_MIN_BYTES,
+        owner: bool = True
+    ) -> SharedValueStore:
+        """Spill large arrays and DataFrames to memory-mapped files from now on.
+
+        Values already in the context that qualify are spilled immediately.
+        Calling this again returns the existing store.
+
+        :param directory: Directory for spilled values (default: a new directory in shared memory)
+        :type directory: Optional[str]
+        :param min_bytes: Values smaller than this stay in memory
+        :type min_bytes: int
+        :param owner: Whether closing the store removes ``directory``
+        :type owner: bool
+
+        :return: The shared store
+        :rtype: SharedValueStore
+        """
+        if self._shared_store is None:
+            self._shared_store = SharedValueStore(directory, min_bytes=min_bytes, owner=owner)
+            for key, value in self.get_all_handles().items():
+                if not isinstance(value, SharedValueHandle) and self._shared_store.should_spill(value):
+                    self.set(key, value)
+        return self._shared_store
+
+    def close_shared_store(self) -> None:
+        """Map spilled values back into memory, delete their files and disable spilling."""
+        store = self._shared_store
+        if store is None:
+            return
+        with self._lock:
+            for key, value in self._data.items():
+                if isinstance(value, SharedValueHandle) and store.owns(value):
+                    self._data[key] = self._materialize(value)
+            self._shared_store = None
+        store.close()
+
+    @staticmethod
+    def _materialize(handle: SharedValueHandle) -> Any:
+        value = handle.load()
+        return value.copy() if hasattr(value, "copy") else value
+
     def delete(self, key: str) -> None:
         """Delete a key-value pair from the context data dictionary.
 
@@ -94,9 +211,10 @@ class PipelineContext:
         """
         with self._lock:
             if key in self._data:
-                del self._data[key]
+                value = self._data.pop(key)
             else:
                 raise KeyError(f"Key '{key}' not found in PipelineContext.")
+        self._release(value)
 
     def get_all_data(self) -> Dict[str, Any]:
         """Return a copy of all data stored in the context.
@@ -104,6 +222,17 @@ class PipelineContext:
         :return: A dictionary containing all key-value pairs in the data store
         :rtype: Dict[str, Any]
         """
+        return {
+            key: value.load() if isinstance(value, SharedValueHandle) else value
+            for key, value in self.get_all_handles().items()
+        }
+
+    def get_all_handles(self) -> Dict[str, Any]:
+        """Return a copy of the data store with spilled values as handles.
+
+        :return: A dictionary of keys to handles or in-memory values
+        :rtype: Dict[str, Any]
+        """
         with self._lock:
             return self._data.copy()
 
@@ -114,7 +243,10 @@ class PipelineContext:
         but preserves the metadata.
         """
         with self._lock:
+            values = list(self._data.values())
             self._data.clear()
+        for value in values:
+            self._release(value)
 
     def set_metadata(self, key: str, value: Any) -> None:
         """Set a metadata value.
@@ -167,10 +299,12 @@ class PipelineContext:
         
         This method is useful for testing scenarios or when re-running
         pipelines with a clean state. It removes all stored data and
-        metadata but maintains the singleton instance.
+        metadata but maintains the singleton instance. The shared store, if
+        enabled, is closed and its files are deleted.
         """
         self.clear_data()
         self.clear_metadata()
+        self.close_shared_store()
 
     def __repr__(self) -> str:
         return f"<PipelineContext(data_keys={list(self._data.keys())}, metadata_keys={list(self._metadata.keys())})>"
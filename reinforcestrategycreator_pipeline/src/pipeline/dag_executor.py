@@ -0,0 +1,525 @@
+import hashlib
+import json
+import multiprocessing
+import pickle
+import tempfile
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from reinforcestrategycreator_pipeline.src.artifact_store.base import ArtifactStore, ArtifactType
+from reinforcestrategycreator_pipeline.src.pipeline.context import PipelineContext
+from reinforcestrategycreator_pipeline.src.pipeline.executor import PipelineExecutionError
+from reinforcestrategycreator_pipeline.src.pipeline.shared_store import SharedValueHandle
+from reinforcestrategycreator_pipeline.src.pipeline.stage import PipelineStage
+from reinforcestrategycreator_pipeline.src.monitoring.logger import get_logger
+
+CACHE_ARTIFACT_PREFIX = "stage_cache_"
+# Shared services the orchestrator puts in the context; stages read them in setup
+CONTEXT_SERVICE_KEYS = ("config_manager", "artifact_store", "data_manager", "model_registry", "monitoring_service")
+_MISSING = object()
+
+
+def _canonical_json(value: Any) -> str:
+    """Serialize a value to JSON with sorted keys so equal configs hash equally."""
+    return json.dumps(value, sort_keys=True, default=str, separators=(",", ":"))
+
+
+def _run_stage_in_process(
+    stage: PipelineStage,
+    services: Dict[str, Any],
+    inputs: Dict[str, Any],
+    store_directory: str,
+    min_bytes: int
+) -> Tuple[Dict[str, Any], Optional[str]]:
+    """Run one stage in a worker process against a private context.
+
+    The context gets copies of the parent's services (config manager,
+    artifact store, ...) and the stage's inputs, which arrive as handles or
+    small values. Large outputs are spilled into
+    the parent's shared store directory and returned as handles that the
+    parent adopts; anything else the stage spilled is deleted with the
+    worker's context.
+
+    :return: The stage's declared outputs and the teardown error message, if any
+    :rtype: Tuple[Dict[str, Any], Optional[str]]
+    """
+    # A worker started with fork inherits the parent's singleton (and possibly
+    # a held lock); start from a fresh context instead.
+    PipelineContext._instance = None
+    PipelineContext._lock = threading.Lock()
+    context = PipelineContext.get_instance()
+    context.enable_shared_store(store_directory, min_bytes=min_bytes, owner=False)
+    teardown_error = None
+    try:
+        for key, value in {**services, **inputs}.items():
+            context.set(key, value)
+        try:
+            stage.setup(context)
+            stage.run(context)
+        finally:
+            try:
+                stage.teardown(context)
+            except Exception as e:
+                teardown_error = str(e)
+        available = context.get_all_handles()
+        outputs = {key: context.export_handle(key) for key in stage.outputs if key in available}
+    finally:
+        context.reset()
+    return outputs, teardown_error
+
+
+@dataclass
+class StagePlan:
+    """Planned execution of one stage, as reported by :meth:`DAGPipelineExecutor.explain`.
+
+    :param name: Stage name
+    :param level: Depth in the dependency graph; stages on the same level can run concurrently
+    :param depends_on: Names of the stages that must finish first
+    :param cache_key: Hash of the stage's config and its upstream cache keys
+    :param cacheable: Whether the stage's outputs are memoized
+    :param cache_hit: Whether a memoized result exists for ``cache_key``
+    """
+    name: str
+    level: int
+    depends_on: List[str]
+    cache_key: str
+    cacheable: bool
+    cache_hit: bool = False
+    inputs: Optional[List[str]] = None
+    outputs: Optional[List[str]] = None
+
+    @property
+    def action(self) -> str:
+        """What the executor will do with this stage."""
+        return "cached" if self.cache_hit else "run"
+
+
+class DAGPipelineExecutor:
+    """Executes pipeline stages as a dependency graph, memoizing stage outputs.
+
+    Dependencies are derived from the context keys each stage declares in its
+    ``inputs`` and ``outputs``. A stage depends on the last earlier stage that
+    writes a key it reads, and on earlier readers and writers of the keys it
+    writes, so the final context matches a sequential run of the same stage
+    list. Stages without declarations act as barriers: they wait for every
+    earlier stage and every later stage waits for them. Stages whose
+    dependencies are satisfied run concurrently in a thread pool.
+
+    With ``use_processes=True`` stages that declare their inputs and outputs
+    run in a process pool instead. The context's shared store is enabled, so
+    large arrays and DataFrames cross the process boundary as memory-mapped
+    handles rather than pickled copies. Each worker gets copies of the
+    context's services (``config_manager``, ``artifact_store``,
+    ``data_manager``, ``model_registry``, ``monitoring_service``) and the
+    declared inputs, and only declared outputs come back: changes a stage
+    makes to its own attributes, to the services or to context metadata
+    stay in the worker. Undeclared stages, and all stages when a service
+    in the context cannot be pickled, still run in the parent.
+
+    Cacheable stages are memoized in the artifact store. The cache key hashes
+    the stage class, name and config, the global pipeline config (when a
+    ``config_manager`` is in the context) and the cache keys of the stage's
+    dependencies, so a change upstream invalidates everything downstream.
+    On a hit the stage is not set up or run; its declared outputs are restored
+    into the context instead. Inputs that come from outside the pipeline, such
+    as a source file's contents, are not part of the key; disable caching for
+    a stage with ``cache: false`` in its config when that matters.
+
+    :param stages: Stages to execute, in the order a sequential run would use
+    :type stages: List[PipelineStage]
+    :param max_workers: Maximum number of stages running at once
+    :type max_workers: int
+    :param artifact_store: Store for memoized outputs (default: ``artifact_store`` from the context)
+    :type artifact_store: Optional[ArtifactStore]
+    :param use_processes: Run declared stages in a process pool
+    :type use_processes: bool
+    :param mp_context: Multiprocessing start method for the process pool. Stages are
+        submitted from scheduler threads, so the default avoids ``fork``.
+    :type mp_context: str
+
+    :raises ValueError: If initialized with an empty list of stages or duplicate stage names
+    """
+
+    def __init__(
+        self,
+        stages: List[PipelineStage],
+        max_workers: int = 4,
+        artifact_store: Optional[ArtifactStore] = None,
+        use_processes: bool = False,
+        mp_context: str = "spawn"
+    ):
+        if not stages:
+            raise ValueError("DAGPipelineExecutor must be initialized with at least one stage.")
+        names = [stage.name for stage in stages]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Stage names must be unique for DAG execution, got {names}")
+        self.stages = stages
+        self.max_workers = max(1, max_workers)
+        self._artifact_store = artifact_store
+        self.use_processes = use_processes
+        self.mp_context = mp_context
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self.logger = get_logger(f"executor.{self.__class__.__name__}")
+        self.context = PipelineContext.get_instance()
+        self.dependencies = self._build_dependencies()
+        self._status_lock = threading.Lock()
+
+    @property
+    def artifact_store(self) -> Optional[ArtifactStore]:
+        """The store used for memoized stage outputs, if any."""
+        return self._artifact_store or self.context.get("artifact_store")
+
+    def _build_dependencies(self) -> Dict[int, Set[int]]:
+        """Derive each stage's dependencies from its declared inputs and outputs.
+
+        :return: Mapping of stage index to the indices it depends on
+        :rtype: Dict[int, Set[int]]
+        """
+        dependencies: Dict[int, Set[int]] = {}
+        last_writer: Dict[str, int] = {}
+        readers: Dict[str, List[int]] = {}
+        barrier: Optional[int] = None
+        later_outputs: Dict[str, str] = {}
+        for stage in self.stages:
+            for key in stage.outputs or []:
+                later_outputs.setdefault(key, stage.name)
+
+        for index, stage in enumerate(self.stages):
+            if stage.inputs is None and stage.outputs is None:
+                dependencies[index] = set(range(index))
+                barrier = index
+                continue
+
+            deps: Set[int] = set() if barrier is None else {barrier}
+            for key in stage.inputs or []:
+                if key in last_writer:
+                    deps.add(last_writer[key])
+                elif key in later_outputs and later_outputs[key] != stage.name:
+                    self.logger.warning(
+                        f"Stage '{stage.name}' reads '{key}', which is only written by a later stage "
+                        f"('{later_outputs[key]}'); it will see the value from before the run."
+                    )
+            for key in stage.outputs or []:
+                if key in last_writer:
+                    deps.add(last_writer[key])
+                deps.update(readers.get(key, []))
+            deps.discard(index)
+            dependencies[index] = deps
+
+            for key in stage.inputs or []:
+                readers.setdefault(key, []).append(index)
+            for key in stage.outputs or []:
+                last_writer[key] = index
+                readers[key] = []
+        return dependencies
+
+    def _levels(self) -> List[int]:
+        """Depth of each stage in the dependency graph."""
+        levels: List[int] = []
+        for index in range(len(self.stages)):
+            levels.append(max((levels[dep] + 1 for dep in self.dependencies[index]), default=0))
+        return levels
+
+    def _global_config_digest(self) -> str:
+        """Hash of the global pipeline config, or an empty string without a config manager."""
+        config_manager = self.context.get("config_manager")
+        if config_manager is None:
+            return ""
+        try:
+            config = config_manager.get_config()
+            if hasattr(config, "model_dump"):
+                config = config.model_dump(mode="json")
+            return hashlib.sha256(_canonical_json(config).encode("utf-8")).hexdigest()
+        except Exception as e:
+            self.logger.warning(f"Could not hash the global pipeline config: {e}")
+            return ""
+
+    def compute_cache_keys(self) -> List[str]:
+        """Compute the cache key of every stage without running anything.
+
+        :return: Cache keys, in stage order
+        :rtype: List[str]
+        """
+        global_digest = self._global_config_digest()
+        keys: List[str] = []
+        for index, stage in enumerate(self.stages):
+            payload = {
+                "stage": f"{stage.__class__.__module__}.{stage.__class__.__qualname__}",
+                "name": stage.name,
+                "config": stage.config,
+                "global_config": global_digest,
+                "upstream": [keys[dep] for dep in sorted(self.dependencies[index])]
+            }
+            keys.append(hashlib.sha256(_canonical_json(payload).encode("utf-8")).hexdigest())
+        return keys
+
+    @staticmethod
+    def _cache_artifact_id(stage: PipelineStage) -> str:
+        return f"{CACHE_ARTIFACT_PREFIX}{stage.name}"
+
+    def _is_cacheable(self, stage: PipelineStage) -> bool:
+        return bool(stage.cacheable and stage.outputs)
+
+    def _cache_hit(self, stage: PipelineStage, cache_key: str) -> bool:
+        """Check whether memoized outputs exist for a stage and cache key."""
+        store = self.artifact_store
+        if store is None or not self._is_cacheable(stage):
+            return False
+        try:
+            return store.artifact_exists(self._cache_artifact_id(stage), ArtifactType.OTHER, version=cache_key)
+        except Exception as e:
+            self.logger.warning(f"Cache lookup failed for stage '{stage.name}': {e}")
+            return False
+
+    def explain(self) -> List[StagePlan]:
+        """Report the execution plan without running any stage.
+
+        :return: One entry per stage with its level, dependencies, cache key and whether it hits the cache
+        :rtype: List[StagePlan]
+        """
+        keys = self.compute_cache_keys()
+        levels = self._levels()
+        return [
+            StagePlan(
+                name=stage.name,
+                level=levels[index],
+                depends_on=[self.stages[dep].name for dep in sorted(self.dependencies[index])],
+                cache_key=keys[index],
+                cacheable=self._is_cacheable(stage),
+                cache_hit=self._cache_hit(stage, keys[index]),
+                inputs=stage.inputs,
+                outputs=stage.outputs
+            )
+            for index, stage in enumerate(self.stages)
+        ]
+
+    @staticmethod
+    def format_plan(plan: List[StagePlan]) -> str:
+        """Render an execution plan as a text table.
+
+        :param plan: Plan returned by :meth:`explain`
+        :type plan: List[StagePlan]
+        :return: One line per stage, grouped by level
+        :rtype: str
+        """
+        width = max([len(entry.name) for entry in plan] + [5])
+        lines = [f"{'level':>5}  {'stage':<{width}}  {'action':<7}  {'cache key':<12}  depends on"]
+        for entry in sorted(plan, key=lambda entry: entry.level):
+            action = entry.action if entry.cacheable else "run*"
+            lines.append(
+                f"{entry.level:>5}  {entry.name:<{width}}  {action:<7}  {entry.cache_key[:12]:<12}  "
+                f"{', '.join(entry.depends_on) or '-'}"
+            )
+        hits = sum(entry.cache_hit for entry in plan)
+        lines.append(f"{hits}/{len(plan)} stages cached; * = not cacheable")
+        return "\n".join(lines)
+
+    def _set_stage_status(self, stage_name: str, status: str) -> None:
+        with self._status_lock:
+            statuses = dict(self.context.get_metadata("stage_status", {}) or {})
+            statuses[stage_name] = status
+            self.context.set_metadata("stage_status", statuses)
+
+    def _restore_cached(self, stage: PipelineStage, cache_key: str) -> None:
+        """Load a stage's memoized outputs into the context."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = self.artifact_store.load_artifact(
+                self._cache_artifact_id(stage), ArtifactType.OTHER, version=cache_key,
+                destination_path=Path(tmp_dir) / "outputs.pkl"
+            )
+            with open(path, "rb") as f:
+                outputs = pickle.load(f)
+        for key, value in outputs.items():
+            self.context.set(key, value)
+
+    def _store_cached(self, stage: PipelineStage, cache_key: str) -> None:
+        """Memoize a stage's declared outputs in the artifact store."""
+        outputs = {key: self.context.get(key) for key in stage.outputs if key in self.context.get_all_handles()}
+        try:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                path = Path(tmp_dir) / "outputs.pkl"
+                with open(path, "wb") as f:
+                    pickle.dump(outputs, f, protocol=pickle.HIGHEST_PROTOCOL)
+                self.artifact_store.save_artifact(
+                    artifact_id=self._cache_artifact_id(stage),
+                    artifact_path=path,
+                    artifact_type=ArtifactType.OTHER,
+                    version=cache_key,
+                    metadata={"stage": stage.name, "cache_key": cache_key, "outputs": sorted(outputs)},
+                    tags=["stage_cache"],
+                    description=f"Memoized outputs of pipeline stage '{stage.name}'"
+                )
+        except Exception as e:
+            self.logger.warning(f"Could not cache outputs of stage '{stage.name}': {e}")
+
+    def _execute_stage(self, stage: PipelineStage, cache_key: str, cache_hit: bool) -> str:
+        """Run or restore one stage; executed on a worker thread.
+
+        :return: ``"cached"`` or ``"completed"``
+        :rtype: str
+        """
+        stage_name = stage.name
+        self.context.set_metadata("current_stage_name", stage_name)
+        if cache_hit:
+            try:
+                self._restore_cached(stage, cache_key)
+                self.logger.info(f"Stage '{stage_name}' restored from cache ({cache_key[:12]})")
+                return "cached"
+            except Exception as e:
+                self.logger.warning(f"Cached outputs of stage '{stage_name}' could not be loaded, re-running: {e}")
+
+        self.logger.info(f"Starting stage: {stage_name}")
+        services = self._picklable_services(stage) if self._process_pool is not None else None
+        if services is not None and stage.inputs is not None and stage.outputs is not None:
+            self._execute_in_process(stage, services)
+        else:
+            self._execute_in_thread(stage)
+        self.logger.info(f"Stage completed successfully: {stage_name}")
+
+        if self._is_cacheable(stage) and self.artifact_store is not None:
+            self._store_cached(stage, cache_key)
+        return "completed"
+
+    def _execute_in_thread(self, stage: PipelineStage) -> None:
+        """Set up, run and tear down a stage against the shared context."""
+        stage_name = stage.name
+        try:
+            stage.setup(self.context)
+            stage.run(self.context)
+        finally:
+            try:
+                stage.teardown(self.context)
+            except Exception as e:
+                self.logger.error(f"Error during teardown of stage '{stage_name}': {e}", exc_info=True)
+                self.context.set_metadata(f"teardown_error_{stage_name}", str(e))
+
+    def _picklable_services(self, stage: PipelineStage) -> Optional[Dict[str, Any]]:
+        """Collect the context's services for a worker process.
+
+        :return: The services, or None if one cannot be pickled and the stage must run in the parent
+        :rtype: Optional[Dict[str, Any]]
+        """
+        services = {key: self.context.get(key) for key in CONTEXT_SERVICE_KEYS if self.context.get(key) is not None}
+        try:
+            pickle.dumps(services)
+        except Exception as e:
+            self.logger.warning(
+                f"Running stage '{stage.name}' in the parent process: the context services cannot be sent to a worker ({e})"
+            )
+            return None
+        return services
+
+    def _execute_in_process(self, stage: PipelineStage, services: Dict[str, Any]) -> None:
+        """Run a stage in the process pool, passing inputs and outputs as shared handles."""
+        inputs = {}
+        for key in stage.inputs:
+            value = self.context.get_handle(key, _MISSING)
+            if value is not _MISSING:
+                inputs[key] = value
+        store = self.context.shared_store
+        outputs, teardown_error = self._process_pool.submit(
+            _run_stage_in_process, stage, services, inputs, store.directory, store.min_bytes
+        ).result()
+        for key, value in outputs.items():
+            if isinstance(value, SharedValueHandle):
+                self.context.adopt_handle(key, value)
+            else:
+                self.context.set(key, value)
+        if teardown_error is not None:
+            self.logger.error(f"Error during teardown of stage '{stage.name}': {teardown_error}")
+            self.context.set_metadata(f"teardown_error_{stage.name}", teardown_error)
+
+    def _run_graph(self, plan: List[StagePlan]) -> Optional[Tuple[str, Exception]]:
+        """Schedule stages as their dependencies finish until all are done or one fails.
+
+        :return: Name and exception of the first failed stage, or None
+        :rtype: Optional[Tuple[str, Exception]]
+        """
+        pending = set(range(len(self.stages)))
+        finished: Set[int] = set()
+        running: Dict[Future, int] = {}
+        failure: Optional[Tuple[str, Exception]] = None
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="pipeline-stage") as pool:
+            while pending or running:
+                if failure is None:
+                    for index in sorted(pending):
+                        if self.dependencies[index] <= finished:
+                            pending.discard(index)
+                            entry = plan[index]
+                            future = pool.submit(self._execute_stage, self.stages[index], entry.cache_key, entry.cache_hit)
+                            running[future] = index
+                if not running:
+                    break
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = running.pop(future)
+                    stage_name = self.stages[index].name
+                    try:
+                        self._set_stage_status(stage_name, future.result())
+                        finished.add(index)
+                    except Exception as e:
+                        self.logger.error(f"Error during execution of stage '{stage_name}': {e}", exc_info=True)
+                        self._set_stage_status(stage_name, "failed")
+                        if failure is None:
+                            failure = (stage_name, e)
+        return failure
+
+    def run_pipeline(self, dry_run: bool = False) -> PipelineContext:
+        """Execute the stages in dependency order, running independent stages concurrently.
+
+        Execution metadata in the context mirrors :class:`PipelineExecutor`
+        (``pipeline_status``, ``error_stage``, ``error_message``), plus
+        ``stage_status`` (stage name to ``completed``, ``cached`` or ``failed``)
+        and ``execution_plan``. When a stage fails, no further stages are
+        started, running stages are allowed to finish and the first failure
+        is raised.
+
+        :param dry_run: Only compute and log the execution plan
+        :type dry_run: bool
+        :return: The pipeline context after execution
+        :rtype: PipelineContext
+
+        :raises PipelineExecutionError: If any stage fails
+        """
+        plan = self.explain()
+        self.context.set_metadata("execution_plan", [asdict(entry) for entry in plan])
+        self.logger.info(f"Execution plan:\n{self.format_plan(plan)}")
+        if dry_run:
+            self.context.set_metadata("pipeline_status", "dry_run")
+            return self.context
+
+        self.logger.info("Starting DAG pipeline execution...")
+        self.context.set_metadata("pipeline_status", "running")
+        self.context.set_metadata("total_stages", len(self.stages))
+        self.context.set_metadata("stage_status", {})
+
+        if self.use_processes:
+            self.context.enable_shared_store()
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context(self.mp_context)
+            )
+        try:
+            failure = self._run_graph(plan)
+        finally:
+            if self._process_pool is not None:
+                self._process_pool.shutdown()
+                self._process_pool = None
+
+        if failure is not None:
+            stage_name, error = failure
+            self.context.set_metadata("pipeline_status", "failed")
+            self.context.set_metadata("error_stage", stage_name)
+            self.context.set_metadata("error_message", str(error))
+            raise PipelineExecutionError(f"Stage '{stage_name}' failed: {error}") from error
+
+        self.logger.info("DAG pipeline execution finished.")
+        self.context.set_metadata("pipeline_status", "completed")
+        return self.context
+
+    def __repr__(self) -> str:
+        stage_names = [stage.name for stage in self.stages]
+        return f"<DAGPipelineExecutor(stages={stage_names}, max_workers={self.max_workers})>"
@@ -4,6 +4,7 @@ from pathlib import Path
 
 from reinforcestrategycreator_pipeline.src.pipeline.stage import PipelineStage
 from reinforcestrategycreator_pipeline.src.pipeline.executor import PipelineExecutor, PipelineExecutionError
+from reinforcestrategycreator_pipeline.src.pipeline.dag_executor import DAGPipelineExecutor
 from reinforcestrategycreator_pipeline.src.pipeline.context import PipelineContext
 from reinforcestrategycreator_pipeline.src.config.manager import ConfigManager
 from reinforcestrategycreator_pipeline.src.monitoring.logger import get_logger
@@ -11,6 +12,7 @@ from reinforcestrategycreator_pipeline.src.monitoring.service import MonitoringS
 # Imports for ArtifactStore
 from reinforcestrategycreator_pipeline.src.artifact_store.base import ArtifactStore
 from reinforcestrategycreator_pipeline.src.artifact_store.local_adapter import LocalFileSystemStore
+from reinforcestrategycreator_pipeline.src.artifact_store.content_addressed import ContentAddressedStore
 # from reinforcestrategycreator_pipeline.src.artifact_store.s3_adapter import S3ArtifactStore # Example if S3 needed
 from reinforcestrategycreator_pipeline.src.config.models import ArtifactStoreConfig, ArtifactStoreType
 
@@ -52,7 +54,7 @@ class ModelPipeline:
         self.config_manager = config_manager
         self.logger = get_logger(f"orchestrator.ModelPipeline.{pipeline_name}") # Adjusted usage
         self.stages: List[PipelineStage] = []
-        self.executor: PipelineExecutor | None = None
+        self.executor: PipelineExecutor | DAGPipelineExecutor | None = None
         self.context: PipelineContext = PipelineContext.get_instance()
         self.context.set("config_manager", self.config_manager) # Make ConfigManager available to stages
         
@@ -194,7 +196,10 @@ class ModelPipeline:
 
             self.logger.info(f"ArtifactStore type from config: {store_type}, root_path: {root_path}")
 
-            if store_type == ArtifactStoreType.LOCAL:
+            if store_type == ArtifactStoreType.LOCAL and artifact_store_cfg_obj.content_addressed:
+                self.artifact_store_instance = ContentAddressedStore(root_path=Path(root_path))
+                self.logger.info(f"ContentAddressedStore initialized with root_path: {root_path}")
+            elif store_type == ArtifactStoreType.LOCAL:
                 self.artifact_store_instance = LocalFileSystemStore(root_path=Path(root_path))
                 self.logger.info(f"LocalFileSystemStore initialized with root_path: {root_path}")
             # elif store_type == ArtifactStoreType.S3:
@@ -293,7 +298,18 @@ class ModelPipeline:
             if not self.stages:
                 self.logger.warning(f"Pipeline '{self.pipeline_name}' loaded with no stages.")
             
-            self.executor = PipelineExecutor(self.stages)
+            # An optional 'executor' entry selects the DAG executor, e.g.
+            # executor: {type: "dag", max_workers: 4, use_processes: false}
+            executor_config = pipeline_def.get('executor') or {}
+            if executor_config.get('type') == 'dag':
+                self.executor = DAGPipelineExecutor(
+                    self.stages,
+                    max_workers=executor_config.get('max_workers', 4),
+                    artifact_store=self.artifact_store_instance,
+                    use_processes=executor_config.get('use_processes', False)
+                )
+            else:
+                self.executor = PipelineExecutor(self.stages)
             self.logger.info(f"Pipeline definition for '{self.pipeline_name}' loaded successfully with {len(self.stages)} stages.")
 
         except KeyError as e:
@@ -0,0 +1,193 @@
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+import weakref
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Optional, Set
+
+import numpy as np
+import pandas as pd
+
+from reinforcestrategycreator_pipeline.src.monitoring.logger import get_logger
+
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+DEFAULT_MIN_BYTES = 1 << 20
+SHARED_MEMORY_DIR = Path("/dev/shm")
+
+
+@dataclass
+class SharedValueHandle:
+    """Lightweight, picklable reference to a value spilled by a :class:`SharedValueStore`.
+
+    Arrays are stored as ``.npy`` files and DataFrames/Series as Arrow IPC
+    files; both are memory-mapped on load, so every process that loads the
+    same handle reads the same pages instead of its own copy. Loaded values
+    are read-only.
+
+    :param path: File holding the value
+    :param kind: ``"ndarray"``, ``"dataframe"`` or ``"series"``
+    :param nbytes: Size of the value in memory when it was spilled
+    :param name: Series name, for ``kind == "series"``
+    """
+    path: str
+    kind: str
+    nbytes: int
+    name: Any = None
+    _value: Any = field(default=None, init=False, repr=False, compare=False)
+
+    def load(self) -> Any:
+        """Memory-map the value; repeated loads in one process reuse the mapping.
+
+        :return: The spilled array, DataFrame or Series
+        :rtype: Any
+        """
+        if self._value is None:
+            if self.kind == "ndarray":
+                self._value = np.load(self.path, mmap_mode="r")
+            else:
+                table = pa.ipc.open_file(pa.memory_map(self.path, "r")).read_all()
+                frame = table.to_pandas(split_blocks=True)
+                self._value = frame.iloc[:, 0].rename(self.name) if self.kind == "series" else frame
+        return self._value
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_value"] = None
+        return state
+
+
+class SharedValueStore:
+    """Spills large arrays and DataFrames to memory-mapped files in a shared directory.
+
+    The store owns the files it writes and the handles it adopts; releasing
+    a handle or closing the store deletes them. A store opened on an
+    existing directory with ``owner=False`` (as in a worker process) leaves
+    the directory in place on close and only removes files it still owns,
+    so values handed back to the parent with :meth:`disown` survive.
+
+    :param directory: Directory for spilled values (default: a new directory
+        under ``/dev/shm`` when available, otherwise the system temp dir)
+    :param min_bytes: Values smaller than this stay in memory
+    :param owner: Whether the store removes the directory when closed
+    """
+
+    def __init__(self, directory: Optional[str] = None, min_bytes: int = DEFAULT_MIN_BYTES, owner: bool = True):
+        if directory is None:
+            base = SHARED_MEMORY_DIR if SHARED_MEMORY_DIR.is_dir() and os.access(SHARED_MEMORY_DIR, os.W_OK) else None
+            directory = tempfile.mkdtemp(prefix="pipeline_context_", dir=base)
+        else:
+            Path(directory).mkdir(parents=True, exist_ok=True)
+        self.directory = str(directory)
+        self.min_bytes = min_bytes
+        self.owner = owner
+        self._owned: Set[str] = set()
+        self._lock = threading.Lock()
+        self.logger = get_logger("context.SharedValueStore")
+        self._finalizer = weakref.finalize(self, shutil.rmtree, self.directory, True) if owner else None
+
+    @staticmethod
+    def _nbytes(value: Any) -> int:
+        if isinstance(value, np.ndarray):
+            return value.nbytes
+        if isinstance(value, (pd.DataFrame, pd.Series)):
+            # Series.memory_usage returns an int, DataFrame.memory_usage a Series per column
+            return int(np.sum(value.memory_usage(index=True, deep=False)))
+        return 0
+
+    def should_spill(self, value: Any) -> bool:
+        """Whether a value is a large array, DataFrame or Series the store can spill.
+
+        :param value: Candidate value
+        :type value: Any
+        :rtype: bool
+        """
+        if isinstance(value, np.ndarray):
+            return value.dtype != object and value.nbytes >= self.min_bytes
+        if isinstance(value, pd.DataFrame):
+            if not PYARROW_AVAILABLE or not all(isinstance(column, str) for column in value.columns):
+                return False
+        elif not (isinstance(value, pd.Series) and PYARROW_AVAILABLE):
+            return False
+        return self._nbytes(value) >= self.min_bytes
+
+    def spill(self, value: Any, key: str = "value") -> Optional[SharedValueHandle]:
+        """Write a value to the store and return a handle to it.
+
+        :param value: Array, DataFrame or Series to spill
+        :type value: Any
+        :param key: Context key, used in the file name for easier debugging
+        :type key: str
+        :return: Handle owned by this store, or None if the value could not be written
+        :rtype: Optional[SharedValueHandle]
+        """
+        stem = f"{''.join(c if c.isalnum() else '_' for c in key)[:40]}_{uuid.uuid4().hex}"
+        try:
+            if isinstance(value, np.ndarray):
+                path = os.path.join(self.directory, f"{stem}.npy")
+                np.save(path, value, allow_pickle=False)
+                handle = SharedValueHandle(path, "ndarray", value.nbytes)
+            else:
+                kind = "series" if isinstance(value, pd.Series) else "dataframe"
+                frame = value.to_frame(name="value") if kind == "series" else value
+                table = pa.Table.from_pandas(frame, preserve_index=True)
+                path = os.path.join(self.directory, f"{stem}.arrow")
+                with pa.OSFile(path, "wb") as sink:
+                    with pa.ipc.new_file(sink, table.schema) as writer:
+                        writer.write_table(table)
+                handle = SharedValueHandle(path, kind, self._nbytes(value), name=value.name if kind == "series" else None)
+        except Exception as e:
+            self.logger.debug(f"Keeping '{key}' in memory, it could not be spilled: {e}")
+            return None
+        self.adopt(handle)
+        return handle
+
+    def adopt(self, handle: SharedValueHandle) -> None:
+        """Take ownership of a handle's file, e.g. one written by a worker process."""
+        with self._lock:
+            self._owned.add(handle.path)
+
+    def disown(self, handle: SharedValueHandle) -> None:
+        """Give up ownership of a handle's file so that closing the store keeps it."""
+        with self._lock:
+            self._owned.discard(handle.path)
+
+    def owns(self, handle: SharedValueHandle) -> bool:
+        """Whether the store will delete the handle's file on release."""
+        with self._lock:
+            return handle.path in self._owned
+
+    def release(self, handle: SharedValueHandle) -> None:
+        """Delete an owned handle's file; handles owned elsewhere are left alone."""
+        with self._lock:
+            if handle.path not in self._owned:
+                return
+            self._owned.discard(handle.path)
+        try:
+            os.unlink(handle.path)
+        except OSError as e:
+            # Still mapped on platforms that forbid deleting open files; the
+            # directory is removed when the owning store closes.
+            self.logger.debug(f"Could not delete spilled value {handle.path}: {e}")
+
+    def close(self) -> None:
+        """Release every owned file and, for an owning store, remove the directory."""
+        with self._lock:
+            owned, self._owned = list(self._owned), set()
+        for path in owned:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+        if self._finalizer is not None:
+            self._finalizer()
+
+    def __repr__(self) -> str:
+        return f"<SharedValueStore(directory='{self.directory}', files={len(self._owned)})>"
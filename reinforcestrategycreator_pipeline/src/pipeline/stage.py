@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
 from reinforcestrategycreator_pipeline.src.pipeline.context import PipelineContext # Placeholder for now
 from reinforcestrategycreator_pipeline.src.monitoring.logger import get_logger # Changed import
@@ -19,15 +19,36 @@ class PipelineStage(ABC):
     :param config: Configuration dictionary specific to this stage
     :type config: Dict[str, Any]
     
+    Stages may declare the context keys they read (``inputs``) and write
+    (``outputs``) so that the DAG executor can order them and run independent
+    stages concurrently, and mark themselves ``cacheable`` so their outputs
+    are memoized. Subclasses set class-level defaults; the stage config can
+    override them with ``inputs``, ``outputs`` and ``cache`` entries.
+    ``None`` means undeclared, and such stages run as barriers.
+    
     Attributes:
         name: The stage instance name
         config: Stage-specific configuration
         logger: Logger instance for this stage
+        inputs: Context keys the stage reads, or None if undeclared
+        outputs: Context keys the stage writes, or None if undeclared
+        cacheable: Whether the stage's outputs may be memoized
     """
 
+    inputs: Optional[List[str]] = None
+    outputs: Optional[List[str]] = None
+    cacheable: bool = False
+
     def __init__(self, name: str, config: Dict[str, Any]):
         self.name = name
         self.config = config
+        if isinstance(config, dict):
+            if config.get("inputs") is not None:
+                self.inputs = list(config["inputs"])
+            if config.get("outputs") is not None:
+                self.outputs = list(config["outputs"])
+            if config.get("cache") is not None:
+                self.cacheable = bool(config["cache"])
         # Construct a more specific logger name. get_logger prefixes with 'pipeline.'
         logger_name = f"stage.{self.__class__.__name__}.{self.name}"
         self.logger = get_logger(logger_name) # Adjusted usage
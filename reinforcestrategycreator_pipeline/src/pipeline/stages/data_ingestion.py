@@ -21,6 +21,10 @@ class DataIngestionStage(PipelineStage):
     - Basic data quality checks
     - Storing raw data as artifacts
     """
+
+    inputs: List[str] = []
+    outputs: List[str] = ["raw_data", "data_validation_results", "data_metadata", "raw_data_artifact"]
+    cacheable = True
     
     def __init__(self, name: str = "data_ingestion", config: Optional[Dict[str, Any]] = None):
         """
@@ -98,6 +102,15 @@ class DataIngestionStage(PipelineStage):
                 raise ValueError("source_id for yfinance not configured in global data config.")
             self.logger.info(f"Configured to use yfinance source with ID: {self.source_id_from_config}")
 
+        elif self.source_type == "synthetic":
+            if not self.data_manager:
+                self.logger.error("DataManager not found in context. This is required for synthetic source type.")
+                raise RuntimeError("DataManager not found in pipeline context for synthetic source type.")
+            if not self.source_id_from_config:
+                self.logger.error("source_id not found in global_data_config. This is required for synthetic.")
+                raise ValueError("source_id for synthetic not configured in global data config.")
+            self.logger.info(f"Configured to use synthetic source with ID: {self.source_id_from_config}")
+
         # Get artifact store from context if available
         self.artifact_store = context.get("artifact_store")
 
@@ -251,6 +264,16 @@ class DataIngestionStage(PipelineStage):
             yfinance_params = {k: v for k, v in yfinance_params.items() if v is not None}
 
             data = self.data_manager.load_data(source_id=self.source_id_from_config, **yfinance_params)
+
+        elif self.source_type == "synthetic":
+            if not self.data_manager:
+                raise RuntimeError("DataManager not available for synthetic source type.")
+            if not self.source_id_from_config:
+                raise ValueError("source_id_from_config not set for synthetic source type.")
+
+            # The generator settings (symbols, bars, seed) were given when the source was registered
+            self.logger.info(f"Loading data using synthetic source via DataManager, source_id: {self.source_id_from_config}")
+            data = self.data_manager.load_data(source_id=self.source_id_from_config)
         else:
             raise ValueError(f"Unsupported source type: {self.source_type}")
             
@@ -1,6 +1,6 @@
 import pandas as pd
 import numpy as np
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from reinforcestrategycreator_pipeline.src.pipeline.stage import PipelineStage
 from reinforcestrategycreator_pipeline.src.pipeline.context import PipelineContext
@@ -16,8 +16,12 @@ class DeploymentStage(PipelineStage):
     Pipeline stage for deploying a trained model, currently supporting paper trading.
     """
 
+    inputs: List[str] = ["trained_model_artifact_id", "trained_model_version", "evaluation_data_output"]
+
     def __init__(self, name: str, config: Dict[str, Any]):
         super().__init__(name, config)
+        if self.outputs is None:
+            self.outputs = [f"{name}_paper_trading_portfolio"]
         self.deployment_config: Dict[str, Any] = {}
         self.model_artifact_id: str = ""
         self.model_version: str = "" # Optional, could be part of artifact_id or separate
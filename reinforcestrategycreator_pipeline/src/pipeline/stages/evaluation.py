@@ -29,6 +29,14 @@ class EvaluationStage(PipelineStage):
     - Comparing against baseline models
     - Saving evaluation results as artifacts
     """
+
+    inputs: List[str] = [
+        "trained_model", "model_type", "model_config", "trained_model_artifact_id", "trained_model_version"
+    ]
+    outputs: List[str] = [
+        "evaluation_results", "evaluation_reports", "evaluation_artifacts_summary",
+        "evaluation_data_output", "model_passed_thresholds", "evaluation_metadata"
+    ]
     
     def __init__(self, name: str = "evaluation", config: Optional[Dict[str, Any]] = None):
         """
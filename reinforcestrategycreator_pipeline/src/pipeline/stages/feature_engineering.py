@@ -1,6 +1,6 @@
 """Feature engineering stage implementation."""
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 import pandas as pd
 
 from reinforcestrategycreator_pipeline.src.pipeline.stage import PipelineStage
@@ -17,6 +17,10 @@ class FeatureEngineeringStage(PipelineStage):
     """
     Stage responsible for transforming raw data into features for model training.
     """
+
+    inputs: List[str] = ["raw_data"]
+    outputs: List[str] = ["processed_features", "labels"]
+    cacheable = True
     
     def __init__(self, name: str = "feature_engineering", config: Optional[Dict[str, Any]] = None):
         """
@@ -29,6 +29,12 @@ class TrainingStage(PipelineStage):
     - Tracking training metrics
     - Saving trained models as artifacts
     """
+
+    inputs: List[str] = ["processed_features", "data_metadata"]
+    outputs: List[str] = [
+        "trained_model", "training_history", "model_type", "model_config",
+        "training_metadata", "trained_model_artifact_id", "trained_model_version"
+    ]
     
     def __init__(self, name: str = "training", config: Optional[Dict[str, Any]] = None):
         """
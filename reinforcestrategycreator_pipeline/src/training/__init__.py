@@ -9,6 +9,7 @@ from .callbacks import (
 )
 from .engine import TrainingEngine
 from .hpo_optimizer import HPOptimizer
+from .population_trainer import PopulationTrainer
 
 # Optional visualization support
 try:
@@ -16,6 +17,7 @@ try:
     __all__ = [
         "TrainingEngine",
         "HPOptimizer",
+        "PopulationTrainer",
         "HPOVisualizer",
         "CallbackBase",
         "CallbackList",
@@ -28,6 +30,7 @@ except ImportError:
     __all__ = [
         "TrainingEngine",
         "HPOptimizer",
+        "PopulationTrainer",
         "CallbackBase",
         "CallbackList",
         "LoggingCallback",
@@ -2,6 +2,10 @@
 
 import json
 import logging
+import pickle
+import shutil
+import tempfile
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
@@ -13,8 +17,8 @@ import pandas as pd
 try:
     import ray
     from ray import tune
-    from ray.tune import CLIReporter
-    from ray.tune.schedulers import ASHAScheduler, PopulationBasedTraining
+    from ray.tune import Checkpoint, CLIReporter
+    from ray.tune.schedulers import ASHAScheduler, HyperBandScheduler, PopulationBasedTraining
     from ray.tune.search.optuna import OptunaSearch
     from ray.tune.search import ConcurrencyLimiter
     RAY_AVAILABLE = True
@@ -22,6 +26,12 @@ except ImportError:
     RAY_AVAILABLE = False
     warnings.warn("Ray Tune not available. Install with: pip install 'ray[tune]'")
 
+try:
+    from ray.tune.schedulers.pb2 import PB2
+    PB2_AVAILABLE = True
+except ImportError:
+    PB2_AVAILABLE = False
+
 try:
     import optuna
     OPTUNA_AVAILABLE = True
@@ -31,7 +41,62 @@ except ImportError:
 from ..models.base import ModelBase
 from ..models.factory import ModelFactory
 from ..artifact_store.base import ArtifactStore, ArtifactType
+from .callbacks import CallbackBase
 from .engine import TrainingEngine
+from .population_trainer import PER_MEMBER_PARAMS, PopulationTrainer
+
+
+class TuneReportCallback(CallbackBase):
+    """Reports every epoch to Ray Tune together with a checkpoint of the engine.
+    
+    With a checkpoint attached to each report, schedulers can pause a trial
+    and resume it later (HyperBand), or copy a strong trial's model into a
+    weak one and continue with perturbed hyperparameters (PBT, PB2), instead
+    of training every configuration from scratch.
+    
+    Each report carries the epoch's numeric logs plus ``env_steps`` (the
+    model's lifetime step counter, including steps inherited from a restored
+    checkpoint) and ``iteration_env_steps`` (steps taken during this epoch).
+    Models without a ``steps`` counter report zero for both.
+    """
+    
+    def __init__(self, engine: TrainingEngine):
+        """Initialize the callback.
+        
+        Args:
+            engine: Engine running the trial; used to write checkpoints
+        """
+        super().__init__("TuneReportCallback")
+        self.engine = engine
+        self.model = None
+        self._steps_at_epoch_start = 0
+    
+    def set_model(self, model: Any) -> None:
+        """Set the model being trained."""
+        self.model = model
+    
+    def _model_steps(self) -> int:
+        return int(getattr(self.model, "steps", 0) or 0)
+    
+    def on_epoch_begin(self, epoch: int, logs: Optional[Dict[str, Any]] = None) -> None:
+        """Remember the step counter at the start of the epoch."""
+        self._steps_at_epoch_start = self._model_steps()
+    
+    def on_epoch_end(self, epoch: int, logs: Optional[Dict[str, Any]] = None) -> None:
+        """Checkpoint the engine and report the epoch's metrics to Ray Tune."""
+        metrics = {
+            key: float(value) for key, value in (logs or {}).items()
+            if isinstance(value, (int, float, np.integer, np.floating)) and not isinstance(value, bool)
+        }
+        steps = self._model_steps()
+        metrics["env_steps"] = steps
+        metrics["iteration_env_steps"] = steps - self._steps_at_epoch_start
+        
+        checkpoint_path = self.engine.save_checkpoint(f"tune_epoch_{epoch}")
+        try:
+            tune.report(metrics, checkpoint=Checkpoint.from_directory(str(checkpoint_path)))
+        finally:
+            shutil.rmtree(checkpoint_path, ignore_errors=True)
 
 
 class HPOptimizer:
@@ -201,73 +266,98 @@ class HPOptimizer:
             model_config = model_config_template.copy()
             
             # Apply hyperparameters to model config
-            if param_mapping:
-                for hpo_param, config_path in param_mapping.items():
-                    if hpo_param in config:
-                        # Navigate the config path and set value
-                        self._set_nested_config(model_config, config_path, config[hpo_param])
-            else:
-                # Direct mapping - assume HPO params match model hyperparameters
-                if "hyperparameters" not in model_config:
-                    model_config["hyperparameters"] = {}
-                model_config["hyperparameters"].update(config)
+            overrides = self._hyperparameter_overrides(config, param_mapping)
+            for config_path, value in overrides.items():
+                self._set_nested_config(model_config, config_path, value)
             
-            # Train the model using the worker's TrainingEngine with DataManager
-            result = worker_training_engine.train(
-                model_config=model_config,
-                data_config=data_config,
-                training_config=training_config,
-                callbacks=None  # Use default callbacks
-            )
+            # Resume from the trial's checkpoint: its own when a scheduler paused and
+            # resumed it, or another trial's when PBT/PB2 cloned a better performer
+            resume_from = None
+            checkpoint = tune.get_checkpoint()
+            if checkpoint is not None:
+                resume_from = checkpoint.to_directory(tempfile.mkdtemp(prefix="hpo_resume_"))
+                self._retarget_checkpoint(resume_from, overrides)
             
-            # Extract metrics for Ray Tune
-            if result["success"]:
-                metrics = result.get("final_metrics", {})
-                # Add training history summary
-                if "history" in result:
-                    history = result["history"]
-                    if history.get("loss"):
-                        metrics["final_loss"] = history["loss"][-1]
-                        metrics["min_loss"] = min(history["loss"])
-                    if history.get("val_loss"):
-                        metrics["final_val_loss"] = history["val_loss"][-1]
-                        metrics["min_val_loss"] = min(history["val_loss"])
-                
-                # Report epoch-level metrics to Ray Tune
-                for epoch_idx, epoch in enumerate(history.get("epochs", [])):
-                    epoch_metrics = {
-                        "loss": history["loss"][epoch_idx] if epoch_idx < len(history["loss"]) else None,
-                        "val_loss": history["val_loss"][epoch_idx] if epoch_idx < len(history.get("val_loss", [])) else None,
-                        "epoch": epoch
-                    }
-                    # Remove None values
-                    epoch_metrics = {k: v for k, v in epoch_metrics.items() if v is not None}
-                    tune.report(metrics=epoch_metrics)
-                
-                # CRITICAL FIX: Report final metrics as the last result to ensure get_best_trial works
-                # This ensures that the final metric is available in trial.last_result for get_best_trial
-                final_metrics = {}
-                if history.get("loss"):
-                    # Use the final loss as the primary optimization metric
-                    final_metrics["loss"] = history["loss"][-1]
-                    final_metrics["final_loss"] = history["loss"][-1]
-                    final_metrics["min_loss"] = min(history["loss"])
-                if history.get("val_loss"):
-                    final_metrics["val_loss"] = history["val_loss"][-1]
-                    final_metrics["final_val_loss"] = history["val_loss"][-1]
-                    final_metrics["min_val_loss"] = min(history["val_loss"])
-                
-                # Add any additional final metrics
-                final_metrics.update(metrics)
-                
-                # Report final metrics as the last result - this is what get_best_trial will use
-                tune.report(metrics=final_metrics)
-            else:
+            # Tune owns checkpointing for trials; skip the engine's per-epoch checkpoints
+            # unless the training config asks for them explicitly
+            trial_training_config = {"save_checkpoints": False, **training_config}
+            
+            # Train the model using the worker's TrainingEngine, reporting every epoch
+            try:
+                result = worker_training_engine.train(
+                    model_config=model_config,
+                    data_config=data_config,
+                    training_config=trial_training_config,
+                    callbacks=[TuneReportCallback(worker_training_engine)],
+                    resume_from_checkpoint=resume_from
+                )
+            finally:
+                if resume_from is not None:
+                    shutil.rmtree(resume_from, ignore_errors=True)
+            
+            if not result["success"]:
                 # Report failure - Ray Tune expects metrics in a specific format
                 tune.report(metrics={"loss": float('inf'), "error": result.get("error", "Unknown error")})
         
         return trainable
     
+    def _hyperparameter_overrides(
+        self,
+        config: Dict[str, Any],
+        param_mapping: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """Map a trial's hyperparameters to model config paths.
+        
+        Args:
+            config: Hyperparameters sampled for the trial
+            param_mapping: Mapping from HPO params to config paths
+            
+        Returns:
+            Dictionary of dot-separated config path to value
+        """
+        if param_mapping:
+            return {
+                config_path: config[hpo_param]
+                for hpo_param, config_path in param_mapping.items()
+                if hpo_param in config
+            }
+        # Direct mapping - assume HPO params match model hyperparameters
+        return {f"hyperparameters.{name}": value for name, value in config.items()}
+    
+    def _retarget_checkpoint(self, checkpoint_dir: Union[str, Path], overrides: Dict[str, Any]) -> None:
+        """Point a restored checkpoint at the current trial's hyperparameters.
+        
+        A checkpoint cloned from another trial carries that trial's model
+        configuration. The engine rebuilds the model from ``config.json`` and
+        the model restores its creation config from ``model.pkl``, so both are
+        rewritten to keep the weights but train on with this trial's values.
+        
+        Args:
+            checkpoint_dir: Restored checkpoint directory
+            overrides: Config path to value, from :meth:`_hyperparameter_overrides`
+        """
+        checkpoint_dir = Path(checkpoint_dir)
+        
+        config_path = checkpoint_dir / ModelBase.CONFIG_FILENAME
+        if config_path.exists():
+            with open(config_path, "r") as f:
+                saved_config = json.load(f)
+            for path, value in overrides.items():
+                self._set_nested_config(saved_config, path, value)
+            with open(config_path, "w") as f:
+                json.dump(saved_config, f, indent=2, default=str)
+        
+        state_path = checkpoint_dir / "model.pkl"
+        if state_path.exists():
+            with open(state_path, "rb") as f:
+                state = pickle.load(f)
+            creation_config = state.get("creation_config") if isinstance(state, dict) else None
+            if isinstance(creation_config, dict):
+                for path, value in overrides.items():
+                    self._set_nested_config(creation_config, path, value)
+                with open(state_path, "wb") as f:
+                    pickle.dump(state, f)
+    
     def _set_nested_config(self, config: Dict[str, Any], path: str, value: Any) -> None:
         """Set a value in a nested configuration dictionary.
         
@@ -300,7 +390,9 @@ class HPOptimizer:
         mode: str = "min",
         param_mapping: Optional[Dict[str, str]] = None,
         resources_per_trial: Optional[Dict[str, Any]] = None,
-        name: Optional[str] = None
+        name: Optional[str] = None,
+        executor: str = "tune",
+        population_size: int = 16
     ) -> Dict[str, Any]:
         """Run hyperparameter optimization.
         
@@ -312,16 +404,34 @@ class HPOptimizer:
             num_trials: Number of trials to run
             max_concurrent_trials: Maximum concurrent trials
             search_algorithm: Search algorithm to use
-            scheduler: Trial scheduler ("asha", "pbt", None)
+            scheduler: Trial scheduler ("asha", "hyperband", "pbt", "pb2", None).
+                "hyperband" pauses and resumes trials from checkpoints; "pbt" and
+                "pb2" clone the best trials' checkpoints into the worst ones and
+                perturb their hyperparameters ("pb2" needs GPy and scikit-learn
+                and only explores uniform/loguniform params)
             metric: Metric to optimize
             mode: Optimization mode ("min" or "max")
             param_mapping: Mapping from HPO params to config paths
             resources_per_trial: Resources per trial (CPUs, GPUs)
             name: Name for this HPO run
-            
+            executor: "tune" runs one Ray Tune trial per configuration;
+                "population" trains DQN configurations ``population_size`` at a
+                time as one batched program in this process (see
+                :meth:`_optimize_population`)
+            population_size: Configurations per batched population
+        
         Returns:
             Dictionary containing optimization results
         """
+        if executor == "population":
+            return self._optimize_population(
+                model_config, data_config, training_config, param_space,
+                num_trials=num_trials, metric=metric, mode=mode,
+                param_mapping=param_mapping, population_size=population_size, name=name
+            )
+        if executor != "tune":
+            raise ValueError(f"Unknown HPO executor '{executor}'. Use 'tune' or 'population'")
+        
         # Initialize Ray if not already initialized
         if not ray.is_initialized():
             ray.init(**self.ray_config)
@@ -346,13 +456,34 @@ class HPOptimizer:
                     grace_period=1,
                     reduction_factor=2
                 )
+            elif scheduler == "hyperband":
+                # Synchronous successive halving: trials are paused at each rung and
+                # the survivors resume from their checkpoints
+                tune_scheduler = HyperBandScheduler(
+                    time_attr="training_iteration",
+                    metric=metric,
+                    mode=mode,
+                    max_t=training_config.get("epochs", 100),
+                    reduction_factor=2
+                )
             elif scheduler == "pbt":
                 tune_scheduler = PopulationBasedTraining(
+                    time_attr="training_iteration",
                     metric=metric,
                     mode=mode,
-                    perturbation_interval=4,
+                    perturbation_interval=training_config.get("perturbation_interval", 4),
                     hyperparam_mutations=processed_space
                 )
+            elif scheduler == "pb2":
+                if not PB2_AVAILABLE:
+                    raise ImportError("PB2 is not available in this Ray installation")
+                tune_scheduler = PB2(
+                    time_attr="training_iteration",
+                    metric=metric,
+                    mode=mode,
+                    perturbation_interval=training_config.get("perturbation_interval", 4),
+                    hyperparam_bounds=self._pb2_bounds(param_space)
+                )
             
             # Create trainable function
             trainable = self._create_trainable(
@@ -380,7 +511,8 @@ class HPOptimizer:
                 storage_path=f"file://{self.results_dir.absolute()}",
                 progress_reporter=reporter,
                 verbose=1,
-                stop={"training_iteration": training_config.get("epochs", 100)}
+                stop={"training_iteration": training_config.get("epochs", 100)},
+                checkpoint_config=tune.CheckpointConfig(num_to_keep=4)
             )
             
             # Extract results
@@ -412,30 +544,13 @@ class HPOptimizer:
                 "all_trials": self.all_trials,
                 "search_algorithm": search_algorithm,
                 "scheduler": scheduler,
-                "param_space": param_space
+                "param_space": param_space,
+                "compute": self._summarize_compute(
+                    analysis, num_trials, training_config.get("epochs", 100)
+                )
             }
             
-            # Save to file
-            results_file = self.results_dir / f"{run_name}_results.json"
-            with open(results_file, "w") as f:
-                json.dump(results, f, indent=2, default=str)
-            
-            # Save to artifact store if available
-            if self.artifact_store:
-                artifact_metadata = self.artifact_store.save_artifact(
-                    artifact_id=f"hpo_results_{run_name}",
-                    artifact_path=results_file,
-                    artifact_type=ArtifactType.REPORT,
-                    metadata={
-                        "type": "hpo_results",
-                        "run_name": run_name,
-                        "best_score": self.best_score,
-                        "best_params": self.best_params,
-                        "num_trials": num_trials
-                    },
-                    tags=["hpo", "optimization", "results"]
-                )
-                results["artifact_id"] = artifact_metadata.artifact_id
+            self._save_results(results)
             
             self.logger.info(f"HPO completed. Best {metric}: {self.best_score}")
             self.logger.info(f"Best parameters: {self.best_params}")
@@ -447,6 +562,254 @@ class HPOptimizer:
             if ray.is_initialized():
                 ray.shutdown()
     
+    def _save_results(self, results: Dict[str, Any]) -> None:
+        """Write HPO results to the results directory and, if available, the artifact store.
+        
+        Args:
+            results: Results dictionary; gains ``artifact_id`` when stored as an artifact
+        """
+        run_name = results["run_name"]
+        results_file = self.results_dir / f"{run_name}_results.json"
+        with open(results_file, "w") as f:
+            json.dump(results, f, indent=2, default=str)
+        
+        # Save to artifact store if available
+        if self.artifact_store:
+            artifact_metadata = self.artifact_store.save_artifact(
+                artifact_id=f"hpo_results_{run_name}",
+                artifact_path=results_file,
+                artifact_type=ArtifactType.REPORT,
+                metadata={
+                    "type": "hpo_results",
+                    "run_name": run_name,
+                    "best_score": self.best_score,
+                    "best_params": self.best_params,
+                    "num_trials": results["num_trials"]
+                },
+                tags=["hpo", "optimization", "results"]
+            )
+            results["artifact_id"] = artifact_metadata.artifact_id
+
+    def _sample_params(self, param_space: Dict[str, Any], rng: np.random.Generator) -> Dict[str, Any]:
+        """Draw one configuration from a search space without Ray Tune.
+        
+        Args:
+            param_space: Search space in the format accepted by :meth:`define_search_space`
+            rng: Random generator
+        
+        Returns:
+            Sampled configuration
+        """
+        params = {}
+        for param_name, param_config in param_space.items():
+            if not isinstance(param_config, dict):
+                params[param_name] = param_config
+                continue
+            param_type = param_config.get("type", "uniform")
+            if param_type == "uniform":
+                params[param_name] = float(rng.uniform(param_config["low"], param_config["high"]))
+            elif param_type == "loguniform":
+                params[param_name] = float(np.exp(rng.uniform(np.log(param_config["low"]), np.log(param_config["high"]))))
+            elif param_type == "choice":
+                values = param_config["values"]
+                params[param_name] = values[rng.integers(len(values))]
+            elif param_type == "randint":
+                params[param_name] = int(rng.integers(param_config["low"], param_config["high"]))
+            elif param_type == "quniform":
+                q = param_config.get("q", 1)
+                params[param_name] = float(np.round(rng.uniform(param_config["low"], param_config["high"]) / q) * q)
+            else:
+                params[param_name] = param_config
+        return params
+
+    def _optimize_population(
+        self,
+        model_config: Dict[str, Any],
+        data_config: Dict[str, Any],
+        training_config: Dict[str, Any],
+        param_space: Dict[str, Any],
+        num_trials: int = 10,
+        metric: str = "loss",
+        mode: str = "min",
+        param_mapping: Optional[Dict[str, str]] = None,
+        population_size: int = 16,
+        name: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Run HPO for DQN with :class:`PopulationTrainer` instead of Ray Tune.
+        
+        Configurations are sampled at random and trained ``population_size``
+        at a time in this process. The members of a population share one
+        batched forward/backward pass per step, which removes most of the
+        per-trial Python overhead of tiny networks. Only the per-member
+        hyperparameters (``learning_rate``, ``gamma``, ``epsilon_start``,
+        ``epsilon_end``, ``epsilon_decay``) may be searched; fixed values of
+        other parameters go to the shared model hyperparameters. Each
+        configuration trains for ``training_config["epochs"]`` episodes.
+        
+        Args:
+            model_config: Base DQN model configuration
+            data_config: Data configuration
+            training_config: Training configuration (epochs, validation_split, seed)
+            param_space: Hyperparameter search space
+            num_trials: Number of configurations to evaluate
+            metric: Per-episode metric to optimize ("loss", "episode_reward",
+                "total_return", "val_total_return" or "val_sharpe_ratio")
+            mode: Optimization mode ("min" or "max")
+            param_mapping: Mapping from HPO params to config paths; the last path
+                component names the hyperparameter
+            population_size: Configurations per batched population
+            name: Name for this HPO run
+        
+        Returns:
+            Dictionary containing optimization results
+        """
+        shared_hyperparameters = dict(model_config.get("hyperparameters", {}))
+        member_names = {}
+        for param_name, param_config in param_space.items():
+            target = param_mapping.get(param_name, param_name) if param_mapping else param_name
+            target = target.split(".")[-1]
+            if target in PER_MEMBER_PARAMS:
+                member_names[param_name] = target
+            elif isinstance(param_config, dict):
+                raise ValueError(
+                    f"Parameter '{param_name}' cannot vary within a population; "
+                    f"searchable parameters are {PER_MEMBER_PARAMS}"
+                )
+            else:
+                shared_hyperparameters[target] = param_config
+        
+        validation_split = training_config.get("validation_split", 0.2)
+        train_data, val_data = self.training_engine._load_data(data_config, validation_split)
+        train_data = train_data.values if isinstance(train_data, pd.DataFrame) else np.asarray(train_data)
+        if isinstance(val_data, pd.DataFrame):
+            val_data = val_data.values
+        
+        seed = training_config.get("seed")
+        rng = np.random.default_rng(seed)
+        configs = [self._sample_params(param_space, rng) for _ in range(num_trials)]
+        episodes = training_config.get("epochs", 10)
+        run_name = name or f"hpo_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        self.logger.info(
+            f"Starting population HPO run '{run_name}' with {num_trials} trials, {population_size} per population"
+        )
+        
+        start = time.perf_counter()
+        self.all_trials = []
+        for offset in range(0, num_trials, population_size):
+            batch = configs[offset:offset + population_size]
+            trainer = PopulationTrainer(
+                [{member_names[k]: v for k, v in params.items() if k in member_names} for params in batch],
+                shared_hyperparameters,
+                seed=None if seed is None else seed + offset
+            )
+            history = trainer.train(train_data, val_data, episodes=episodes)
+            for member, params in enumerate(batch):
+                if metric not in history[member]:
+                    raise ValueError(f"Metric '{metric}' is not reported by the population trainer")
+                self.all_trials.append({
+                    "trial_id": f"population_{offset + member:05d}",
+                    "params": params,
+                    "metric": history[member][metric][-1],
+                    "status": "TERMINATED",
+                    "iterations": episodes
+                })
+        elapsed = time.perf_counter() - start
+        
+        scored = [t for t in self.all_trials if np.isfinite(t["metric"])] or self.all_trials
+        best = (min if mode == "min" else max)(scored, key=lambda t: t["metric"])
+        self.best_params = best["params"]
+        self.best_score = best["metric"]
+        
+        results = {
+            "run_name": run_name,
+            "timestamp": datetime.now().isoformat(),
+            "num_trials": num_trials,
+            "metric": metric,
+            "mode": mode,
+            "best_params": self.best_params,
+            "best_score": self.best_score,
+            "all_trials": self.all_trials,
+            "search_algorithm": "random",
+            "scheduler": None,
+            "executor": "population",
+            "population_size": population_size,
+            "param_space": param_space,
+            "elapsed_seconds": elapsed,
+            "trials_per_hour": num_trials * 3600.0 / elapsed if elapsed > 0 else float("inf")
+        }
+        self._save_results(results)
+        
+        self.logger.info(
+            f"Population HPO completed in {elapsed:.1f}s ({results['trials_per_hour']:,.0f} trials/hour). "
+            f"Best {metric}: {self.best_score}"
+        )
+        return results
+
+    def _pb2_bounds(self, param_space: Dict[str, Any]) -> Dict[str, List[float]]:
+        """Extract PB2 exploration bounds from the continuous entries of a search space.
+        
+        Args:
+            param_space: Search space as passed to :meth:`optimize`
+            
+        Returns:
+            Dictionary of parameter name to [low, high]
+        """
+        bounds = {
+            name: [param_config["low"], param_config["high"]]
+            for name, param_config in param_space.items()
+            if isinstance(param_config, dict) and param_config.get("type", "uniform") in ("uniform", "loguniform")
+        }
+        if not bounds:
+            raise ValueError("PB2 needs at least one uniform or loguniform parameter in param_space")
+        return bounds
+    
+    def _summarize_compute(self, analysis: Any, num_trials: int, epochs: int) -> Dict[str, Any]:
+        """Compare the environment steps actually run with training every trial from scratch.
+        
+        The from-scratch figure is ``num_trials`` runs of ``epochs`` epochs each
+        at the measured steps per epoch. Savings come from trials stopped early
+        and from trials resumed or cloned from checkpoints.
+        
+        Args:
+            analysis: Ray Tune ``ExperimentAnalysis`` of the run
+            num_trials: Number of sampled configurations
+            epochs: Epoch budget per trial
+            
+        Returns:
+            Dictionary with executed, from-scratch and saved env steps
+        """
+        try:
+            frames = [
+                df for df in analysis.trial_dataframes.values()
+                if isinstance(df, pd.DataFrame) and "iteration_env_steps" in df.columns
+            ]
+        except Exception as e:
+            self.logger.warning(f"Could not read trial progress for the compute summary: {e}")
+            return {}
+        if not frames:
+            return {}
+        
+        progress = pd.concat(frames, ignore_index=True)
+        executed_epochs = len(progress)
+        executed_steps = int(progress["iteration_env_steps"].sum())
+        steps_per_epoch = executed_steps / executed_epochs if executed_epochs else 0.0
+        from_scratch_steps = int(round(num_trials * epochs * steps_per_epoch))
+        saved_steps = max(from_scratch_steps - executed_steps, 0)
+        
+        compute = {
+            "executed_epochs": executed_epochs,
+            "from_scratch_epochs": num_trials * epochs,
+            "executed_env_steps": executed_steps,
+            "from_scratch_env_steps": from_scratch_steps,
+            "saved_env_steps": saved_steps,
+            "saved_fraction": saved_steps / from_scratch_steps if from_scratch_steps else 0.0
+        }
+        self.logger.info(
+            f"HPO compute: {executed_steps:,} env steps run vs {from_scratch_steps:,} from scratch "
+            f"({compute['saved_fraction'] * 100:.1f}% saved)"
+        )
+        return compute
+    
     def analyze_results(
         self,
         results: Optional[Dict[str, Any]] = None,
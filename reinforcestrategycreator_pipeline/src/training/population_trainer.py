@@ -0,0 +1,463 @@
+"""Train a population of small DQN agents as one batched program in a single process."""
+
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+# Hyperparameters that may differ between members of one population; everything
+# else (network shape, batch size, buffer size, update schedule) is shared.
+PER_MEMBER_PARAMS = ("learning_rate", "gamma", "epsilon_start", "epsilon_end", "epsilon_decay")
+
+# Defaults match DQN.train
+MEMBER_DEFAULTS = {
+    "learning_rate": 0.001,
+    "gamma": 0.99,
+    "epsilon_start": 1.0,
+    "epsilon_end": 0.01,
+    "epsilon_decay": 0.995
+}
+
+
+class StackedQNetworks:
+    """K independent MLP Q-networks stored as stacked weight tensors.
+
+    Layer ``i`` of every member lives in one array of shape ``(K, fan_in, fan_out)``
+    (biases ``(K, 1, fan_out)``), so a forward or backward pass for the whole
+    population is one batched matrix product per layer. The layout, ReLU
+    hidden layers, initialization and Adam update are those of
+    :class:`~..models.implementations.dqn.DQN`, applied member-wise.
+    """
+
+    def __init__(
+        self,
+        population_size: int,
+        input_dim: int,
+        n_actions: int,
+        hidden_dims: Sequence[int],
+        learning_rates: np.ndarray,
+        beta1: float = 0.9,
+        beta2: float = 0.999,
+        adam_epsilon: float = 1e-8,
+        rng: Optional[np.random.Generator] = None
+    ):
+        """Initialize the stacked networks.
+
+        Args:
+            population_size: Number of members K
+            input_dim: State dimension
+            n_actions: Number of discrete actions
+            hidden_dims: Hidden layer sizes, shared by all members
+            learning_rates: Adam learning rate of each member, shape (K,)
+            beta1: Adam first-moment decay
+            beta2: Adam second-moment decay
+            adam_epsilon: Adam numerical epsilon
+            rng: Random generator for weight initialization
+        """
+        rng = rng or np.random.default_rng()
+        self.population_size = population_size
+        self.hidden_dims = list(hidden_dims)
+        self.learning_rates = np.asarray(learning_rates, dtype=np.float64).reshape(population_size, 1, 1)
+        self.beta1 = beta1
+        self.beta2 = beta2
+        self.adam_epsilon = adam_epsilon
+
+        self.weights: Dict[str, np.ndarray] = {}
+        prev_size = input_dim
+        for i, hidden_size in enumerate(self.hidden_dims):
+            self.weights[f"W{i}"] = rng.standard_normal((population_size, prev_size, hidden_size)) * 0.01
+            self.weights[f"b{i}"] = np.zeros((population_size, 1, hidden_size))
+            prev_size = hidden_size
+        self.weights["W_out"] = rng.standard_normal((population_size, prev_size, n_actions)) * 0.01
+        self.weights["b_out"] = np.zeros((population_size, 1, n_actions))
+
+        self.target_weights = {key: value.copy() for key, value in self.weights.items()}
+        self.adam_t = 0
+        self.adam_m = {key: np.zeros_like(value) for key, value in self.weights.items()}
+        self.adam_v = {key: np.zeros_like(value) for key, value in self.weights.items()}
+
+    def _forward(self, states: np.ndarray, weights: Dict[str, np.ndarray]) -> Tuple[np.ndarray, List[np.ndarray], List[np.ndarray]]:
+        activations = [states]
+        pre_activations = []
+        x = states
+        for i in range(len(self.hidden_dims)):
+            z = x @ weights[f"W{i}"] + weights[f"b{i}"]
+            x = np.maximum(0, z)
+            pre_activations.append(z)
+            activations.append(x)
+        return x @ weights["W_out"] + weights["b_out"], activations, pre_activations
+
+    def q_values(self, states: np.ndarray, target: bool = False) -> np.ndarray:
+        """Q-values of every member.
+
+        Args:
+            states: Shape (K, B, input_dim); (B, input_dim) is broadcast to all members
+            target: Use the target networks
+
+        Returns:
+            Q-values with shape (K, B, n_actions)
+        """
+        if states.ndim == 2:
+            states = np.broadcast_to(states, (self.population_size,) + states.shape)
+        q_values, _, _ = self._forward(states, self.target_weights if target else self.weights)
+        return q_values
+
+    def train_step(
+        self,
+        states: np.ndarray,
+        actions: np.ndarray,
+        rewards: np.ndarray,
+        next_states: np.ndarray,
+        dones: np.ndarray,
+        gammas: np.ndarray,
+        double_dqn: bool = True
+    ) -> np.ndarray:
+        """One Adam step on each member's own mini-batch.
+
+        Args:
+            states: Shape (K, B, input_dim)
+            actions: Shape (K, B)
+            rewards: Shape (K, B)
+            next_states: Shape (K, B, input_dim)
+            dones: Shape (K, B)
+            gammas: Discount factor of each member, shape (K,)
+            double_dqn: Select next actions with the online networks
+
+        Returns:
+            Mean squared TD error of each member, shape (K,)
+        """
+        batch_size = states.shape[1]
+        next_q_target = self.q_values(next_states, target=True)
+        if double_dqn:
+            next_actions = np.argmax(self.q_values(next_states), axis=2)
+            next_q = np.take_along_axis(next_q_target, next_actions[..., None], axis=2)[..., 0]
+        else:
+            next_q = next_q_target.max(axis=2)
+        targets = rewards + gammas[:, None] * next_q * (1 - dones)
+
+        q_all, activations, pre_activations = self._forward(states, self.weights)
+        q_selected = np.take_along_axis(q_all, actions[..., None], axis=2)[..., 0]
+        errors = q_selected - targets
+        losses = np.mean(errors ** 2, axis=1)
+
+        # Backward pass, member-wise: the same algebra as DQN._train_step on stacked arrays
+        grads = {}
+        d_z = np.zeros_like(q_all)
+        np.put_along_axis(d_z, actions[..., None], (2 * errors / batch_size)[..., None], axis=2)
+        grads["W_out"] = activations[-1].transpose(0, 2, 1) @ d_z
+        grads["b_out"] = d_z.sum(axis=1, keepdims=True)
+        d_a = d_z @ self.weights["W_out"].transpose(0, 2, 1)
+        for i in range(len(self.hidden_dims) - 1, -1, -1):
+            d_z = d_a * (pre_activations[i] > 0)
+            grads[f"W{i}"] = activations[i].transpose(0, 2, 1) @ d_z
+            grads[f"b{i}"] = d_z.sum(axis=1, keepdims=True)
+            if i > 0:
+                d_a = d_z @ self.weights[f"W{i}"].transpose(0, 2, 1)
+
+        self.adam_t += 1
+        correction1 = 1 - self.beta1 ** self.adam_t
+        correction2 = 1 - self.beta2 ** self.adam_t
+        for key, grad in grads.items():
+            self.adam_m[key] = self.beta1 * self.adam_m[key] + (1 - self.beta1) * grad
+            self.adam_v[key] = self.beta2 * self.adam_v[key] + (1 - self.beta2) * grad ** 2
+            m_hat = self.adam_m[key] / correction1
+            v_hat = self.adam_v[key] / correction2
+            self.weights[key] -= self.learning_rates * m_hat / (np.sqrt(v_hat) + self.adam_epsilon)
+        return losses
+
+    def sync_target(self) -> None:
+        """Copy every member's online weights into its target network."""
+        for key, value in self.weights.items():
+            np.copyto(self.target_weights[key], value)
+
+    def member_weights(self, member: int) -> Dict[str, np.ndarray]:
+        """Weights of one member in the layout of ``DQN.q_network["weights"]``.
+
+        Args:
+            member: Member index
+
+        Returns:
+            Dictionary of weight matrices and 1-D biases
+        """
+        return {
+            key: value[member, 0].copy() if key.startswith("b") else value[member].copy()
+            for key, value in self.weights.items()
+        }
+
+
+class PopulationTrainer:
+    """Trains K DQN configurations at once in a single process.
+
+    Each member has its own Q-network, target network, Adam state,
+    learning rate, discount factor and epsilon schedule, its own trading
+    account and its own replay samples. Members step through the same price
+    series in lockstep, so a step costs one batched forward pass for the
+    whole population instead of K small ones, and replayed states are stored
+    once and shared. The trading simulation and reward are those of
+    ``DQN.train`` (hold/buy/sell, transaction costs, invalid-action penalty,
+    liquidation at the end of the episode).
+
+    Members never exchange information: their results are the same as K
+    separate runs up to random number draws.
+    """
+
+    def __init__(
+        self,
+        member_configs: List[Dict[str, Any]],
+        hyperparameters: Optional[Dict[str, Any]] = None,
+        seed: Optional[int] = None
+    ):
+        """Initialize the trainer.
+
+        Args:
+            member_configs: One dict per member with any of ``PER_MEMBER_PARAMS``;
+                missing values fall back to ``hyperparameters`` and then to the
+                DQN defaults
+            hyperparameters: Shared DQN hyperparameters (``hidden_layers``,
+                ``batch_size``, ``memory_size``, ``update_frequency``,
+                ``target_update_frequency``, ``double_dqn``, Adam settings)
+            seed: Seed for weights, exploration and replay sampling
+        """
+        if not member_configs:
+            raise ValueError("PopulationTrainer needs at least one member config")
+        hyperparameters = hyperparameters or {}
+        self.population_size = len(member_configs)
+        self.member_configs = [dict(c) for c in member_configs]
+        self.hidden_dims = list(hyperparameters.get("hidden_layers", [256, 128, 64]))
+        self.batch_size = hyperparameters.get("batch_size", 32)
+        self.memory_size = hyperparameters.get("memory_size", 10000)
+        self.update_frequency = hyperparameters.get("update_frequency", 4)
+        self.target_update_frequency = hyperparameters.get("target_update_frequency", 100)
+        self.double_dqn = hyperparameters.get("double_dqn", True)
+        self.adam = {
+            "beta1": hyperparameters.get("adam_beta1", 0.9),
+            "beta2": hyperparameters.get("adam_beta2", 0.999),
+            "adam_epsilon": hyperparameters.get("adam_epsilon", 1e-8)
+        }
+
+        # Per-member values as (K,) arrays
+        self.member_params = {
+            name: np.array([
+                config.get(name, hyperparameters.get(name, MEMBER_DEFAULTS[name]))
+                for config in self.member_configs
+            ], dtype=np.float64)
+            for name in PER_MEMBER_PARAMS
+        }
+
+        # Trading simulation constants, as in DQN.train
+        self.initial_cash = 100000.0
+        self.transaction_cost_rate = 0.001
+        self.invalid_action_penalty = -1.0
+        self.hold_cash_reward = -0.005
+        self.unrealized_pnl_reward_scaling_factor = 0.1
+        self.close_price_index = 3
+        self.n_actions = 3
+
+        self.rng = np.random.default_rng(seed)
+        self.networks: Optional[StackedQNetworks] = None
+        self.steps = 0
+        self.episodes = 0
+        self.logger = logging.getLogger("PopulationTrainer")
+
+    def _build(self, input_dim: int) -> None:
+        self.networks = StackedQNetworks(
+            self.population_size, input_dim, self.n_actions, self.hidden_dims,
+            self.member_params["learning_rate"], rng=self.rng, **self.adam
+        )
+        capacity = self.memory_size
+        self._buffer_states = np.zeros((capacity, input_dim))
+        self._buffer_next_states = np.zeros((capacity, input_dim))
+        self._buffer_dones = np.zeros(capacity)
+        self._buffer_actions = np.zeros((self.population_size, capacity), dtype=np.int64)
+        self._buffer_rewards = np.zeros((self.population_size, capacity))
+        self._buffer_size = 0
+        self._buffer_pos = 0
+
+    def _push(self, state: np.ndarray, actions: np.ndarray, rewards: np.ndarray,
+              next_state: np.ndarray, done: bool) -> None:
+        pos = self._buffer_pos
+        self._buffer_states[pos] = state
+        self._buffer_next_states[pos] = next_state
+        self._buffer_dones[pos] = done
+        self._buffer_actions[:, pos] = actions
+        self._buffer_rewards[:, pos] = rewards
+        self._buffer_pos = (pos + 1) % self.memory_size
+        self._buffer_size = min(self._buffer_size + 1, self.memory_size)
+
+    def _learn(self) -> np.ndarray:
+        # Every member draws its own mini-batch from the shared transitions
+        idx = self.rng.integers(0, self._buffer_size, size=(self.population_size, self.batch_size))
+        members = np.arange(self.population_size)[:, None]
+        return self.networks.train_step(
+            self._buffer_states[idx],
+            self._buffer_actions[members, idx],
+            self._buffer_rewards[members, idx],
+            self._buffer_next_states[idx],
+            self._buffer_dones[idx],
+            self.member_params["gamma"],
+            self.double_dqn
+        )
+
+    def _run_episode(self, data: np.ndarray, epsilons: np.ndarray, learn: bool) -> Dict[str, np.ndarray]:
+        """Run one episode over ``data`` for all members.
+
+        Returns:
+            Per-member arrays: ``episode_reward``, ``loss`` (mean TD loss, 0.0
+            without updates), ``final_value`` and ``sharpe_ratio``
+        """
+        K = self.population_size
+        cash = np.full(K, self.initial_cash)
+        units = np.zeros(K)
+        entry_price = np.zeros(K)
+        previous_unrealized = np.zeros(K)
+        episode_reward = np.zeros(K)
+        loss_sum = np.zeros(K)
+        loss_count = 0
+        values = [cash.copy()]
+        c = self.transaction_cost_rate
+
+        for step_idx in range(len(data) - 1):
+            state = data[step_idx]
+            next_state = data[step_idx + 1]
+            price = state[self.close_price_index]
+            next_price = next_state[self.close_price_index]
+
+            # Epsilon-greedy over all members with one batched forward pass
+            greedy = np.argmax(self.networks.q_values(state[None, :])[:, 0, :], axis=1)
+            explore = self.rng.random(K) < epsilons
+            actions = np.where(explore, self.rng.integers(0, self.n_actions, size=K), greedy)
+
+            in_position = units > 0
+            rewards = np.zeros(K)
+
+            # Hold
+            hold = actions == 0
+            unrealized = (price - entry_price) * units
+            rewards[hold] = np.where(
+                in_position, (unrealized - previous_unrealized) * self.unrealized_pnl_reward_scaling_factor,
+                self.hold_cash_reward
+            )[hold]
+            previous_unrealized = np.where(hold, np.where(in_position, unrealized, 0.0), previous_unrealized)
+
+            # Buy
+            buy = actions == 1
+            can_buy = buy & (cash >= price * (1 + c)) & ~in_position & (price > 0)
+            units_to_buy = np.where(can_buy, cash / (price * (1 + c)) if price > 0 else 0.0, 0.0)
+            buy_cost = units_to_buy * price * c
+            cash = np.where(can_buy, cash - units_to_buy * price - buy_cost, cash)
+            rewards = np.where(can_buy, -buy_cost, np.where(buy, self.invalid_action_penalty, rewards))
+            entry_price = np.where(can_buy, price, entry_price)
+            previous_unrealized = np.where(can_buy, 0.0, previous_unrealized)
+            units = np.where(can_buy, units_to_buy, units)
+
+            # Sell
+            sell = actions == 2
+            can_sell = sell & in_position
+            transaction_value = units * price
+            sell_cost = transaction_value * c
+            realized = (price - entry_price) * units
+            rewards = np.where(can_sell, realized - sell_cost, np.where(sell, self.invalid_action_penalty, rewards))
+            cash = np.where(can_sell, cash + transaction_value - sell_cost, cash)
+            units = np.where(can_sell, 0.0, units)
+            entry_price = np.where(can_sell, 0.0, entry_price)
+            previous_unrealized = np.where(can_sell, 0.0, previous_unrealized)
+
+            done = step_idx == len(data) - 2
+            if done:
+                # Liquidate open positions at the last price
+                open_position = units > 0
+                liquidation_value = units * next_price
+                rewards = np.where(
+                    open_position,
+                    rewards + (next_price - entry_price) * units - liquidation_value * c,
+                    rewards
+                )
+                cash = np.where(open_position, cash + liquidation_value * (1 - c), cash)
+                units = np.where(open_position, 0.0, units)
+
+            episode_reward += rewards
+            values.append(cash + units * price)
+
+            if learn:
+                self._push(state, actions, rewards, next_state, done)
+                if self._buffer_size >= self.batch_size and self.steps % self.update_frequency == 0:
+                    loss_sum += self._learn()
+                    loss_count += 1
+                if self.steps % self.target_update_frequency == 0:
+                    self.networks.sync_target()
+                self.steps += 1
+
+        values = np.asarray(values)
+        returns = np.diff(values, axis=0) / np.where(values[:-1] > 0, values[:-1], 1.0)
+        std = returns.std(axis=0)
+        sharpe = np.where(std > 0, returns.mean(axis=0) / np.where(std > 0, std, 1.0) * np.sqrt(252), 0.0)
+        return {
+            "episode_reward": episode_reward,
+            "loss": loss_sum / loss_count if loss_count else np.zeros(K),
+            "final_value": values[-1],
+            "sharpe_ratio": sharpe
+        }
+
+    def train(
+        self,
+        train_data: np.ndarray,
+        val_data: Optional[np.ndarray] = None,
+        episodes: int = 10,
+        on_episode_end: Optional[Callable[[int, List[Dict[str, float]]], None]] = None
+    ) -> List[Dict[str, List[float]]]:
+        """Train every member for ``episodes`` episodes.
+
+        After each episode, each member gets its training ``loss``,
+        ``episode_reward`` and ``total_return`` and, when validation data is
+        given, a greedy validation run adds ``val_total_return`` and
+        ``val_sharpe_ratio``.
+
+        Args:
+            train_data: 2D array of features per step; column 3 is the close price
+            val_data: Optional validation array of the same layout
+            episodes: Number of training episodes
+            on_episode_end: Called with (episode, per-member metrics) after each episode
+
+        Returns:
+            Per-member history: metric name to list of per-episode values
+        """
+        train_data = np.asarray(train_data, dtype=np.float64)
+        if train_data.ndim != 2 or train_data.shape[1] <= self.close_price_index:
+            raise ValueError("train_data must be a 2D array with at least 4 columns (OHLC...)")
+        if val_data is not None:
+            val_data = np.asarray(val_data, dtype=np.float64)
+        if self.networks is None:
+            self._build(train_data.shape[1])
+
+        history: List[Dict[str, List[float]]] = [{} for _ in range(self.population_size)]
+        epsilons = self.member_params["epsilon_start"].copy()
+        for episode in range(episodes):
+            start = time.perf_counter()
+            train = self._run_episode(train_data, epsilons, learn=True)
+            metrics = {
+                "loss": train["loss"],
+                "episode_reward": train["episode_reward"],
+                "total_return": train["final_value"] / self.initial_cash - 1
+            }
+            self.episodes += 1
+            epsilons = np.maximum(self.member_params["epsilon_end"], epsilons * self.member_params["epsilon_decay"])
+
+            if val_data is not None and len(val_data) > 1:
+                val = self._run_episode(val_data, np.zeros(self.population_size), learn=False)
+                metrics["val_total_return"] = val["final_value"] / self.initial_cash - 1
+                metrics["val_sharpe_ratio"] = val["sharpe_ratio"]
+            metrics["epsilon"] = epsilons
+
+            member_metrics = [
+                {name: float(values[k]) for name, values in metrics.items()}
+                for k in range(self.population_size)
+            ]
+            for k, member in enumerate(member_metrics):
+                for name, value in member.items():
+                    history[k].setdefault(name, []).append(value)
+            self.logger.debug(f"Population episode {episode} took {time.perf_counter() - start:.3f}s")
+            if on_episode_end is not None:
+                on_episode_end(episode, member_metrics)
+        return history
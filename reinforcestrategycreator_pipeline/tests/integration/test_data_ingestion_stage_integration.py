@@ -10,6 +10,8 @@ from reinforcestrategycreator_pipeline.src.pipeline.stages.data_ingestion import
 from reinforcestrategycreator_pipeline.src.pipeline.context import PipelineContext
 from reinforcestrategycreator_pipeline.src.artifact_store.base import ArtifactMetadata, ArtifactType
 from reinforcestrategycreator_pipeline.src.config.manager import ConfigManager
+from reinforcestrategycreator_pipeline.src.config.models import DataSourceType
+from reinforcestrategycreator_pipeline.src.data.synthetic_source import SyntheticDataSource
 
 class TestDataIngestionStageIntegration(unittest.TestCase):
 
@@ -213,5 +215,25 @@ class TestDataIngestionStageIntegration(unittest.TestCase):
         self.assertIsNone(result_context.get("raw_data_artifact"))
 
 
+    def test_ingest_synthetic_source_through_data_manager(self):
+        source = SyntheticDataSource("synthetic_test", {"symbols": 1, "n_bars": 50, "seed": 3})
+        mock_data_manager = MagicMock()
+        mock_data_manager.load_data.side_effect = lambda source_id: source.load_data()
+        self.context.set("data_manager", mock_data_manager)
+        self.mock_config_manager.get_config.return_value.data.source_type = DataSourceType.SYNTHETIC
+        self.mock_config_manager.get_config.return_value.data.source_id = "synthetic_test"
+        self.mock_artifact_store.save_artifact.return_value = MagicMock(artifact_id="dummy_synthetic_id")
+
+        stage = DataIngestionStage(config={})
+        stage.setup(self.context)
+        result_context = stage.run(self.context)
+
+        mock_data_manager.load_data.assert_called_once_with(source_id="synthetic_test")
+        raw_data = result_context.get("raw_data")
+        self.assertIsInstance(raw_data, pd.DataFrame)
+        self.assertEqual(len(raw_data), 50)
+        self.assertEqual(result_context.get("data_metadata")["source_type"], "synthetic")
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -3,6 +3,10 @@ Unit tests for alerting components.
 """
 import pytest
 import time
+import json
+import socketserver
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import Mock, patch, MagicMock
 import smtplib
 import requests
@@ -11,6 +15,7 @@ from reinforcestrategycreator_pipeline.src.config.models import (
     AlertManagerConfig, AlertRuleConfig, AlertChannelConfig, AlertChannelType
 )
 from reinforcestrategycreator_pipeline.src.monitoring.alerting import AlertManager
+from reinforcestrategycreator_pipeline.src.monitoring.alert_dispatcher import AlertDispatcher, PendingAlert
 
 
 class TestAlertManager:
@@ -451,4 +456,270 @@ class TestAlertManager:
         
         with patch.object(manager, '_dispatch_alert') as mock_dispatch:
             manager.handle_event("test_event", {"data": "test"}, severity="warning")
-            mock_dispatch.assert_not_called()
\ No newline at end of file
+            mock_dispatch.assert_not_called()
+
+
+class SlowSMTPHandler(socketserver.StreamRequestHandler):
+    """Minimal SMTP stand-in that is slow to greet and records messages."""
+
+    def handle(self):
+        server = self.server
+        server.connections += 1
+        time.sleep(server.delay)
+        self.wfile.write(b"220 localhost ready\r\n")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode().strip().upper()
+            if command.startswith(("EHLO", "HELO")):
+                self.wfile.write(b"250 localhost\r\n")
+            elif command == "DATA":
+                self.wfile.write(b"354 end with .\r\n")
+                lines = []
+                while True:
+                    data_line = self.rfile.readline()
+                    if data_line in (b".\r\n", b""):
+                        break
+                    lines.append(data_line.decode())
+                server.messages.append("".join(lines))
+                self.wfile.write(b"250 OK\r\n")
+            elif command == "QUIT":
+                self.wfile.write(b"221 bye\r\n")
+                return
+            else:
+                self.wfile.write(b"250 OK\r\n")
+
+
+class SlowHTTPHandler(BaseHTTPRequestHandler):
+    """Webhook stand-in that is slow to answer and can fail the first requests."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        server = self.server
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        time.sleep(server.delay)
+        if server.failures_left > 0:
+            server.failures_left -= 1
+            status = 500
+        else:
+            server.payloads.append(payload)
+            status = 200
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def smtp_server():
+    """Run a local SMTP stand-in that takes 200ms to accept a connection."""
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), SlowSMTPHandler)
+    server.daemon_threads = True
+    server.delay, server.connections, server.messages = 0.2, 0, []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def http_server():
+    """Run a local webhook stand-in that takes 200ms per request."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SlowHTTPHandler)
+    server.daemon_threads = True
+    server.delay, server.failures_left, server.payloads = 0.2, 0, []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class TestAsyncAlertDispatch:
+    """Test cases for background alert dispatch against local stand-ins."""
+
+    def _manager(self, channel, rule_names, **dispatch_options):
+        rules = [
+            AlertRuleConfig(name=name, event_type=name, severity="error", channels=[channel.name],
+                            deduplication_window_seconds=0)
+            for name in rule_names
+        ]
+        options = {"dispatch_batch_window_seconds": 0.2, "dispatch_backoff_seconds": 0.01}
+        options.update(dispatch_options)
+        return AlertManager(AlertManagerConfig(channels=[channel], rules=rules, **options))
+
+    def test_handle_event_returns_without_waiting_on_smtp(self, smtp_server):
+        """Test that a slow SMTP server does not block the caller, and one connection is reused."""
+        channel = AlertChannelConfig(
+            type=AlertChannelType.EMAIL,
+            name="email",
+            details={"email_to": "ops@example.com", "smtp_host": "127.0.0.1",
+                     "smtp_port": smtp_server.server_address[1], "use_tls": False}
+        )
+        manager = self._manager(channel, ["first", "second"], dispatch_workers=1,
+                                dispatch_batch_window_seconds=0.0)
+        manager.handle_event("first", {"message": "warm-up"}, severity="error")
+        assert manager.flush(timeout=5)
+
+        start = time.perf_counter()
+        manager.handle_event("second", {"message": "slow smtp"}, severity="error")
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.01  # Well below the 200ms SMTP greeting delay
+        assert manager.flush(timeout=5)
+        assert len(smtp_server.messages) == 2
+        assert smtp_server.connections == 1
+        assert manager.get_dispatch_stats()["sent"] == 2
+        manager.close()
+
+    def test_alerts_are_coalesced_into_one_webhook_call(self, http_server):
+        """Test that a burst of alerts to one Slack channel becomes one digest message."""
+        channel = AlertChannelConfig(
+            type=AlertChannelType.SLACK,
+            name="slack",
+            details={"slack_webhook_url": f"http://127.0.0.1:{http_server.server_address[1]}/hook"}
+        )
+        manager = self._manager(channel, ["loss_spike", "drift"], dispatch_workers=1)
+
+        for _ in range(5):
+            manager.handle_event("loss_spike", {"message": "loss spiked"}, severity="error")
+        manager.handle_event("drift", {"message": "drift detected"}, severity="error")
+
+        assert manager.flush(timeout=5)
+        assert len(http_server.payloads) == 1
+        attachment = http_server.payloads[0]["attachments"][0]
+        assert "6 alerts from 2 rules" in attachment["title"]
+        assert "(x5)" in attachment["text"]
+        stats = manager.get_dispatch_stats()
+        assert stats["sent"] == 6
+        assert stats["coalesced"] == 4
+        manager.close()
+
+    def test_failed_delivery_is_retried(self, http_server):
+        """Test that a failing webhook is retried with backoff until it succeeds."""
+        http_server.failures_left = 2
+        channel = AlertChannelConfig(
+            type=AlertChannelType.PAGERDUTY,
+            name="pagerduty",
+            details={"pagerduty_service_key": "key",
+                     "pagerduty_api_url": f"http://127.0.0.1:{http_server.server_address[1]}/enqueue"}
+        )
+        manager = self._manager(channel, ["outage"])
+
+        manager.handle_event("outage", {"message": "down"}, severity="error")
+
+        assert manager.flush(timeout=5)
+        assert len(http_server.payloads) == 1
+        stats = manager.get_dispatch_stats()
+        assert stats["retries"] == 2
+        assert stats["failed"] == 0
+        manager.close()
+
+    def test_full_queue_drops_and_counts(self, http_server):
+        """Test that alerts beyond the queue bound are dropped without blocking."""
+        channel = AlertChannelConfig(
+            type=AlertChannelType.SLACK,
+            name="slack",
+            details={"slack_webhook_url": f"http://127.0.0.1:{http_server.server_address[1]}/hook"}
+        )
+        manager = self._manager(channel, ["burst"], dispatch_queue_size=3, dispatch_workers=1,
+                                dispatch_batch_size=1, dispatch_batch_window_seconds=0.0)
+
+        start = time.perf_counter()
+        for _ in range(20):
+            manager.handle_event("burst", {"message": "burst"}, severity="error")
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.1
+        stats = manager.get_dispatch_stats()
+        assert stats["dropped"] > 0
+        assert stats["submitted"] + stats["dropped"] == 20
+        manager.close(timeout=0)
+
+    def test_flush_waits_for_alert_taken_off_the_queue(self):
+        """Test that flush does not report idle while a worker holds an undelivered alert."""
+        taken, release = threading.Event(), threading.Event()
+        sent = []
+        dispatcher = AlertDispatcher(lambda channel, alerts, connections: sent.extend(alerts),
+                                     num_workers=1, batch_size=1, batch_window_seconds=0.0)
+        real_get = dispatcher._queue.get
+
+        def slow_get(*args, **kwargs):
+            # Hold the worker between taking the alert and starting delivery
+            alert = real_get(*args, **kwargs)
+            taken.set()
+            release.wait(5)
+            return alert
+
+        dispatcher._queue.get = slow_get
+        channel = AlertChannelConfig(type=AlertChannelType.SLACK, name="slack", details={})
+        rule = AlertRuleConfig(name="gap", event_type="gap", severity="error", channels=["slack"])
+        dispatcher.submit(PendingAlert(channel, rule, "title", "body", {}))
+
+        assert taken.wait(5)
+        assert dispatcher._queue.empty()
+        assert not dispatcher.flush(timeout=0.1)
+        assert dispatcher.get_stats()["in_flight"] == 1
+
+        release.set()
+        assert dispatcher.flush(timeout=5)
+        assert len(sent) == 1
+        assert dispatcher.get_stats()["in_flight"] == 0
+        dispatcher.close()
+
+    def test_pagerduty_retry_skips_delivered_events(self):
+        """Test that retrying a PagerDuty batch does not re-trigger events that already went out."""
+        channel = AlertChannelConfig(type=AlertChannelType.PAGERDUTY, name="pagerduty",
+                                     details={"pagerduty_service_key": "key"})
+        manager = self._manager(channel, ["disk", "memory"], dispatch_workers=1)
+        triggered = []
+
+        def send(channel_config, title, body, rule, event_data, session=None):
+            triggered.append(rule.name)
+            if triggered == ["disk", "memory"]:
+                raise requests.exceptions.ConnectionError("memory event lost")
+
+        with patch.object(manager, "_send_pagerduty_alert", side_effect=send):
+            manager.handle_event("disk", {"message": "disk full"}, severity="error")
+            manager.handle_event("memory", {"message": "oom"}, severity="error")
+            assert manager.flush(timeout=5)
+
+        assert triggered == ["disk", "memory", "memory"]
+        stats = manager.get_dispatch_stats()
+        assert stats["retries"] == 1
+        assert stats["sent"] == 2
+        manager.close()
+
+    def test_close_delivers_queued_alert(self):
+        """Test that close sends an alert still waiting in the batch window."""
+        sent = []
+        dispatcher = AlertDispatcher(lambda channel, alerts, connections: sent.extend(alerts),
+                                     num_workers=1, batch_window_seconds=1.0)
+        channel = AlertChannelConfig(type=AlertChannelType.SLACK, name="slack", details={})
+        rule = AlertRuleConfig(name="pipeline_failed", event_type="pipeline_failed", severity="critical",
+                               channels=["slack"])
+
+        with patch("reinforcestrategycreator_pipeline.src.monitoring.alert_dispatcher.atexit") as mock_atexit:
+            dispatcher.submit(PendingAlert(channel, rule, "title", "body", {}))
+            mock_atexit.register.assert_called_once_with(dispatcher.close)
+            assert not sent
+
+            dispatcher.close(timeout=5)
+            mock_atexit.unregister.assert_called_once_with(dispatcher.close)
+
+        assert [alert.rule.name for alert in sent] == ["pipeline_failed"]
+        assert dispatcher.get_stats()["sent"] == 1
+
+    def test_inline_dispatch_when_async_disabled(self):
+        """Test that async_dispatch=False keeps sending on the caller's thread."""
+        channel = AlertChannelConfig(type=AlertChannelType.SLACK, name="slack",
+                                     details={"slack_webhook_url": "https://hooks.slack.com/test"})
+        manager = self._manager(channel, ["inline"], async_dispatch=False)
+
+        with patch('requests.post') as mock_post:
+            manager.handle_event("inline", {"message": "now"}, severity="error")
+            mock_post.assert_called_once()
+        assert manager.dispatcher is None
@@ -11,8 +11,10 @@ from reinforcestrategycreator_pipeline.src.artifact_store import (
     ArtifactStore,
     ArtifactMetadata,
     ArtifactType,
-    LocalFileSystemStore
+    LocalFileSystemStore,
+    ContentAddressedStore
 )
+from reinforcestrategycreator_pipeline.src.artifact_store.content_addressed import hash_file
 
 
 class TestArtifactMetadata:
@@ -374,4 +376,70 @@ class TestLocalFileSystemStore:
         
         # Get metadata for non-existent artifact
         with pytest.raises(ValueError):
-            temp_store.get_artifact_metadata("non-existent", artifact_type=ArtifactType.OTHER)
\ No newline at end of file
+            temp_store.get_artifact_metadata("non-existent", artifact_type=ArtifactType.OTHER)
+
+
+class TestContentAddressedStore(TestLocalFileSystemStore):
+    """Run the LocalFileSystemStore tests against ContentAddressedStore, plus dedup behaviour."""
+    
+    @pytest.fixture
+    def temp_store(self):
+        """Create a temporary content-addressed artifact store."""
+        temp_dir = tempfile.mkdtemp()
+        store = ContentAddressedStore(temp_dir)
+        yield store
+        # Cleanup
+        shutil.rmtree(temp_dir)
+    
+    @staticmethod
+    def _blob_count(store):
+        return sum(1 for p in store.blobs_path.glob("*/*") if p.parent.name != "tmp")
+    
+    def test_identical_content_stored_once(self, temp_store, sample_directory):
+        """Test that saving unchanged content adds no new blobs."""
+        v1 = temp_store.save_artifact("dataset", sample_directory, ArtifactType.DATASET, version="v1")
+        assert self._blob_count(temp_store) == 3
+        
+        v2 = temp_store.save_artifact("dataset", sample_directory, ArtifactType.DATASET, version="v2")
+        assert self._blob_count(temp_store) == 3
+        assert v2.source_info["content_digest"] == v1.source_info["content_digest"]
+        assert v2.source_info["deduplicated_bytes"] == v2.source_info["size_bytes"]
+        
+        # Only the modified file produces a new blob
+        (sample_directory / "file1.txt").write_text("Changed")
+        v3 = temp_store.save_artifact("dataset", sample_directory, ArtifactType.DATASET, version="v3")
+        assert self._blob_count(temp_store) == 4
+        assert v3.source_info["content_digest"] != v1.source_info["content_digest"]
+        
+        loaded = temp_store.load_artifact("dataset", ArtifactType.DATASET, version="v1")
+        assert (loaded / "file1.txt").read_text() == "Content 1"
+        assert (loaded / "subdir" / "file3.txt").read_text() == "Content 3"
+    
+    def test_manifest_digests(self, temp_store, sample_file):
+        """Test that manifests record streaming digests of the saved files."""
+        temp_store.save_artifact("model", sample_file, ArtifactType.MODEL, version="v1")
+        
+        manifest = temp_store.get_manifest("model", ArtifactType.MODEL)
+        assert manifest["is_directory"] is False
+        assert manifest["files"]["."]["size"] == len("Sample artifact content")
+        assert temp_store.get_file_digests("model", ArtifactType.MODEL) == {".": hash_file(sample_file)}
+    
+    def test_collect_garbage(self, temp_store, sample_file):
+        """Test that only unreferenced blobs are collected."""
+        temp_store.save_artifact("gc", sample_file, ArtifactType.OTHER, version="v1")
+        sample_file.write_text("Other content")
+        temp_store.save_artifact("gc", sample_file, ArtifactType.OTHER, version="v2")
+        assert self._blob_count(temp_store) == 2
+        
+        # Referenced blobs survive
+        assert temp_store.collect_garbage()["blobs_removed"] == 0
+        
+        temp_store.delete_artifact("gc", ArtifactType.OTHER, version="v1")
+        dry_run = temp_store.collect_garbage(dry_run=True)
+        assert dry_run["blobs_removed"] == 1
+        assert self._blob_count(temp_store) == 2
+        
+        stats = temp_store.collect_garbage()
+        assert stats == {"blobs_scanned": 2, "blobs_removed": 1, "bytes_freed": len("Sample artifact content")}
+        assert self._blob_count(temp_store) == 1
+        assert temp_store.load_artifact("gc", ArtifactType.OTHER).read_text() == "Other content"
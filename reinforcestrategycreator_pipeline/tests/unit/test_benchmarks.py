@@ -0,0 +1,105 @@
+"""Unit tests for the vectorized benchmark strategies."""
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from reinforcestrategycreator_pipeline.src.evaluation.benchmarks import (
+    BenchmarkEvaluator,
+    RandomStrategy,
+    SimpleMovingAverageStrategy,
+    simulate_positions,
+)
+
+
+class TestBenchmarkSweeps:
+    """Test cases for the signal-to-equity engine and parameter sweeps."""
+
+    @pytest.fixture
+    def price_data(self):
+        """Create a random-walk price series."""
+        rng = np.random.default_rng(3)
+        prices = 100 * np.exp(0.01 * rng.standard_normal(300).cumsum())
+        return pd.DataFrame({"Close": prices})
+
+    def test_simulate_positions_round_trip(self):
+        """Test equity, trades and fees for a single buy and sell."""
+        prices = np.array([10.0, 10.0, 12.0, 15.0, 15.0])
+        positions = np.array([0, 1, 1, 0, 0])
+
+        result = simulate_positions(prices, positions, initial_balance=1000, transaction_fee=0.01)
+
+        # Buy 99 worth of shares at 10, sell at 15, pay 1% on both legs
+        expected = [1000, 990, 1188, 1485 * 0.99, 1485 * 0.99]
+        np.testing.assert_allclose(result["portfolio_values"][0], expected)
+        assert result["trades"][0] == 1
+        assert result["profitable_trades"][0] == 1
+        assert result["fees"][0] == pytest.approx(10 + 14.85)
+
+    def test_simulate_positions_rows_are_independent(self):
+        """Test that each row of a 2D position array is simulated on its own."""
+        prices = np.array([10.0, 11.0, 9.0, 10.0, 12.0])
+        positions = np.array([
+            [0, 1, 1, 1, 1],
+            [0, 0, 0, 0, 0],
+            [0, 1, 0, 1, 1],
+        ])
+
+        result = simulate_positions(prices, positions, initial_balance=100, transaction_fee=0.0)
+
+        np.testing.assert_allclose(result["portfolio_values"][0], 100 * np.array([1, 1, 9 / 11, 10 / 11, 12 / 11]))
+        np.testing.assert_allclose(result["portfolio_values"][1], [100, 100, 100, 100, 100])
+        np.testing.assert_array_equal(result["trades"], [1, 0, 2])
+        # Row 2 sells at a loss, then holds an open winner
+        np.testing.assert_array_equal(result["profitable_trades"], [1, 0, 1])
+
+    def test_sma_grid_matches_individual_runs(self, price_data):
+        """Test that a window grid gives the same metrics as separate runs."""
+        windows = [(5, 20), (10, 30), (20, 50), (50, 400)]
+
+        results = SimpleMovingAverageStrategy().run_grid(price_data, windows)
+
+        assert len(results) == len(windows)
+        for (short, long), result in zip(windows, results):
+            assert (result["short_window"], result["long_window"]) == (short, long)
+            expected = SimpleMovingAverageStrategy(short_window=short, long_window=long).run(price_data)
+            for key, value in expected.items():
+                assert result[key] == pytest.approx(value)
+        assert results[-1]["trades"] == 0
+
+    def test_random_seeds_match_seeded_runs(self, price_data):
+        """Test that each seed reproduces a seeded RandomStrategy run."""
+        seeds = [1, 2, 42]
+
+        results = RandomStrategy(trade_probability=0.1).run_seeds(price_data, seeds)
+
+        for seed, result in zip(seeds, results):
+            assert result["seed"] == seed
+            expected = RandomStrategy(trade_probability=0.1, random_seed=seed).run(price_data)
+            for key, value in expected.items():
+                assert result[key] == pytest.approx(value)
+
+    def test_compare_with_benchmarks_sweeps(self, price_data):
+        """Test that configured sweeps are reported with a summary."""
+        evaluator = BenchmarkEvaluator({
+            "sma_window_grid": [[5, 20], [10, 30], [20, 50]],
+            "random_seeds": list(range(10))
+        })
+        model_metrics = {"pnl": 0.0, "sharpe_ratio": 0.0}
+
+        comparison = evaluator.compare_with_benchmarks(price_data, model_metrics)
+
+        sweeps = comparison["sweeps"]
+        assert len(sweeps["simple_moving_average"]["results"]) == 3
+        assert sweeps["random"]["summary"]["count"] == 10
+        pnls = [result["pnl"] for result in sweeps["random"]["results"]]
+        assert sweeps["random"]["summary"]["best_pnl"] == pytest.approx(max(pnls))
+        assert 0.0 <= sweeps["random"]["summary"]["model_outperformance_rate"] <= 1.0
+
+    def test_compare_with_benchmarks_without_sweeps(self, price_data):
+        """Test that no sweeps are reported unless configured."""
+        evaluator = BenchmarkEvaluator({})
+
+        comparison = evaluator.compare_with_benchmarks(price_data, {"pnl": 0.0, "sharpe_ratio": 0.0})
+
+        assert "sweeps" not in comparison
@@ -1,5 +1,7 @@
 """Unit tests for CrossValidator."""
 
+import os
+
 import pytest
 import numpy as np
 import pandas as pd
@@ -68,6 +70,23 @@ class MockModel(ModelBase):
         pass
 
 
+class StatsCrossValidator(CrossValidator):
+    """CrossValidator whose folds report data statistics instead of training a model."""
+
+    def _train_fold(self, fold_idx, train_data, val_data, model_config, training_config,
+                    metrics, save_models, callbacks):
+        train = np.asarray(train_data, dtype=float)
+        val = np.asarray(val_data, dtype=float)
+        return CVFoldResult(
+            fold_idx=fold_idx,
+            train_metrics={"loss": float(train[:, 0].sum()), "rows": len(train)},
+            val_metrics={"loss": float(val[:, 0].sum()), "rows": len(val)},
+            training_time=0.0,
+            additional_info={"pid": os.getpid(), "val_is_view": not val_data.flags.owndata
+                             if isinstance(val_data, np.ndarray) else None}
+        )
+
+
 @pytest.fixture
 def temp_dir():
     """Create a temporary directory for tests."""
@@ -443,6 +462,193 @@ class TestCrossValidator:
         assert len(saved_results["fold_results"]) == len(results.fold_results)
 
 
+@pytest.fixture(scope="module")
+def process_validator():
+    """A shared-data multiprocessing validator whose warm pool is reused across tests."""
+    checkpoint_dir = tempfile.mkdtemp()
+    validator = StatsCrossValidator(
+        model_factory=ModelFactory(), checkpoint_dir=checkpoint_dir,
+        n_jobs=2, use_multiprocessing=True, shared_data=True
+    )
+    yield validator
+    validator.close()
+    shutil.rmtree(checkpoint_dir)
+
+
+class TestSharedDataCV:
+    """Test cases for shared-data fold execution."""
+
+    def make_validator(self, temp_dir, **kwargs):
+        return StatsCrossValidator(model_factory=ModelFactory(), checkpoint_dir=temp_dir, **kwargs)
+
+    @pytest.mark.parametrize("cv_config", [
+        {"n_folds": 4},
+        {"n_folds": 4, "method": "time_series"},
+        {"n_folds": 3, "method": "stratified", "target_column": "target"},
+    ])
+    def test_fold_indices_match_materialized_folds(self, temp_dir, sample_data, cv_config):
+        """Test that index folds select exactly the rows of the materialized folds."""
+        validator = self.make_validator(temp_dir)
+
+        folds = validator._create_folds(sample_data, cv_config)
+        indices = validator._create_fold_indices(sample_data, cv_config)
+
+        assert len(folds) == len(indices)
+        for (train, val), (train_index, val_index) in zip(folds, indices):
+            pd.testing.assert_frame_equal(validator._take(sample_data, train_index), train)
+            pd.testing.assert_frame_equal(validator._take(sample_data, val_index), val)
+        if cv_config.get("method") == "time_series":
+            assert all(isinstance(index, slice) for pair in indices for index in pair)
+
+    def test_shared_multiprocessing_matches_sequential(self, temp_dir, process_validator):
+        """Test that workers see the same folds, as views for contiguous ranges."""
+        data = np.random.default_rng(0).standard_normal((1000, 4))
+        data_config = {"data": data}
+        cv_config = {"n_folds": 5, "method": "time_series"}
+        expected = self.make_validator(temp_dir).cross_validate({}, data_config, cv_config)
+
+        results = process_validator.cross_validate({}, data_config, cv_config)
+
+        assert [f.val_metrics for f in results.fold_results] == [f.val_metrics for f in expected.fold_results]
+        assert all(f.additional_info["pid"] != os.getpid() for f in results.fold_results)
+        assert all(f.additional_info["val_is_view"] for f in results.fold_results)
+
+    def test_pool_and_published_data_reused_across_models(self, process_validator):
+        """Test that compare_models publishes the data once and keeps the same warm pool."""
+        data = np.random.default_rng(1).standard_normal((500, 3))
+        process_validator.cross_validate({}, {"data": data}, {"n_folds": 3})
+        pool, handle = process_validator._pool, process_validator._published[1]
+
+        results = process_validator.compare_models([{"name": "a"}, {"name": "b"}], {"data": data}, {"n_folds": 3})
+
+        assert process_validator._pool is pool
+        assert process_validator._published[1] is handle
+        assert results["a"].aggregated_metrics == results["b"].aggregated_metrics
+
+    def test_close_releases_pool_and_shared_data(self, temp_dir):
+        """Test that closing the validator deletes the published data."""
+        validator = self.make_validator(temp_dir, n_jobs=2, use_multiprocessing=True, shared_data=True)
+        with validator:
+            handle = validator._publish(np.zeros((10, 2)))
+            directory = validator._shared_store.directory
+            assert os.path.exists(handle.path)
+
+        assert not os.path.exists(directory)
+        assert validator._pool is None
+
+    def test_shared_threads_without_multiprocessing(self, temp_dir, sample_data):
+        """Test that thread-based shared mode gives the same results as copying folds."""
+        cv_config = {"n_folds": 4}
+        data_config = {"data": sample_data}
+        expected = self.make_validator(temp_dir).cross_validate({}, data_config, cv_config)
+
+        results = self.make_validator(temp_dir, n_jobs=2, shared_data=True).cross_validate({}, data_config, cv_config)
+
+        assert [f.val_metrics for f in results.fold_results] == [f.val_metrics for f in expected.fold_results]
+
+
+class CountingCrossValidator(StatsCrossValidator):
+    """StatsCrossValidator that records trained folds, fails on request and stages fake weights."""
+
+    def __init__(self, *args, fail_folds=(), **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fail_folds = set(fail_folds)
+        self.trained = []
+
+    def _train_fold(self, fold_idx, train_data, val_data, *args):
+        if fold_idx in self.fail_folds:
+            raise RuntimeError(f"fold {fold_idx} crashed")
+        self.trained.append(fold_idx)
+        result = super()._train_fold(fold_idx, train_data, val_data, *args)
+        weights_path = self.checkpoint_dir / f"fold_{fold_idx}" / "cache_weights"
+        weights_path.mkdir(parents=True, exist_ok=True)
+        (weights_path / "model.pkl").write_bytes(b"weights")
+        result.additional_info["weights_path"] = str(weights_path)
+        return result
+
+
+class TestFoldCache:
+    """Test cases for cached, resumable fold results."""
+
+    def make_validator(self, temp_dir, **kwargs):
+        return CountingCrossValidator(
+            model_factory=ModelFactory(), checkpoint_dir=temp_dir,
+            fold_cache_dir=Path(temp_dir) / "fold_cache", **kwargs
+        )
+
+    def test_second_run_reuses_every_fold(self, temp_dir, sample_data):
+        """Test that an identical run is served entirely from the cache."""
+        data_config = {"data": sample_data}
+        first = self.make_validator(temp_dir)
+        expected = first.cross_validate({"type": "mock"}, data_config, {"n_folds": 4})
+
+        second = self.make_validator(temp_dir)
+        results = second.cross_validate({"type": "mock"}, data_config, {"n_folds": 4})
+
+        assert first.trained == [0, 1, 2, 3]
+        assert second.trained == []
+        assert results.config["fold_cache"] == {"hits": 4, "misses": 0}
+        assert [f.val_metrics for f in results.fold_results] == [f.val_metrics for f in expected.fold_results]
+        assert all(f.additional_info["cached"] for f in results.fold_results)
+
+    def test_interrupted_run_resumes_missing_folds(self, temp_dir, sample_data):
+        """Test that folds finished before a crash are kept and only the rest are trained."""
+        data_config = {"data": sample_data}
+        cv_config = {"n_folds": 4, "method": "time_series"}
+        crashed = self.make_validator(temp_dir, fail_folds={2})
+        with pytest.raises(RuntimeError, match="fold 2 crashed"):
+            crashed.cross_validate({"type": "mock"}, data_config, cv_config)
+
+        resumed = self.make_validator(temp_dir)
+        results = resumed.cross_validate({"type": "mock"}, data_config, cv_config)
+
+        assert resumed.trained == [2, 3]
+        assert results.config["fold_cache"] == {"hits": 2, "misses": 2}
+        assert [f.fold_idx for f in results.fold_results] == [0, 1, 2, 3]
+
+    def test_parallel_failure_still_caches_finished_folds(self, temp_dir, sample_data):
+        """Test that one failing fold in a parallel run does not discard the others."""
+        data_config = {"data": sample_data}
+        with pytest.raises(RuntimeError):
+            self.make_validator(temp_dir, n_jobs=2, fail_folds={0}).cross_validate({}, data_config, {"n_folds": 4})
+
+        resumed = self.make_validator(temp_dir)
+        resumed.cross_validate({}, data_config, {"n_folds": 4})
+
+        assert resumed.trained == [0]
+
+    @pytest.mark.parametrize("change", ["data", "training_config", "seed"])
+    def test_inputs_change_invalidates_folds(self, temp_dir, sample_data, change):
+        """Test that data, training settings and the seed are all part of the key."""
+        self.make_validator(temp_dir).cross_validate({}, {"data": sample_data}, {"n_folds": 3}, {"epochs": 1})
+        data, cv_config, training_config = sample_data, {"n_folds": 3}, {"epochs": 1}
+        if change == "data":
+            data = sample_data.copy()
+            data.iloc[0, 0] += 1.0
+        elif change == "training_config":
+            training_config = {"epochs": 2}
+        else:
+            cv_config = {"n_folds": 3, "random_seed": 7}
+
+        validator = self.make_validator(temp_dir)
+        results = validator.cross_validate({}, {"data": data}, cv_config, training_config)
+
+        assert results.config["fold_cache"]["hits"] == 0
+        assert validator.trained == [0, 1, 2]
+
+    def test_weights_are_moved_into_cache(self, temp_dir, sample_data):
+        """Test that staged fold weights end up in the cache entry and are reported on hits."""
+        first = self.make_validator(temp_dir).cross_validate({}, {"data": sample_data}, {"n_folds": 2})
+        stored = first.fold_results[0].additional_info["weights_path"]
+
+        assert stored.startswith(str(Path(temp_dir) / "fold_cache"))
+        assert not (Path(temp_dir) / "fold_0" / "cache_weights").exists()
+
+        second = self.make_validator(temp_dir).cross_validate({}, {"data": sample_data}, {"n_folds": 2})
+        assert second.fold_results[0].additional_info["weights_path"] == stored
+        assert (Path(stored) / "model.pkl").read_bytes() == b"weights"
+
+
 class TestCVVisualization:
     """Test cases for CV visualization (basic structure tests)."""
     
@@ -0,0 +1,131 @@
+"""Unit tests for the synthetic OHLCV data source."""
+
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from reinforcestrategycreator_pipeline.src.data.manager import DataManager
+from reinforcestrategycreator_pipeline.src.data.synthetic_source import SyntheticDataSource
+
+
+class TestSyntheticDataSource:
+    """Test SyntheticDataSource class."""
+
+    @pytest.fixture
+    def config(self):
+        """A small two-regime configuration with frequent gaps."""
+        return {
+            "symbols": ["AAA", "BBB", "CCC"],
+            "n_bars": 500,
+            "interval": "1h",
+            "seed": 7,
+            "regimes": [{"drift": 0.001, "volatility": 0.01}, {"drift": -0.002, "volatility": 0.04}],
+            "switch_probability": 0.05,
+            "gap_probability": 0.05,
+        }
+
+    def test_long_format_schema(self, config):
+        """Test that data comes out time-major with one row per symbol and bar."""
+        source = SyntheticDataSource("synthetic", config)
+        df = source.load_data()
+
+        assert list(df.columns) == list(source.get_schema())
+        assert len(df) == 1500
+        assert list(df["symbol"].iloc[:3]) == ["AAA", "BBB", "CCC"]
+        assert df["timestamp"].is_monotonic_increasing
+        assert df["timestamp"].iloc[-1] == pd.Timestamp("2020-01-01") + 499 * pd.Timedelta("1h")
+        np.testing.assert_allclose(df["open"].iloc[:3], 100.0, rtol=0.1)
+
+    def test_seeded_and_independent_of_chunk_size(self, config):
+        """Test that the same seed reproduces the data however it is chunked."""
+        whole = SyntheticDataSource("a", config).load_data()
+        chunked = SyntheticDataSource("b", {**config, "chunk_size": 10}).load_data()
+        other_seed = SyntheticDataSource("c", {**config, "seed": 8}).load_data()
+
+        pd.testing.assert_frame_equal(whole, chunked)
+        assert not np.allclose(whole["close"], other_seed["close"])
+
+    def test_ohlc_invariants_and_gaps(self, config):
+        """Test that highs and lows bound the bar and gaps move the open off the previous close."""
+        df = SyntheticDataSource("synthetic", config).load_data()
+        body_high = np.maximum(df["open"], df["close"])
+        body_low = np.minimum(df["open"], df["close"])
+
+        assert (df["high"] >= body_high).all()
+        assert (df["low"] <= body_low).all()
+        assert (df["low"] > 0).all()
+        assert (df["volume"] > 0).all()
+
+        close = df.pivot(index="timestamp", columns="symbol", values="close")
+        open_ = df.pivot(index="timestamp", columns="symbol", values="open")
+        gapped = ~np.isclose(open_.values[1:], close.values[:-1])
+        assert 0.02 < gapped.mean() < 0.08
+
+    def test_regimes_change_volatility(self):
+        """Test that a high-volatility regime produces larger returns than a calm one."""
+        calm = SyntheticDataSource("calm", {"n_bars": 5000, "regimes": [{"drift": 0.0, "volatility": 0.005}]})
+        wild = SyntheticDataSource("wild", {"n_bars": 5000, "regimes": [{"drift": 0.0, "volatility": 0.05}]})
+
+        calm_std = np.log(calm.load_data()["close"]).diff().std()
+        wild_std = np.log(wild.load_data()["close"]).diff().std()
+        assert calm_std == pytest.approx(0.005, rel=0.2)
+        assert wild_std > 5 * calm_std
+
+    def test_single_symbol_frame(self, config):
+        """Test that symbol= returns one symbol's OHLCV bars indexed by timestamp."""
+        df = SyntheticDataSource("synthetic", config).load_data(symbol="BBB")
+
+        assert list(df.columns) == ["open", "high", "low", "close", "volume"]
+        assert isinstance(df.index, pd.DatetimeIndex)
+        assert len(df) == 500
+        with pytest.raises(ValueError, match="Unknown symbol"):
+            SyntheticDataSource("synthetic", config).load_data(symbol="ZZZ")
+
+    def test_write_parquet_streams_chunks(self, config, tmp_path):
+        """Test that the Parquet file holds one row group per chunk and matches load_data."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        source = SyntheticDataSource("synthetic", config)
+
+        path = source.write_parquet(tmp_path / "bars.parquet", chunk_size=300)
+
+        assert pq.ParquetFile(path).num_row_groups == 5
+        written = pd.read_parquet(path)
+        expected = source.load_data()
+        pd.testing.assert_frame_equal(written, expected, check_categorical=False)
+
+    def test_config_options(self):
+        """Test symbol counts, end_date and the nested synthetic block."""
+        source = SyntheticDataSource("synthetic", {
+            "symbols": 12, "start_date": "2024-01-01", "end_date": "2024-01-02", "interval": "15m",
+            "synthetic": {"seed": 3}
+        })
+
+        assert source.symbols[0] == "SYN00" and len(source.symbols) == 12
+        assert source.n_bars == 97
+        assert source.seed == 3
+
+    @pytest.mark.parametrize("override", [
+        {"symbols": ["A", "A"]},
+        {"n_bars": 0},
+        {"interval": "1mo"},
+        {"gap_probability": 1.5},
+        {"regimes": [{"drift": 0.0}]},
+    ])
+    def test_invalid_config(self, override):
+        """Test that invalid configurations are rejected."""
+        with pytest.raises(ValueError):
+            SyntheticDataSource("synthetic", {"n_bars": 10, **override})
+
+    def test_registered_with_data_manager(self, tmp_path):
+        """Test that DataManager creates and loads the synthetic source type."""
+        config_manager = Mock()
+        config_manager.get_config.return_value = Mock(data=None)
+        manager = DataManager(config_manager, Mock(), cache_dir=tmp_path)
+
+        source = manager.register_source("bars", "synthetic", {"symbols": 2, "n_bars": 50})
+        df = manager.load_data("bars", use_cache=False)
+
+        assert isinstance(source, SyntheticDataSource)
+        assert len(df) == 100
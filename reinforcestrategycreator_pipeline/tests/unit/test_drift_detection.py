@@ -11,8 +11,9 @@ from reinforcestrategycreator_pipeline.src.config.models import (
     DataDriftDetectionMethod, ModelDriftDetectionMethod
 )
 from reinforcestrategycreator_pipeline.src.monitoring.drift_detection import (
-    DataDriftDetector, ModelDriftDetector
+    DataDriftDetector, ModelDriftDetector, ReferenceProfile
 )
+from reinforcestrategycreator_pipeline.src.artifact_store.local_adapter import LocalFileSystemStore
 
 
 class TestDataDriftDetector:
@@ -233,6 +234,96 @@ class TestDataDriftDetector:
         assert 'drift_detected' in result
 
 
+class TestReferenceProfile:
+    """Test cases for drift detection against a fitted reference profile."""
+
+    @pytest.fixture
+    def reference_data(self):
+        """Create reference data with numerical and categorical features."""
+        rng = np.random.default_rng(0)
+        return pd.DataFrame({
+            'feature1': rng.normal(0, 1, 2000),
+            'feature2': rng.integers(0, 5, 2000).astype(float),
+            'category': rng.choice(['a', 'b', 'c'], 2000)
+        })
+
+    @pytest.fixture
+    def current_data(self):
+        """Create shifted current data with a missing value."""
+        rng = np.random.default_rng(1)
+        data = pd.DataFrame({
+            'feature1': rng.normal(0.3, 1, 300),
+            'feature2': rng.integers(0, 6, 300).astype(float),
+            'category': rng.choice(['a', 'b', 'c'], 300, p=[0.5, 0.3, 0.2])
+        })
+        data.loc[0, 'feature1'] = np.nan
+        return data
+
+    @pytest.mark.parametrize("method", list(DataDriftDetectionMethod))
+    def test_profile_matches_per_call_detection(self, method, reference_data, current_data):
+        """Test that scoring against a profile gives the same feature statistics."""
+        detector = DataDriftDetector(DataDriftConfig(method=method, threshold=0.05))
+        expected = detector.detect(current_data, reference_data)
+
+        detector.fit_reference(reference_data)
+        result = detector.detect(current_data)
+
+        assert result['drift_detected'] == expected['drift_detected']
+        if method == DataDriftDetectionMethod.PSI:
+            assert result['details']['feature_scores'] == pytest.approx(expected['details']['feature_scores'])
+        else:
+            for feature, values in expected['details']['feature_results'].items():
+                assert result['details']['feature_results'][feature]['statistic'] == pytest.approx(values['statistic'])
+                if method == DataDriftDetectionMethod.CHI2:
+                    assert result['details']['feature_results'][feature]['p_value'] == pytest.approx(values['p_value'])
+
+    @pytest.mark.parametrize("method", list(DataDriftDetectionMethod))
+    def test_incremental_update_matches_full_batch(self, method, reference_data, current_data):
+        """Test that streaming batches through update equals scoring them at once."""
+        detector = DataDriftDetector(DataDriftConfig(method=method))
+        detector.fit_reference(reference_data)
+        expected = detector.detect(current_data)
+
+        for start in range(0, len(current_data), 70):
+            result = detector.update(current_data.iloc[start:start + 70])
+
+        assert result['score'] == pytest.approx(expected['score'])
+        detector.reset_stream()
+        assert detector.update(current_data)['score'] == pytest.approx(expected['score'])
+
+    def test_unseen_category_is_drift(self, reference_data):
+        """Test that a category absent from the reference gives a zero p-value."""
+        detector = DataDriftDetector(DataDriftConfig(method=DataDriftDetectionMethod.CHI2, threshold=0.05))
+        detector.fit_reference(reference_data)
+
+        result = detector.detect(pd.DataFrame({'category': ['a', 'b', 'z']}))
+
+        assert result['drift_detected']
+        assert result['details']['feature_results']['category']['p_value'] == 0.0
+
+    def test_profile_round_trip_through_artifact_store(self, reference_data, current_data, tmp_path):
+        """Test that a persisted profile scores the same as the fitted one."""
+        detector = DataDriftDetector(DataDriftConfig(method=DataDriftDetectionMethod.PSI))
+        detector.fit_reference(reference_data)
+        expected = detector.detect(current_data)
+        store = LocalFileSystemStore(tmp_path / "artifacts")
+
+        detector.save_reference_profile(store, "drift_reference", version="v1")
+        loaded = DataDriftDetector(DataDriftConfig(method=DataDriftDetectionMethod.PSI))
+        profile = loaded.load_reference_profile(store, "drift_reference")
+
+        assert isinstance(profile, ReferenceProfile)
+        assert profile.categorical['category'].categories == detector.reference_profile.categorical['category'].categories
+        assert loaded.detect(current_data)['score'] == pytest.approx(expected['score'])
+
+    def test_detect_without_profile_raises(self, current_data):
+        """Test that detect needs reference data or a fitted profile."""
+        detector = DataDriftDetector(DataDriftConfig())
+
+        with pytest.raises(ValueError):
+            detector.detect(current_data)
+
+
 class TestModelDriftDetector:
     """Test cases for ModelDriftDetector."""
     
@@ -307,4 +307,65 @@ class TestEvaluationEngine:
         assert "<style>" in html_report
         assert '<div class="section">' in html_report
         assert '<table>' in html_report
-        assert 'class="metric-value"' in html_report
\ No newline at end of file
+        assert 'class="metric-value"' in html_report
+
+
+    @pytest.fixture
+    def backtest_data(self):
+        """Create price data with features for backtesting."""
+        rng = np.random.default_rng(0)
+        n_rows = 500
+        close = 100 + rng.standard_normal(n_rows).cumsum()
+        return pd.DataFrame({
+            'Close': close,
+            'feature_1': rng.standard_normal(n_rows),
+            'feature_2': rng.standard_normal(n_rows)
+        }, index=pd.date_range('2023-01-01', periods=n_rows))
+    
+    @pytest.fixture
+    def linear_model(self):
+        """Create a deterministic model mapping features to Q-values for 3 actions."""
+        weights = np.random.default_rng(1).standard_normal((3, 3))
+        model = Mock(spec=ModelBase)
+        model.predict.side_effect = lambda states, **kwargs: states @ weights
+        return model
+    
+    def test_batched_backtest_matches_sequential(self, evaluation_engine, backtest_data, linear_model):
+        """Test that batched and sequential backtests produce identical results."""
+        seq_history, seq_trades = evaluation_engine._run_sequential_backtest(
+            linear_model, backtest_data, 100000.0
+        )
+        batched_history, batched_trades = evaluation_engine._run_batched_backtest(
+            linear_model, backtest_data, 100000.0
+        )
+        
+        assert len(seq_trades) > 0
+        assert batched_trades == seq_trades
+        assert batched_history == seq_history
+        
+        seq_metrics, _ = evaluation_engine._evaluate_model(
+            linear_model, backtest_data, backtest_mode="sequential"
+        )
+        batched_metrics, _ = evaluation_engine._evaluate_model(
+            linear_model, backtest_data, backtest_mode="batched"
+        )
+        assert batched_metrics == seq_metrics
+    
+    def test_batched_backtest_predicts_once(self, evaluation_engine, backtest_data, linear_model):
+        """Test that the batched backtest calls predict a single time for the whole frame."""
+        evaluation_engine._evaluate_model(linear_model, backtest_data)
+        
+        linear_model.predict.assert_called_once()
+        assert linear_model.predict.call_args[0][0].shape == (len(backtest_data), 3)
+    
+    def test_batched_backtest_falls_back_to_sequential(self, evaluation_engine, backtest_data):
+        """Test that models without batch support fall back to the sequential loop."""
+        model = Mock(spec=ModelBase)
+        model.predict.return_value = {"actions": [1]}
+        
+        assert evaluation_engine._run_batched_backtest(model, backtest_data, 100000.0) is None
+        model.predict.reset_mock()
+        
+        metrics, portfolio_values = evaluation_engine._evaluate_model(model, backtest_data)
+        assert model.predict.call_count == len(backtest_data) + 1
+        assert portfolio_values[-1] == 100000.0
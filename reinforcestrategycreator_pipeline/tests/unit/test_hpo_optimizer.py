@@ -3,14 +3,21 @@
 import json
 import tempfile
 from pathlib import Path
+import pickle
 from unittest.mock import Mock, MagicMock, patch
 import pytest
 
-from reinforcestrategycreator_pipeline.src.training.hpo_optimizer import HPOptimizer
+from reinforcestrategycreator_pipeline.src.training.hpo_optimizer import HPOptimizer, TuneReportCallback
 from reinforcestrategycreator_pipeline.src.training.engine import TrainingEngine
 from reinforcestrategycreator_pipeline.src.artifact_store.base import ArtifactStore, ArtifactType
 
 
+@pytest.fixture(autouse=True)
+def run_in_tmp_path(tmp_path, monkeypatch):
+    """Run each test in tmp_path, so trial checkpoints and artifacts are created there."""
+    monkeypatch.chdir(tmp_path)
+
+
 class TestHPOptimizer:
     """Test cases for HPOptimizer."""
     
@@ -414,4 +421,64 @@ class TestHPOptimizer:
             mock_artifact_store.save_artifact.assert_called_once()
             call_args = mock_artifact_store.save_artifact.call_args
             assert call_args[1]["artifact_type"] == ArtifactType.REPORT
-            assert "artifact_id" in results
\ No newline at end of file
+            assert "artifact_id" in results
+    
+    def test_retarget_checkpoint_applies_trial_hyperparameters(self, hpo_optimizer, temp_dir):
+        """Test that a cloned checkpoint is rewritten to the receiving trial's hyperparameters."""
+        saved_config = {"model_type": "DQN", "hyperparameters": {"learning_rate": 0.1, "gamma": 0.9}}
+        with open(temp_dir / "config.json", "w") as f:
+            json.dump(saved_config, f)
+        with open(temp_dir / "model.pkl", "wb") as f:
+            pickle.dump({"creation_config": saved_config, "model_weights": {"W0": [1.0]}}, f)
+        
+        overrides = hpo_optimizer._hyperparameter_overrides({"learning_rate": 0.01})
+        hpo_optimizer._retarget_checkpoint(temp_dir, overrides)
+        
+        with open(temp_dir / "config.json") as f:
+            assert json.load(f)["hyperparameters"] == {"learning_rate": 0.01, "gamma": 0.9}
+        with open(temp_dir / "model.pkl", "rb") as f:
+            state = pickle.load(f)
+        assert state["creation_config"]["hyperparameters"]["learning_rate"] == 0.01
+        assert state["model_weights"] == {"W0": [1.0]}
+    
+    def test_hyperparameter_overrides_with_mapping(self, hpo_optimizer):
+        """Test mapping trial params to config paths."""
+        overrides = hpo_optimizer._hyperparameter_overrides(
+            {"lr": 0.01, "unused": 1}, {"lr": "hyperparameters.learning_rate"}
+        )
+        assert overrides == {"hyperparameters.learning_rate": 0.01}
+    
+    def test_pb2_bounds(self, hpo_optimizer):
+        """Test that PB2 bounds come from the continuous params only."""
+        bounds = hpo_optimizer._pb2_bounds({
+            "lr": {"type": "loguniform", "low": 1e-4, "high": 1e-2},
+            "gamma": {"type": "uniform", "low": 0.9, "high": 0.99},
+            "batch_size": {"type": "choice", "values": [32, 64]}
+        })
+        assert bounds == {"lr": [1e-4, 1e-2], "gamma": [0.9, 0.99]}
+        
+        with pytest.raises(ValueError):
+            hpo_optimizer._pb2_bounds({"batch_size": {"type": "choice", "values": [32, 64]}})
+    
+    def test_tune_report_callback_reports_checkpoint_and_env_steps(self, temp_dir):
+        """Test that each epoch is reported with a checkpoint and the env steps it took."""
+        checkpoint_path = temp_dir / "tune_epoch_0"
+        checkpoint_path.mkdir()
+        engine = Mock()
+        engine.save_checkpoint.return_value = checkpoint_path
+        model = Mock(steps=100)
+        
+        callback = TuneReportCallback(engine)
+        callback.set_model(model)
+        with patch('reinforcestrategycreator_pipeline.src.training.hpo_optimizer.tune') as mock_tune, \
+             patch('reinforcestrategycreator_pipeline.src.training.hpo_optimizer.Checkpoint') as mock_checkpoint:
+            callback.on_epoch_begin(0)
+            model.steps = 350
+            callback.on_epoch_end(0, {"epoch": 0, "loss": 0.5, "note": "text"})
+        
+        engine.save_checkpoint.assert_called_once_with("tune_epoch_0")
+        mock_checkpoint.from_directory.assert_called_once_with(str(checkpoint_path))
+        metrics = mock_tune.report.call_args[0][0]
+        assert metrics == {"epoch": 0.0, "loss": 0.5, "env_steps": 350, "iteration_env_steps": 250}
+        assert mock_tune.report.call_args[1]["checkpoint"] == mock_checkpoint.from_directory.return_value
+        assert not checkpoint_path.exists()
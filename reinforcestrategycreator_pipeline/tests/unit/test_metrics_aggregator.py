@@ -0,0 +1,263 @@
+"""Unit tests for client-side metric aggregation."""
+
+import socket
+import time
+
+import numpy as np
+import pytest
+
+from reinforcestrategycreator_pipeline.src.monitoring.datadog_client import DatadogClient
+from reinforcestrategycreator_pipeline.src.monitoring.metrics_aggregator import (
+    HistogramSketch,
+    InMemoryMetricsSink,
+    MetricsAggregator,
+    UDPMetricsSink,
+)
+
+
+def parse_lines(lines):
+    """Map 'name|type|#tags' to the numeric value of each DogStatsD line."""
+    parsed = {}
+    for line in lines:
+        name_value, rest = line.split("|", 1)
+        name, value = name_value.rsplit(":", 1)
+        parsed[f"{name}|{rest}"] = float(value)
+    return parsed
+
+
+class TestHistogramSketch:
+    """Test cases for HistogramSketch."""
+
+    def test_quantiles_within_relative_accuracy(self):
+        """Test that quantiles of a skewed sample stay within the configured error."""
+        values = np.random.default_rng(0).lognormal(0.0, 1.0, 10_000)
+        sketch = HistogramSketch(relative_accuracy=0.01)
+        for value in values:
+            sketch.add(value)
+
+        for q in (0.1, 0.5, 0.95, 0.99):
+            expected = np.quantile(values, q, method="lower")
+            assert sketch.quantile(q) == pytest.approx(expected, rel=0.011)
+        assert sketch.count == len(values)
+        assert sketch.min == values.min()
+        assert sketch.max == values.max()
+
+    def test_negative_and_zero_values(self):
+        """Test that negative values and zeros are ordered correctly."""
+        sketch = HistogramSketch()
+        for value in [-10.0, -1.0, 0.0, 0.0, 1.0, 10.0]:
+            sketch.add(value)
+
+        assert sketch.quantile(0.0) == pytest.approx(-10.0, rel=0.01)
+        assert sketch.quantile(0.5) == 0.0
+        assert sketch.quantile(1.0) == pytest.approx(10.0, rel=0.01)
+        assert sketch.avg == 0.0
+
+    def test_merge_matches_single_sketch(self):
+        """Test that merging two sketches equals recording all values in one."""
+        values = np.random.default_rng(1).normal(5.0, 2.0, 2_000)
+        left, right, combined = HistogramSketch(), HistogramSketch(), HistogramSketch()
+        for i, value in enumerate(values):
+            (left if i % 2 else right).add(value)
+            combined.add(value)
+
+        left.merge(right)
+
+        assert left.count == combined.count
+        assert left.sum == pytest.approx(combined.sum)
+        for q in (0.01, 0.5, 0.99):
+            assert left.quantile(q) == combined.quantile(q)
+
+    def test_add_many_matches_add(self):
+        """Test that recording an array equals recording its values one by one."""
+        values = np.concatenate([np.random.default_rng(2).normal(0.0, 3.0, 1_000), [0.0, 0.0]])
+        single, batch = HistogramSketch(), HistogramSketch()
+        for value in values:
+            single.add(value)
+
+        batch.add_many(values)
+
+        assert batch.positive == single.positive
+        assert batch.negative == single.negative
+        assert batch.zero_count == single.zero_count == 2
+        assert (batch.count, batch.min, batch.max) == (single.count, single.min, single.max)
+        assert batch.sum == pytest.approx(single.sum)
+
+    def test_merge_rejects_different_accuracy(self):
+        """Test that sketches with different bucket sizes cannot be merged."""
+        with pytest.raises(ValueError):
+            HistogramSketch(0.01).merge(HistogramSketch(0.02))
+
+
+class TestMetricsAggregator:
+    """Test cases for MetricsAggregator."""
+
+    @pytest.fixture
+    def sink(self):
+        """Create an in-memory sink."""
+        return InMemoryMetricsSink()
+
+    def test_counters_gauges_and_histograms(self, sink):
+        """Test the aggregation semantics of each metric type."""
+        aggregator = MetricsAggregator(sink, flush_interval_seconds=3600, percentiles=[0.5])
+        for value in [3.0, 1.0, 2.0]:
+            aggregator.increment("steps", 2, tags=["env:test"])
+            aggregator.gauge("loss", value)
+            aggregator.histogram("reward", value)
+
+        assert sink.datagrams == []
+        assert aggregator.flush() == 1 + 3 + 5
+
+        parsed = parse_lines(sink.lines)
+        assert parsed["steps|c|#env:test"] == 6
+        assert parsed["loss|g"] == 2.0
+        assert parsed["loss.min|g"] == 1.0
+        assert parsed["loss.max|g"] == 3.0
+        assert parsed["reward.count|c"] == 3
+        assert parsed["reward.avg|g"] == 2.0
+        assert parsed["reward.median|g"] == pytest.approx(2.0, rel=0.01)
+        assert aggregator.pending == 0
+
+    def test_tags_keep_series_apart(self, sink):
+        """Test that the same metric with different tags is aggregated separately."""
+        aggregator = MetricsAggregator(sink, flush_interval_seconds=3600)
+        aggregator.increment("trades", tags=["symbol:A"])
+        aggregator.increment("trades", tags=["symbol:B"])
+        aggregator.increment("trades", tags=["symbol:A"])
+        aggregator.flush()
+
+        parsed = parse_lines(sink.lines)
+        assert parsed["trades|c|#symbol:A"] == 2
+        assert parsed["trades|c|#symbol:B"] == 1
+
+    def test_flush_on_size_threshold(self, sink):
+        """Test that reaching max_pending_metrics triggers a flush."""
+        aggregator = MetricsAggregator(sink, flush_interval_seconds=3600, max_pending_metrics=10)
+        for i in range(9):
+            aggregator.gauge(f"metric_{i}", i)
+        assert sink.datagrams == []
+
+        aggregator.gauge("metric_9", 9)
+
+        assert len(sink.lines) == 30
+        assert aggregator.pending == 0
+
+    def test_flush_on_interval(self, sink, monkeypatch):
+        """Test that a call after the flush interval triggers a flush."""
+        clock = [1000.0]
+        monkeypatch.setattr(
+            "reinforcestrategycreator_pipeline.src.monitoring.metrics_aggregator.time.monotonic",
+            lambda: clock[0]
+        )
+        aggregator = MetricsAggregator(sink, flush_interval_seconds=10)
+        aggregator.increment("calls")
+        clock[0] += 5
+        aggregator.increment("calls")
+        assert sink.datagrams == []
+
+        clock[0] += 5
+        aggregator.increment("calls")
+
+        assert parse_lines(sink.lines) == {"calls|c": 3}
+
+    def test_background_timer_flushes_idle_series(self, sink):
+        """Test that a series logged once is sent after the interval without another call."""
+        aggregator = MetricsAggregator(sink, flush_interval_seconds=0.05)
+        aggregator.increment("rare")
+
+        deadline = time.monotonic() + 2
+        while not sink.datagrams and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert parse_lines(sink.lines) == {"rare|c": 1}
+        aggregator.close()
+        assert not aggregator._timer.is_alive()
+
+    def test_close_flushes_without_timer(self, sink):
+        """Test that close sends pending metrics when the timer is disabled."""
+        aggregator = MetricsAggregator(sink, flush_interval_seconds=3600, background_flush=False)
+        aggregator.gauge("cash", 5)
+
+        assert aggregator.close() == 3
+        assert aggregator._timer is None
+
+    def test_datagrams_are_packed_within_packet_size(self, sink):
+        """Test that many lines are packed into few datagrams under the size limit."""
+        aggregator = MetricsAggregator(sink, flush_interval_seconds=3600, max_packet_size=512)
+        for i in range(200):
+            aggregator.increment(f"model_pipeline.training.metric_{i}", i, tags=["model:dqn"])
+
+        aggregator.flush()
+
+        assert len(sink.lines) == 200
+        assert 1 < len(sink.datagrams) < 200
+        assert all(len(datagram.encode()) <= 512 for datagram in sink.datagrams)
+
+    def test_udp_sink_sends_packed_datagram(self):
+        """Test that the UDP sink delivers one packet containing several lines."""
+        receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        receiver.bind(("127.0.0.1", 0))
+        receiver.settimeout(2)
+        sink = UDPMetricsSink("127.0.0.1", receiver.getsockname()[1])
+        aggregator = MetricsAggregator(sink, flush_interval_seconds=3600)
+        aggregator.increment("a", 1)
+        aggregator.gauge("b", 2.5)
+
+        aggregator.flush()
+        packet = receiver.recv(65535).decode()
+
+        assert parse_lines(packet.split("\n")) == {"a|c": 1, "b|g": 2.5, "b.min|g": 2.5, "b.max|g": 2.5}
+        sink.close()
+        receiver.close()
+
+
+class TestDatadogClientAggregation:
+    """Test cases for routing DatadogClient metrics through the aggregator."""
+
+    @pytest.fixture
+    def client(self):
+        """Configure aggregation on the singleton client and remove it afterwards."""
+        client = DatadogClient()
+        was_enabled, client.enabled = client.enabled, True
+        sink = InMemoryMetricsSink()
+        client.configure_aggregation(sink=sink, flush_interval_seconds=3600)
+        yield client, sink
+        client.configure_aggregation(enabled=False)
+        client.enabled = was_enabled
+
+    def test_metrics_are_prefixed_and_aggregated(self, client):
+        """Test that client calls are aggregated under the metrics prefix."""
+        client, sink = client
+        for _ in range(100):
+            client.increment("episodes", tags=["model:dqn"])
+            client.timing("step_time", 4.0)
+
+        assert client.flush() == 1 + 7
+
+        parsed = parse_lines(sink.lines)
+        prefix = client.metrics_prefix
+        assert parsed[f"{prefix}.episodes|c|#model:dqn"] == 100
+        assert parsed[f"{prefix}.step_time.count|c"] == 100
+
+    def test_disabling_flushes_pending_metrics(self, client):
+        """Test that turning aggregation off sends what is still pending."""
+        client, sink = client
+        client.gauge("cash", 100.0)
+
+        client.configure_aggregation(enabled=False)
+
+        assert client.aggregator is None
+        assert any("cash:100|g" in line for line in sink.lines)
+
+    def test_disabled_client_sends_nothing(self, client):
+        """Test that a disabled client drops metrics even with aggregation configured."""
+        client, sink = client
+        client.enabled = False
+        client.increment("episodes")
+        client.gauge("cash", 1.0)
+        client.histogram("loss", 0.5)
+        client.timing("step_time", 4.0)
+
+        assert client.aggregator.pending == 0
+        assert client.flush() == 0
+        assert sink.lines == []
@@ -133,6 +133,17 @@ class TestDQN:
         batch_states = np.random.randn(5, 8)
         batch_q_values = model.predict(batch_states)
         assert batch_q_values.shape == (5, 3)
+        
+        # Batched forward pass matches per-state forward passes
+        expected = np.array([model.predict(s) for s in batch_states])
+        np.testing.assert_allclose(batch_q_values, expected)
+        
+        # A malformed network fails the same way in single and batched mode
+        del model.q_network["weights"]["W_out"]
+        with pytest.raises(KeyError, match="Missing output layer weights"):
+            model.predict(state)
+        with pytest.raises(KeyError, match="Missing output layer weights"):
+            model.predict(batch_states)
     
     def test_dqn_action_selection(self):
         """Test epsilon-greedy action selection."""
@@ -221,6 +232,28 @@ class TestDQN:
         assert "mean_episode_length" in metrics
         assert "min_episode_reward" in metrics
         assert "max_episode_reward" in metrics
+    
+    def test_dqn_state_keeps_counters_and_optional_replay_buffer(self):
+        """Test that model state carries step counters and, when asked, the replay buffer."""
+        config = {"input_dim": 4, "output_dim": 2, "hyperparameters": {"memory_size": 50}}
+        model = DQN(config)
+        model.build(input_shape=(4,), output_shape=(2,))
+        model.steps, model.episodes = 120, 3
+        for _ in range(10):
+            model.replay_buffer.push(np.random.randn(4), 1, 0.5, np.random.randn(4), False)
+        
+        state = model.get_model_state()
+        assert "replay_buffer" not in state
+        
+        restored = DQN(config)
+        restored.set_model_state(state)
+        assert (restored.steps, restored.episodes) == (120, 3)
+        assert len(restored.replay_buffer) == 0
+        
+        model.set_hyperparameters({"checkpoint_replay_buffer": True})
+        restored = DQN(config)
+        restored.set_model_state(model.get_model_state())
+        assert len(restored.replay_buffer) == 10
 
 
 class TestPPO:
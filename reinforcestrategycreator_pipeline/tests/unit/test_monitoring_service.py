@@ -7,13 +7,16 @@ from pathlib import Path
 from reinforcestrategycreator_pipeline.src.config.models import (
     MonitoringConfig, PipelineConfig, ModelConfig, ModelType,
     DataDriftConfig, ModelDriftConfig, AlertManagerConfig,
-    DataDriftDetectionMethod, ModelDriftDetectionMethod # Assuming these enums exist
+    DataDriftDetectionMethod, ModelDriftDetectionMethod, # Assuming these enums exist
+    MetricsAggregationConfig
 )
 from reinforcestrategycreator_pipeline.src.monitoring.service import (
     MonitoringService,
     get_monitoring_service,
     initialize_monitoring_from_pipeline_config
 )
+from reinforcestrategycreator_pipeline.src.monitoring.datadog_client import DatadogClient, datadog_client
+from reinforcestrategycreator_pipeline.src.monitoring.metrics_aggregator import InMemoryMetricsSink
 from reinforcestrategycreator_pipeline.src.monitoring.drift_detection import DataDriftDetector, ModelDriftDetector
 from reinforcestrategycreator_pipeline.src.monitoring.alerting import AlertManager
 from reinforcestrategycreator_pipeline.src.deployment.manager import DeploymentManager
@@ -463,6 +466,23 @@ class TestMonitoringIntegration:
             event_type, event_data, severity, tags
         )
 
+    @patch('reinforcestrategycreator_pipeline.src.monitoring.service.datadog_client')
+    def test_shutdown_closes_alert_manager_and_flushes_metrics(self, mock_dd_client):
+        """Test shutdown delivers queued alerts and aggregated metrics."""
+        config = MonitoringConfig(
+            enabled=True,
+            alert_manager=AlertManagerConfig(enabled=True)
+        )
+        service = MonitoringService(config)
+        mock_alert_manager = MagicMock(spec=AlertManager)
+        service.alert_manager = mock_alert_manager
+        mock_dd_client.flush.return_value = 0
+
+        service.shutdown(timeout=2.0)
+
+        mock_alert_manager.close.assert_called_once_with(2.0)
+        mock_dd_client.flush.assert_called_once()
+
     @patch('reinforcestrategycreator_pipeline.src.monitoring.service.log_with_context')
     @patch('reinforcestrategycreator_pipeline.src.monitoring.service.datadog_client')
     def test_log_metric_with_deployment_manager_enrichment(self, mock_dd_client, mock_log_context):
@@ -489,4 +509,78 @@ class TestMonitoringIntegration:
         
         # Check datadog_client call
         dd_call_args = mock_dd_client.gauge.call_args
-        assert sorted(dd_call_args[1]["tags"]) == sorted(expected_tags)
\ No newline at end of file
+        assert sorted(dd_call_args[1]["tags"]) == sorted(expected_tags)
+
+    @patch('reinforcestrategycreator_pipeline.src.monitoring.service.log_with_context')
+    @patch('reinforcestrategycreator_pipeline.src.monitoring.service.datadog_client')
+    def test_deployment_tags_are_cached(self, mock_dd_client, mock_log_context):
+        """Test that deployment tags are looked up once per (model_id, environment)."""
+        mock_deployment_manager = MagicMock(spec=DeploymentManager)
+        mock_deployment_manager.get_current_deployment.return_value = {
+            "model_version": "v1", "deployment_id": "d1"
+        }
+        service = MonitoringService(deployment_manager=mock_deployment_manager)
+        service._initialized = True
+
+        for _ in range(5):
+            service.log_metric("latency", 1.0, model_id="m", environment="production")
+        service.log_metric("latency", 1.0, model_id="m", environment="staging")
+
+        assert mock_deployment_manager.get_current_deployment.call_count == 2
+        assert mock_dd_client.gauge.call_args[1]["tags"] == ["model_version:v1", "deployment_id:d1"]
+
+        # A new deployment invalidates the cached tags
+        service.log_event = MagicMock()
+        service.track_deployment("m", "v2", "production", "d2")
+        service.log_metric("latency", 1.0, model_id="m", environment="production")
+        assert mock_deployment_manager.get_current_deployment.call_count == 3
+
+
+class TestMonitoringServiceMetricAggregation:
+    """Test log_metric with client-side aggregation enabled."""
+
+    @pytest.fixture
+    def aggregated_service(self):
+        """Create a service with aggregation routed to an in-memory sink."""
+        config = MonitoringConfig(
+            enabled=True,
+            metrics_prefix="test",
+            metrics_aggregation=MetricsAggregationConfig(flush_interval_seconds=3600)
+        )
+        sink = InMemoryMetricsSink()
+        with patch('reinforcestrategycreator_pipeline.src.monitoring.service.configure_logging'), \
+             patch('reinforcestrategycreator_pipeline.src.monitoring.service.configure_datadog'), \
+             patch.object(datadog_client, 'enabled', True), \
+             patch.object(datadog_client, 'configure_aggregation',
+                          wraps=lambda **options: DatadogClient.configure_aggregation(datadog_client, sink=sink, **options)):
+            service = MonitoringService(config)
+            yield service, sink
+        datadog_client.configure_aggregation(enabled=False)
+
+    @patch('reinforcestrategycreator_pipeline.src.monitoring.service.log_with_context')
+    def test_log_metric_aggregates_without_per_call_logging(self, mock_log_context, aggregated_service):
+        """Test that metric calls are aggregated and not logged one by one."""
+        service, sink = aggregated_service
+        prefix = datadog_client.metrics_prefix
+
+        for step in range(1000):
+            service.log_metric("training.loss", 1.0 / (step + 1))
+            service.log_metric("training.steps", 1, metric_type="increment")
+        service.flush_metrics()
+
+        mock_log_context.assert_not_called()
+        assert f"{prefix}.training.steps:1000|c" in sink.lines
+        assert f"{prefix}.training.loss.max:1|g" in sink.lines
+        assert service.create_health_check()["metrics_aggregation"]["calls"] == 2000
+
+    def test_aggregation_not_configured_when_datadog_disabled(self):
+        """Test that no aggregator (and no UDP socket) is set up while the client is disabled."""
+        config = MonitoringConfig(enabled=True, metrics_aggregation=MetricsAggregationConfig())
+        with patch('reinforcestrategycreator_pipeline.src.monitoring.service.configure_logging'), \
+             patch('reinforcestrategycreator_pipeline.src.monitoring.service.configure_datadog'), \
+             patch.object(datadog_client, 'enabled', False), \
+             patch.object(datadog_client, 'configure_aggregation') as mock_configure:
+            MonitoringService(config)
+
+        mock_configure.assert_not_called()
+        assert datadog_client.aggregator is None
@@ -5,10 +5,12 @@ from datetime import datetime
 from pathlib import Path
 import tempfile
 import json
+import numpy as np
 from unittest.mock import Mock, MagicMock, patch
 
 from reinforcestrategycreator_pipeline.src.deployment.paper_trading import (
     TradingSimulationEngine,
+    VectorizedTradingEngine,
     PaperTradingDeployer,
     Order,
     OrderType,
@@ -291,6 +293,91 @@ class TestTradingSimulationEngine:
         assert engine.daily_loss == 0.0
 
 
+class TestVectorizedTradingEngine:
+    """Test cases for VectorizedTradingEngine."""
+    
+    def test_matches_object_engine_on_market_orders(self):
+        """Test that fills, cash, positions and P&L match TradingSimulationEngine."""
+        symbols = ["A", "B", "C", "D"]
+        settings = dict(initial_capital=100000.0, max_position_size=0.2, daily_stop_loss=0.5)
+        legacy = TradingSimulationEngine(**settings)
+        vectorized = VectorizedTradingEngine(symbols, **settings)
+        rng = np.random.default_rng(0)
+        prices = 100 * np.exp(np.cumsum(0.01 * rng.standard_normal((60, len(symbols))), axis=0))
+        
+        for tick, tick_prices in enumerate(prices):
+            for symbol_id, symbol in enumerate(symbols):
+                held = legacy.positions.get(symbol)
+                if held is None and rng.random() < 0.3:
+                    quantity, side = int(rng.integers(1, 100)), OrderSide.BUY
+                elif held is not None and rng.random() < 0.3:
+                    quantity, side = held.quantity, OrderSide.SELL
+                else:
+                    continue
+                order = Order(f"{tick}_{symbol}", symbol, side, OrderType.MARKET, quantity)
+                legacy.submit_order(order, current_market_price=tick_prices[symbol_id])
+                vectorized.submit_order(order, current_market_price=tick_prices[symbol_id])
+            legacy.process_market_data(dict(zip(symbols, tick_prices)))
+            vectorized.process_tick(tick_prices)
+        
+        assert vectorized.cash == pytest.approx(legacy.cash)
+        assert vectorized.portfolio_value_history == pytest.approx([v for _, v in legacy.portfolio_values])
+        # TradingSimulationEngine books each realized P&L on the trade before the closing fill,
+        # so compare the P&L values rather than their order
+        assert np.sort(vectorized.trade_records["pnl"]) == pytest.approx(np.sort([t["pnl"] for t in legacy.trades]))
+        positions = vectorized.get_positions()
+        assert positions.keys() == legacy.positions.keys()
+        for symbol, position in legacy.positions.items():
+            assert positions[symbol].average_price == pytest.approx(position.average_price)
+        assert vectorized.get_performance_metrics() == pytest.approx(legacy.get_performance_metrics())
+    
+    def test_limit_and_stop_orders_fill_on_trigger(self):
+        """Test that limit and stop orders wait for their trigger price."""
+        engine = VectorizedTradingEngine(["A", "B"], slippage_rate=0.0, commission_rate=0.0)
+        engine.process_tick(np.array([100.0, 50.0]))
+        accepted = engine.submit_orders(
+            np.array([0, 1]), np.array([1, 1]), np.array([10.0, 10.0]),
+            order_type=np.array([1, 2]),
+            limit_prices=np.array([95.0, np.nan]),
+            stop_prices=np.array([np.nan, 55.0])
+        )
+        assert accepted.all()
+        
+        engine.process_tick(np.array([97.0, 52.0]))
+        assert len(engine.orders) == 2
+        
+        engine.process_tick(np.array([94.0, 56.0]))
+        assert len(engine.orders) == 0
+        assert engine.position_qty.tolist() == [10.0, 10.0]
+        assert engine.average_price.tolist() == [94.0, 56.0]
+    
+    def test_validation_rejects_in_batch(self):
+        """Test that oversized buys, uncovered sells and duplicate slots are rejected."""
+        engine = VectorizedTradingEngine(["A", "B", "C"], max_position_size=0.1)
+        engine.process_tick(np.array([100.0, 100.0, 100.0]))
+        
+        accepted = engine.submit_orders(np.array([0, 1, 2]), np.array([1, 1, -1]), np.array([50.0, 200.0, 1.0]))
+        
+        assert accepted.tolist() == [True, False, False]
+        assert not engine.submit_orders(np.array([0]), np.array([1]), np.array([1.0]))[0]
+        assert engine.rejected_orders == 3
+    
+    def test_daily_stop_loss_cancels_pending_orders(self):
+        """Test that the daily stop loss blocks and cancels orders."""
+        engine = VectorizedTradingEngine(["A", "B"], initial_capital=10000.0, max_position_size=1.0, daily_stop_loss=0.02)
+        engine.process_tick(np.array([100.0, 100.0]))
+        engine.submit_orders(np.array([0]), np.array([1]), np.array([90.0]))
+        engine.process_tick(np.array([100.0, 100.0]))
+        engine.submit_orders(np.array([1]), np.array([1]), np.array([1.0]), order_type=np.array([1]), limit_prices=np.array([50.0]))
+        
+        engine.process_tick(np.array([90.0, 100.0]))
+        
+        assert engine.risk_limit_hit
+        assert engine.cancelled_orders == 1
+        assert len(engine.orders) == 0
+        assert not engine.submit_orders(np.array([1]), np.array([1]), np.array([1.0]))[0]
+
+
 class TestPaperTradingDeployer:
     """Test cases for PaperTradingDeployer."""
     
@@ -452,6 +539,59 @@ class TestPaperTradingDeployer:
         engine = simulation["engine"]
         assert len(engine.orders) > 0 or len(engine.order_history) > 0
     
+    def test_drift_monitoring_observes_features_and_predictions(self, paper_trading_deployer):
+        """Test that market updates feed the streaming drift monitor."""
+        simulation_id = paper_trading_deployer.deploy_to_paper_trading(
+            model_id="test_model",
+            model_version="v1.0",
+            simulation_config={"drift_monitoring": {"warmup_size": 4, "window_size": 10, "num_blocks": 2, "check_interval": 2}}
+        )
+        paper_trading_deployer.start_simulation(simulation_id)
+        simulation = paper_trading_deployer.active_simulations[simulation_id]
+        mock_model = Mock()
+        mock_model.predict.return_value = "hold"
+        simulation["model"] = mock_model
+        
+        for step in range(4):
+            paper_trading_deployer.process_market_update(
+                simulation_id,
+                {"AAPL": 150.0 + step, "MSFT": 300.0 + step},
+                {"AAPL": np.array([step, 1.0]), "MSFT": np.array([step, 2.0])}
+            )
+        
+        monitor = simulation["drift_monitor"]
+        assert monitor.n_observations == 8
+        assert mock_model.predict.call_count == 8
+        status = paper_trading_deployer.get_simulation_status(simulation_id)
+        assert status["drift_report"]["details"]["prediction_distribution"]["hold"] == 1.0
+    
+    def test_vectorized_engine_uses_batched_predict(self, paper_trading_deployer):
+        """Test that the vectorized engine predicts all symbols in one call."""
+        symbols = [f"SYM{i}" for i in range(5)]
+        simulation_id = paper_trading_deployer.deploy_to_paper_trading(
+            model_id="test_model",
+            simulation_config={"engine": "vectorized", "symbols": symbols}
+        )
+        paper_trading_deployer.start_simulation(simulation_id)
+        simulation = paper_trading_deployer.active_simulations[simulation_id]
+        assert isinstance(simulation["engine"], VectorizedTradingEngine)
+        mock_model = Mock()
+        # Scores for buy/sell/hold per symbol: buy the even symbols
+        mock_model.predict.return_value = np.array([[1.0, 0.0, 0.5] if i % 2 == 0 else [0.0, 0.0, 1.0] for i in range(5)])
+        simulation["model"] = mock_model
+        
+        prices = np.array([10.0, 20.0, 30.0, 40.0, 50.0])
+        paper_trading_deployer.process_market_arrays(simulation_id, prices, np.ones((5, 3)))
+        paper_trading_deployer.process_market_update(
+            simulation_id, dict(zip(symbols, prices)), {symbol: np.ones(3) for symbol in symbols}
+        )
+        
+        assert mock_model.predict.call_count == 2
+        assert mock_model.predict.call_args[0][0].shape == (5, 3)
+        status = paper_trading_deployer.get_simulation_status(simulation_id)
+        assert sorted(status["positions"]) == ["SYM0", "SYM2", "SYM4"]
+        assert status["total_trades"] == 3
+    
     def test_invalid_simulation_id(self, paper_trading_deployer):
         """Test operations with invalid simulation ID."""
         with pytest.raises(ValueError, match="Simulation invalid_id not found"):
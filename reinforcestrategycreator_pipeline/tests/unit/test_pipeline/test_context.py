@@ -1,6 +1,13 @@
+import os
+import pickle
 import unittest
 import threading
+
+import numpy as np
+import pandas as pd
+
 from reinforcestrategycreator_pipeline.src.pipeline.context import PipelineContext, PipelineContextError
+from reinforcestrategycreator_pipeline.src.pipeline.shared_store import SharedValueHandle
 
 class TestPipelineContext(unittest.TestCase):
 
@@ -134,5 +141,82 @@ class TestPipelineContext(unittest.TestCase):
         PipelineContext._instance = None
 
 
+class TestPipelineContextSharedStore(unittest.TestCase):
+
+    def setUp(self):
+        if PipelineContext._instance:
+            PipelineContext._instance.reset()
+            PipelineContext._instance = None
+        self.context = PipelineContext.get_instance()
+        self.store = self.context.enable_shared_store(min_bytes=1024)
+        self.frame = pd.DataFrame(
+            {"close": np.arange(1000.0), "volume": np.arange(1000)},
+            index=pd.date_range("2024-01-01", periods=1000, freq="h", name="timestamp")
+        )
+
+    def tearDown(self):
+        if PipelineContext._instance:
+            PipelineContext._instance.reset()
+            PipelineContext._instance = None
+
+    def test_large_values_are_spilled_and_mapped_back(self):
+        array = np.random.default_rng(0).standard_normal((100, 10))
+        self.context.set("raw_data", self.frame)
+        self.context.set("features", array)
+        self.context.set("small", np.zeros(3))
+
+        self.assertIsInstance(self.context.get_handle("raw_data"), SharedValueHandle)
+        self.assertIsInstance(self.context.get_handle("features"), SharedValueHandle)
+        self.assertNotIsInstance(self.context.get_handle("small"), SharedValueHandle)
+        pd.testing.assert_frame_equal(self.context.get("raw_data"), self.frame, check_freq=False)
+        np.testing.assert_array_equal(self.context.get("features"), array)
+        self.assertFalse(self.context.get("features").flags.writeable)
+
+    def test_handles_pickle_small_and_reload(self):
+        self.context.set("raw_data", self.frame)
+        handle = self.context.get_handle("raw_data")
+        self.context.get("raw_data")
+
+        payload = pickle.dumps(handle)
+
+        self.assertLess(len(payload), 1024)
+        pd.testing.assert_frame_equal(pickle.loads(payload).load(), self.frame, check_freq=False)
+
+    def test_overwrite_delete_and_reset_remove_files(self):
+        self.context.set("a", self.frame)
+        first = self.context.get_handle("a").path
+        self.context.set("a", self.frame * 2)
+        second = self.context.get_handle("a").path
+
+        self.assertFalse(os.path.exists(first))
+        self.context.delete("a")
+        self.assertFalse(os.path.exists(second))
+
+        self.context.set("b", self.frame)
+        self.context.reset()
+        self.assertFalse(os.path.exists(self.store.directory))
+        self.assertIsNone(self.context.shared_store)
+
+    def test_exported_handles_outlive_their_context(self):
+        worker_store_dir = self.store.directory
+        self.context.set("features", self.frame)
+        handle = self.context.export_handle("features")
+        self.context.delete("features")
+        self.assertTrue(os.path.exists(handle.path))
+
+        self.context.adopt_handle("adopted", handle)
+        self.assertTrue(self.store.owns(handle))
+        self.assertTrue(handle.path.startswith(worker_store_dir))
+
+    def test_close_keeps_values_in_memory(self):
+        self.context.set("raw_data", self.frame)
+        directory = self.store.directory
+
+        self.context.close_shared_store()
+
+        self.assertFalse(os.path.exists(directory))
+        pd.testing.assert_frame_equal(self.context.get("raw_data"), self.frame, check_freq=False)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
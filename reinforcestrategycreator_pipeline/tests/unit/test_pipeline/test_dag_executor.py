@@ -0,0 +1,235 @@
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+
+from reinforcestrategycreator_pipeline.src.artifact_store.local_adapter import LocalFileSystemStore
+from reinforcestrategycreator_pipeline.src.config.models import TransformationConfig
+from reinforcestrategycreator_pipeline.src.pipeline.context import PipelineContext
+from reinforcestrategycreator_pipeline.src.pipeline.dag_executor import DAGPipelineExecutor
+from reinforcestrategycreator_pipeline.src.pipeline.executor import PipelineExecutionError
+from reinforcestrategycreator_pipeline.src.pipeline.shared_store import SharedValueHandle
+from reinforcestrategycreator_pipeline.src.pipeline.stage import PipelineStage
+from reinforcestrategycreator_pipeline.src.pipeline.stages.feature_engineering import FeatureEngineeringStage
+
+
+class FunctionStage(PipelineStage):
+    """Stage that writes fn(*inputs) to each of its outputs."""
+
+    def __init__(self, name, inputs=None, outputs=None, fn=None, config=None, cacheable=True):
+        super().__init__(name, dict(config or {}, inputs=inputs, outputs=outputs))
+        self.cacheable = cacheable
+        self.fn = fn or (lambda *args: name)
+        self.run_count = 0
+        self.teardown_count = 0
+
+    def setup(self, context):
+        pass
+
+    def run(self, context):
+        self.run_count += 1
+        value = self.fn(*[context.get(key) for key in self.inputs or []])
+        for key in self.outputs or []:
+            context.set(key, value)
+        return context
+
+    def teardown(self, context):
+        self.teardown_count += 1
+
+
+class FrameStage(PipelineStage):
+    """Picklable stage for process-pool runs."""
+
+    def __init__(self, name, inputs, outputs, column=None):
+        super().__init__(name, {"inputs": inputs, "outputs": outputs})
+        self.column = column
+
+    def setup(self, context):
+        pass
+
+    def run(self, context):
+        if not self.inputs:
+            frame = pd.DataFrame({"close": np.arange(100_000.0), "volume": np.ones(100_000)})
+            context.set(self.outputs[0], frame)
+        else:
+            frame = context.get(self.inputs[0])
+            context.set(self.outputs[0], (os.getpid(), float(frame[self.column].sum())))
+            context.set("scratch", frame * 2)
+        return context
+
+    def teardown(self, context):
+        pass
+
+
+class StaticConfigManager:
+    """Picklable config manager that counts get_config calls on this copy."""
+
+    def __init__(self, config):
+        self.config = config
+        self.calls = 0
+
+    def get_config(self):
+        self.calls += 1
+        return self.config
+
+
+class TestDAGPipelineExecutor(unittest.TestCase):
+
+    def setUp(self):
+        if PipelineContext._instance:
+            PipelineContext._instance.reset()
+            PipelineContext._instance = None
+        self.context = PipelineContext.get_instance()
+        self.temp_dir = tempfile.mkdtemp()
+        self.store = LocalFileSystemStore(Path(self.temp_dir))
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        if PipelineContext._instance:
+            PipelineContext._instance.reset()
+            PipelineContext._instance = None
+
+    def make_stages(self, scale=2):
+        return [
+            FunctionStage("ingest", [], ["raw"], lambda: [1, 2, 3]),
+            FunctionStage("features", ["raw"], ["features"], lambda raw: [x * scale for x in raw], config={"scale": scale}),
+            FunctionStage("eval_a", ["features"], ["score_a"], sum),
+            FunctionStage("eval_b", ["features"], ["score_b"], max),
+            FunctionStage("report", ["score_a", "score_b"], ["report"], lambda a, b: f"{a}/{b}", cacheable=False),
+        ]
+
+    def test_dependencies_and_levels_follow_declared_keys(self):
+        executor = DAGPipelineExecutor(self.make_stages(), artifact_store=self.store)
+        plan = {entry.name: entry for entry in executor.explain()}
+
+        self.assertEqual([plan[name].level for name in ["ingest", "features", "eval_a", "eval_b", "report"]], [0, 1, 2, 2, 3])
+        self.assertEqual(plan["report"].depends_on, ["eval_a", "eval_b"])
+        self.assertFalse(any(entry.cache_hit for entry in plan.values()))
+
+    def test_independent_stages_run_concurrently(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def wait_for_sibling(features):
+            barrier.wait()
+            return len(features)
+
+        stages = self.make_stages()
+        stages[2].fn = stages[3].fn = wait_for_sibling
+        context = DAGPipelineExecutor(stages, max_workers=2, artifact_store=self.store).run_pipeline()
+
+        self.assertEqual(context.get("report"), "3/3")
+        self.assertEqual(context.get_metadata("pipeline_status"), "completed")
+
+    def test_unchanged_stages_are_restored_from_cache(self):
+        first = self.make_stages()
+        DAGPipelineExecutor(first, artifact_store=self.store).run_pipeline()
+        self.assertEqual(self.context.get("report"), "12/6")
+
+        self.context.reset()
+        second = self.make_stages()
+        executor = DAGPipelineExecutor(second, artifact_store=self.store)
+        self.assertEqual([entry.cache_hit for entry in executor.explain()], [True, True, True, True, False])
+        context = executor.run_pipeline()
+
+        self.assertEqual([stage.run_count for stage in second], [0, 0, 0, 0, 1])
+        self.assertEqual(context.get("report"), "12/6")
+        self.assertEqual(context.get_metadata("stage_status")["features"], "cached")
+        self.assertEqual(context.get_metadata("stage_status")["report"], "completed")
+
+    def test_config_change_invalidates_downstream_stages(self):
+        DAGPipelineExecutor(self.make_stages(scale=2), artifact_store=self.store).run_pipeline()
+
+        self.context.reset()
+        stages = self.make_stages(scale=3)
+        executor = DAGPipelineExecutor(stages, artifact_store=self.store)
+        self.assertEqual([entry.cache_hit for entry in executor.explain()], [True, False, False, False, False])
+        context = executor.run_pipeline()
+
+        self.assertEqual(context.get("report"), "18/9")
+        self.assertEqual(stages[0].run_count, 0)
+
+    def test_dry_run_reports_plan_without_running(self):
+        stages = self.make_stages()
+        executor = DAGPipelineExecutor(stages, artifact_store=self.store)
+        context = executor.run_pipeline(dry_run=True)
+
+        self.assertEqual(context.get_metadata("pipeline_status"), "dry_run")
+        self.assertEqual(len(context.get_metadata("execution_plan")), 5)
+        self.assertTrue(all(stage.run_count == 0 for stage in stages))
+        self.assertIn("0/5 stages cached", executor.format_plan(executor.explain()))
+
+    def test_failure_stops_downstream_and_tears_down(self):
+        stages = self.make_stages()
+        stages[1].fn = lambda raw: 1 / 0
+        executor = DAGPipelineExecutor(stages, artifact_store=self.store)
+
+        with self.assertRaisesRegex(PipelineExecutionError, "Stage 'features' failed"):
+            executor.run_pipeline()
+
+        self.assertEqual(self.context.get_metadata("pipeline_status"), "failed")
+        self.assertEqual(self.context.get_metadata("error_stage"), "features")
+        self.assertEqual(stages[1].teardown_count, 1)
+        self.assertEqual([stage.run_count for stage in stages[2:]], [0, 0, 0])
+
+    def test_undeclared_stage_is_a_barrier(self):
+        stages = self.make_stages()
+        stages.insert(2, FunctionStage("legacy", cacheable=False))
+        executor = DAGPipelineExecutor(stages, artifact_store=self.store)
+        plan = {entry.name: entry for entry in executor.explain()}
+
+        self.assertEqual(plan["legacy"].depends_on, ["ingest", "features"])
+        self.assertEqual(plan["eval_a"].depends_on, ["features", "legacy"])
+
+    def test_process_pool_passes_large_values_as_handles(self):
+        stages = [
+            FrameStage("ingest", [], ["raw"]),
+            FrameStage("sum_close", ["raw"], ["close_total"], column="close"),
+            FrameStage("sum_volume", ["raw"], ["volume_total"], column="volume"),
+        ]
+        executor = DAGPipelineExecutor(stages, max_workers=2, artifact_store=self.store, use_processes=True)
+        context = executor.run_pipeline()
+
+        raw = context.get_handle("raw")
+        self.assertIsInstance(raw, SharedValueHandle)
+        self.assertEqual(context.get("close_total")[1], float(np.arange(100_000.0).sum()))
+        self.assertEqual(context.get("volume_total")[1], 100_000.0)
+        self.assertNotEqual(context.get("close_total")[0], os.getpid())
+        # Only the adopted output survives; the workers' scratch values were cleaned up.
+        self.assertEqual(os.listdir(context.shared_store.directory), [os.path.basename(raw.path)])
+
+    def test_process_pool_passes_services_to_builtin_stage(self):
+        config_manager = StaticConfigManager(
+            SimpleNamespace(data=SimpleNamespace(transformation=TransformationConfig(add_technical_indicators=False)))
+        )
+        self.context.set("config_manager", config_manager)
+        self.context.set("raw_data", pd.DataFrame({"Close": np.linspace(100.0, 120.0, 30)}))
+        executor = DAGPipelineExecutor([FeatureEngineeringStage()], artifact_store=self.store, use_processes=True)
+        context = executor.run_pipeline()
+
+        # The parent only reads the config for the cache key; the stage read the worker's copy
+        # and skipped the default indicators
+        self.assertEqual(config_manager.calls, 1)
+        self.assertEqual(list(context.get("processed_features").columns), ["Close"])
+        self.assertEqual(len(context.get("labels")), 30)
+
+    def test_unpicklable_service_keeps_stages_in_parent(self):
+        self.context.set("monitoring_service", threading.Lock())
+        stages = [FrameStage("ingest", [], ["raw"]), FrameStage("sum_close", ["raw"], ["close_total"], column="close")]
+        context = DAGPipelineExecutor(stages, artifact_store=self.store, use_processes=True).run_pipeline()
+
+        self.assertEqual(context.get("close_total")[0], os.getpid())
+        self.assertEqual(context.get_metadata("stage_status"), {"ingest": "completed", "sum_close": "completed"})
+
+    def test_duplicate_stage_names_rejected(self):
+        with self.assertRaises(ValueError):
+            DAGPipelineExecutor([FunctionStage("a", [], ["x"]), FunctionStage("a", [], ["y"])])
+
+
+if __name__ == '__main__':
+    unittest.main()
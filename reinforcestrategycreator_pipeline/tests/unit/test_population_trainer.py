@@ -0,0 +1,150 @@
+"""Unit tests for the stacked population trainer."""
+
+import tempfile
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+from reinforcestrategycreator_pipeline.src.models.implementations import DQN
+from reinforcestrategycreator_pipeline.src.training.engine import TrainingEngine
+from reinforcestrategycreator_pipeline.src.training.hpo_optimizer import HPOptimizer
+from reinforcestrategycreator_pipeline.src.training.population_trainer import (
+    PopulationTrainer,
+    StackedQNetworks
+)
+
+
+def price_data(rows: int = 120, seed: int = 0) -> np.ndarray:
+    """OHLCV-like array with a random-walk close in column 3."""
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, rows))
+    return np.column_stack([close, close + 1, close - 1, close, rng.random(rows) * 1000])
+
+
+class TestStackedQNetworks:
+    """Test cases for StackedQNetworks."""
+
+    def test_train_step_matches_dqn(self):
+        """A population of one takes the same Adam step as DQN._train_step."""
+        rng = np.random.default_rng(1)
+        networks = StackedQNetworks(1, 5, 3, [8, 4], np.array([0.01]), rng=rng)
+
+        model = DQN({"hyperparameters": {"hidden_layers": [8, 4], "learning_rate": 0.01, "double_dqn": True}})
+        model.build((5,), (3,))
+        model.q_network["weights"] = networks.member_weights(0)
+        model.target_network["weights"] = networks.member_weights(0)
+
+        batch = 16
+        states, next_states = rng.standard_normal((batch, 5)), rng.standard_normal((batch, 5))
+        actions = rng.integers(0, 3, batch)
+        rewards = rng.standard_normal(batch).astype(np.float32).astype(np.float64)
+        dones = (rng.random(batch) < 0.2).astype(np.float64)
+        for i in range(batch):
+            model.replay_buffer.push(states[i], actions[i], rewards[i], next_states[i], dones[i])
+
+        dqn_loss = model._train_step(batch, 0.9)
+        losses = networks.train_step(
+            states[None], actions[None], rewards[None], next_states[None], dones[None], np.array([0.9])
+        )
+
+        assert losses[0] == pytest.approx(dqn_loss, rel=1e-6)
+        for key, value in networks.member_weights(0).items():
+            np.testing.assert_allclose(value, model.q_network["weights"][key], rtol=1e-6, atol=1e-9)
+
+    def test_members_are_independent(self):
+        """Updating one member's batch does not touch another member's weights."""
+        rng = np.random.default_rng(2)
+        networks = StackedQNetworks(2, 4, 3, [6], np.array([0.01, 0.0]), rng=rng)
+        before = networks.member_weights(1)
+
+        states = rng.standard_normal((2, 8, 4))
+        networks.train_step(
+            states, rng.integers(0, 3, (2, 8)), rng.standard_normal((2, 8)),
+            states, np.zeros((2, 8)), np.array([0.9, 0.9])
+        )
+
+        # Member 1 has a zero learning rate, member 0 moved
+        for key, value in networks.member_weights(1).items():
+            np.testing.assert_array_equal(value, before[key])
+        assert not np.allclose(networks.member_weights(0)["W0"], before["W0"])
+
+
+class TestPopulationTrainer:
+    """Test cases for PopulationTrainer."""
+
+    def test_train_reports_per_member_history(self):
+        """Each member gets its own per-episode metrics."""
+        trainer = PopulationTrainer(
+            [{"learning_rate": 1e-3, "epsilon_decay": 0.5}, {"learning_rate": 1e-2, "gamma": 0.9}],
+            {"hidden_layers": [16], "batch_size": 8, "memory_size": 500},
+            seed=0
+        )
+        data = price_data()
+        history = trainer.train(data[:90], data[90:], episodes=3)
+
+        assert len(history) == 2
+        for member in history:
+            for name in ("loss", "episode_reward", "total_return", "val_total_return", "val_sharpe_ratio", "epsilon"):
+                assert len(member[name]) == 3
+        assert history[0]["epsilon"] == pytest.approx([0.5, 0.25, 0.125])
+        assert history[1]["epsilon"][0] == pytest.approx(0.995)
+        assert trainer.steps == 3 * 89
+
+    def test_requires_members(self):
+        """An empty population is rejected."""
+        with pytest.raises(ValueError):
+            PopulationTrainer([])
+
+
+class TestPopulationExecutor:
+    """Test HPOptimizer's population executor."""
+
+    @pytest.fixture
+    def hpo_optimizer(self):
+        """Create an HPOptimizer whose engine returns fixed arrays."""
+        engine = Mock(spec=TrainingEngine)
+        data = price_data(100)
+        engine._load_data.return_value = (data[:80], data[80:])
+        with tempfile.TemporaryDirectory() as tmpdir, \
+             patch('reinforcestrategycreator_pipeline.src.training.hpo_optimizer.RAY_AVAILABLE', True):
+            yield HPOptimizer(training_engine=engine, results_dir=Path(tmpdir))
+
+    def test_optimize_with_population_executor(self, hpo_optimizer):
+        """Trials run in populations without Ray and the best one is selected."""
+        with patch('reinforcestrategycreator_pipeline.src.training.hpo_optimizer.ray') as mock_ray:
+            results = hpo_optimizer.optimize(
+                model_config={"hyperparameters": {"hidden_layers": [8], "batch_size": 8}},
+                data_config={},
+                training_config={"epochs": 2, "seed": 3},
+                param_space={
+                    "lr": {"type": "loguniform", "low": 1e-4, "high": 1e-2},
+                    "gamma": {"type": "uniform", "low": 0.9, "high": 0.99},
+                    "memory_size": 200
+                },
+                num_trials=5,
+                metric="episode_reward",
+                mode="max",
+                param_mapping={"lr": "hyperparameters.learning_rate"},
+                executor="population",
+                population_size=2
+            )
+            mock_ray.init.assert_not_called()
+
+        assert results["executor"] == "population"
+        assert len(results["all_trials"]) == 5
+        assert results["best_score"] == max(t["metric"] for t in results["all_trials"])
+        assert results["trials_per_hour"] > 0
+        assert (hpo_optimizer.results_dir / f"{results['run_name']}_results.json").exists()
+
+    def test_population_rejects_shared_params_in_search(self, hpo_optimizer):
+        """Only per-member hyperparameters can be searched."""
+        with pytest.raises(ValueError, match="cannot vary within a population"):
+            hpo_optimizer.optimize(
+                model_config={},
+                data_config={},
+                training_config={"epochs": 1},
+                param_space={"batch_size": {"type": "choice", "values": [16, 32]}},
+                executor="population"
+            )
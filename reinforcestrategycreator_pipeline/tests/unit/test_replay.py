@@ -0,0 +1,160 @@
+"""Unit tests for replaying recorded market data through paper trading."""
+
+import time
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from reinforcestrategycreator_pipeline.src.artifact_store.base import ArtifactStore
+from reinforcestrategycreator_pipeline.src.data.synthetic_source import SyntheticDataSource
+from reinforcestrategycreator_pipeline.src.deployment.manager import DeploymentManager
+from reinforcestrategycreator_pipeline.src.deployment.paper_trading import PaperTradingDeployer
+from reinforcestrategycreator_pipeline.src.deployment.replay import REPLAY_PHASES, MarketReplay
+from reinforcestrategycreator_pipeline.src.models.registry import ModelRegistry
+
+
+def make_ticks(n_ticks, symbols, freq="1min"):
+    """Create long-format ticks with a close price and two features per symbol."""
+    rng = np.random.default_rng(0)
+    timestamps = pd.date_range("2024-01-02 09:30", periods=n_ticks, freq=freq)
+    rows = []
+    for timestamp in timestamps:
+        for symbol in symbols:
+            rows.append({
+                "timestamp": timestamp,
+                "symbol": symbol,
+                "close": 100 + rng.standard_normal(),
+                "feature_a": rng.standard_normal(),
+                "feature_b": rng.standard_normal()
+            })
+    return pd.DataFrame(rows)
+
+
+class TestMarketReplay:
+    """Test cases for MarketReplay."""
+
+    @pytest.fixture
+    def deployer(self, tmp_path):
+        """Create a PaperTradingDeployer with mocked dependencies."""
+        deployment_manager = Mock(spec=DeploymentManager)
+        deployment_manager.deploy.return_value = "deploy_replay"
+        deployment_manager.get_deployment_status.return_value = {
+            "deployment_id": "deploy_replay",
+            "model_id": "test_model",
+            "model_version": "v1.0"
+        }
+        return PaperTradingDeployer(
+            deployment_manager=deployment_manager,
+            model_registry=Mock(spec=ModelRegistry),
+            artifact_store=Mock(spec=ArtifactStore),
+            paper_trading_root=tmp_path / "paper_trading"
+        )
+
+    def start(self, deployer, symbols, engine="standard", action="buy"):
+        """Deploy and start a simulation whose model always returns one action."""
+        simulation_id = deployer.deploy_to_paper_trading(
+            model_id="test_model", simulation_config={"symbols": symbols, "engine": engine}
+        )
+        model = Mock()
+        model.predict.side_effect = lambda features: np.zeros(len(features), dtype=int) if action == "buy" else "hold"
+        deployer.active_simulations[simulation_id]["model"] = model
+        deployer.start_simulation(simulation_id)
+        return simulation_id
+
+    def test_csv_replay_uses_recorded_timestamps(self, deployer, tmp_path):
+        """Test that a CSV feed drives the engine on the simulated clock."""
+        data = make_ticks(10, ["AAPL", "MSFT"])
+        csv_path = tmp_path / "ticks.csv"
+        data.to_csv(csv_path, index=False)
+        simulation_id = self.start(deployer, ["AAPL", "MSFT"])
+
+        report = MarketReplay(deployer, simulation_id, csv_path).run()
+
+        engine = deployer.active_simulations[simulation_id]["engine"]
+        assert report.ticks == 10
+        assert report.symbol_updates == 20
+        assert report.simulated_seconds == 9 * 60
+        assert engine.portfolio_values[-1][0] == data["timestamp"].iloc[-1].to_pydatetime()
+        assert {trade["timestamp"] for trade in engine.trades} == {data["timestamp"].iloc[0].to_pydatetime()}
+        assert report.final_status["total_trades"] == 2
+
+    def test_latency_report_covers_every_phase(self, deployer):
+        """Test that every tick records latency for each phase."""
+        simulation_id = self.start(deployer, ["AAPL"], action="hold")
+
+        report = MarketReplay(deployer, simulation_id, make_ticks(20, ["AAPL"])).run(max_ticks=15)
+
+        assert report.ticks == 15
+        assert set(report.latencies) == set(REPLAY_PHASES)
+        for phase in REPLAY_PHASES:
+            assert (report.latencies[phase] > 0).all()
+            _, counts = report.latency_histogram(phase)
+            assert counts.sum() == 15
+        summary = report.latency_summary()
+        assert summary["tick"]["p99_ms"] >= summary["tick"]["p50_ms"]
+        assert "signal_generation latency histogram" in report.format()
+
+    def test_parquet_replay_with_vectorized_engine(self, deployer, tmp_path):
+        """Test that Parquet data replays through the vectorized engine."""
+        symbols = [f"SYM{i}" for i in range(5)]
+        parquet_path = tmp_path / "ticks.parquet"
+        make_ticks(8, symbols).to_parquet(parquet_path)
+        simulation_id = self.start(deployer, symbols, engine="vectorized")
+
+        report = MarketReplay(deployer, simulation_id, parquet_path).run()
+
+        engine = deployer.active_simulations[simulation_id]["engine"]
+        assert report.ticks == 8
+        assert engine.num_ticks == 8
+        assert len(engine.trade_records) == 5
+        assert engine.portfolio_values[-1][0] == pd.Timestamp("2024-01-02 09:37").to_pydatetime()
+
+    def test_synthetic_source_replay(self, deployer):
+        """Test that a synthetic data source replays bar by bar without a file."""
+        source = SyntheticDataSource("synthetic_bars", {"symbols": ["AAPL", "MSFT"], "n_bars": 12, "interval": "1m"})
+        simulation_id = self.start(deployer, ["AAPL", "MSFT"], action="hold")
+
+        report = MarketReplay(deployer, simulation_id, source).run()
+
+        assert report.ticks == 12
+        assert report.symbol_updates == 24
+        assert report.simulated_seconds == 11 * 60
+
+    def test_speed_multiplier_paces_replay(self, deployer):
+        """Test that a speed multiplier slows the replay to scaled real time."""
+        simulation_id = self.start(deployer, ["AAPL"], action="hold")
+        data = make_ticks(5, ["AAPL"], freq="1s")
+
+        start = time.perf_counter()
+        report = MarketReplay(deployer, simulation_id, data, speed=20.0).run()
+
+        assert time.perf_counter() - start >= 4 / 20.0
+        assert report.speedup == pytest.approx(20.0, rel=0.5)
+
+    def test_single_symbol_data_requires_symbol(self, deployer):
+        """Test that data without a symbol column needs an explicit symbol."""
+        simulation_id = self.start(deployer, ["AAPL"], action="hold")
+        data = make_ticks(3, ["AAPL"]).drop(columns="symbol").set_index("timestamp")
+
+        with pytest.raises(ValueError, match="symbol"):
+            MarketReplay(deployer, simulation_id, data)
+
+        report = MarketReplay(deployer, simulation_id, data, symbol="AAPL").run()
+        assert report.ticks == 3
+
+    def test_engine_clock_is_restored_after_replay(self, deployer):
+        """Test that the engine goes back to its own clock when the replay ends or fails."""
+        simulation_id = self.start(deployer, ["AAPL"], action="hold")
+        engine = deployer.active_simulations[simulation_id]["engine"]
+        live_clock = engine.clock
+        data = make_ticks(3, ["AAPL"])
+
+        MarketReplay(deployer, simulation_id, data).run()
+        assert engine.clock is live_clock
+
+        deployer.process_market_update = Mock(side_effect=RuntimeError("feed error"))
+        with pytest.raises(RuntimeError, match="feed error"):
+            MarketReplay(deployer, simulation_id, data).run()
+        assert engine.clock is live_clock
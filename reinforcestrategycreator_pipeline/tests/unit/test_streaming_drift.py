@@ -0,0 +1,131 @@
+"""Unit tests for streaming drift monitoring."""
+
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from reinforcestrategycreator_pipeline.src.config.models import StreamingDriftConfig
+from reinforcestrategycreator_pipeline.src.monitoring.drift_detection import ReferenceProfile
+from reinforcestrategycreator_pipeline.src.monitoring.streaming_drift import StreamingDriftMonitor
+
+
+def make_config(**overrides):
+    """Create a small streaming drift configuration."""
+    settings = dict(window_size=400, num_blocks=4, warmup_size=500, check_interval=100)
+    settings.update(overrides)
+    return StreamingDriftConfig(**settings)
+
+
+class TestStreamingDriftMonitor:
+    """Test cases for StreamingDriftMonitor."""
+
+    @pytest.fixture
+    def rng(self):
+        """Create a seeded random generator."""
+        return np.random.default_rng(42)
+
+    def feed(self, monitor, rows, predictions=None):
+        """Observe rows one at a time and return the reports produced."""
+        reports = []
+        for i, row in enumerate(rows):
+            report = monitor.observe(row, prediction=None if predictions is None else predictions[i])
+            if report is not None:
+                reports.append(report)
+        return reports
+
+    def test_warmup_then_no_drift_on_same_distribution(self, rng):
+        """Test that the warm-up becomes the reference and a stable stream is not flagged."""
+        alert_manager = Mock()
+        monitor = StreamingDriftMonitor(make_config(), feature_names=["a", "b"], alert_manager=alert_manager)
+
+        assert self.feed(monitor, rng.normal(size=(500, 2))) == []
+        assert not monitor.is_warming_up
+
+        reports = self.feed(monitor, rng.normal(size=(800, 2)))
+
+        assert len(reports) == 8
+        assert not any(report["drift_detected"] for report in reports)
+        alert_manager.handle_event.assert_not_called()
+
+    def test_shifted_stream_alerts_through_alert_manager(self, rng):
+        """Test that a mean shift in one feature is detected and alerted."""
+        alert_manager = Mock()
+        monitor = StreamingDriftMonitor(
+            make_config(alert_severity="critical"),
+            feature_names=["a", "b"],
+            alert_manager=alert_manager,
+            tags=["env:test"]
+        )
+        self.feed(monitor, rng.normal(size=(500, 2)))
+
+        shifted = rng.normal(size=(400, 2))
+        shifted[:, 1] += 2.0
+        report = self.feed(monitor, shifted)[-1]
+
+        assert report["drift_detected"]
+        assert report["details"]["drifted_features"] == ["b"]
+        assert report["details"]["feature_results"]["b"]["mean_shift"] == pytest.approx(2.0, abs=0.3)
+        assert report["details"]["feature_results"]["b"]["ks_statistic"] > 0.5
+        event_type, event_data = alert_manager.handle_event.call_args[0]
+        assert event_type == "streaming_drift_detected"
+        assert event_data["drifted_features"] == ["b"]
+        assert alert_manager.handle_event.call_args[1] == {"severity": "critical", "tags": ["env:test"]}
+
+    def test_window_slides_and_memory_is_bounded(self, rng):
+        """Test that old blocks leave the window once the stream returns to normal."""
+        monitor = StreamingDriftMonitor(make_config(), feature_names=["a"])
+        self.feed(monitor, rng.normal(size=(500, 1)))
+        assert self.feed(monitor, rng.normal(5.0, 1.0, size=(400, 1)))[-1]["drift_detected"]
+
+        report = self.feed(monitor, rng.normal(size=(400, 1)))[-1]
+
+        assert not report["drift_detected"]
+        assert report["window_observations"] == 400
+        assert report["n_observations"] == 1300
+        assert monitor._hist.shape[0] == 4
+        assert monitor._buffer.shape == (100, 1)
+
+    def test_psi_matches_batch_detector_on_full_window(self, rng):
+        """Test that the streaming PSI equals the batch PSI over the same window."""
+        reference = pd.DataFrame({"a": rng.normal(size=1000)})
+        profile = ReferenceProfile.fit(reference)
+        monitor = StreamingDriftMonitor(make_config(check_interval=400), reference_profile=profile)
+        current = rng.normal(0.3, 1.2, size=400)
+
+        report = self.feed(monitor, current[:, None])[-1]
+
+        edges = profile.numeric["a"].bin_edges
+        ref_counts, _ = np.histogram(reference["a"], bins=edges)
+        cur_counts, _ = np.histogram(np.clip(current, edges[0], edges[-1]), bins=edges)
+        ref_props = (ref_counts + 1) / (ref_counts.sum() + len(edges) - 1)
+        cur_props = (cur_counts + 1) / (cur_counts.sum() + len(edges) - 1)
+        expected = np.sum((cur_props - ref_props) * np.log(cur_props / ref_props))
+        assert report["score"] == pytest.approx(expected)
+        assert report["details"]["feature_results"]["a"]["median"] == pytest.approx(np.median(current), abs=0.05)
+
+    def test_prediction_distribution_drift(self, rng):
+        """Test that a change in the predicted action mix is reported."""
+        monitor = StreamingDriftMonitor(make_config(), feature_names=["a"])
+        warmup_actions = rng.choice(["buy", "sell", "hold"], size=500, p=[0.3, 0.3, 0.4])
+        self.feed(monitor, rng.normal(size=(500, 1)), warmup_actions)
+
+        report = self.feed(monitor, rng.normal(size=(400, 1)), ["buy"] * 400)[-1]
+
+        assert report["drift_detected"]
+        assert report["details"]["drifted_features"] == []
+        assert report["details"]["prediction_psi"] > 0.2
+        assert report["details"]["prediction_distribution"]["buy"] == 1.0
+
+    def test_check_cadence_and_feature_count(self, rng):
+        """Test that checks run every check_interval observations and bad vectors are rejected."""
+        callback = Mock()
+        monitor = StreamingDriftMonitor(
+            make_config(warmup_size=50, check_interval=25), feature_names=["a", "b"], report_callback=callback
+        )
+        self.feed(monitor, rng.normal(size=(150, 2)))
+
+        assert callback.call_count == 4
+        with pytest.raises(ValueError):
+            monitor.observe([1.0, 2.0, 3.0])
@@ -66,6 +66,12 @@ class MockModel(ModelBase):
         self.logger.info(f"MockModel '{self.name}' pretended to load from {path}")
 
 
+@pytest.fixture(autouse=True)
+def run_in_tmp_path(tmp_path, monkeypatch):
+    """Run each test in tmp_path, so the default ./checkpoints directory is created there."""
+    monkeypatch.chdir(tmp_path)
+
+
 class TestTrainingEngine:
     """Test the training engine."""
     
@@ -0,0 +1,154 @@
+"""
+Tests for the SQL episode analytics in the analytics module.
+
+Runs the queries against an in-memory SQLite database and checks them
+against the same metrics computed in Python from the raw rows.
+"""
+
+import datetime
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from reinforcestrategycreator import analytics
+from reinforcestrategycreator.db_models import (
+    Base, Episode, EpisodeSeries, OperationType, Step, TradingOperation, TrainingRun
+)
+from reinforcestrategycreator.episode_series import summarize_equity
+from reinforcestrategycreator.metrics_calculator import calculate_max_drawdown
+
+RUN_ID = "RUN-TEST"
+START = datetime.datetime(2024, 1, 1)
+
+
+@pytest.fixture
+def db():
+    """In-memory database with one run of three episodes."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(TrainingRun(run_id=RUN_ID, status="completed"))
+        session.add(TrainingRun(run_id="RUN-OTHER", status="completed"))
+        episodes = [
+            # (status, pnl, portfolio values, actions)
+            ("completed", 50.0, [100, 120, 90, 130, 117], ["buy", "hold", "sell", "buy", "hold"]),
+            ("completed", -20.0, [100, 95, 97, 80], ["sell", "sell", "hold", "hold"]),
+            ("started", None, [100, 101], ["hold", "buy"]),
+        ]
+        for i, (status, pnl, values, actions) in enumerate(episodes):
+            episode = Episode(
+                run_id=RUN_ID, rllib_episode_id=f"ep-{i}", status=status, pnl=pnl,
+                initial_portfolio_value=values[0], final_portfolio_value=values[-1],
+                sharpe_ratio=0.5 * i if pnl is not None else None, total_reward=float(i), total_steps=len(values)
+            )
+            session.add(episode)
+            session.flush()
+            for t, (value, action) in enumerate(zip(values, actions)):
+                step = Step(
+                    episode_id=episode.episode_id, timestamp=START + datetime.timedelta(minutes=t),
+                    portfolio_value=value, action=action
+                )
+                session.add(step)
+                session.flush()
+                operation_type = OperationType.HOLD if action == "hold" else OperationType.ENTRY_LONG
+                session.add(TradingOperation(
+                    step_id=step.step_id, episode_id=episode.episode_id, timestamp=step.timestamp,
+                    operation_type=operation_type, size=1.0, price=value
+                ))
+        # An episode of another run must never leak into the results
+        session.add(Episode(run_id="RUN-OTHER", rllib_episode_id="other", status="completed", pnl=1000.0))
+        session.commit()
+        yield session
+
+
+def test_episode_drawdowns_match_python(db):
+    """Windowed running-peak drawdowns equal the Python calculation."""
+    result = analytics.episode_drawdowns(db, RUN_ID)
+
+    np.testing.assert_array_equal(result["episode_id"], [1, 2])
+    expected = [calculate_max_drawdown([100, 120, 90, 130, 117]), calculate_max_drawdown([100, 95, 97, 80])]
+    np.testing.assert_allclose(result["max_drawdown"], expected)
+
+
+def test_episode_returns(db):
+    """Returns come from the portfolio values, missing values become NaN."""
+    result = analytics.episode_returns(db, RUN_ID, completed_only=False)
+
+    np.testing.assert_allclose(result["return"], [0.17, -0.2, 0.01])
+    assert np.isnan(result["pnl"][2])
+    assert np.isnan(result["sharpe_ratio"][2])
+
+
+def test_action_distribution(db):
+    """Actions are counted per episode into a dense matrix."""
+    result = analytics.action_distribution(db, RUN_ID)
+
+    assert list(result["actions"]) == ["buy", "hold", "sell"]
+    np.testing.assert_array_equal(result["counts"], [[2, 2, 1], [0, 2, 2]])
+
+
+def test_non_hold_operations_include_empty_episodes(db):
+    """Episodes are counted even without non-HOLD operations."""
+    db.add(Episode(run_id=RUN_ID, rllib_episode_id="empty", status="completed"))
+    db.commit()
+
+    result = analytics.non_hold_operations(db, RUN_ID)
+
+    np.testing.assert_array_equal(result["non_hold_count"], [3, 2, 1, 0])
+
+
+def test_run_summary(db):
+    """Run aggregates cover completed episodes only."""
+    summary = analytics.run_summary(db, RUN_ID)
+    pnl = np.array([50.0, -20.0])
+    drawdowns = [calculate_max_drawdown([100, 120, 90, 130, 117]), calculate_max_drawdown([100, 95, 97, 80])]
+
+    assert summary["episodes"] == 2
+    assert summary["pnl_mean"] == pytest.approx(pnl.mean())
+    assert summary["pnl_std"] == pytest.approx(pnl.std())
+    assert summary["sharpe_ratio"] == pytest.approx(pnl.mean() / (pnl.std() + 1e-6))
+    assert summary["win_rate"] == pytest.approx(0.5)
+    assert summary["max_drawdown"] == pytest.approx(np.mean(drawdowns))
+
+
+def test_run_summary_without_episodes(db):
+    """An unknown run yields zeros instead of failing."""
+    summary = analytics.run_summary(db, "RUN-MISSING")
+
+    assert summary["episodes"] == 0
+    assert summary["sharpe_ratio"] == 0.0
+    assert summary["max_drawdown"] == 0.0
+
+
+def test_persisted_series_replace_step_scan(db):
+    """Episodes with a stored series take their drawdown from it, not from the steps."""
+    # A different path than the logged steps, so the source is observable
+    db.add(EpisodeSeries(episode_id=1, **summarize_equity([100, 150, 75, 90])))
+    db.commit()
+
+    drawdowns = analytics.episode_drawdowns(db, RUN_ID)
+    summary = analytics.run_summary(db, RUN_ID)
+
+    np.testing.assert_array_equal(drawdowns["episode_id"], [1, 2])
+    np.testing.assert_allclose(drawdowns["max_drawdown"], [0.5, calculate_max_drawdown([100, 95, 97, 80])])
+    assert summary["max_drawdown"] == pytest.approx(np.mean(drawdowns["max_drawdown"]))
+
+
+def test_episode_series(db):
+    """Stored series load per episode and as padded run matrices."""
+    db.add(EpisodeSeries(episode_id=1, **summarize_equity([100, 150, 75, 90])))
+    db.add(EpisodeSeries(episode_id=2, **summarize_equity([100, 95])))
+    db.commit()
+
+    single = analytics.load_episode_series(db, 1)
+    run = analytics.episode_series(db, RUN_ID)
+
+    assert single["max_drawdown_step"] == 2
+    np.testing.assert_array_equal(single["equity"], [100, 150, 75, 90])
+    assert analytics.load_episode_series(db, 3) is None
+    np.testing.assert_array_equal(run["n_points"], [4, 2])
+    assert run["drawdown"].shape == (2, 4)
+    assert np.isnan(run["equity"][1, 2:]).all()
+    np.testing.assert_allclose(run["total_return"], [-0.1, -0.05])
@@ -0,0 +1,167 @@
+"""
+Tests for lockstep evaluation in the backtesting ModelTrainer.
+
+Evaluation episodes are stepped together with one batched forward pass per
+step. These tests check that this gives the same actions and metrics as
+stepping a single episode with select_action.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+import torch
+
+from reinforcestrategycreator.trading_environment import TradingEnv
+from reinforcestrategycreator.rl_agent import StrategyAgent
+from reinforcestrategycreator.backtesting.evaluation import MetricsCalculator
+from reinforcestrategycreator.backtesting.model import ModelTrainer, run_lockstep_episodes
+
+
+@pytest.fixture
+def test_df():
+    """Create a random-walk OHLCV DataFrame."""
+    rng = np.random.default_rng(0)
+    close = 100 * np.exp(0.01 * rng.standard_normal(80).cumsum())
+    return pd.DataFrame({
+        'open': close,
+        'high': close * 1.01,
+        'low': close * 0.99,
+        'close': close,
+        'volume': rng.integers(1000, 5000, 80).astype(float)
+    })
+
+
+@pytest.fixture
+def env_config():
+    """Create a minimal environment configuration."""
+    return {"initial_balance": 10000, "window_size": 5, "normalization_window_size": 5}
+
+
+@pytest.fixture
+def agent(test_df, env_config):
+    """Create an agent sized for the environment's observations."""
+    torch.manual_seed(0)
+    env = TradingEnv(env_config={**env_config, "df": test_df})
+    return StrategyAgent(
+        state_size=env.observation_space.shape[0],
+        action_size=env.action_space.n,
+        epsilon=0.0,
+        epsilon_min=0.0
+    )
+
+
+def test_select_actions_batch_matches_select_action(agent):
+    """Test that batched greedy actions and confidences match per-state selection."""
+    states = np.random.default_rng(1).standard_normal((16, agent.state_size)).astype(np.float32)
+
+    actions, confidences = agent.select_actions_batch(states, epsilon=0.0)
+
+    for state, action, confidence in zip(states, actions, confidences):
+        expected_action, expected_confidence = agent.select_action(state, return_confidence=True)
+        assert action == expected_action
+        assert confidence == pytest.approx(expected_confidence, rel=1e-5)
+
+
+def test_lockstep_episodes_match_single_episode(agent, test_df, env_config):
+    """Test that each lockstep episode matches a sequentially stepped episode."""
+    env = TradingEnv(env_config={**env_config, "df": test_df})
+    state, _ = env.reset()
+    done = False
+    while not done:
+        action, confidence = agent.select_action(state, return_confidence=True)
+        state, _, terminated, truncated, _ = env.step(action, confidence)
+        done = terminated or truncated
+    expected = MetricsCalculator().get_episode_metrics(env)
+
+    results = run_lockstep_episodes(agent, test_df, env_config, num_episodes=3, epsilon=0.0)
+
+    assert len(results) == 3
+    for metrics in results:
+        for key, value in expected.items():
+            assert metrics[key] == pytest.approx(value)
+
+
+def test_evaluate_model_greedy_runs_single_episode(agent, test_df, env_config, tmp_path, monkeypatch):
+    """Test that a greedy evaluation runs one episode in-process without Ray."""
+    calls = []
+
+    def fake_lockstep(model, data, config, num_episodes, epsilon):
+        calls.append(num_episodes)
+        return run_lockstep_episodes(model, data, config, num_episodes, epsilon)
+
+    monkeypatch.setattr("reinforcestrategycreator.backtesting.model.run_lockstep_episodes", fake_lockstep)
+    trainer = ModelTrainer(
+        config={**env_config, "eval_episodes": 20, "eval_epsilon": 0.0},
+        models_dir=str(tmp_path)
+    )
+
+    metrics = trainer.evaluate_model(agent, test_df)
+
+    assert calls == [1]
+    assert "pnl" in metrics and "sharpe_ratio" in metrics
+    assert trainer._eval_workers == []
+
+
+@pytest.fixture
+def local_ray():
+    """Start a small local Ray instance for the rollout actors."""
+    ray = pytest.importorskip("ray")
+    ray.init(num_cpus=2, include_dashboard=False, ignore_reinit_error=True, log_to_driver=False)
+    yield ray
+    ray.shutdown()
+
+
+def episode_length(test_df, env_config):
+    """Number of steps in one episode, which does not depend on the actions."""
+    env = TradingEnv(env_config={**env_config, "df": test_df})
+    env.reset()
+    steps, done = 0, False
+    while not done:
+        _, _, terminated, truncated, _ = env.step(0)
+        done = terminated or truncated
+        steps += 1
+    return steps
+
+
+def test_train_final_model_with_rollout_actors(local_ray, test_df, env_config, tmp_path):
+    """Test that the actor loop collects every episode and runs one update per batch of steps."""
+    trainer = ModelTrainer(
+        config={**env_config, "final_episodes": 3, "num_rollout_workers": 2},
+        models_dir=str(tmp_path)
+    )
+
+    agent = trainer.train_final_model(test_df, {"batch_size": 16}, use_transfer_learning=False)
+
+    stats = trainer.training_stats
+    assert isinstance(agent, StrategyAgent)
+    assert stats["episodes"] == 3
+    assert stats["rollout_workers"] == 2
+    assert stats["env_steps"] == 3 * episode_length(test_df, env_config)
+    assert stats["learner_updates"] == stats["env_steps"] // 16
+    assert stats["env_steps_per_sec"] > 0 and stats["learner_updates_per_sec"] > 0
+    assert (tmp_path / "final_model.pth").exists()
+
+
+def test_train_final_model_stops_actors_when_learner_fails(local_ray, test_df, env_config, tmp_path, monkeypatch):
+    """Test that the rollout actors are killed when the learner raises."""
+    killed = []
+    real_kill = local_ray.kill
+
+    def record_kill(actor):
+        killed.append(actor)
+        real_kill(actor)
+
+    def failing_learn(self, *args, **kwargs):
+        raise RuntimeError("learner failed")
+
+    monkeypatch.setattr("reinforcestrategycreator.backtesting.model.ray.kill", record_kill)
+    monkeypatch.setattr(StrategyAgent, "learn", failing_learn)
+    trainer = ModelTrainer(
+        config={**env_config, "final_episodes": 3, "num_rollout_workers": 2},
+        models_dir=str(tmp_path)
+    )
+
+    with pytest.raises(RuntimeError, match="learner failed"):
+        trainer.train_final_model(test_df, {"batch_size": 16}, use_transfer_learning=False)
+
+    assert len(killed) == 2
@@ -0,0 +1,99 @@
+"""
+Tests for the benchmark suite runner.
+
+Covers the timing statistics, result storage and the regression check of the
+compare command. The benchmarks themselves are only discovered, not run.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from benchmarks import runner
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def result_document(commit, **medians):
+    return {
+        "commit": commit,
+        "machine": {},
+        "benchmarks": {
+            name: {"error": "boom"} if median is None else {"median": median, "min": median, "mean": median, "stdev": 0.0}
+            for name, median in medians.items()
+        },
+    }
+
+
+def test_time_callable_statistics():
+    calls = []
+    stats = runner.time_callable(lambda: calls.append(1), repeat=4, min_time=0.001)
+
+    assert stats["repeat"] == 4
+    assert len(stats["samples"]) == 4
+    assert stats["number"] >= 1
+    assert stats["min"] <= stats["median"] <= max(stats["samples"])
+    # Warm-up, calibration and the samples all call the function
+    assert len(calls) > 4 * stats["number"]
+
+
+def test_compare_flags_regressions_beyond_threshold():
+    base = result_document("a", same=1.0, slower=1.0, faster=1.0, broken=1.0, gone=1.0)
+    head = result_document("b", same=1.05, slower=1.2, faster=0.5, broken=None, new=2.0)
+
+    rows = {row["name"]: row for row in runner.compare_results(base, head, threshold=0.1)}
+
+    assert rows["same"]["status"] == "ok"
+    assert rows["slower"]["status"] == "regression"
+    assert rows["slower"]["ratio"] == pytest.approx(1.2)
+    assert rows["faster"]["status"] == "improved"
+    assert rows["broken"]["status"] == "failed"
+    assert rows["gone"]["status"] == "removed"
+    assert rows["new"]["status"] == "added"
+
+
+def test_results_round_trip_by_commit_prefix(tmp_path):
+    results = {"env.step": {"median": 0.001, "min": 0.001, "mean": 0.001, "stdev": 0.0}}
+    path = runner.save_results(results, "abc123def456", str(tmp_path))
+
+    with open(path) as f:
+        assert json.load(f)["benchmarks"] == results
+    assert runner.load_results("abc123", str(tmp_path))["commit"] == "abc123def456"
+    with pytest.raises(FileNotFoundError):
+        runner.load_results("fff", str(tmp_path))
+
+
+def test_compare_command_exit_code(tmp_path, capsys):
+    for document in (result_document("base", step=1.0), result_document("head", step=1.5)):
+        with open(tmp_path / f"{document['commit']}.json", "w") as f:
+            json.dump(document, f)
+
+    args = ["compare", "base", "head", "--results-dir", str(tmp_path)]
+    assert runner.main(args) == 1
+    assert "1 regression(s): step" in capsys.readouterr().out
+    assert runner.main(args + ["--threshold", "0.6"]) == 0
+
+
+def test_suite_covers_hot_paths():
+    names = set(runner.discover())
+
+    assert {
+        "env.step", "env.reset", "env.get_observation", "indicators.calculate_indicators_2000",
+        "agent.learn_uniform", "agent.learn_per", "pipeline.dqn_train_step",
+        "pipeline.backtest_batched_5000", "api.list_runs",
+    } <= names
+
+
+def test_synthetic_data_does_not_need_ta_libraries():
+    # Blocking the modules makes any import of them fail, as if they were not installed
+    code = (
+        "import sys\n"
+        "sys.modules['ta'] = sys.modules['pandas_ta'] = None\n"
+        "from benchmarks.synthetic import make_ohlcv\n"
+        "assert len(make_ohlcv(n_rows=10)) == 10\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=PROJECT_ROOT, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,90 @@
+"""
+Tests for the vectorized benchmark strategies in the backtesting module.
+
+The strategies simulate trades with NumPy instead of a per-step loop, so these
+tests check the vectorized engine against a straightforward loop and check that
+the grid and seed sweeps agree with individual strategy runs.
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+from reinforcestrategycreator.backtesting.benchmarks import (
+    SMAStrategy,
+    RandomStrategy,
+    simulate_positions,
+)
+
+
+@pytest.fixture
+def price_df():
+    """Create a random-walk price series."""
+    rng = np.random.default_rng(3)
+    prices = 100 * np.exp(0.01 * rng.standard_normal(400).cumsum())
+    return pd.DataFrame({'close': prices})
+
+
+def loop_simulation(prices, positions, initial_balance, fee):
+    """Reference per-step simulation of a long/flat position series."""
+    cash, shares, entry_price = initial_balance, 0.0, 0.0
+    values, trades, profitable = [initial_balance], 0, 0
+    for i in range(1, len(prices)):
+        if positions[i] == 1 and positions[i - 1] == 0:
+            shares = cash / prices[i] * (1 - fee)
+            cash, entry_price = 0.0, prices[i]
+            trades += 1
+        elif positions[i] == 0 and positions[i - 1] == 1:
+            cash = shares * prices[i] * (1 - fee)
+            profitable += prices[i] > entry_price
+            shares = 0.0
+        values.append(cash + shares * prices[i])
+    if positions[-1] == 1 and prices[-1] > entry_price:
+        profitable += 1
+    return np.array(values), trades, profitable
+
+
+def test_simulate_positions_matches_loop(price_df):
+    """Test that every row of a 2D position array matches the loop simulation."""
+    prices = price_df['close'].values
+    rng = np.random.default_rng(0)
+    positions = (rng.random((5, len(prices))) < 0.3).astype(float)
+    positions[:, 0] = 0
+
+    result = simulate_positions(prices, positions, 10000, 0.001)
+
+    assert result["portfolio_values"].shape == positions.shape
+    for row in range(len(positions)):
+        values, trades, profitable = loop_simulation(prices, positions[row], 10000, 0.001)
+        np.testing.assert_allclose(result["portfolio_values"][row], values, rtol=1e-10)
+        assert result["trades"][row] == trades
+        assert result["profitable_trades"][row] == profitable
+    assert np.all(result["fees"] > 0)
+
+
+def test_sma_grid_matches_individual_runs(price_df):
+    """Test that a window grid gives the same metrics as separate SMA runs."""
+    windows = [(5, 20), (10, 30), (20, 50), (50, 500)]
+
+    results = SMAStrategy().run_grid(price_df, windows)
+
+    assert len(results) == len(windows)
+    for (short, long), result in zip(windows, results):
+        assert (result["short_window"], result["long_window"]) == (short, long)
+        expected = SMAStrategy(short_window=short, long_window=long).run(price_df)
+        for key, value in expected.items():
+            assert result[key] == pytest.approx(value)
+    # The last pair needs more data than is available
+    assert results[-1]["trades"] == 0
+
+
+def test_random_seeds_match_seeded_runs(price_df):
+    """Test that each seed reproduces a freshly seeded RandomStrategy run."""
+    seeds = [1, 2, 42]
+
+    results = RandomStrategy(trade_probability=0.1).run_seeds(price_df, seeds)
+
+    for seed, result in zip(seeds, results):
+        assert result["seed"] == seed
+        expected = RandomStrategy(trade_probability=0.1, random_seed=seed).run(price_df)
+        for key, value in expected.items():
+            assert result[key] == pytest.approx(value)
@@ -0,0 +1,161 @@
+"""
+Tests for the fold result cache of the backtesting CrossValidator.
+
+Fold tasks and the Ray calls around them are replaced with in-process fakes,
+so these tests exercise the cache keys and the resume logic without training.
+"""
+
+import os
+import types
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from reinforcestrategycreator.backtesting import cross_validation
+from reinforcestrategycreator.backtesting.cross_validation import CrossValidator
+
+
+class ObjectRef:
+    """Hashable stand-in for a Ray object reference."""
+
+    def __init__(self, result):
+        self.result = result
+
+
+class FoldTask:
+    """Stands in for the Ray fold task; records the folds it runs."""
+
+    def __init__(self, failing_folds=()):
+        self.calls = []
+        self.failing_folds = set(failing_folds)
+
+    def remote(self, fold, train_data, fold_size, cv_folds, config, models_dir, random_seed):
+        self.calls.append(fold)
+        if fold in self.failing_folds:
+            return ObjectRef({"fold": fold, "error": "Insufficient training data"})
+        model_path = os.path.join(models_dir, f"model_fold_{fold}.h5")
+        with open(model_path, "w") as f:
+            f.write(f"weights of fold {fold}")
+        return ObjectRef({
+            "fold": fold,
+            "train_size": len(train_data) - fold_size,
+            "val_size": fold_size,
+            "val_metrics": {"sharpe_ratio": np.float64(0.1 * fold), "pnl": 10.0 * fold},
+            "model_path": model_path,
+            "processing_time": 0.01
+        })
+
+
+@pytest.fixture(autouse=True)
+def fake_ray(monkeypatch):
+    """Run the object store calls in process."""
+    fake = types.SimpleNamespace(
+        is_initialized=lambda: True,
+        put=lambda value: value,
+        get=lambda ref: ref.result,
+        wait=lambda refs, num_returns=1: (refs[:num_returns], refs[num_returns:])
+    )
+    monkeypatch.setattr(cross_validation, "ray", fake)
+
+
+@pytest.fixture
+def train_data():
+    """Create a random-walk OHLCV DataFrame."""
+    rng = np.random.default_rng(0)
+    close = 100 * np.exp(0.01 * rng.standard_normal(300).cumsum())
+    return pd.DataFrame({"open": close, "high": close * 1.01, "low": close * 0.99, "close": close},
+                        index=pd.date_range("2024-01-01", periods=300))
+
+
+def make_validator(train_data, tmp_path, monkeypatch, task, config=None, random_seed=42):
+    monkeypatch.setattr(CrossValidator, "_process_fold_remote", task)
+    return CrossValidator(
+        train_data=train_data,
+        config=config or {"episodes": 1, "window_size": 5},
+        cv_folds=3,
+        models_dir=str(tmp_path / "models"),
+        random_seed=random_seed,
+        cache_dir=str(tmp_path / "cache")
+    )
+
+
+def test_rerun_hits_cache(train_data, tmp_path, monkeypatch):
+    """Test that a second run with the same inputs loads every fold from the cache."""
+    first_task = FoldTask()
+    first = make_validator(train_data, tmp_path, monkeypatch, first_task).perform_cross_validation()
+    assert first_task.calls == [0, 1, 2]
+
+    second_task = FoldTask()
+    validator = make_validator(train_data, tmp_path, monkeypatch, second_task)
+    second = validator.perform_cross_validation()
+
+    assert second_task.calls == []
+    assert validator.cache_stats == {"hits": 3, "misses": 0}
+    assert all(result["cached"] for result in second)
+    assert [r["val_metrics"] for r in second] == [
+        {"sharpe_ratio": pytest.approx(0.1 * i), "pnl": 10.0 * i} for i in range(3)
+    ]
+    assert [r["val_metrics"] for r in second] == [r["val_metrics"] for r in first]
+    assert "Cached folds: 3/3" in validator.generate_cv_report()
+
+
+def test_failed_fold_is_retried(train_data, tmp_path, monkeypatch):
+    """Test that a fold that returned an error is not cached and runs again."""
+    make_validator(train_data, tmp_path, monkeypatch, FoldTask(failing_folds=[1])).perform_cross_validation()
+
+    task = FoldTask()
+    validator = make_validator(train_data, tmp_path, monkeypatch, task)
+    results = validator.perform_cross_validation()
+
+    assert task.calls == [1]
+    assert validator.cache_stats == {"hits": 2, "misses": 1}
+    assert all("error" not in result for result in results)
+
+
+def test_cached_model_path_points_into_cache(train_data, tmp_path, monkeypatch):
+    """Test that the cache keeps its own copy of the fold model and records its path."""
+    make_validator(train_data, tmp_path, monkeypatch, FoldTask()).perform_cross_validation()
+    os.remove(tmp_path / "models" / "model_fold_0.h5")
+
+    results = make_validator(train_data, tmp_path, monkeypatch, FoldTask()).perform_cross_validation()
+
+    model_path = results[0]["model_path"]
+    assert model_path.startswith(str(tmp_path / "cache"))
+    assert os.path.basename(model_path) == "model_fold_0.h5"
+    with open(model_path) as f:
+        assert f.read() == "weights of fold 0"
+
+
+def test_cache_key_depends_on_config_seed_and_data(train_data, tmp_path, monkeypatch):
+    """Test that training inputs change the key and cross-validation settings do not."""
+    base = make_validator(train_data, tmp_path, monkeypatch, FoldTask())
+    fingerprint = base._data_fingerprint()
+    key = base._fold_cache_key(fingerprint, 0, 100)
+
+    other_config = make_validator(train_data, tmp_path, monkeypatch, FoldTask(),
+                                  config={"episodes": 2, "window_size": 5})
+    other_seed = make_validator(train_data, tmp_path, monkeypatch, FoldTask(), random_seed=7)
+    cv_only = make_validator(train_data, tmp_path, monkeypatch, FoldTask(),
+                             config={"episodes": 1, "window_size": 5, "cross_validation": {"metric": "pnl"}})
+    changed = train_data.copy()
+    changed.iloc[10, 0] += 1.0
+    other_data = make_validator(changed, tmp_path, monkeypatch, FoldTask())
+
+    assert other_config._fold_cache_key(fingerprint, 0, 100) != key
+    assert other_seed._fold_cache_key(fingerprint, 0, 100) != key
+    assert base._fold_cache_key(fingerprint, 100, 200) != key
+    assert other_data._data_fingerprint() != fingerprint
+    assert cv_only._fold_cache_key(fingerprint, 0, 100) == key
+
+
+def test_changed_seed_reruns_folds(train_data, tmp_path, monkeypatch):
+    """Test that a run with another seed misses the entries of the first run."""
+    make_validator(train_data, tmp_path, monkeypatch, FoldTask()).perform_cross_validation()
+
+    task = FoldTask()
+    validator = make_validator(train_data, tmp_path, monkeypatch, task, random_seed=7)
+    validator.perform_cross_validation()
+
+    assert task.calls == [0, 1, 2]
+    assert validator.cache_stats == {"hits": 0, "misses": 3}
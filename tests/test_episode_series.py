@@ -0,0 +1,72 @@
+"""
+Tests for the episode_series module.
+
+Covers LTTB downsampling, the exact path statistics and the float32 blob
+round trip used to persist equity/drawdown series.
+"""
+
+import numpy as np
+import pytest
+
+from reinforcestrategycreator.episode_series import (
+    decode_series,
+    lttb_indices,
+    summarize_equity,
+)
+from reinforcestrategycreator.metrics_calculator import calculate_max_drawdown
+
+
+@pytest.fixture
+def equity():
+    """A 2,000 step random-walk equity curve."""
+    rng = np.random.default_rng(7)
+    return 10000 * np.cumprod(np.r_[1.0, 1 + rng.normal(0, 0.01, 2000)])
+
+
+def test_lttb_keeps_endpoints_and_size(equity):
+    """The downsample is sorted, fixed-size and includes both endpoints."""
+    indices = lttb_indices(equity, 100)
+
+    assert len(indices) == 100
+    assert indices[0] == 0 and indices[-1] == len(equity) - 1
+    assert np.all(np.diff(indices) > 0)
+
+
+def test_lttb_keeps_spike():
+    """A single spike in a flat series is always selected."""
+    values = np.ones(1000)
+    values[437] = 5.0
+
+    assert 437 in lttb_indices(values, 20)
+
+
+def test_lttb_short_series_untouched():
+    """Series no longer than the target are returned whole."""
+    np.testing.assert_array_equal(lttb_indices([1.0, 2.0, 3.0], 10), [0, 1, 2])
+
+
+def test_summary_stats_are_exact(equity):
+    """Statistics are computed on the full path, not the downsample."""
+    summary = summarize_equity(equity, n_points=64)
+    returns = np.diff(equity) / equity[:-1]
+
+    assert summary["n_steps"] == 2000
+    assert summary["n_points"] == 64
+    assert summary["max_drawdown"] == pytest.approx(calculate_max_drawdown(equity))
+    assert summary["total_return"] == pytest.approx(equity[-1] / equity[0] - 1)
+    assert summary["mean_return"] == pytest.approx(returns.mean())
+    assert summary["return_std"] == pytest.approx(returns.std())
+    assert summary["downside_std"] == pytest.approx(returns[returns < 0].std())
+    assert summary["peak_value"] == pytest.approx(equity.max())
+
+
+def test_series_round_trip_includes_trough(equity):
+    """The decoded series contains the maximum drawdown point."""
+    summary = summarize_equity(equity, n_points=64)
+    series = decode_series(summary["series"])
+
+    assert series["equity"].dtype == np.float32
+    assert len(series["step"]) == 64
+    assert summary["max_drawdown_step"] in series["step"]
+    assert series["drawdown"].max() == pytest.approx(summary["max_drawdown"], rel=1e-6)
+    np.testing.assert_allclose(series["equity"], equity[series["step"]], rtol=1e-6)
@@ -0,0 +1,244 @@
+"""
+Tests for the Ray Tune trainable of the backtesting HyperparameterOptimizer.
+
+Trials run in-process with tune.report and tune.get_checkpoint replaced, so
+the reports, checkpoints and per-trial overhead can be checked without Ray.
+"""
+
+import os
+
+import pytest
+import numpy as np
+import pandas as pd
+import torch
+
+from reinforcestrategycreator.backtesting import hyperparameter_optimization as hpo
+from reinforcestrategycreator.backtesting.hyperparameter_optimization import HyperparameterOptimizer, hpo_trial
+
+TRIAL_CONFIG = {"learning_rate": 0.001, "batch_size": 8, "gamma": 0.95,
+                "epsilon_decay": 0.99, "epsilon_min": 0.05}
+
+
+class ObjectRef:
+    """Hashable stand-in for a Ray object reference."""
+
+    def __init__(self, value):
+        self.value = value
+
+
+@pytest.fixture
+def train_df():
+    """Create a random-walk OHLCV DataFrame."""
+    rng = np.random.default_rng(0)
+    close = 100 * np.exp(0.01 * rng.standard_normal(100).cumsum())
+    return pd.DataFrame({
+        'open': close,
+        'high': close * 1.01,
+        'low': close * 0.99,
+        'close': close,
+        'volume': rng.integers(1000, 5000, 100).astype(float)
+    })
+
+
+@pytest.fixture
+def base_config():
+    """Create a small optimizer configuration: two iterations of one episode."""
+    return {"episodes": 2, "report_interval": 1, "window_size": 5,
+            "normalization_window_size": 5, "sharpe_window_size": 10}
+
+
+@pytest.fixture
+def reports(monkeypatch):
+    """Record tune.report calls, loading each checkpoint before it is deleted."""
+    recorded = []
+
+    def report(metrics, checkpoint=None):
+        with checkpoint.as_directory() as checkpoint_dir:
+            payload = torch.load(os.path.join(checkpoint_dir, hpo.TRIAL_CHECKPOINT_FILE), weights_only=False)
+        recorded.append((metrics, payload))
+
+    monkeypatch.setattr(hpo.tune, "report", report)
+    monkeypatch.setattr(hpo.tune, "get_checkpoint", lambda: None)
+    return recorded
+
+
+def test_trainable_runs_trial_on_dataframes(train_df, base_config, reports, tmp_path, monkeypatch):
+    """Test that _trainable passes DataFrames straight to hpo_trial, without the object store."""
+    def fail_get(ref):
+        raise AssertionError("DataFrames must not be fetched from the object store")
+    monkeypatch.setattr(hpo.ray, "get", fail_get)
+    optimizer = HyperparameterOptimizer(train_df, base_config, models_dir=str(tmp_path))
+
+    optimizer._trainable(TRIAL_CONFIG)
+
+    assert [metrics["episodes"] for metrics, _ in reports] == [1, 2]
+    for metrics, payload in reports:
+        assert metrics["data_fetch_seconds"] >= 0.0
+        assert metrics["setup_seconds"] >= metrics["data_fetch_seconds"]
+        assert np.isfinite(metrics["score"])
+        assert payload["episode"] == metrics["episodes"]
+        assert payload["env_steps"] == metrics["env_steps"]
+    assert reports[1][0]["env_steps"] == 2 * reports[0][0]["iteration_env_steps"]
+
+
+def test_hpo_trial_fetches_object_refs(train_df, base_config, reports, tmp_path, monkeypatch):
+    """Test that hpo_trial resolves object references with ray.get."""
+    fetched = []
+
+    def get(ref):
+        fetched.append(ref)
+        return ref.value
+    monkeypatch.setattr(hpo.ray, "get", get)
+    data_refs = {"train": ObjectRef(train_df), "val": ObjectRef(train_df.iloc[-20:])}
+
+    hpo_trial(TRIAL_CONFIG, data_refs=data_refs, base_config=base_config, models_dir=str(tmp_path))
+
+    assert fetched == [data_refs["train"], data_refs["val"]]
+    assert len(reports) == 2
+
+
+def test_summarize_trial_overhead_averages_reported_times(train_df, base_config, tmp_path):
+    """Test that per-trial times are collected and averaged, skipping missing results."""
+    optimizer = HyperparameterOptimizer(train_df, base_config, models_dir=str(tmp_path))
+    results = {
+        "a": {"score": 1.0, "data_fetch_seconds": 0.1, "setup_seconds": 0.4},
+        "b": {"score": 0.5, "data_fetch_seconds": 0.3, "setup_seconds": 0.8},
+        "c": {"score": 0.2},
+        "d": None
+    }
+
+    optimizer._summarize_trial_overhead(results)
+
+    assert optimizer.trial_overhead["per_trial"] == {
+        "a": {"data_fetch_seconds": 0.1, "setup_seconds": 0.4},
+        "b": {"data_fetch_seconds": 0.3, "setup_seconds": 0.8},
+        "c": {}
+    }
+    assert optimizer.trial_overhead["mean_data_fetch_seconds"] == pytest.approx(0.2)
+    assert optimizer.trial_overhead["mean_setup_seconds"] == pytest.approx(0.6)
+
+
+def test_optimize_passes_object_refs_to_trials(train_df, base_config, tmp_path, monkeypatch):
+    """Test that trials get object references to data put in the store once, not DataFrames."""
+    put = []
+    parameters = {}
+
+    def ray_put(value):
+        put.append(value)
+        return ObjectRef(value)
+
+    class StopTuning(Exception):
+        pass
+
+    def run(trainable, **kwargs):
+        raise StopTuning
+
+    def with_parameters(trainable, **kwargs):
+        parameters.update(kwargs, trainable=trainable)
+        return trainable
+    monkeypatch.setattr(hpo.ray, "is_initialized", lambda: True)
+    monkeypatch.setattr(hpo.ray, "put", ray_put)
+    monkeypatch.setattr(hpo.tune, "with_parameters", with_parameters)
+    monkeypatch.setattr(hpo.tune, "run", run)
+    # The ASHA grace period is 10 episodes
+    optimizer = HyperparameterOptimizer(train_df, {**base_config, "episodes": 20}, models_dir=str(tmp_path))
+
+    with pytest.raises(StopTuning):
+        optimizer.optimize_hyperparameters()
+
+    assert parameters["trainable"] is hpo_trial
+    assert len(put) == 2
+    assert put[0] is train_df
+    pd.testing.assert_frame_equal(put[1], optimizer._validation_data())
+    data_refs = parameters["data_refs"]
+    assert set(data_refs) == {"train", "val"}
+    assert all(isinstance(ref, ObjectRef) for ref in data_refs.values())
+    assert [ref.value for ref in data_refs.values()] == put
+    assert not any(isinstance(value, pd.DataFrame) for value in parameters.values())
+    assert optimizer.trial_overhead["data_registration_seconds"] >= 0.0
+    assert optimizer.trial_overhead["trainable_pickle_bytes"] > 0
+
+
+def save_trial_checkpoint(checkpoint_dir, agent, episode, env_steps):
+    """Write a trial checkpoint the way hpo_trial does."""
+    torch.save({"agent": agent.get_state(), "episode": episode, "env_steps": env_steps},
+               os.path.join(checkpoint_dir, hpo.TRIAL_CHECKPOINT_FILE))
+    return hpo.Checkpoint.from_directory(str(checkpoint_dir))
+
+
+def test_restore_trial_state_without_checkpoint(monkeypatch):
+    """Test that a trial without a checkpoint starts from episode 0."""
+    monkeypatch.setattr(hpo.tune, "get_checkpoint", lambda: None)
+    assert hpo._restore_trial_state(hpo.RLAgent(4, 3)) == (0, 0)
+
+
+def test_restore_trial_state_loads_checkpointed_agent(tmp_path, monkeypatch):
+    """Test that the checkpointed agent is loaded and its progress counters returned."""
+    torch.manual_seed(0)
+    source = hpo.RLAgent(4, 3, learning_rate=0.01)
+    checkpoint = save_trial_checkpoint(tmp_path, source, episode=3, env_steps=120)
+    monkeypatch.setattr(hpo.tune, "get_checkpoint", lambda: checkpoint)
+    torch.manual_seed(1)
+    agent = hpo.RLAgent(4, 3, learning_rate=0.002)
+
+    assert hpo._restore_trial_state(agent) == (3, 120)
+
+    for name, value in source.model.state_dict().items():
+        assert torch.equal(agent.model.state_dict()[name], value)
+    assert agent.optimizer.param_groups[0]["lr"] == 0.002
+
+
+def test_hpo_trial_resumes_from_checkpoint(train_df, base_config, reports, tmp_path, monkeypatch):
+    """Test that a resumed trial only trains the remaining episodes and counts its lineage."""
+    hpo_trial(TRIAL_CONFIG, data_refs={"train": train_df, "val": train_df.iloc[-20:]},
+              base_config=base_config, models_dir=str(tmp_path))
+    first_metrics, first_payload = reports[0]
+    checkpoint_dir = tmp_path / "checkpoint"
+    checkpoint_dir.mkdir()
+    torch.save(first_payload, os.path.join(checkpoint_dir, hpo.TRIAL_CHECKPOINT_FILE))
+    monkeypatch.setattr(hpo.tune, "get_checkpoint", lambda: hpo.Checkpoint.from_directory(str(checkpoint_dir)))
+    reports.clear()
+
+    hpo_trial(TRIAL_CONFIG, data_refs={"train": train_df, "val": train_df.iloc[-20:]},
+              base_config=base_config, models_dir=str(tmp_path))
+
+    assert len(reports) == 1
+    metrics, _ = reports[0]
+    assert metrics["episodes"] == 2
+    assert metrics["restored"] == 1
+    assert metrics["iteration_episodes"] == 1
+    assert metrics["env_steps"] == first_metrics["env_steps"] + metrics["iteration_env_steps"]
+
+
+def test_summarize_compute_compares_with_training_from_scratch(train_df, tmp_path):
+    """Test the compute report on synthetic progress frames of three trials."""
+    optimizer = HyperparameterOptimizer(train_df, {"episodes": 20}, models_dir=str(tmp_path),
+                                        num_samples=3, scheduler="pbt")
+    trial_dataframes = {
+        # Ran to the end, then was cloned into trial c
+        "a": pd.DataFrame({"iteration_env_steps": [500, 500], "iteration_episodes": [10, 10], "restored": [0, 0]}),
+        # Stopped after one iteration
+        "b": pd.DataFrame({"iteration_env_steps": [500], "iteration_episodes": [10], "restored": [0]}),
+        # Resumed from a's checkpoint at episode 10
+        "c": pd.DataFrame({"iteration_env_steps": [500], "iteration_episodes": [10], "restored": [1]}),
+        "errored": pd.DataFrame({"score": [0.0]})
+    }
+
+    optimizer._summarize_compute(trial_dataframes, {"score": 1.0, "env_steps": 1000})
+
+    assert optimizer.compute_report == {
+        "scheduler": "pbt",
+        "executed_env_steps": 2000,
+        "from_scratch_env_steps": 3000,
+        "saved_env_steps": 1000,
+        "saved_fraction": pytest.approx(1 / 3),
+        "best_trial_env_steps": 1000,
+        "checkpoint_restores": 1
+    }
+
+
+def test_summarize_compute_without_step_counts(train_df, tmp_path):
+    """Test that no compute report is made when no trial reported step counts."""
+    optimizer = HyperparameterOptimizer(train_df, {}, models_dir=str(tmp_path))
+    optimizer._summarize_compute({"a": pd.DataFrame({"score": [0.0]})}, {})
+    assert optimizer.compute_report == {}
@@ -0,0 +1,154 @@
+"""
+Tests for the inference module.
+
+Exports small Q-networks as inference artifacts and checks that
+InferenceRuntime reproduces the original network's outputs.
+"""
+
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+import torch
+
+from reinforcestrategycreator.backtesting.export import ModelExporter
+from reinforcestrategycreator.inference import InferenceRuntime, export_inference_artifact
+from reinforcestrategycreator.rl_agent import StrategyAgent
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def q_network():
+    """A small fully connected Q-network with fixed weights."""
+    torch.manual_seed(0)
+    return torch.nn.Sequential(torch.nn.Linear(6, 16), torch.nn.ReLU(), torch.nn.Linear(16, 3))
+
+
+@pytest.fixture
+def observations():
+    return np.random.default_rng(0).standard_normal((50, 6))
+
+
+def reference_q_values(model, observations):
+    with torch.no_grad():
+        return model(torch.tensor(observations, dtype=torch.float32)).numpy()
+
+
+def test_torchscript_matches_model(q_network, observations, tmp_path):
+    """Batched predictions match the exported network, across buffer chunks."""
+    export_inference_artifact(q_network, 6, str(tmp_path))
+    runtime = InferenceRuntime(str(tmp_path), num_threads=1, max_batch_size=16)
+
+    expected = reference_q_values(q_network, observations)
+    np.testing.assert_allclose(runtime.q_values_batch(observations), expected, rtol=1e-5, atol=1e-6)
+    np.testing.assert_array_equal(runtime.predict_batch(observations), expected.argmax(axis=1))
+    assert runtime.predict(observations[3]) == expected[3].argmax()
+    assert runtime.action_probabilities(observations[3]).sum() == pytest.approx(1.0)
+
+
+def test_dict_observations_use_feature_order(q_network, observations, tmp_path):
+    """Dict observations are flattened in the exported feature order, not insertion order."""
+    names = [f"f{i}" for i in range(6)]
+    export_inference_artifact(q_network, 6, str(tmp_path), feature_names=names)
+    runtime = InferenceRuntime(str(tmp_path))
+
+    row = observations[0]
+    shuffled = {name: row[i] for i, name in reversed(list(enumerate(names)))}
+    np.testing.assert_allclose(runtime.observation_to_array(shuffled), row.astype(np.float32))
+
+
+def test_rejects_wrong_width(q_network, tmp_path):
+    export_inference_artifact(q_network, 6, str(tmp_path))
+    runtime = InferenceRuntime(str(tmp_path))
+
+    with pytest.raises(ValueError):
+        runtime.predict_batch(np.zeros((2, 5)))
+
+
+def test_runtime_does_not_import_ray(q_network, tmp_path):
+    """Loading and predicting never pulls in Ray/RLlib."""
+    export_inference_artifact(q_network, 6, str(tmp_path))
+    code = (
+        "import sys, numpy as np\n"
+        "from reinforcestrategycreator.inference import InferenceRuntime\n"
+        f"InferenceRuntime({str(tmp_path)!r}).predict_batch(np.zeros((4, 6)))\n"
+        "assert 'ray' not in sys.modules, 'ray was imported'\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=PROJECT_ROOT, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+
+def test_onnx_matches_model(q_network, observations, tmp_path):
+    pytest.importorskip("onnx")
+    pytest.importorskip("onnxruntime")
+    export_inference_artifact(q_network, 6, str(tmp_path), fmt="onnx")
+    runtime = InferenceRuntime(str(tmp_path), num_threads=1, max_batch_size=16)
+
+    np.testing.assert_allclose(
+        runtime.q_values_batch(observations), reference_q_values(q_network, observations), rtol=1e-5, atol=1e-6
+    )
+
+
+def test_model_exporter_writes_runtime_artifact(observations, tmp_path):
+    """ModelExporter exports a runtime artifact next to the state dict."""
+    agent = StrategyAgent(state_size=6, action_size=3)
+    exporter = ModelExporter(export_dir=str(tmp_path))
+    model_path = exporter.export_model(agent, "SPY", "2020-01-01", "2021-01-01", {"episodes": 1}, {"pnl": 0.0})
+    model_id = os.path.basename(model_path)[:-len(".pth")]
+
+    runtime = exporter.load_runtime(model_id, num_threads=1)
+
+    agent.model.eval()
+    expected = reference_q_values(agent.model, observations)
+    np.testing.assert_allclose(runtime.q_values_batch(observations), expected, rtol=1e-5, atol=1e-6)
+    assert exporter.get_model_metadata(model_id)["inference_artifact"] == f"{model_id}_inference"
+
+
+def test_export_leaves_model_untouched(q_network, tmp_path):
+    """Exporting does not switch the model to eval mode or move it."""
+    q_network.train()
+    export_inference_artifact(q_network, 6, str(tmp_path))
+
+    assert q_network.training
+    assert all(parameter.device.type == "cpu" for parameter in q_network.parameters())
+
+
+@pytest.mark.skipif(not torch.cuda.is_available(), reason="needs a CUDA device")
+def test_model_exporter_exports_gpu_agent(observations, tmp_path):
+    """An agent whose network lives on the GPU exports a CPU artifact."""
+    agent = StrategyAgent(state_size=6, action_size=3)
+    agent.model.to("cuda")
+    exporter = ModelExporter(export_dir=str(tmp_path))
+    model_path = exporter.export_model(agent, "SPY", "2020-01-01", "2021-01-01", {"episodes": 1}, {"pnl": 0.0})
+    model_id = os.path.basename(model_path)[:-len(".pth")]
+
+    runtime = exporter.load_runtime(model_id, num_threads=1)
+
+    assert next(agent.model.parameters()).device.type == "cuda"
+    expected = reference_q_values(agent.model.cpu().eval(), observations)
+    np.testing.assert_allclose(runtime.q_values_batch(observations), expected, rtol=1e-5, atol=1e-6)
+
+
+def test_concurrent_calls_share_buffer_safely(q_network, tmp_path):
+    """Threads sharing one runtime each get the Q-values of their own observations."""
+    export_inference_artifact(q_network, 6, str(tmp_path))
+    runtime = InferenceRuntime(str(tmp_path), num_threads=1, max_batch_size=4)
+    forward = runtime._forward
+
+    def slow_forward(rows):
+        # Give other threads a chance to overwrite the buffer before it is read
+        time.sleep(0.001)
+        return forward(rows)
+    runtime._forward = slow_forward
+
+    batches = [np.random.default_rng(seed).standard_normal((12, 6)) for seed in range(8)]
+    with ThreadPoolExecutor(max_workers=len(batches)) as pool:
+        results = list(pool.map(runtime.q_values_batch, batches))
+
+    for batch, q_values in zip(batches, results):
+        np.testing.assert_allclose(q_values, reference_q_values(q_network, batch), rtol=1e-5, atol=1e-6)
@@ -0,0 +1,180 @@
+"""
+Tests for the multi-asset PortfolioTradingEnv.
+
+Covers input formats, risk-limited target weights, vectorized rebalancing costs,
+the reward shared with TradingEnv and the cross-asset observation layout.
+
+:ComponentRole TradingEnvironment
+:Context RL Core
+"""
+
+from collections import deque
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from reinforcestrategycreator.portfolio_environment import PortfolioTradingEnv, build_panel
+from reinforcestrategycreator.trading_environment import calculate_reward_components
+
+FEATURES = ["open", "high", "low", "close", "volume"]
+
+
+def make_panel(n_assets=3, n_steps=40, seed=0):
+    """Random-walk OHLCV data of shape (assets, time, features)."""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, (n_assets, n_steps)), axis=1))
+    volume = rng.uniform(1000, 2000, (n_assets, n_steps))
+    return np.stack([close, close * 1.01, close * 0.99, close, volume], axis=2)
+
+
+@pytest.fixture
+def env():
+    return PortfolioTradingEnv({
+        "data": make_panel(),
+        "feature_names": FEATURES,
+        "initial_balance": 10000.0,
+        "transaction_fee_percent": 0.1,
+        "slippage_bps": 5,
+    })
+
+
+def test_build_panel_accepts_long_and_dict_frames():
+    data = make_panel(n_assets=2, n_steps=10)
+    frames = {name: pd.DataFrame(data[i], columns=FEATURES) for i, name in enumerate(["AAA", "BBB"])}
+    long = pd.concat([frame.assign(symbol=name, timestamp=range(10)) for name, frame in frames.items()])
+
+    from_array, _, _ = build_panel(data, feature_names=FEATURES)
+    from_dict, assets, features = build_panel(frames)
+    from_long, long_assets, long_features = build_panel(long.sample(frac=1.0, random_state=0))
+
+    assert from_array.shape == (10, 2, 5)
+    assert assets == long_assets == ["AAA", "BBB"]
+    assert features == FEATURES
+    assert "timestamp" not in long_features
+    np.testing.assert_allclose(from_dict, from_array)
+    np.testing.assert_allclose(from_long, from_array)
+
+
+def test_build_panel_rejects_misaligned_assets():
+    data = make_panel(n_assets=2, n_steps=10)
+    dates = pd.date_range("2024-01-01", periods=10)
+    frames = {
+        "AAA": pd.DataFrame(data[0], columns=FEATURES, index=dates),
+        "BBB": pd.DataFrame(data[1], columns=FEATURES, index=dates + pd.Timedelta(days=1)),
+    }
+    with pytest.raises(ValueError, match="BBB"):
+        build_panel(frames)
+
+    long = pd.concat([frame.assign(symbol=name, timestamp=frame.index) for name, frame in frames.items()])
+    with pytest.raises(ValueError, match="BBB"):
+        build_panel(long)
+
+    # Same timestamps, different row labels: aligned
+    aligned = long.assign(timestamp=np.tile(dates, 2)).reset_index(drop=True)
+    panel, _, _ = build_panel(aligned)
+    np.testing.assert_allclose(panel, data.transpose(1, 0, 2))
+
+
+def test_invalid_data_is_rejected():
+    with pytest.raises(ValueError):
+        PortfolioTradingEnv({"data": make_panel()[0]})
+    with pytest.raises(ValueError):
+        PortfolioTradingEnv({"data": make_panel(), "feature_names": ["a", "b", "c", "d", "e"]})
+    bad = make_panel()
+    bad[1, 5, 3] = np.nan
+    with pytest.raises(ValueError):
+        PortfolioTradingEnv({"data": bad, "feature_names": FEATURES})
+
+
+def test_spaces_and_reset(env):
+    observation, info = env.reset()
+    assert env.action_space.shape == (3,)
+    assert observation.shape == (5 * 3 * 5 + 2 * 3 + 3,)
+    assert env.observation_space.contains(observation)
+    assert info["portfolio_value"] == 10000.0
+    assert env.current_step == env.window_size - 1
+
+
+def test_target_weights_respect_risk_limits():
+    env = PortfolioTradingEnv({"data": make_panel(n_assets=4), "feature_names": FEATURES,
+                               "max_position_weight": 0.3, "max_leverage": 0.8, "allow_short": False})
+    weights = env._target_weights([1.0, 0.5, -1.0, 0.4])
+
+    np.testing.assert_allclose(weights, np.array([0.3, 0.3, 0.0, 0.3]) * 0.8 / 0.9)
+    assert np.abs(weights).sum() == pytest.approx(0.8)
+
+
+def test_positions_mode_splits_leverage_equally():
+    env = PortfolioTradingEnv({"data": make_panel(n_assets=4), "feature_names": FEATURES, "action_mode": "positions"})
+    np.testing.assert_allclose(env._target_weights([1, 0, 2, 1]), [1 / 3, 0.0, -1 / 3, 1 / 3])
+    np.testing.assert_allclose(env._target_weights([0, 0, 0, 0]), 0.0)
+
+
+def test_rebalance_charges_fee_and_slippage_on_traded_notional(env):
+    env.reset()
+    _, _, _, _, info = env.step([0.5, -0.25, 0.0])
+
+    # From all cash, traded notional is 75% of the portfolio at a cost of 0.1% + 5 bps
+    assert info["costs"] == pytest.approx(10000.0 * 0.75 * 0.0015)
+    assert info["portfolio_value"] == pytest.approx(10000.0 - info["costs"])
+    assert info["turnover"] == pytest.approx(0.75)
+
+    # Holding the same weights only trades the drift back to target
+    _, _, _, _, info = env.step(info["weights"])
+    assert info["costs"] < 1.0
+
+
+def test_flat_portfolio_keeps_its_value(env):
+    env.reset()
+    done = False
+    while not done:
+        _, reward, done, _, info = env.step(np.zeros(3))
+        assert reward == 0.0
+    assert info["final_portfolio_value"] == 10000.0
+    assert info["total_steps"] == env.n_steps - env.window_size
+    assert len(info["portfolio_values"]) == info["total_steps"] + 1
+
+
+def test_reward_uses_trading_env_components(env):
+    env.reset()
+    recent = deque(maxlen=env.sharpe_window_size)
+    peak = env.initial_balance
+    action = np.array([0.6, 0.2, -0.2])
+    for _ in range(10):
+        last_value = env.portfolio_value
+        _, reward, _, _, info = env.step(action)
+        change = (info["portfolio_value"] - last_value) / last_value
+        recent.append(change)
+        peak = max(peak, info["portfolio_value"])
+        components = calculate_reward_components(change, recent, info["portfolio_value"], peak)
+        expected = 0.7 * components["sharpe"] + 0.3 * components["pnl"] - components["drawdown_penalty"]
+        assert reward == pytest.approx(expected)
+
+
+def test_observation_normalizes_each_asset_independently(env):
+    observation, _ = env.reset()
+    t = env.current_step
+    market = observation[:env._market_size].reshape(env.window_size, env.n_assets, env.n_features)
+
+    # Asset 1's close column matches a single-series rolling z-score of its own closes
+    closes = pd.Series(env._prices[:, 1])
+    mean = closes.rolling(env.normalization_window_size, min_periods=1).mean().iloc[t]
+    std = closes.rolling(env.normalization_window_size, min_periods=1).std().iloc[t] + 1e-8
+    expected = np.clip((closes.iloc[t - env.window_size + 1:t + 1].to_numpy() - mean) / std, -10, 10)
+    np.testing.assert_allclose(market[:, 1, 3], expected, rtol=1e-5, atol=1e-5)
+
+    # Portfolio block: no weights, all cash, no exposure, no drawdown
+    np.testing.assert_array_equal(observation[env._market_size:env._market_size + env.n_assets], 0.0)
+    np.testing.assert_allclose(observation[-3:], [1.0, 0.0, 0.0])
+
+
+def test_relative_strength_is_cross_sectional(env):
+    env.reset()
+    observation, _, _, _, _ = env.step(np.zeros(3))
+    offset = env._market_size + env.n_assets
+    relative = observation[offset:offset + env.n_assets]
+    returns = np.log(env._prices[env.current_step] / env._prices[env.current_step - 1])
+
+    assert relative.mean() == pytest.approx(0.0, abs=1e-5)
+    assert np.argmax(relative) == np.argmax(returns)
@@ -0,0 +1,111 @@
+"""
+Tests for StrategyAgent.get_state and set_state.
+
+A state captured from one agent and restored into another must carry the
+networks, optimizer moments and counters, while the receiving agent keeps
+its own learning rate and epsilon settings (as a PBT clone does).
+"""
+
+import pytest
+import numpy as np
+import torch
+
+from reinforcestrategycreator.rl_agent import StrategyAgent
+
+STATE_SIZE = 6
+ACTION_SIZE = 3
+
+
+def trained_agent(**kwargs):
+    """Create an agent with a filled replay memory and a few learning steps."""
+    torch.manual_seed(0)
+    agent = StrategyAgent(STATE_SIZE, ACTION_SIZE, learning_rate=0.01, epsilon=0.5,
+                          epsilon_decay=0.9, epsilon_min=0.01, batch_size=8, **kwargs)
+    rng = np.random.default_rng(0)
+    for _ in range(32):
+        agent.remember(rng.standard_normal(STATE_SIZE), int(rng.integers(ACTION_SIZE)),
+                       float(rng.standard_normal()), rng.standard_normal(STATE_SIZE), False)
+    for _ in range(3):
+        agent.learn()
+    agent.epsilon = 0.3
+    agent.update_counter = 7
+    return agent
+
+
+def receiving_agent(**kwargs):
+    """Create a fresh agent with different learning rate and epsilon settings."""
+    torch.manual_seed(1)
+    return StrategyAgent(STATE_SIZE, ACTION_SIZE, learning_rate=0.0005, epsilon=1.0,
+                         epsilon_decay=0.99, epsilon_min=0.05, batch_size=8, **kwargs)
+
+
+def assert_same_weights(module, other):
+    for (name, value), (_, other_value) in zip(module.state_dict().items(), other.state_dict().items()):
+        assert torch.equal(value, other_value), name
+
+
+def test_round_trip_keeps_receiver_hyperparameters():
+    """Test that networks and counters transfer while learning rate and epsilon settings stay."""
+    source = trained_agent()
+    receiver = receiving_agent()
+
+    receiver.set_state(source.get_state())
+
+    assert_same_weights(receiver.model, source.model)
+    assert_same_weights(receiver.target_model, source.target_model)
+    source_moments = source.optimizer.state_dict()["state"]
+    receiver_moments = receiver.optimizer.state_dict()["state"]
+    assert source_moments.keys() == receiver_moments.keys()
+    for key, moments in source_moments.items():
+        assert torch.equal(receiver_moments[key]["exp_avg"], moments["exp_avg"])
+    assert [group["lr"] for group in receiver.optimizer.param_groups] == [0.0005]
+    assert receiver.learning_rate == 0.0005
+    assert receiver.epsilon_decay == 0.99
+    assert receiver.epsilon_min == 0.05
+    assert receiver.epsilon == pytest.approx(0.3)
+    assert receiver.update_counter == 7
+
+
+def test_restored_epsilon_respects_receiver_minimum():
+    """Test that a checkpointed epsilon below the receiver's epsilon_min is raised to it."""
+    source = trained_agent()
+    source.epsilon = 0.02
+    receiver = receiving_agent()
+
+    receiver.set_state(source.get_state())
+
+    assert receiver.epsilon == 0.05
+
+
+def test_replay_buffer_is_only_restored_when_captured():
+    """Test that the replay memory transfers only with include_replay_buffer."""
+    source = trained_agent()
+
+    without_buffer = receiving_agent()
+    without_buffer.set_state(source.get_state())
+    with_buffer = receiving_agent()
+    with_buffer.set_state(source.get_state(include_replay_buffer=True))
+
+    assert "memory" not in source.get_state()
+    assert len(without_buffer.memory) == 0
+    assert len(with_buffer.memory) == len(source.memory) == 32
+    assert with_buffer.memory.maxlen == with_buffer.memory_size
+    for restored, original in zip(with_buffer.memory, source.memory):
+        np.testing.assert_array_equal(restored[0], original[0])
+        assert restored[1:3] == original[1:3]
+
+    # The restored agent keeps training from the transferred memory
+    with_buffer.learn()
+    assert with_buffer.update_counter == 8
+
+
+def test_prioritized_replay_round_trip_keeps_priorities():
+    """Test that PER memory and priorities transfer together."""
+    source = trained_agent(use_prioritized_replay=True)
+    receiver = receiving_agent(use_prioritized_replay=True)
+
+    receiver.set_state(source.get_state(include_replay_buffer=True))
+
+    assert len(receiver.memory) == len(source.memory)
+    np.testing.assert_array_equal(receiver.priorities, source.priorities)
+    assert receiver.priorities is not source.priorities